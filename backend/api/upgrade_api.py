@@ -8,12 +8,14 @@ from __future__ import annotations
 import asyncio
 import json
 import os
-from typing import Dict, Any, Optional
+import threading
+from collections import OrderedDict, deque
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor
 from fastapi import FastAPI, HTTPException, BackgroundTasks
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import JSONResponse, FileResponse, PlainTextResponse, StreamingResponse
 from pydantic import BaseModel
 
 # Load environment variables from .env file
@@ -33,13 +35,113 @@ from backend.packages.orchestrator.newbuild_orchestrator import (
     NewBuildConfig
 )
 from backend.packages.memory.hub import MemoryHub
+from backend.packages.memory.client import MemoryHubClient
 from backend.packages.memory.contexts import ContextType
+from backend.packages.memory.server import MemoryHubServer
+from backend.packages.memory.storage import get_memory_storage
 
 app = FastAPI(title="T-Developer Upgrade API", version="2.0.0")
 
 # 글로벌 오케스트레이터 인스턴스
 orchestrator: Optional[UpgradeOrchestrator] = None
 memory_hub: Optional[MemoryHub] = None
+# MEMORY_SOCKET이 설정되면 API 프로세스가 메모리 허브를 소켓으로 제공
+memory_server: Optional[MemoryHubServer] = None
+
+
+class TaskEventStream:
+    """분석 작업의 스트리밍 AI 출력을 SSE 구독자에게 전달.
+    
+    분석은 별도 스레드의 이벤트 루프에서 실행되므로, 이벤트는 각 구독자의
+    루프로 call_soon_threadsafe를 통해 전달됩니다. 늦게 연결한 구독자를 위해
+    최근 이벤트를 backlog로 보관합니다.
+    """
+    
+    def __init__(self, backlog: int = 2000):
+        """스트림 초기화.
+        
+        Args:
+            backlog: 새 구독자에게 재생할 최대 이벤트 수
+        """
+        self._lock = threading.Lock()
+        self._backlog: deque = deque(maxlen=backlog)
+        self._subscribers: List[Tuple[asyncio.AbstractEventLoop, asyncio.Queue]] = []
+        self.closed = False
+    
+    def publish(self, event: Dict[str, Any]) -> None:
+        """이벤트 발행 (어느 스레드에서든 호출 가능).
+        
+        Args:
+            event: "event" 키를 가진 이벤트
+        """
+        with self._lock:
+            self._backlog.append(event)
+            subscribers = list(self._subscribers)
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(queue.put_nowait, event)
+            except RuntimeError:
+                # 구독자의 이벤트 루프가 이미 닫힘
+                self.unsubscribe(queue)
+    
+    def publish_chunk(self, agent_name: str, chunk: str) -> None:
+        """AgentRuntime 스트림 콜백 (에이전트 출력 조각)."""
+        self.publish({"event": "token", "agent": agent_name, "text": chunk})
+    
+    def close(self, status: str) -> None:
+        """종료 이벤트를 발행하고 스트림을 닫습니다.
+        
+        Args:
+            status: 작업의 최종 상태
+        """
+        self.publish({"event": "end", "status": status})
+        self.closed = True
+    
+    def subscribe(self) -> asyncio.Queue:
+        """현재 이벤트 루프에서 이벤트를 받을 큐를 등록합니다.
+        
+        Returns:
+            backlog가 미리 채워진 큐
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        with self._lock:
+            for event in self._backlog:
+                queue.put_nowait(event)
+            self._subscribers.append((asyncio.get_running_loop(), queue))
+        return queue
+    
+    def unsubscribe(self, queue: asyncio.Queue) -> None:
+        """구독 해제.
+        
+        Args:
+            queue: subscribe()가 반환한 큐
+        """
+        with self._lock:
+            self._subscribers = [(l, q) for l, q in self._subscribers if q is not queue]
+
+
+# 작업별 출력 스트림 (최근 작업만 유지)
+task_streams: "OrderedDict[str, TaskEventStream]" = OrderedDict()
+MAX_TASK_STREAMS = 32
+SSE_KEEPALIVE_SECONDS = 15.0
+
+
+def open_task_stream(task_id: str) -> TaskEventStream:
+    """작업 출력 스트림 생성 (오래된 종료 스트림은 정리).
+    
+    Args:
+        task_id: 작업 ID
+        
+    Returns:
+        새 TaskEventStream
+    """
+    stream = task_streams[task_id] = TaskEventStream()
+    for old_id in list(task_streams):
+        if len(task_streams) <= MAX_TASK_STREAMS:
+            break
+        if task_streams[old_id].closed:
+            del task_streams[old_id]
+    return stream
 
 
 @app.get("/health")
@@ -125,18 +227,64 @@ class UpgradeStatus(BaseModel):
 @app.on_event("startup")
 async def startup_event():
     """앱 시작 시 초기화."""
-    global memory_hub
-    memory_hub = MemoryHub()
+    global memory_hub, memory_server
+    # MEMORY_STORAGE=sqlite 로 여러 워커/Streamlit 앱이 하나의 저장소를 공유
+    # 진행 상태 갱신(task_*_status)은 write-behind로 병합되어 배치 저장됨
+    # 컨텍스트는 첫 접근 시 로드하여 누적된 메모리 양과 무관하게 빠르게 기동
+    memory_hub = MemoryHub(storage=get_memory_storage(), write_behind=True, lazy_load=True)
     await memory_hub.initialize()
+    
+    # 분석 스레드와 다른 프로세스는 MemoryHubClient로 같은 허브를 공유
+    if os.getenv("MEMORY_SOCKET"):
+        memory_server = MemoryHubServer(memory_hub)
+        await memory_server.start()
+
+
+async def open_worker_memory_hub():
+    """분석 스레드에서 사용할 메모리 허브를 가져옵니다.
+    
+    서버 모드에서는 스레드의 이벤트 루프에 연결된 클라이언트를 생성하고,
+    그렇지 않으면 API의 허브를 그대로 사용합니다.
+    """
+    if not memory_server:
+        return memory_hub
+    
+    client = MemoryHubClient(memory_server.socket_path)
+    await client.initialize()
+    return client
+
+
+async def write_task_status(hub, task_id: str, status: Dict[str, Any]) -> None:
+    """작업 상태 저장.
+    
+    상태 엔트리는 "task_status" 태그와 task_id/status 메타데이터를 가지므로
+    list_analyses에서 전체 스캔 없이 조회할 수 있습니다.
+    
+    Args:
+        hub: 사용할 메모리 허브
+        task_id: 작업 ID
+        status: 상태 데이터
+    """
+    await hub.write(
+        ContextType.O_CTX,
+        f"task_{task_id}_status",
+        status,
+        ttl_seconds=86400,
+        tags=["task_status"],
+        metadata={"task_id": task_id, "status": status.get("status")}
+    )
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     """앱 종료 시 정리."""
-    global orchestrator, memory_hub
+    global orchestrator, memory_hub, memory_server
     if orchestrator:
         if hasattr(orchestrator, 'shutdown'):
             await orchestrator.shutdown()
+    if memory_server:
+        await memory_server.stop()
+        memory_server = None
     if memory_hub:
         if hasattr(memory_hub, 'shutdown'):
             await memory_hub.shutdown()
@@ -191,6 +339,9 @@ async def start_upgrade_analysis(
         )
         orchestrator = UpgradeOrchestrator(config)
     
+    # 에이전트의 AI 출력을 /api/upgrade/stream/{task_id}로 전달
+    orchestrator.add_stream_callback(open_task_stream(task_id).publish_chunk)
+    
     # ThreadPoolExecutor를 사용하여 백그라운드에서 실행
     # 새로운 이벤트 루프에서 실행하여 충돌 방지
     executor.submit(
@@ -201,16 +352,15 @@ async def start_upgrade_analysis(
     )
     
     # 초기 상태 저장
-    await memory_hub.write(
-        ContextType.O_CTX,
-        f"task_{task_id}_status",
+    await write_task_status(
+        memory_hub,
+        task_id,
         {
             "status": "running",
             "progress": 0.0,
             "current_phase": "initialization",
             "started_at": datetime.now().isoformat()
-        },
-        ttl_seconds=86400
+        }
     )
     
     return UpgradeStatus(
@@ -237,11 +387,14 @@ def run_analysis_wrapper(task_id: str, orchestrator, requirements: str):
             run_analysis_with_init_async(task_id, orchestrator, requirements)
         )
     finally:
+        # 루프에 묶인 자원(예: Bedrock HTTP 세션)을 정리한 뒤 종료
+        loop.run_until_complete(loop.shutdown_asyncgens())
         loop.close()
 
 
 async def run_analysis_with_init_async(task_id: str, orchestrator, requirements: str):
     """백그라운드에서 초기화 후 분석 실행 (비동기)."""
+    hub = await open_worker_memory_hub()
     try:
         print(f"[{task_id}] Starting initialization...")
         # 오케스트레이터 초기화
@@ -249,16 +402,16 @@ async def run_analysis_with_init_async(task_id: str, orchestrator, requirements:
         print(f"[{task_id}] Initialization complete, starting analysis...")
         
         # 분석 실행
-        await run_analysis(task_id, orchestrator, requirements)
+        await run_analysis(task_id, orchestrator, requirements, hub)
         print(f"[{task_id}] Analysis complete")
     except Exception as e:
         import traceback
         error_detail = f"{str(e)}\n{traceback.format_exc()}"
         
         # 에러 저장
-        await memory_hub.write(
-            ContextType.O_CTX,
-            f"task_{task_id}_status",
+        await write_task_status(
+            hub,
+            task_id,
             {
                 "status": "failed",
                 "progress": 0.0,
@@ -266,21 +419,32 @@ async def run_analysis_with_init_async(task_id: str, orchestrator, requirements:
                 "message": str(e),
                 "error_detail": error_detail,
                 "failed_at": datetime.now().isoformat()
-            },
-            ttl_seconds=86400
+            }
         )
         
         print(f"Task {task_id} initialization failed: {error_detail}")
-
-
-async def run_analysis(task_id: str, orchestrator, requirements: str):
+    finally:
+        stream = task_streams.get(task_id)
+        if stream:
+            try:
+                status = await hub.read(ContextType.O_CTX, f"task_{task_id}_status")
+            except Exception:
+                status = None
+            stream.close(status.get("status", "unknown") if isinstance(status, dict) else "unknown")
+        if hub is not memory_hub:
+            await hub.shutdown()
+
+
+async def run_analysis(task_id: str, orchestrator, requirements: str, hub=None):
     """백그라운드에서 분석 실행.
     
     Args:
         task_id: 작업 ID
         orchestrator: 오케스트레이터
         requirements: 요구사항
+        hub: 사용할 메모리 허브 (기본값은 API의 허브)
     """
+    hub = hub or memory_hub
     try:
         print(f"[{task_id}] Starting orchestrator execution...")
         # 오케스트레이터 타입에 따라 실행
@@ -296,17 +460,16 @@ async def run_analysis(task_id: str, orchestrator, requirements: str):
         print(f"[{task_id}] Orchestrator execution complete")
         
         # 결과 저장
-        await memory_hub.write(
-            ContextType.O_CTX,
-            f"task_{task_id}_status",
+        await write_task_status(
+            hub,
+            task_id,
             {
                 "status": "completed",
                 "progress": 1.0,
                 "current_phase": "completed",
                 "completed_at": datetime.now().isoformat(),
                 "result_path": orchestrator.config.output_dir
-            },
-            ttl_seconds=86400
+            }
         )
         
         # 리포트 저장
@@ -315,7 +478,7 @@ async def run_analysis(task_id: str, orchestrator, requirements: str):
         else:
             report_data = report if isinstance(report, dict) else {"result": str(report)}
             
-        await memory_hub.write(
+        await hub.write(
             ContextType.O_CTX,
             f"task_{task_id}_report",
             report_data,
@@ -327,9 +490,9 @@ async def run_analysis(task_id: str, orchestrator, requirements: str):
         error_detail = f"{str(e)}\n{traceback.format_exc()}"
         
         # 에러 저장
-        await memory_hub.write(
-            ContextType.O_CTX,
-            f"task_{task_id}_status",
+        await write_task_status(
+            hub,
+            task_id,
             {
                 "status": "failed",
                 "progress": 0.0,
@@ -337,8 +500,7 @@ async def run_analysis(task_id: str, orchestrator, requirements: str):
                 "message": str(e),
                 "error_detail": error_detail,
                 "failed_at": datetime.now().isoformat()
-            },
-            ttl_seconds=86400
+            }
         )
         
         # 에러 로그 출력
@@ -439,38 +601,104 @@ async def get_document(task_id: str, doc_name: str) -> FileResponse:
 
 
 @app.get("/api/upgrade/list")
-async def list_analyses() -> Dict[str, Any]:
+async def list_analyses(
+    status: Optional[str] = None,
+    limit: int = 20,
+    cursor: Optional[str] = None
+) -> Dict[str, Any]:
     """모든 분석 작업 목록 조회.
     
+    Args:
+        status: 이 상태의 작업만 조회 (running, completed, failed)
+        limit: 페이지당 작업 수
+        cursor: 이전 응답의 next_cursor (다음 페이지 조회)
+    
     Returns:
-        작업 목록
+        작업 목록과 다음 페이지 커서
     """
-    # 메모리에서 모든 작업 조회
-    tasks = []
-    
-    # O_CTX에서 task_* 패턴으로 저장된 모든 작업 조회
-    # 실제 구현에서는 메모리 허브의 scan 기능 필요
-    # 여기서는 예시로 최근 작업만 반환
+    criteria: Dict[str, Any] = {"all_tags": ["task_status"]}
+    if status:
+        criteria["metadata"] = {"status": status}
     
-    latest_path = await memory_hub.read(
-        ContextType.O_CTX,
-        "latest_report_path"
-    )
+    try:
+        page = await memory_hub.query(
+            ContextType.O_CTX,
+            fields=["metadata.task_id", "value", "updated_at"],
+            limit=limit,
+            cursor=cursor,
+            **criteria
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
     
-    if latest_path:
-        # summary.json 읽기
-        summary_path = Path(latest_path) / "summary.json"
-        if summary_path.exists():
-            with open(summary_path, 'r') as f:
-                summary = json.load(f)
-                tasks.append(summary)
+    tasks = [
+        {
+            "task_id": item["metadata.task_id"],
+            "updated_at": item["updated_at"],
+            **item["value"],
+        }
+        for item in page["items"]
+    ]
     
     return {
         "tasks": tasks,
-        "total": len(tasks)
+        "total": len(tasks),
+        "next_cursor": page["next_cursor"]
     }
 
 
+@app.get("/api/upgrade/stream/{task_id}")
+async def stream_task_output(task_id: str) -> StreamingResponse:
+    """작업의 AI 출력을 Server-Sent Events로 스트리밍.
+    
+    이벤트:
+        token: {"agent", "text"} - 에이전트의 AI 출력 조각
+        end: {"status"} - 작업 종료
+    
+    Args:
+        task_id: 작업 ID
+        
+    Returns:
+        text/event-stream 응답
+    """
+    stream = task_streams.get(task_id)
+    if stream is None:
+        raise HTTPException(status_code=404, detail="Task stream not found")
+    
+    async def events():
+        queue = stream.subscribe()
+        try:
+            while True:
+                try:
+                    event = await asyncio.wait_for(queue.get(), timeout=SSE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                data = json.dumps(event, ensure_ascii=False)
+                yield f"event: {event['event']}\ndata: {data}\n\n"
+                if event["event"] == "end":
+                    break
+        finally:
+            stream.unsubscribe(queue)
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics() -> PlainTextResponse:
+    """메모리 계층 메트릭 (Prometheus 텍스트 형식).
+    
+    Returns:
+        작업별 지연 시간/저장 바이트 히스토그램과 컨텍스트 크기 게이지
+    """
+    body = memory_hub.render_metrics() if memory_hub else ""
+    return PlainTextResponse(body, media_type="text/plain; version=0.0.4")
+
+
 @app.get("/api/health")
 async def health_check() -> Dict[str, str]:
     """헬스 체크.
@@ -0,0 +1,343 @@
+"""Content-addressed cache for LLM completions.
+
+Responses are keyed by a SHA-256 hash of ``(model_id, system, prompt,
+max_tokens, temperature)`` and kept in two tiers:
+
+- an in-process LRU for repeated prompts within one run, and
+- a SQLite file shared by processes and across runs (evolution-loop
+  re-runs, repeated report generation).
+
+Both tiers honour a TTL. In deterministic mode (the default) only calls
+with ``temperature <= 0.3`` are cached, since higher temperatures ask for
+varied answers. Callers opt out per call with ``use_cache=False``.
+
+``cached_completion`` adds the cache to a provider's ``complete`` or
+``stream_complete`` method; the provider supplies its cache through a
+``response_cache`` attribute (None disables caching).
+
+Environment:
+    AI_CACHE: "off" disables the shared cache
+    AI_CACHE_PATH: SQLite file of the disk tier ("" keeps memory only)
+    AI_CACHE_TTL_SECONDS: Entry lifetime
+    AI_CACHE_DETERMINISTIC_ONLY: "0" also caches high-temperature calls
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import hashlib
+import inspect
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = "/tmp/t-developer/ai_cache/responses.db"
+DEFAULT_TTL_SECONDS = 7 * 86400
+DETERMINISTIC_MAX_TEMPERATURE = 0.3
+
+
+def make_cache_key(
+    model_id: str,
+    system: Optional[str],
+    prompt: str,
+    max_tokens: int,
+    temperature: float
+) -> str:
+    """Hash the parameters that determine a completion.
+
+    Args:
+        model_id: Bedrock model ID
+        system: System prompt
+        prompt: User prompt
+        max_tokens: Maximum tokens to generate
+        temperature: Sampling temperature
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    material = json.dumps(
+        [model_id, system, prompt, int(max_tokens), float(temperature)],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class AIResponseCache:
+    """Two-tier (LRU + SQLite) cache of LLM responses.
+
+    Attributes:
+        max_entries: Capacity of the in-process LRU tier
+        ttl_seconds: Lifetime of cached responses
+        db_path: SQLite file of the disk tier (None for memory only)
+        deterministic_only: Only cache calls with temperature <= 0.3
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY,
+            response TEXT NOT NULL,
+            created_at REAL NOT NULL,
+            expires_at REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_responses_expires_at ON responses (expires_at);
+    """
+
+    # Expired disk rows are purged every this many writes
+    _PURGE_INTERVAL = 100
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        db_path: Optional[str] = DEFAULT_CACHE_PATH,
+        deterministic_only: bool = True
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Capacity of the in-process LRU tier
+            ttl_seconds: Lifetime of cached responses
+            db_path: SQLite file of the disk tier (None for memory only)
+            deterministic_only: Only cache calls with temperature <= 0.3
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.deterministic_only = deterministic_only
+        self.db_path = Path(db_path) if db_path else None
+
+        # key -> (expires_at, response)
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "stores": 0, "bypassed": 0}
+        self._writes = 0
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        if self.db_path is not None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(
+                str(self.db_path), timeout=5, isolation_level=None, check_same_thread=False
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(self._SCHEMA)
+
+    def is_cacheable(self, temperature: float) -> bool:
+        """Check whether a call with this temperature may be cached.
+
+        Args:
+            temperature: Sampling temperature of the call
+
+        Returns:
+            True unless deterministic mode excludes the temperature
+        """
+        return not self.deterministic_only or temperature <= DETERMINISTIC_MAX_TEMPERATURE
+
+    async def get(self, key: str) -> Optional[str]:
+        """Look a response up, memory tier first.
+
+        Args:
+            key: Key from make_cache_key()
+
+        Returns:
+            The cached response, or None on a miss
+        """
+        now = time.time()
+        with self._lock:
+            cached = self._entries.get(key)
+            if cached is not None:
+                if cached[0] > now:
+                    self._entries.move_to_end(key)
+                    self._stats["memory_hits"] += 1
+                    return cached[1]
+                del self._entries[key]
+
+        if self._conn is not None:
+            row = await asyncio.to_thread(self._locked, self._select, key, now)
+            if row is not None:
+                self._remember(key, row[1], row[0])
+                self._stats["disk_hits"] += 1
+                return row[1]
+
+        self._stats["misses"] += 1
+        return None
+
+    async def put(self, key: str, response: str) -> None:
+        """Store a response in both tiers.
+
+        Args:
+            key: Key from make_cache_key()
+            response: The completion text
+        """
+        now = time.time()
+        expires_at = now + self.ttl_seconds
+        self._remember(key, response, expires_at)
+        self._stats["stores"] += 1
+        if self._conn is not None:
+            await asyncio.to_thread(self._locked, self._upsert, key, response, now, expires_at)
+
+    def record_bypass(self) -> None:
+        """Count a call that skipped the cache (opt-out or temperature)."""
+        self._stats["bypassed"] += 1
+
+    def _remember(self, key: str, response: str, expires_at: float) -> None:
+        """Insert into the LRU tier, evicting the least recently used."""
+        with self._lock:
+            self._entries[key] = (expires_at, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _locked(self, func: Callable, *args: Any) -> Any:
+        """Run a database function while holding the cache lock."""
+        with self._lock:
+            return func(*args)
+
+    def _select(self, key: str, now: float) -> Optional[Tuple[float, str]]:
+        """Read an unexpired row."""
+        return self._conn.execute(
+            "SELECT expires_at, response FROM responses WHERE key = ? AND expires_at > ?",
+            (key, now),
+        ).fetchone()
+
+    def _upsert(self, key: str, response: str, now: float, expires_at: float) -> None:
+        """Write a row, purging expired rows now and then."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO responses (key, response, created_at, expires_at) "
+            "VALUES (?, ?, ?, ?)",
+            (key, response, now, expires_at),
+        )
+        self._writes += 1
+        if self._writes % self._PURGE_INTERVAL == 0:
+            self._conn.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Hit/miss/store counters, hit rate and LRU size
+        """
+        lookups = self._stats["memory_hits"] + self._stats["disk_hits"] + self._stats["misses"]
+        hits = lookups - self._stats["misses"]
+        return {
+            **self._stats,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "memory_entries": len(self._entries),
+            "disk_path": str(self.db_path) if self.db_path else None,
+        }
+
+    async def clear(self) -> None:
+        """Drop every cached response from both tiers."""
+        with self._lock:
+            self._entries.clear()
+        if self._conn is not None:
+            await asyncio.to_thread(self._locked, self._conn.execute, "DELETE FROM responses")
+
+    def close(self) -> None:
+        """Close the disk tier."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+def cached_completion(func: Callable) -> Callable:
+    """Add the response cache to a provider completion method.
+
+    Works for coroutine methods returning the text (``complete``) and for
+    async generators yielding text chunks (``stream_complete``); a cache
+    hit on a stream is yielded as a single chunk. The wrapped method gains
+    a ``use_cache`` keyword (default True).
+
+    Args:
+        func: Method taking prompt, system, max_tokens, temperature and model_id
+
+    Returns:
+        The wrapped method
+    """
+    signature = inspect.signature(func)
+
+    def lookup(self: Any, args: Tuple[Any, ...], kwargs: Dict[str, Any], use_cache: bool):
+        """Resolve the cache and key of a call (None when it is not cached)."""
+        cache: Optional[AIResponseCache] = getattr(self, "response_cache", None)
+        if cache is None:
+            return None, None
+        params = signature.bind(self, *args, **kwargs)
+        params.apply_defaults()
+        call = params.arguments
+        if not use_cache or not cache.is_cacheable(call["temperature"]):
+            cache.record_bypass()
+            return None, None
+        key = make_cache_key(
+            call.get("model_id") or getattr(self, "default_model_id", ""),
+            call.get("system"),
+            call["prompt"],
+            call["max_tokens"],
+            call["temperature"],
+        )
+        return cache, key
+
+    if inspect.isasyncgenfunction(func):
+        @functools.wraps(func)
+        async def stream_wrapper(self: Any, *args: Any, use_cache: bool = True, **kwargs: Any):
+            cache, key = lookup(self, args, kwargs, use_cache)
+            if cache is not None:
+                cached = await cache.get(key)
+                if cached is not None:
+                    yield cached
+                    return
+            parts = []
+            async for chunk in func(self, *args, **kwargs):
+                parts.append(chunk)
+                yield chunk
+            if cache is not None:
+                await cache.put(key, "".join(parts))
+        return stream_wrapper
+
+    @functools.wraps(func)
+    async def wrapper(self: Any, *args: Any, use_cache: bool = True, **kwargs: Any) -> str:
+        cache, key = lookup(self, args, kwargs, use_cache)
+        if cache is not None:
+            cached = await cache.get(key)
+            if cached is not None:
+                return cached
+        response = await func(self, *args, **kwargs)
+        if cache is not None and response:
+            await cache.put(key, response)
+        return response
+    return wrapper
+
+
+_cache: Optional[AIResponseCache] = None
+_cache_loaded = False
+
+
+def get_ai_response_cache() -> Optional[AIResponseCache]:
+    """Get the process-wide response cache configured from the environment.
+
+    Returns:
+        AIResponseCache instance, or None when AI_CACHE=off
+    """
+    global _cache, _cache_loaded
+    if not _cache_loaded:
+        _cache_loaded = True
+        if os.getenv("AI_CACHE", "on").lower() not in ("off", "0", "false"):
+            settings = {
+                "ttl_seconds": float(os.getenv("AI_CACHE_TTL_SECONDS", str(DEFAULT_TTL_SECONDS))),
+                "deterministic_only": os.getenv("AI_CACHE_DETERMINISTIC_ONLY", "1") != "0",
+            }
+            try:
+                _cache = AIResponseCache(
+                    db_path=os.getenv("AI_CACHE_PATH", DEFAULT_CACHE_PATH) or None, **settings
+                )
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"AI response cache disk tier unavailable, using memory only: {e}")
+                _cache = AIResponseCache(db_path=None, **settings)
+    return _cache
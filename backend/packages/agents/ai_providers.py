@@ -8,7 +8,7 @@ T-Developer v2의 모든 AI 기능의 핵심이 되는 모듈로, Mock이나 Fak
 1. AWS Bedrock 연결 관리
 2. Claude 3 모델 패밀리 지원 (Sonnet, Haiku, Opus)
 3. 프롬프트 템플릿 관리 및 최적화
-4. 응답 스트리밍 지원
+4. 응답 스트리밍 지원 (InvokeModelWithResponseStream)
 5. 에러 처리 및 재시도 로직
 6. 토큰 사용량 추적
 7. 비용 모니터링
@@ -42,6 +42,7 @@ from __future__ import annotations
 
 import json
 import logging
+import random
 from typing import Any, Dict, Optional, AsyncGenerator
 from dataclasses import dataclass
 from abc import ABC, abstractmethod
@@ -49,6 +50,13 @@ from abc import ABC, abstractmethod
 import boto3
 from botocore.exceptions import ClientError
 
+from .ai_cache import AIResponseCache, cached_completion, get_ai_response_cache
+from .bedrock_transport import get_bedrock_transport, stream_chunk_text
+from .single_flight import SingleFlight, coalesced_completion, get_single_flight
+from .model_router import ModelRouter, get_model_router, routed_completion
+from .rate_limiter import BedrockRateLimiter, estimate_request_tokens, get_bedrock_rate_limiter
+from ..memory.context_builder import estimate_tokens
+
 logger = logging.getLogger(__name__)
 
 
@@ -62,15 +70,35 @@ class AIResponse:
 
 
 class AIProvider(ABC):
-    """AI Provider 추상 베이스 클래스."""
+    """AI Provider 추상 베이스 클래스.
+    
+    동시에 들어온 동일한 요청은 프로세스 전역 single-flight 테이블을 통해
+    하나의 호출로 합쳐집니다 (single_flight.coalesced_completion 참고).
     
-    def __init__(self, config: Dict[str, Any]):
+    Attributes:
+        config: Provider 설정
+        single_flight: 진행 중인 호출 테이블 (None이면 합치지 않음)
+    """
+    
+    def __init__(self, config: Dict[str, Any], single_flight: Optional[SingleFlight] = None):
         """AI Provider 초기화.
         
         Args:
             config: Provider 설정
+            single_flight: 진행 중인 호출 테이블 (기본값: 프로세스 전역 테이블)
         """
         self.config = config
+        self.single_flight = single_flight or get_single_flight()
+    
+    def get_coalescing_stats(self) -> Dict[str, Any]:
+        """요청 합치기(single-flight) 통계.
+        
+        Returns:
+            전체 호출 수, 실제 실행 수, 합쳐진 호출 수와 비율
+        """
+        if self.single_flight is None:
+            return {}
+        return self.single_flight.get_stats()
     
     @abstractmethod
     async def generate(
@@ -121,6 +149,10 @@ class BedrockAIProvider(AIProvider):
     
     Attributes:
         client: Boto3 Bedrock Runtime client
+        transport: Shared async transport used for model invocation
+        response_cache: Completion cache (None disables caching)
+        rate_limiter: Process-wide Bedrock rate limiter shared with AgentRuntime
+        model_router: Task-class model routing (None sends every call to default_model_id)
         default_model_id: Default model to use
         region: AWS region
     """
@@ -140,7 +172,11 @@ class BedrockAIProvider(AIProvider):
         self,
         model: str = "claude-3-sonnet",  # 작동 확인된 모델로 변경
         region: str = "us-east-1",
-        aws_profile: Optional[str] = None
+        aws_profile: Optional[str] = None,
+        endpoint_url: Optional[str] = None,
+        response_cache: Optional[AIResponseCache] = None,
+        rate_limiter: Optional[BedrockRateLimiter] = None,
+        model_router: Optional[ModelRouter] = None
     ) -> None:
         """Initialize Bedrock AI provider.
         
@@ -148,6 +184,10 @@ class BedrockAIProvider(AIProvider):
             model: Model name from MODELS dict
             region: AWS region
             aws_profile: Optional AWS profile name
+            endpoint_url: Optional Bedrock runtime endpoint override
+            response_cache: Completion cache (default: the shared cache)
+            rate_limiter: Rate limiter (default: the process-wide limiter)
+            model_router: Model router (default: the process-wide router)
         """
         self.region = region
         self.default_model_id = self.MODELS.get(model, self.MODELS["claude-3-sonnet"])
@@ -158,6 +198,14 @@ class BedrockAIProvider(AIProvider):
             service_name="bedrock-runtime",
             region_name=region
         )
+        # 비동기 전송 계층 (커넥션 풀 공유, 이벤트 루프 비차단)
+        self.transport = get_bedrock_transport(region, endpoint_url, aws_profile)
+        # 동일한 요청의 응답 재사용 (complete/stream_complete에 use_cache=False로 개별 해제)
+        self.response_cache = response_cache if response_cache is not None else get_ai_response_cache()
+        # 프로세스 전체 요청/토큰 한도와 적응형 동시성 (AgentRuntime과 공유)
+        self.rate_limiter = rate_limiter or get_bedrock_rate_limiter()
+        # task_class별 모델/토큰/타임아웃 라우팅 (분류·추출은 경량 모델)
+        self.model_router = model_router or get_model_router()
         
         # AIProvider 초기화
         super().__init__({
@@ -167,6 +215,9 @@ class BedrockAIProvider(AIProvider):
             "aws_profile": aws_profile
         })
     
+    @routed_completion
+    @coalesced_completion
+    @cached_completion
     async def complete(
         self,
         prompt: str,
@@ -178,6 +229,12 @@ class BedrockAIProvider(AIProvider):
     ) -> str:
         """Generate AI completion using AWS Bedrock with retry logic.
         
+        Identical calls are answered from response_cache (see ai_cache);
+        pass use_cache=False to force a fresh completion. Identical calls
+        made concurrently share one invocation (see single_flight).
+        Pass task_class (see model_router.TaskClass) to let the route pick
+        the model, max_tokens and timeout.
+        
         Args:
             prompt: The user prompt
             system: Optional system prompt
@@ -211,27 +268,19 @@ class BedrockAIProvider(AIProvider):
                 else:
                     raise ValueError(f"Unsupported model: {model_id}")
                 
-                # Invoke model (동기 호출을 비동기로 래핑)
-                loop = asyncio.get_event_loop()
-                response = await loop.run_in_executor(
-                    None,
-                    lambda: self.client.invoke_model(
-                        modelId=model_id,
-                        contentType="application/json",
-                        accept="application/json",
-                        body=json.dumps(request_body)
-                    )
-                )
-                
-                # Parse response
-                response_body = json.loads(response["body"].read())
+                # Invoke model (공유 rate limiter 통과 후 풀링된 비동기 전송 계층 사용)
+                reserved = estimate_request_tokens(prompt, system, max_tokens)
+                async with self.rate_limiter.limit(reserved) as permit:
+                    response_body = await self.transport.invoke_model(model_id, request_body)
                 
                 if "claude" in model_id:
-                    return response_body.get("content", [{}])[0].get("text", "")
+                    text = response_body.get("content", [{}])[0].get("text", "")
                 elif "titan" in model_id:
-                    return response_body.get("results", [{}])[0].get("outputText", "")
+                    text = response_body.get("results", [{}])[0].get("outputText", "")
                 else:
-                    return str(response_body)
+                    text = str(response_body)
+                permit.settle(reserved - max_tokens + estimate_tokens(text))
+                return text
                     
             except ClientError as e:
                 error_code = e.response["Error"]["Code"]
@@ -239,8 +288,8 @@ class BedrockAIProvider(AIProvider):
                 
                 # Throttling 에러 처리
                 if error_code == "ThrottlingException" and attempt < max_retries - 1:
-                    # Exponential backoff: 2^attempt seconds
-                    wait_time = 2 ** attempt
+                    # Exponential backoff with jitter so parallel callers do not retry in lockstep
+                    wait_time = round(2 ** attempt * random.uniform(0.5, 1.5), 2)
                     logger.warning(f"Throttled by Bedrock API. Retrying in {wait_time} seconds... (attempt {attempt + 1}/{max_retries})")
                     await asyncio.sleep(wait_time)
                     continue
@@ -253,6 +302,75 @@ class BedrockAIProvider(AIProvider):
                     continue
                 raise Exception(f"Error calling Bedrock after {max_retries} attempts: {str(e)}")
     
+    @routed_completion
+    @cached_completion
+    async def stream_complete(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        model_id: Optional[str] = None,
+        max_retries: int = 3
+    ) -> AsyncGenerator[str, None]:
+        """Stream an AI completion token by token (InvokeModelWithResponseStream).
+        
+        Throttling and connection errors are retried like complete() as long
+        as no text has been yielded yet; later errors are raised to the caller.
+        
+        Args:
+            prompt: The user prompt
+            system: Optional system prompt
+            max_tokens: Maximum tokens to generate
+            temperature: Temperature for generation
+            model_id: Optional specific model ID to use
+            max_retries: Maximum number of retries before the first chunk
+            
+        Yields:
+            Generated text fragments in order
+            
+        Raises:
+            Exception: If the stream fails
+        """
+        import asyncio
+        
+        model_id = model_id or self.default_model_id
+        if "claude" in model_id:
+            request_body = self._prepare_claude_request(prompt, system, max_tokens, temperature)
+        elif "titan" in model_id:
+            request_body = self._prepare_titan_request(prompt, max_tokens, temperature)
+        else:
+            raise ValueError(f"Unsupported model: {model_id}")
+        
+        reserved = estimate_request_tokens(prompt, system, max_tokens)
+        for attempt in range(max_retries):
+            started = False
+            try:
+                async with self.rate_limiter.limit(reserved) as permit:
+                    generated = 0
+                    async for chunk in self.transport.invoke_model_stream(model_id, request_body):
+                        text = stream_chunk_text(chunk)
+                        if text:
+                            started = True
+                            generated += estimate_tokens(text)
+                            yield text
+                    permit.settle(reserved - max_tokens + generated)
+                return
+            except ClientError as e:
+                error_code = e.response["Error"]["Code"]
+                if not started and error_code == "ThrottlingException" and attempt < max_retries - 1:
+                    wait_time = round(2 ** attempt * random.uniform(0.5, 1.5), 2)
+                    logger.warning(f"Throttled by Bedrock API. Retrying stream in {wait_time} seconds... (attempt {attempt + 1}/{max_retries})")
+                    await asyncio.sleep(wait_time)
+                    continue
+                raise Exception(f"Bedrock API error ({error_code}): {e.response['Error']['Message']}") from e
+            except Exception as e:
+                if not started and attempt < max_retries - 1:
+                    logger.warning(f"Bedrock stream failed: {str(e)}. Retrying... (attempt {attempt + 1}/{max_retries})")
+                    await asyncio.sleep(2 ** attempt)
+                    continue
+                raise
+    
     def _prepare_claude_request(
         self,
         prompt: str,
@@ -515,18 +633,22 @@ and well-documented code following best practices."""
         Args:
             prompt: 사용자 프롬프트
             system_prompt: 시스템 프롬프트
-            **kwargs: 추가 매개변수
+            **kwargs: 추가 매개변수 (max_tokens, temperature, model_id,
+                use_cache, task_class)
             
         Returns:
             AI 응답
         """
         try:
+            # max_tokens는 명시된 경우에만 전달 (task_class 라우트가 채움)
+            options = {key: kwargs[key] for key in ("max_tokens", "task_class") if key in kwargs}
             response = await self.complete(
                 prompt=prompt,
                 system=system_prompt,
-                max_tokens=kwargs.get("max_tokens", 4096),
                 temperature=kwargs.get("temperature", 0.7),
-                model_id=kwargs.get("model_id")
+                model_id=kwargs.get("model_id"),
+                use_cache=kwargs.get("use_cache", True),
+                **options
             )
             
             return AIResponse(
@@ -553,7 +675,7 @@ and well-documented code following best practices."""
         system_prompt: Optional[str] = None,
         **kwargs
     ) -> AsyncGenerator[str, None]:
-        """스트리밍 응답 생성 (현재 미구현).
+        """스트리밍 응답 생성 (AIProvider 인터페이스 구현).
         
         Args:
             prompt: 사용자 프롬프트
@@ -561,13 +683,18 @@ and well-documented code following best practices."""
             **kwargs: 추가 매개변수
             
         Yields:
-            응답 청크
+            응답 청크 (토큰 단위로 도착하는 대로)
         """
-        # Bedrock 스트리밍은 추후 구현
-        response = await self.generate(prompt, system_prompt, **kwargs)
-        if response.success:
-            # 단순히 전체 응답을 한 번에 yield
-            yield response.content
+        options = {key: kwargs[key] for key in ("max_tokens", "task_class") if key in kwargs}
+        async for chunk in self.stream_complete(
+            prompt=prompt,
+            system=system_prompt,
+            temperature=kwargs.get("temperature", 0.7),
+            model_id=kwargs.get("model_id"),
+            use_cache=kwargs.get("use_cache", True),
+            **options
+        ):
+            yield chunk
 
 
 def get_ai_provider(
@@ -576,8 +703,12 @@ def get_ai_provider(
 ) -> AIProvider:
     """AI Provider 인스턴스를 가져옵니다.
     
+    AI_PROVIDER 환경변수가 설정되어 있으면 "bedrock"/"auto" 요청도 해당
+    Provider로 바뀌므로, 파이프라인 전체를 오프라인(replay/synthetic)으로
+    실행할 수 있습니다.
+    
     Args:
-        provider_type: Provider 타입 ("bedrock")
+        provider_type: Provider 타입 ("bedrock", "replay", "synthetic")
         config: Provider 설정
         
     Returns:
@@ -585,23 +716,75 @@ def get_ai_provider(
     """
     import os
     
+    if provider_type in ("bedrock", "auto"):
+        provider_type = os.getenv("AI_PROVIDER", "bedrock")
+    config = config or {}
+    
     if provider_type == "bedrock" or provider_type == "auto":
-        # Bedrock Provider 생성
-        bedrock_config = config or {}
-        
-        # 환경변수에서 기본값 설정
-        if "model" not in bedrock_config:
-            bedrock_config["model"] = os.getenv("BEDROCK_MODEL", "claude-3-sonnet")
-        if "region" not in bedrock_config:
-            bedrock_config["region"] = os.getenv("AWS_DEFAULT_REGION", "us-east-1")
+        return _create_bedrock_provider(config)
+    
+    elif provider_type == "replay":
+        # 녹화된 Bedrock 응답 재생 (record/auto 모드는 Bedrock으로 녹화)
+        from .offline_providers import DEFAULT_CASSETTE_PATH, ReplayAIProvider
         
-        logger.info(f"Using AWS Bedrock AI Provider (model: {bedrock_config['model']}, region: {bedrock_config['region']})")
+        mode = config.get("mode") or os.getenv("AI_REPLAY_MODE", "replay")
+        logger.info(f"Using Replay AI Provider (mode: {mode})")
+        return ReplayAIProvider(
+            cassette_path=config.get("cassette_path") or os.getenv("AI_CASSETTE_PATH", DEFAULT_CASSETTE_PATH),
+            mode=mode,
+            upstream=_create_bedrock_provider(config) if mode != "replay" else None,
+            model_id=config.get("model_id")
+        )
+    
+    elif provider_type == "synthetic":
+        # 네트워크 없이 부하 테스트용 합성 JSON 응답
+        from .offline_providers import LatencyModel, SyntheticAIProvider
         
-        return BedrockAIProvider(
-            model=bedrock_config["model"],
-            region=bedrock_config["region"],
-            aws_profile=bedrock_config.get("aws_profile")
+        latency = LatencyModel(
+            distribution=config.get("latency") or os.getenv("AI_SYNTHETIC_LATENCY", "lognormal"),
+            mean_ms=float(config.get("latency_ms") or os.getenv("AI_SYNTHETIC_LATENCY_MS", "800")),
+            spread=float(config.get("latency_spread", 0.5)),
+            seed=config.get("seed")
+        )
+        logger.info(f"Using Synthetic AI Provider (latency: {latency.distribution}, {latency.mean_ms}ms)")
+        return SyntheticAIProvider(
+            latency=latency,
+            schema=config.get("schema"),
+            rules=config.get("rules"),
+            seed=config.get("seed")
         )
     
     else:
-        raise ValueError(f"Unknown provider type: {provider_type}. Only 'bedrock' is supported.")
\ No newline at end of file
+        raise ValueError(
+            f"Unknown provider type: {provider_type}. Expected 'bedrock', 'replay' or 'synthetic'."
+        )
+
+
+def _create_bedrock_provider(config: Dict[str, Any]) -> BedrockAIProvider:
+    """환경변수 기본값을 적용해 BedrockAIProvider를 생성합니다.
+    
+    Args:
+        config: Provider 설정
+        
+    Returns:
+        BedrockAIProvider 인스턴스
+    """
+    import os
+    
+    # Bedrock Provider 생성
+    bedrock_config = dict(config)
+    
+    # 환경변수에서 기본값 설정
+    if "model" not in bedrock_config:
+        bedrock_config["model"] = os.getenv("BEDROCK_MODEL", "claude-3-sonnet")
+    if "region" not in bedrock_config:
+        bedrock_config["region"] = os.getenv("AWS_DEFAULT_REGION", "us-east-1")
+    
+    logger.info(f"Using AWS Bedrock AI Provider (model: {bedrock_config['model']}, region: {bedrock_config['region']})")
+    
+    return BedrockAIProvider(
+        model=bedrock_config["model"],
+        region=bedrock_config["region"],
+        aws_profile=bedrock_config.get("aws_profile"),
+        endpoint_url=bedrock_config.get("endpoint_url")
+    )
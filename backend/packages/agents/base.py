@@ -48,16 +48,19 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Protocol
+from typing import Any, AsyncGenerator, Callable, Dict, List, Optional, Protocol
 from uuid import uuid4
+import asyncio
 import json
 import logging
 
 from pydantic import BaseModel, Field
 
 from ..memory import MemoryHub
+from ..memory.context_builder import DEFAULT_CONTEXT_TOKEN_BUDGET
 from ..memory.contexts import ContextType
 from ..memory.document_context import SharedDocumentContext
+from .structured_output import StructuredOutputError, StructuredOutputParser
 
 logger = logging.getLogger(__name__)
 
@@ -144,7 +147,8 @@ class AIProvider(Protocol):
         prompt: str,
         system: Optional[str] = None,
         max_tokens: int = 4096,
-        temperature: float = 0.7
+        temperature: float = 0.7,
+        task_class: Optional[str] = None
     ) -> str:
         """Generate AI completion.
         
@@ -153,6 +157,8 @@ class AIProvider(Protocol):
             system: Optional system prompt
             max_tokens: Maximum tokens to generate
             temperature: Temperature for generation
+            task_class: Kind of call, used to route it to a model tier
+                (see agents.model_router.TaskClass)
             
         Returns:
             The generated text
@@ -195,6 +201,8 @@ class BaseAgent(ABC):
         ai_provider: Optional AI provider for intelligent processing
         max_retries: Maximum number of retry attempts
         timeout_seconds: Default timeout for operations
+        stream_callback: Optional callback receiving (agent name, text chunk)
+            while AI output streams in
     """
     
     def __init__(
@@ -231,6 +239,8 @@ class BaseAgent(ABC):
         self.timeout_seconds = timeout_seconds
         self.document_context = document_context
         self.persona = persona
+        # 스트리밍 AI 출력 전달 (AgentRuntime.publish_stream 등)
+        self.stream_callback: Optional[Callable[[str, str], Any]] = None
         
         # 페르소나가 없으면 자동으로 로드
         if not self.persona and name != "BaseAgent":
@@ -445,24 +455,28 @@ Your reports are known for being comprehensive, insightful, and actionable.
 You always base your analysis on actual data and provide specific, measurable recommendations."""
 
         try:
-            # Get AI-generated report
-            ai_response = await self.ai_provider.complete(
-                prompt=prompt,
-                system=system_prompt,
-                max_tokens=4096,
-                temperature=0.3  # Lower temperature for consistent, factual reports
-            )
+            # Get AI-generated report (streamed to stream_callback when set)
+            if self.stream_callback:
+                ai_response = "".join([
+                    chunk async for chunk in self._iter_ai_chunks(
+                        prompt, system_prompt, max_tokens=4096, temperature=0.3,
+                        task_class="report"
+                    )
+                ])
+            else:
+                ai_response = await self.ai_provider.complete(
+                    prompt=prompt,
+                    system=system_prompt,
+                    max_tokens=4096,
+                    temperature=0.3,  # Lower temperature for consistent, factual reports
+                    task_class="report"
+                )
             
             # Post-process based on format
             if format_type == "json":
                 # Try to parse and validate JSON
                 try:
-                    if "```json" in ai_response:
-                        json_start = ai_response.find("```json") + 7
-                        json_end = ai_response.find("```", json_start)
-                        ai_response = ai_response[json_start:json_end].strip()
-                    
-                    parsed = json.loads(ai_response)
+                    parsed = await self.parse_ai_output(ai_response, Dict[str, Any])
                     # Add metadata
                     parsed["metadata"] = {
                         "agent": self.name,
@@ -471,7 +485,7 @@ You always base your analysis on actual data and provide specific, measurable re
                         "ai_enhanced": True
                     }
                     return parsed
-                except json.JSONDecodeError:
+                except StructuredOutputError:
                     # Fallback to structured format
                     return {
                         "report": ai_response,
@@ -553,14 +567,25 @@ You always base your analysis on actual data and provide specific, measurable re
             print(f"AI report generation failed: {e}, falling back to basic format")
             return self._format_report(result, format_type)
     
-    def get_all_context_for_prompt(self) -> str:
+    def get_all_context_for_prompt(self, token_budget: Optional[int] = DEFAULT_CONTEXT_TOKEN_BUDGET) -> str:
         """모든 공유 문서를 AI 프롬프트용으로 가져오기
         
+        이 에이전트와 관련된 문서가 먼저 배치되고, 토큰 예산을 넘는 문서는
+        요약되거나 생략됩니다.
+        
+        Args:
+            token_budget: 문서에 쓸 최대 토큰 수 (None이면 제한 없음)
+        
         Returns:
             AI가 참조할 수 있는 모든 문서 컨텍스트
         """
         if self.document_context:
-            return self.document_context.get_context_for_ai(include_history=True, max_history_loops=2)
+            return self.document_context.get_context_for_ai(
+                include_history=True,
+                max_history_loops=2,
+                agent_name=self.name,
+                token_budget=token_budget
+            )
         return "{}"
     
     def add_document_to_context(self, document: Dict[str, Any], document_type: str = "analysis") -> None:
@@ -704,6 +729,46 @@ You always base your analysis on actual data and provide specific, measurable re
             print(f"Error writing memory: {e}")
             return False
     
+    async def write_memory_batch(self, writes: List[Dict[str, Any]]) -> bool:
+        """Write several entries to Memory Hub, persisting once per context.
+        
+        Writes are grouped into one put_many() per context, and the
+        contexts are written concurrently.
+        
+        Args:
+            writes: Dictionaries with the arguments of write_memory():
+                ``context_type``, ``key``, ``value`` and optionally
+                ``ttl_seconds`` and ``tags``
+            
+        Returns:
+            True if every entry was written, False otherwise
+        """
+        if not self.memory_hub:
+            return False
+        
+        metadata = {"agent_id": self.agent_id, "timestamp": datetime.utcnow().isoformat()}
+        batches: Dict[ContextType, List[Dict[str, Any]]] = {}
+        for write in writes:
+            batches.setdefault(write["context_type"], []).append({
+                "key": write["key"],
+                "value": write["value"],
+                "ttl_seconds": write.get("ttl_seconds"),
+                "tags": write.get("tags"),
+                "metadata": dict(metadata),
+            })
+        
+        results = await asyncio.gather(
+            *(self.memory_hub.put_many(context_type, items) for context_type, items in batches.items()),
+            return_exceptions=True
+        )
+        success = True
+        for result in results:
+            if isinstance(result, Exception):
+                # In production, use proper logging
+                print(f"Error writing memory batch: {result}")
+            success = success and result is True
+        return success
+    
     async def search_memory(
         self,
         context_type: ContextType,
@@ -734,7 +799,8 @@ You always base your analysis on actual data and provide specific, measurable re
         self,
         prompt: str,
         system: Optional[str] = None,
-        max_tokens: int = 4096
+        max_tokens: int = 4096,
+        task_class: Optional[str] = None
     ) -> Optional[str]:
         """Use AI provider for intelligent processing.
         
@@ -742,6 +808,8 @@ You always base your analysis on actual data and provide specific, measurable re
             prompt: The prompt to send
             system: Optional system prompt
             max_tokens: Maximum tokens to generate
+            task_class: Optional task class routing the call to a model tier
+                (e.g. "classify" for a fast, cheap model)
             
         Returns:
             The AI response or None if no provider
@@ -749,17 +817,125 @@ You always base your analysis on actual data and provide specific, measurable re
         if not self.ai_provider:
             return None
         
+        options = {"task_class": task_class} if task_class else {}
         try:
             return await self.ai_provider.complete(
                 prompt=prompt,
                 system=system,
-                max_tokens=max_tokens
+                max_tokens=max_tokens,
+                **options
             )
         except Exception as e:
             # In production, use proper logging
             print(f"Error using AI: {e}")
             return None
     
+    async def parse_ai_output(self, response: str, schema: Any = None) -> Any:
+        """Parse a JSON answer of the AI provider into a schema.
+        
+        The JSON is extracted from code fences or prose and mechanically
+        repaired first; if it still does not parse or validate, the provider
+        is re-asked to fix only the broken part (see structured_output).
+        Outcomes are counted per agent in get_parse_metrics().
+        
+        Args:
+            response: The AI response text
+            schema: pydantic model or type to validate against (None: any JSON)
+            
+        Returns:
+            The validated value
+            
+        Raises:
+            StructuredOutputError: If the answer cannot be recovered
+        """
+        parser = StructuredOutputParser(self.name, schema)
+        return await parser.parse_with_reask(response, self.ai_provider)
+    
+    async def use_ai_stream(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.7,
+        task_class: Optional[str] = None
+    ) -> AsyncGenerator[str, None]:
+        """Streaming variant of use_ai().
+        
+        Yields text as the provider produces it and forwards every chunk to
+        stream_callback. Providers without stream_complete() yield their
+        whole completion as a single chunk.
+        
+        Args:
+            prompt: The prompt to send
+            system: Optional system prompt
+            max_tokens: Maximum tokens to generate
+            temperature: Temperature for generation
+            task_class: Optional task class routing the call to a model tier
+            
+        Yields:
+            Response text chunks (nothing if no provider or on error)
+        """
+        if not self.ai_provider:
+            return
+        
+        try:
+            async for chunk in self._iter_ai_chunks(prompt, system, max_tokens, temperature, task_class):
+                yield chunk
+        except Exception as e:
+            # In production, use proper logging
+            print(f"Error streaming AI: {e}")
+    
+    async def _iter_ai_chunks(
+        self,
+        prompt: str,
+        system: Optional[str],
+        max_tokens: int,
+        temperature: float,
+        task_class: Optional[str] = None
+    ) -> AsyncGenerator[str, None]:
+        """Stream chunks from the AI provider, forwarding them to stream_callback.
+        
+        Args:
+            prompt: The prompt to send
+            system: Optional system prompt
+            max_tokens: Maximum tokens to generate
+            temperature: Temperature for generation
+            task_class: Optional task class routing the call to a model tier
+            
+        Yields:
+            Response text chunks
+        """
+        options = {"task_class": task_class} if task_class else {}
+        stream_complete = getattr(self.ai_provider, "stream_complete", None)
+        if stream_complete is not None:
+            chunks = stream_complete(
+                prompt=prompt, system=system, max_tokens=max_tokens, temperature=temperature,
+                **options
+            )
+        else:
+            chunks = self._single_chunk(prompt, system, max_tokens, temperature, options)
+        
+        async for chunk in chunks:
+            if self.stream_callback:
+                forwarded = self.stream_callback(self.name, chunk)
+                if asyncio.iscoroutine(forwarded):
+                    await forwarded
+            yield chunk
+    
+    async def _single_chunk(
+        self,
+        prompt: str,
+        system: Optional[str],
+        max_tokens: int,
+        temperature: float,
+        options: Dict[str, Any]
+    ) -> AsyncGenerator[str, None]:
+        """Yield a non-streaming completion as one chunk."""
+        yield await self.ai_provider.complete(
+            prompt=prompt, system=system, max_tokens=max_tokens, temperature=temperature,
+            **options
+        )
+    
     def format_result(
         self,
         success: bool,
@@ -795,6 +971,9 @@ You always base your analysis on actual data and provide specific, measurable re
     ) -> None:
         """Log execution to Memory Hub.
         
+        The personal log (A_CTX) and the shared summary (S_CTX) are one
+        entry each, written concurrently with one write per context.
+        
         Args:
             task: The executed task
             result: The execution result
@@ -802,34 +981,35 @@ You always base your analysis on actual data and provide specific, measurable re
         if not self.memory_hub:
             return
         
-        # Log to agent's personal context
-        await self.write_memory(
-            ContextType.A_CTX,
-            f"{self.agent_id}_execution_{task.task_id}",
+        await self.write_memory_batch([
+            # Log to agent's personal context
             {
-                "task": task.dict(),
-                "result": {
-                    "success": result.success,
-                    "status": result.status.value,
-                    "error": result.error,
-                    "execution_time_ms": result.execution_time_ms,
-                    "tokens_used": result.tokens_used,
-                }
+                "context_type": ContextType.A_CTX,
+                "key": f"{self.agent_id}_execution_{task.task_id}",
+                "value": {
+                    "task": task.dict(),
+                    "result": {
+                        "success": result.success,
+                        "status": result.status.value,
+                        "error": result.error,
+                        "execution_time_ms": result.execution_time_ms,
+                        "tokens_used": result.tokens_used,
+                    }
+                },
+                "ttl_seconds": 86400,  # Keep for 24 hours
+                "tags": ["execution", self.name],
             },
-            ttl_seconds=86400,  # Keep for 24 hours
-            tags=["execution", self.name]
-        )
-        
-        # Log summary to shared context
-        await self.write_memory(
-            ContextType.S_CTX,
-            f"latest_execution_{self.agent_id}",
+            # Log summary to shared context
             {
-                "agent": self.name,
-                "task_intent": task.intent,
-                "success": result.success,
-                "timestamp": datetime.utcnow().isoformat()
+                "context_type": ContextType.S_CTX,
+                "key": f"latest_execution_{self.agent_id}",
+                "value": {
+                    "agent": self.name,
+                    "task_intent": task.intent,
+                    "success": result.success,
+                    "timestamp": datetime.utcnow().isoformat()
+                },
+                "ttl_seconds": 3600,  # Keep for 1 hour
+                "tags": ["latest", self.name],
             },
-            ttl_seconds=3600,  # Keep for 1 hour
-            tags=["latest", self.name]
-        )
\ No newline at end of file
+        ])
\ No newline at end of file
@@ -0,0 +1,505 @@
+"""Async transport for the Bedrock runtime API.
+
+Both BedrockAIProvider and AgentRuntime send their InvokeModel calls
+through a BedrockTransport so that LLM calls never block the event loop:
+
+- HTTP mode: SigV4-signed requests over a pooled aiohttp session with
+  keep-alive, so parallel agents share warm connections and overlap
+  their calls instead of queuing on a thread pool.
+- Executor mode: the boto3 client on a bounded, dedicated thread pool.
+  Used when aiohttp is missing or no AWS credentials can be resolved.
+
+``invoke_model_stream`` is the streaming counterpart
+(InvokeModelWithResponseStream): it yields the decoded model chunks as
+they arrive, decoding the AWS event-stream framing incrementally.
+
+Errors are raised as ``botocore.exceptions.ClientError`` in both modes,
+so the existing throttling/retry handling keeps working unchanged.
+
+``endpoint_url`` (or the ``BEDROCK_ENDPOINT_URL`` environment variable)
+points the transport at another endpoint, e.g. a local HTTP stand-in
+for tests. Requests to such an endpoint are sent unsigned when no
+credentials are available.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import json
+import logging
+import os
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Dict, Optional, Tuple, Union
+from urllib.parse import quote
+
+import boto3
+from botocore.auth import SigV4Auth
+from botocore.awsrequest import AWSRequest
+from botocore.config import Config
+from botocore.eventstream import EventStreamBuffer
+from botocore.exceptions import ClientError
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - aiohttp ships with the backend
+    aiohttp = None
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_CONNECTIONS = 32
+DEFAULT_KEEPALIVE_SECONDS = 60.0
+DEFAULT_TIMEOUT_SECONDS = 300.0
+DEFAULT_EXECUTOR_WORKERS = 8
+
+Body = Union[Dict[str, Any], str, bytes]
+
+# End-of-stream marker passed from the executor thread to the event loop
+_STREAM_END = object()
+
+
+class BedrockTransport:
+    """Non-blocking InvokeModel transport with connection pooling.
+
+    Attributes:
+        region: AWS region
+        endpoint_url: Bedrock runtime endpoint
+        mode: "http" (pooled aiohttp) or "executor" (boto3 on a thread pool)
+        max_connections: Size of the HTTP connection pool
+    """
+
+    def __init__(
+        self,
+        region: str = "us-east-1",
+        endpoint_url: Optional[str] = None,
+        aws_profile: Optional[str] = None,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        keepalive_seconds: float = DEFAULT_KEEPALIVE_SECONDS,
+        timeout_seconds: float = DEFAULT_TIMEOUT_SECONDS,
+        executor_workers: int = DEFAULT_EXECUTOR_WORKERS,
+        max_attempts: int = 3
+    ) -> None:
+        """Initialize the transport.
+
+        Args:
+            region: AWS region
+            endpoint_url: Endpoint override (default: regional Bedrock runtime)
+            aws_profile: Optional AWS profile name
+            max_connections: Maximum pooled HTTP connections
+            keepalive_seconds: How long idle connections are kept open
+            timeout_seconds: Total timeout of one request
+            executor_workers: Threads of the fallback executor
+            max_attempts: boto3 retry attempts in executor mode
+        """
+        self.region = region
+        self.endpoint_url = (
+            endpoint_url or f"https://bedrock-runtime.{region}.amazonaws.com"
+        ).rstrip("/")
+        self.max_connections = max_connections
+        self.keepalive_seconds = keepalive_seconds
+        self.timeout_seconds = timeout_seconds
+        self.executor_workers = executor_workers
+        self.max_attempts = max_attempts
+
+        self._boto_session = (
+            boto3.Session(profile_name=aws_profile) if aws_profile else boto3.Session()
+        )
+        self._credentials = self._boto_session.get_credentials()
+        self._signed = self._credentials is not None
+        self.mode = "http" if aiohttp is not None and (self._signed or endpoint_url) else "executor"
+
+        # One pooled session per event loop: loop -> (session, closer)
+        self._sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Tuple[Any, Any]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._client: Any = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._stats = {"requests": 0, "streams": 0, "errors": 0, "in_flight": 0, "max_in_flight": 0}
+
+        logger.debug(f"Bedrock transport ready (mode: {self.mode}, endpoint: {self.endpoint_url})")
+
+    async def invoke_model(
+        self,
+        model_id: str,
+        body: Body,
+        content_type: str = "application/json",
+        accept: str = "application/json"
+    ) -> Dict[str, Any]:
+        """Invoke a model and return the decoded response body.
+
+        Args:
+            model_id: Bedrock model ID
+            body: Request body (a dict is serialized as JSON)
+            content_type: Request content type
+            accept: Accepted response type
+
+        Returns:
+            The JSON response body
+
+        Raises:
+            ClientError: If Bedrock rejects the request
+        """
+        payload = _encode_body(body)
+        self._begin_request()
+        try:
+            if self.mode == "http":
+                return await self._invoke_http(model_id, payload, content_type, accept)
+            return await self._invoke_executor(model_id, payload, content_type, accept)
+        except Exception:
+            self._stats["errors"] += 1
+            raise
+        finally:
+            self._stats["in_flight"] -= 1
+
+    async def invoke_model_stream(
+        self,
+        model_id: str,
+        body: Body,
+        content_type: str = "application/json",
+        accept: str = "application/json"
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Invoke a model with a streamed response.
+
+        Args:
+            model_id: Bedrock model ID
+            body: Request body (a dict is serialized as JSON)
+            content_type: Request content type
+            accept: Accepted type of the chunk payloads
+
+        Yields:
+            Decoded JSON chunks in arrival order
+
+        Raises:
+            ClientError: If Bedrock rejects the request or fails mid-stream
+        """
+        payload = _encode_body(body)
+        self._begin_request()
+        self._stats["streams"] += 1
+        try:
+            if self.mode == "http":
+                chunks = self._stream_http(model_id, payload, content_type, accept)
+            else:
+                chunks = self._stream_executor(model_id, payload, content_type, accept)
+            async for chunk in chunks:
+                yield chunk
+        except Exception:
+            self._stats["errors"] += 1
+            raise
+        finally:
+            self._stats["in_flight"] -= 1
+
+    def _begin_request(self) -> None:
+        """Count a request as started."""
+        self._stats["requests"] += 1
+        self._stats["in_flight"] += 1
+        self._stats["max_in_flight"] = max(self._stats["max_in_flight"], self._stats["in_flight"])
+
+    async def _get_session(self) -> "aiohttp.ClientSession":
+        """Get the pooled HTTP session of the running event loop.
+
+        aiohttp sessions are bound to the loop that created them, so each
+        loop (e.g. the API loop and every analysis thread's loop) keeps its
+        own session. A session is closed when its loop shuts down its async
+        generators, which asyncio.run() does before closing the loop.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            entry = self._sessions.get(loop)
+            if entry is not None and not entry[0].closed:
+                return entry[0]
+
+            connector = aiohttp.TCPConnector(
+                limit=self.max_connections,
+                keepalive_timeout=self.keepalive_seconds,
+                ttl_dns_cache=300,
+            )
+            session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout_seconds),
+            )
+            closer = _close_on_loop_shutdown(session)
+            self._sessions[loop] = (session, closer)
+
+        # Registers the closer with the loop's async generator hooks
+        await closer.__anext__()
+        return session
+
+    def _sign(self, url: str, payload: bytes, headers: Dict[str, str]) -> Dict[str, str]:
+        """Add SigV4 authentication headers (unchanged when unsigned)."""
+        if not self._signed:
+            return headers
+        request = AWSRequest(method="POST", url=url, data=payload, headers=headers)
+        SigV4Auth(self._credentials.get_frozen_credentials(), "bedrock", self.region).add_auth(request)
+        return dict(request.headers.items())
+
+    async def _invoke_http(
+        self,
+        model_id: str,
+        payload: bytes,
+        content_type: str,
+        accept: str
+    ) -> Dict[str, Any]:
+        """Send InvokeModel over the pooled aiohttp session."""
+        url = f"{self.endpoint_url}/model/{quote(model_id, safe='')}/invoke"
+        headers = self._sign(url, payload, {"Content-Type": content_type, "Accept": accept})
+
+        session = await self._get_session()
+        async with session.post(url, data=payload, headers=headers) as response:
+            raw = await response.read()
+            if response.status >= 400:
+                raise _client_error(response.status, response.headers, raw)
+            return json.loads(raw)
+
+    async def _stream_http(
+        self,
+        model_id: str,
+        payload: bytes,
+        content_type: str,
+        accept: str
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Send InvokeModelWithResponseStream and decode the event stream."""
+        url = f"{self.endpoint_url}/model/{quote(model_id, safe='')}/invoke-with-response-stream"
+        headers = self._sign(url, payload, {
+            "Content-Type": content_type,
+            "Accept": "application/vnd.amazon.eventstream",
+            "X-Amzn-Bedrock-Accept": accept,
+        })
+
+        session = await self._get_session()
+        async with session.post(url, data=payload, headers=headers) as response:
+            if response.status >= 400:
+                raise _client_error(response.status, response.headers, await response.read())
+
+            buffer = EventStreamBuffer()
+            async for data in response.content.iter_any():
+                buffer.add_data(data)
+                for message in buffer:
+                    chunk = _decode_stream_message(message.headers, message.payload)
+                    if chunk is not None:
+                        yield chunk
+
+    def _get_client(self) -> Any:
+        """Get the boto3 client used in executor mode."""
+        with self._lock:
+            if self._client is None:
+                self._client = self._boto_session.client(
+                    service_name="bedrock-runtime",
+                    region_name=self.region,
+                    endpoint_url=None if self.endpoint_url.endswith(".amazonaws.com") else self.endpoint_url,
+                    config=Config(
+                        max_pool_connections=self.max_connections,
+                        retries={"max_attempts": self.max_attempts},
+                    ),
+                )
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.executor_workers, thread_name_prefix="bedrock"
+                )
+            return self._client
+
+    async def _invoke_executor(
+        self,
+        model_id: str,
+        payload: bytes,
+        content_type: str,
+        accept: str
+    ) -> Dict[str, Any]:
+        """Run the boto3 call on the dedicated executor."""
+        client = self._get_client()
+
+        def call() -> Dict[str, Any]:
+            response = client.invoke_model(
+                modelId=model_id, contentType=content_type, accept=accept, body=payload
+            )
+            return json.loads(response["body"].read())
+
+        return await asyncio.get_running_loop().run_in_executor(self._executor, call)
+
+    async def _stream_executor(
+        self,
+        model_id: str,
+        payload: bytes,
+        content_type: str,
+        accept: str
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Read the boto3 event stream on the executor, handing chunks to the loop."""
+        client = self._get_client()
+        loop = asyncio.get_running_loop()
+        queue: asyncio.Queue = asyncio.Queue()
+        stopped = threading.Event()
+
+        def read() -> None:
+            try:
+                response = client.invoke_model_with_response_stream(
+                    modelId=model_id, contentType=content_type, accept=accept, body=payload
+                )
+                for event in response["body"]:
+                    if stopped.is_set():
+                        response["body"].close()
+                        return
+                    if "chunk" in event:
+                        loop.call_soon_threadsafe(
+                            queue.put_nowait, json.loads(event["chunk"]["bytes"])
+                        )
+                loop.call_soon_threadsafe(queue.put_nowait, _STREAM_END)
+            except Exception as e:
+                loop.call_soon_threadsafe(queue.put_nowait, e)
+
+        loop.run_in_executor(self._executor, read)
+        try:
+            while True:
+                item = await queue.get()
+                if item is _STREAM_END:
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            # Lets the reader stop early when the consumer abandons the stream
+            stopped.set()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get transport statistics.
+
+        Returns:
+            Mode, pool size and request counters
+        """
+        return {
+            "mode": self.mode,
+            "endpoint_url": self.endpoint_url,
+            "max_connections": self.max_connections,
+            "sessions": len(self._sessions),
+            **self._stats,
+        }
+
+    async def close(self) -> None:
+        """Close the running loop's HTTP session and shut the executor down.
+
+        Sessions of other loops are closed when those loops shut down.
+        """
+        with self._lock:
+            entry = self._sessions.pop(asyncio.get_running_loop(), None)
+        if entry is not None:
+            await entry[1].aclose()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+async def _close_on_loop_shutdown(session: "aiohttp.ClientSession") -> AsyncIterator[None]:
+    """Hold a session open until the generator is closed, then close it."""
+    try:
+        yield
+    finally:
+        if not session.closed:
+            await session.close()
+
+
+def stream_chunk_text(chunk: Dict[str, Any]) -> str:
+    """Extract the generated text of one streamed model chunk.
+
+    Understands Claude Messages API deltas, Claude Text Completions and
+    Titan chunks.
+
+    Args:
+        chunk: Chunk yielded by invoke_model_stream()
+
+    Returns:
+        Text fragment ("" for events that carry no text)
+    """
+    if chunk.get("type") == "content_block_delta":
+        return chunk.get("delta", {}).get("text", "")
+    return chunk.get("completion") or chunk.get("outputText") or ""
+
+
+def _encode_body(body: Body) -> bytes:
+    """Serialize a request body."""
+    if isinstance(body, bytes):
+        return body
+    return (body if isinstance(body, str) else json.dumps(body)).encode("utf-8")
+
+
+def _decode_stream_message(headers: Dict[str, Any], payload: bytes) -> Optional[Dict[str, Any]]:
+    """Decode one event-stream message of InvokeModelWithResponseStream.
+
+    Returns:
+        The model chunk, or None for messages that carry no chunk
+
+    Raises:
+        ClientError: For exception and error messages
+    """
+    message_type = headers.get(":message-type")
+    if message_type == "event":
+        if headers.get(":event-type") != "chunk":
+            return None
+        return json.loads(base64.b64decode(json.loads(payload)["bytes"]))
+
+    if message_type == "exception":
+        code = headers.get(":exception-type", "ModelStreamErrorException")
+        try:
+            message = json.loads(payload).get("message", "")
+        except ValueError:
+            message = payload.decode("utf-8", "replace")
+    else:
+        code = headers.get(":error-code", "InternalServerException")
+        message = headers.get(":error-message", "")
+    raise ClientError(
+        {"Error": {"Code": code[:1].upper() + code[1:], "Message": message}},
+        "InvokeModelWithResponseStream",
+    )
+
+
+def _client_error(status: int, headers: Any, raw: bytes) -> ClientError:
+    """Convert an HTTP error response into a botocore ClientError."""
+    try:
+        data = json.loads(raw)
+    except ValueError:
+        data = {}
+    code = headers.get("x-amzn-ErrorType", "").split(":", 1)[0] or data.get("__type", "")
+    if not code:
+        code = "ThrottlingException" if status == 429 else f"HTTP{status}"
+    message = data.get("message") or data.get("Message") or raw.decode("utf-8", "replace")
+    return ClientError(
+        {
+            "Error": {"Code": code, "Message": message},
+            "ResponseMetadata": {"HTTPStatusCode": status},
+        },
+        "InvokeModel",
+    )
+
+
+_transports: Dict[Tuple[str, Optional[str], Optional[str]], BedrockTransport] = {}
+
+
+def get_bedrock_transport(
+    region: str = "us-east-1",
+    endpoint_url: Optional[str] = None,
+    aws_profile: Optional[str] = None
+) -> BedrockTransport:
+    """Get the shared transport for a region and endpoint.
+
+    Pool size comes from ``BEDROCK_MAX_CONNECTIONS`` and the endpoint
+    defaults to ``BEDROCK_ENDPOINT_URL`` when set.
+
+    Args:
+        region: AWS region
+        endpoint_url: Endpoint override
+        aws_profile: Optional AWS profile name
+
+    Returns:
+        BedrockTransport instance
+    """
+    endpoint_url = endpoint_url or os.getenv("BEDROCK_ENDPOINT_URL") or None
+    key = (region, endpoint_url, aws_profile)
+    transport = _transports.get(key)
+    if transport is None:
+        transport = _transports[key] = BedrockTransport(
+            region=region,
+            endpoint_url=endpoint_url,
+            aws_profile=aws_profile,
+            max_connections=int(os.getenv("BEDROCK_MAX_CONNECTIONS", str(DEFAULT_MAX_CONNECTIONS))),
+        )
+    return transport
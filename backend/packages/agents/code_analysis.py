@@ -376,40 +376,41 @@ Current code to analyze:
         # Prepare memory key
         key = f"analysis_{file_identifier.replace('/', '_')}_{analysis_type}_{time.time()}"
         
-        # Store in agent context with TTL
-        await self.write_memory(
-            ContextType.A_CTX,
-            key,
+        summary_key = f"latest_analysis_{self.agent_id}"
+        await self.write_memory_batch([
+            # Store in agent context with TTL
             {
-                "file": file_identifier,
-                "analysis_type": analysis_type,
-                "analysis": analysis,
-                "code_hash": hash(code),  # Store hash to detect changes
-                "code_lines": len(code.split("\n"))
+                "context_type": ContextType.A_CTX,
+                "key": key,
+                "value": {
+                    "file": file_identifier,
+                    "analysis_type": analysis_type,
+                    "analysis": analysis,
+                    "code_hash": hash(code),  # Store hash to detect changes
+                    "code_lines": len(code.split("\n"))
+                },
+                "ttl_seconds": 86400 * 7,  # Keep for 7 days
+                "tags": [
+                    "code_analysis",
+                    analysis_type,
+                    file_identifier.replace("/", "_")
+                ],
             },
-            ttl_seconds=86400 * 7,  # Keep for 7 days
-            tags=[
-                "code_analysis",
-                analysis_type,
-                file_identifier.replace("/", "_")
-            ]
-        )
-        
-        # Store summary in shared context
-        summary_key = f"latest_analysis_{self.agent_id}"
-        await self.write_memory(
-            ContextType.S_CTX,
-            summary_key,
+            # Store summary in shared context
             {
-                "file": file_identifier,
-                "type": analysis_type,
-                "summary": analysis.get("summary", "Analysis completed"),
-                "quality_score": analysis.get("quality_score"),
-                "issues_count": len(analysis.get("issues", [])) if "issues" in analysis else None
+                "context_type": ContextType.S_CTX,
+                "key": summary_key,
+                "value": {
+                    "file": file_identifier,
+                    "type": analysis_type,
+                    "summary": analysis.get("summary", "Analysis completed"),
+                    "quality_score": analysis.get("quality_score"),
+                    "issues_count": len(analysis.get("issues", [])) if "issues" in analysis else None
+                },
+                "ttl_seconds": 3600,  # Keep for 1 hour
+                "tags": ["latest", "analysis", self.name],
             },
-            ttl_seconds=3600,  # Keep for 1 hour
-            tags=["latest", "analysis", self.name]
-        )
+        ])
     
     async def _perform_dynamic_analysis(
         self,
@@ -477,7 +477,8 @@ Focus on maintainability, readability, and performance."""
             prompt=prompt,
             system_prompt=system_prompt,
             temperature=self.config.temperature,
-            max_tokens=self.config.max_tokens
+            max_tokens=self.config.max_tokens,
+            task_class="generate_code"
         )
         
         if not response.success:
@@ -530,7 +531,8 @@ Use appropriate testing framework for {target_language}."""
 
         response = await self.ai_provider.generate(
             prompt=prompt,
-            temperature=0.3  # 테스트는 더 deterministic하게
+            temperature=0.3,  # 테스트는 더 deterministic하게
+            task_class="generate_code"
         )
         
         if response.success:
@@ -673,14 +675,19 @@ Generated at: {datetime.now().isoformat()}
         if not self.memory_hub:
             return
         
-        for code in codes:
-            if code.success:
-                await self.memory_hub.put(
-                    context_type=ContextType.A_CTX,
-                    key=f"generated:{code.component_name}",
-                    value=code.code,
-                    ttl_seconds=86400
-                )
+        # 성공한 코드를 한 번에 저장
+        await self.memory_hub.put_many(
+            ContextType.A_CTX,
+            [
+                {
+                    "key": f"generated:{code.component_name}",
+                    "value": code.code,
+                    "ttl_seconds": 86400,
+                }
+                for code in codes
+                if code.success
+            ]
+        )
         
         logger.info(f"Stored {len(codes)} generated codes in memory")
     
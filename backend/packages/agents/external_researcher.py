@@ -90,6 +90,7 @@ import feedparser
 
 from .base import BaseAgent, AgentTask, AgentResult, TaskStatus
 from .ai_providers import get_ai_provider
+from .structured_output import StructuredOutputError
 from ..memory.contexts import ContextType
 from ..safety import CircuitBreaker, CircuitBreakerConfig, ResourceLimiter, ResourceLimit
 
@@ -308,16 +309,17 @@ class ExternalResearcher(BaseAgent):
                 key="requirements:latest"
             )
             
-            # Get requirement specification
-            req_spec = await self.memory_hub.search(
+            # Get requirement specification (values only, no tags/metadata)
+            req_spec = await self.memory_hub.query(
                 context_type=ContextType.A_CTX,
-                tags=["requirements", "RequirementAnalyzer"],
+                any_tags=["requirements", "RequirementAnalyzer"],
+                fields=["key", "value", "updated_at"],
                 limit=5
             )
             
             return {
                 "latest": req_report,
-                "specifications": req_spec
+                "specifications": req_spec["items"]
             }
         except Exception as e:
             logger.debug(f"Failed to get requirement reports: {e}")
@@ -353,16 +355,17 @@ class ExternalResearcher(BaseAgent):
                     key=f"latest_{report_type}_analysis"
                 )
                 
-                # Search for historical reports
-                historical = await self.memory_hub.search(
+                # Search for historical reports (values only, no tags/metadata)
+                historical = await self.memory_hub.query(
                     context_type=ContextType.A_CTX,
-                    tags=[report_type, agent_name],
+                    any_tags=[report_type, agent_name],
+                    fields=["key", "value", "updated_at"],
                     limit=3
                 )
                 
                 reports[report_type] = {
                     "latest": latest,
-                    "history": historical
+                    "history": historical["items"]
                 }
             except Exception as e:
                 logger.debug(f"Failed to get {report_type} reports: {e}")
@@ -539,8 +542,8 @@ class ExternalResearcher(BaseAgent):
             
             if isinstance(response, str):
                 try:
-                    data = json.loads(response)
-                except:
+                    data = await self.parse_ai_output(response, Dict[str, Any])
+                except StructuredOutputError:
                     data = {"analysis": response}
             else:
                 data = response
@@ -994,8 +997,8 @@ class ExternalResearcher(BaseAgent):
             
             if isinstance(response, str):
                 try:
-                    data = json.loads(response)
-                except:
+                    data = await self.parse_ai_output(response, Dict[str, Any])
+                except StructuredOutputError:
                     data = {"analysis": response}
             else:
                 data = response
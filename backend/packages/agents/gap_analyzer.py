@@ -229,8 +229,6 @@ class GapAnalyzer(BaseAgent):
         
         from ..memory.contexts import ContextType
         
-        reports = {}
-        
         # Fetch analysis reports
         analysis_types = [
             ("behavior", "BehaviorAnalyzer"),
@@ -239,19 +237,19 @@ class GapAnalyzer(BaseAgent):
             ("static", "StaticAnalyzer"),
             ("quality", "QualityGate")
         ]
+        keys = {f"latest_{report_type}_analysis": report_type for report_type, _ in analysis_types}
         
-        for report_type, agent_name in analysis_types:
-            try:
-                latest = await self.memory_hub.get(
-                    context_type=ContextType.S_CTX,
-                    key=f"latest_{report_type}_analysis"
-                )
-                if latest:
-                    reports[report_type] = latest
-            except Exception as e:
-                self.logger.debug(f"Failed to get {report_type} reports: {e}")
+        try:
+            # One lookup for every report instead of one per type
+            latest = await self.memory_hub.get_many(
+                context_type=ContextType.S_CTX,
+                keys=list(keys)
+            )
+        except Exception as e:
+            self.logger.debug(f"Failed to get analysis reports: {e}")
+            return {}
         
-        return reports
+        return {keys[key]: value for key, value in latest.items() if value}
     
     async def execute(self, task) -> AgentResult:
         """Execute test gap analysis.
@@ -82,6 +82,7 @@
 from __future__ import annotations
 
 import ast
+import asyncio
 import os
 import json
 from pathlib import Path
@@ -94,6 +95,7 @@ import networkx as nx
 from backend.packages.agents.base import BaseAgent, AgentResult, AgentTask, TaskStatus
 from backend.packages.agents.static_analyzer import StaticAnalyzer, CodebaseAnalysis
 from backend.packages.agents.ai_providers import get_ai_provider
+from backend.packages.agents.structured_output import StructuredOutputError, StructuredOutputParser
 from backend.packages.memory import ContextType, MemoryHub
 
 
@@ -185,6 +187,11 @@ class ImpactAnalyzer(BaseAgent):
     7. Suggest refactoring opportunities
     """
     
+    # Risk scoring packs this many change summaries into one AI prompt
+    RISK_BATCH_SIZE = 25
+    # Maximum number of scoring prompts in flight at once
+    RISK_BATCH_CONCURRENCY = 4
+    
     def __init__(
         self,
         memory_hub: Optional[MemoryHub] = None,
@@ -436,12 +443,11 @@ class ImpactAnalyzer(BaseAgent):
             impact.total_files_affected = len(unique_files)
             impact.blast_radius = len(all_impacts)
             
-            # Calculate risk score
-            # Use AI for risk assessment
-            impact.risk_score = await self._calculate_risk_score_with_ai(impact)
-            
             impacts.append(impact)
         
+        # Calculate risk scores with AI, many changes per prompt
+        await self._score_impacts(impacts)
+        
         return impacts
     
     def _find_test_impacts(
@@ -515,41 +521,124 @@ class ImpactAnalyzer(BaseAgent):
         Returns:
             Risk score (0-100)
         """
+        return (await self._score_batch([impact]))[0]
+    
+    async def _score_impacts(self, impacts: List[ChangeImpact]) -> None:
+        """Set risk_score on every impact using batched AI scoring.
+        
+        Impacts are split into batches of RISK_BATCH_SIZE and the batches
+        are scored concurrently, at most RISK_BATCH_CONCURRENCY at a time.
+        
+        Args:
+            impacts: Change impacts to score in place
+        """
+        batches = [
+            impacts[i:i + self.RISK_BATCH_SIZE]
+            for i in range(0, len(impacts), self.RISK_BATCH_SIZE)
+        ]
+        semaphore = asyncio.Semaphore(self.RISK_BATCH_CONCURRENCY)
+        
+        async def score(batch: List[ChangeImpact]) -> None:
+            async with semaphore:
+                scores = await self._score_batch(batch)
+            for impact, risk_score in zip(batch, scores):
+                impact.risk_score = risk_score
+        
+        await asyncio.gather(*(score(batch) for batch in batches))
+    
+    async def _score_batch(self, batch: List[ChangeImpact]) -> List[float]:
+        """Score a batch of change impacts with one AI call.
+        
+        Items the response does not score validly fall back to
+        _calculate_risk_score_fallback individually; if the call itself
+        fails, the whole batch falls back.
+        
+        Args:
+            batch: Change impacts to score
+            
+        Returns:
+            Risk scores (0-100) in batch order
+        """
         # Initialize AI provider if needed
         if not self.ai_provider:
             self.ai_provider = get_ai_provider()
         
-        # Prepare context for AI
-        context = {
-            "changed_file": impact.changed_file,
-            "changed_component": impact.changed_component,
-            "change_type": impact.change_type,
-            "direct_impacts": len(impact.direct_impacts),
-            "indirect_impacts": len(impact.indirect_impacts),
-            "blast_radius": impact.blast_radius
-        }
+        summaries = [
+            {
+                "id": index,
+                "changed_file": impact.changed_file,
+                "changed_component": impact.changed_component,
+                "change_type": impact.change_type,
+                "direct_impacts": len(impact.direct_impacts),
+                "indirect_impacts": len(impact.indirect_impacts),
+                "test_impacts": len(impact.test_impacts),
+                "downstream_impacts": len(impact.downstream_impacts),
+                "files_affected": impact.total_files_affected,
+                "blast_radius": impact.blast_radius
+            }
+            for index, impact in enumerate(batch)
+        ]
         
+        prompt = f"""Analyze these change impacts and provide a risk score (0-100) for each:
+{json.dumps(summaries, indent=2)}
+
+Return only a JSON array with one object per change, in any order:
+[{{"id": 0, "risk_score": 42}}]"""
+        
+        scores: Dict[int, float] = {}
         try:
-            prompt = f"""Analyze this change impact and provide risk score (0-100):
-            Change: {context['changed_component']} in {context['changed_file']}
-            Type: {context['change_type']}
-            Direct impacts: {context['direct_impacts']}
-            Indirect impacts: {context['indirect_impacts']}
-            Total affected: {context['blast_radius']}
-            
-            Return a number between 0-100 representing the risk level."""
-            
-            response = await self.ai_provider.analyze(prompt)
-            # Extract number from response
-            import re
-            numbers = re.findall(r'\d+', response)
-            if numbers:
-                return min(float(numbers[0]), 100)
+            response = await self.ai_provider.generate(
+                prompt,
+                system_prompt="You are a software change risk analyst. Answer with JSON only.",
+                max_tokens=200 + 30 * len(batch),
+                temperature=0.0,
+                task_class="classify"
+            )
+            if response.success:
+                scores = self._parse_batch_scores(response.content, len(batch))
+            else:
+                self.logger.debug(f"AI risk assessment failed: {response.error}")
         except Exception as e:
             self.logger.debug(f"AI risk assessment failed: {e}")
         
-        # Fallback to rule-based
-        return self._calculate_risk_score_fallback(impact)
+        if len(scores) < len(batch):
+            self.logger.debug(
+                f"AI scored {len(scores)}/{len(batch)} changes, using rule-based scores for the rest"
+            )
+        # Fallback to rule-based per item
+        return [
+            scores[index] if index in scores else self._calculate_risk_score_fallback(impact)
+            for index, impact in enumerate(batch)
+        ]
+    
+    def _parse_batch_scores(self, content: str, count: int) -> Dict[int, float]:
+        """Parse the scores of a batch scoring response.
+        
+        Args:
+            content: AI response text
+            count: Number of changes in the batch
+            
+        Returns:
+            Valid scores by change id (invalid or missing items are omitted)
+        """
+        # 잘린 응답도 받은 항목까지는 복구
+        try:
+            items = StructuredOutputParser("ImpactAnalyzer", List[Any]).parse(content)
+        except StructuredOutputError:
+            return {}
+        
+        scores: Dict[int, float] = {}
+        for item in items if isinstance(items, list) else []:
+            if not isinstance(item, dict):
+                continue
+            index, risk_score = item.get("id"), item.get("risk_score")
+            if (
+                isinstance(index, int) and 0 <= index < count
+                and isinstance(risk_score, (int, float)) and not isinstance(risk_score, bool)
+                and 0 <= risk_score <= 100
+            ):
+                scores[index] = float(risk_score)
+        return scores
     
     def _calculate_risk_score_fallback(self, impact: ChangeImpact) -> float:
         """Fallback rule-based risk calculation.
@@ -0,0 +1,326 @@
+"""Task-class based model routing for LLM calls.
+
+Callers declare what kind of call they make (``task_class``) instead of
+always using the provider's default model. A RoutingPolicy maps every
+TaskClass to a model, a max_tokens value and a timeout, so short
+structural jobs (classification, JSON extraction) run on a fast,
+Haiku-class model and only generation runs on the large model.
+
+The ModelRouter keeps latency, token and cost accounting per route.
+
+``routed_completion`` adds routing to a provider's ``complete`` or
+``stream_complete`` method: the wrapped method gains a ``task_class``
+keyword, and explicit ``model_id``/``max_tokens`` arguments still win over
+the route. The provider supplies the router through a ``model_router``
+attribute (None disables routing).
+
+Environment:
+    MODEL_ROUTE_<CLASS>: Route override as "model[:max_tokens[:timeout_seconds]]",
+        e.g. MODEL_ROUTE_CLASSIFY=claude-3-haiku:512:30
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+from ..memory.context_builder import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+
+class TaskClass(str, Enum):
+    """Kinds of LLM calls, from cheapest to most demanding."""
+
+    CLASSIFY = "classify"
+    EXTRACT = "extract"
+    SUMMARIZE = "summarize"
+    GENERATE_CODE = "generate_code"
+    REPORT = "report"
+
+
+@dataclass(frozen=True)
+class ModelRoute:
+    """Model settings of one task class.
+
+    Attributes:
+        model: Model name (BedrockAIProvider.MODELS key) or Bedrock model ID
+        max_tokens: Maximum tokens to generate
+        timeout_seconds: Time limit of one call
+    """
+
+    model: str
+    max_tokens: int
+    timeout_seconds: float
+
+
+DEFAULT_ROUTES: Dict[TaskClass, ModelRoute] = {
+    TaskClass.CLASSIFY: ModelRoute("claude-3-haiku", 512, 30),
+    TaskClass.EXTRACT: ModelRoute("claude-3-haiku", 2048, 60),
+    TaskClass.SUMMARIZE: ModelRoute("claude-3-haiku", 2048, 60),
+    TaskClass.GENERATE_CODE: ModelRoute("claude-3-5-sonnet", 8192, 300),
+    TaskClass.REPORT: ModelRoute("claude-3-5-sonnet", 4096, 180),
+}
+
+# USD per 1K (input, output) tokens, matched against the model ID
+MODEL_PRICES: Tuple[Tuple[str, Tuple[float, float]], ...] = (
+    ("haiku", (0.0008, 0.004)),
+    ("sonnet", (0.003, 0.015)),
+    ("opus", (0.015, 0.075)),
+    ("claude-instant", (0.0008, 0.0024)),
+    ("claude-v2", (0.008, 0.024)),
+    ("titan", (0.0002, 0.0006)),
+)
+
+
+def estimate_cost(model_id: str, input_tokens: int, output_tokens: int) -> float:
+    """Estimate the on-demand price of a call.
+
+    Args:
+        model_id: Bedrock model ID
+        input_tokens: Prompt tokens
+        output_tokens: Generated tokens
+
+    Returns:
+        Cost in USD (0.0 for models without a known price)
+    """
+    for marker, (input_price, output_price) in MODEL_PRICES:
+        if marker in model_id:
+            return (input_tokens * input_price + output_tokens * output_price) / 1000
+    return 0.0
+
+
+class RoutingPolicy:
+    """Mapping of task classes to model routes."""
+
+    def __init__(self, routes: Optional[Dict[TaskClass, ModelRoute]] = None) -> None:
+        """Initialize the policy.
+
+        Args:
+            routes: Routes overriding DEFAULT_ROUTES
+        """
+        self.routes = {**DEFAULT_ROUTES, **(routes or {})}
+
+    def route(self, task_class: Union[TaskClass, str]) -> ModelRoute:
+        """Get the route of a task class.
+
+        Args:
+            task_class: TaskClass or its value
+
+        Returns:
+            The model route
+
+        Raises:
+            ValueError: If the task class is unknown
+        """
+        return self.routes[TaskClass(task_class)]
+
+    @classmethod
+    def from_env(cls) -> "RoutingPolicy":
+        """Build the default policy with MODEL_ROUTE_<CLASS> overrides.
+
+        Returns:
+            RoutingPolicy instance
+        """
+        routes = {}
+        for task_class, default in DEFAULT_ROUTES.items():
+            value = os.getenv(f"MODEL_ROUTE_{task_class.name}")
+            if not value:
+                continue
+            model, _, rest = value.partition(":")
+            max_tokens, _, timeout = rest.partition(":")
+            routes[task_class] = ModelRoute(
+                model=model or default.model,
+                max_tokens=int(max_tokens) if max_tokens else default.max_tokens,
+                timeout_seconds=float(timeout) if timeout else default.timeout_seconds,
+            )
+        return cls(routes)
+
+
+class ModelRouter:
+    """Routes task classes to models and accounts for every routed call.
+
+    Attributes:
+        policy: Task class to route mapping
+    """
+
+    def __init__(self, policy: Optional[RoutingPolicy] = None) -> None:
+        """Initialize the router.
+
+        Args:
+            policy: Routing policy (default: RoutingPolicy())
+        """
+        self.policy = policy or RoutingPolicy()
+        self._stats: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def route(self, task_class: Union[TaskClass, str]) -> ModelRoute:
+        """Get the route of a task class.
+
+        Args:
+            task_class: TaskClass or its value
+
+        Returns:
+            The model route
+        """
+        return self.policy.route(task_class)
+
+    def record(
+        self,
+        task_class: Union[TaskClass, str],
+        model_id: str,
+        latency_seconds: float,
+        input_tokens: int,
+        output_tokens: int,
+        error: Optional[BaseException] = None
+    ) -> None:
+        """Account for one routed call.
+
+        Args:
+            task_class: Task class of the call
+            model_id: Model the call used
+            latency_seconds: Wall-clock duration
+            input_tokens: Prompt tokens
+            output_tokens: Generated tokens
+            error: Exception the call raised, if any
+        """
+        name = TaskClass(task_class).value
+        with self._lock:
+            stats = self._stats.setdefault(name, {
+                "calls": 0, "errors": 0, "timeouts": 0, "latency_seconds": 0.0,
+                "max_latency_seconds": 0.0, "input_tokens": 0, "output_tokens": 0,
+                "cost_usd": 0.0, "models": {},
+            })
+            stats["calls"] += 1
+            stats["latency_seconds"] += latency_seconds
+            stats["max_latency_seconds"] = max(stats["max_latency_seconds"], latency_seconds)
+            stats["input_tokens"] += input_tokens
+            stats["output_tokens"] += output_tokens
+            stats["cost_usd"] += estimate_cost(model_id, input_tokens, output_tokens)
+            stats["models"][model_id] = stats["models"].get(model_id, 0) + 1
+            if error is not None:
+                stats["errors"] += 1
+                if isinstance(error, asyncio.TimeoutError):
+                    stats["timeouts"] += 1
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get per-route accounting.
+
+        Returns:
+            Counters, mean latency, tokens and estimated cost by task class
+        """
+        with self._lock:
+            return {
+                name: {
+                    **stats,
+                    "models": dict(stats["models"]),
+                    "mean_latency_seconds": stats["latency_seconds"] / stats["calls"],
+                }
+                for name, stats in self._stats.items()
+            }
+
+
+def routed_completion(func: Callable) -> Callable:
+    """Add task-class routing to a provider completion method.
+
+    With ``task_class`` set, the route supplies model_id and max_tokens
+    unless the caller passed them, and a coroutine call is bounded by the
+    route timeout (asyncio.TimeoutError). Streams are routed and accounted
+    for but not time-limited.
+
+    Args:
+        func: Method taking prompt, system, max_tokens, temperature and model_id
+
+    Returns:
+        The wrapped method
+    """
+    signature = inspect.signature(func)
+
+    def prepare(self: Any, args: Tuple[Any, ...], kwargs: Dict[str, Any], task_class: Any):
+        """Apply the route to the call arguments (None when not routed)."""
+        router: Optional[ModelRouter] = getattr(self, "model_router", None)
+        if router is None or task_class is None:
+            return None, args, kwargs
+        route = router.route(task_class)
+        explicit = signature.bind_partial(
+            self, *args, **{name: value for name, value in kwargs.items() if name != "use_cache"}
+        ).arguments
+        kwargs = dict(kwargs)
+        if explicit.get("model_id") is None:
+            kwargs["model_id"] = getattr(self, "MODELS", {}).get(route.model, route.model)
+        if "max_tokens" not in explicit:
+            kwargs["max_tokens"] = route.max_tokens
+        call = signature.bind(self, *args, **{n: v for n, v in kwargs.items() if n != "use_cache"})
+        call.apply_defaults()
+        return (router, route, call.arguments), args, kwargs
+
+    def account(routed: Tuple[ModelRouter, ModelRoute, Dict[str, Any]], task_class: Any,
+                started: float, output: str, error: Optional[BaseException]) -> None:
+        """Record one routed call."""
+        router, _, call = routed
+        router.record(
+            task_class,
+            call["model_id"],
+            time.perf_counter() - started,
+            estimate_tokens(call["prompt"]) + estimate_tokens(call.get("system") or ""),
+            estimate_tokens(output),
+            error,
+        )
+
+    if inspect.isasyncgenfunction(func):
+        @functools.wraps(func)
+        async def stream_wrapper(self: Any, *args: Any, task_class: Any = None, **kwargs: Any):
+            routed, args, kwargs = prepare(self, args, kwargs, task_class)
+            if routed is None:
+                async for chunk in func(self, *args, **kwargs):
+                    yield chunk
+                return
+            started = time.perf_counter()
+            parts = []
+            try:
+                async for chunk in func(self, *args, **kwargs):
+                    parts.append(chunk)
+                    yield chunk
+            except Exception as e:
+                account(routed, task_class, started, "".join(parts), e)
+                raise
+            account(routed, task_class, started, "".join(parts), None)
+        return stream_wrapper
+
+    @functools.wraps(func)
+    async def wrapper(self: Any, *args: Any, task_class: Any = None, **kwargs: Any) -> str:
+        routed, args, kwargs = prepare(self, args, kwargs, task_class)
+        if routed is None:
+            return await func(self, *args, **kwargs)
+        started = time.perf_counter()
+        try:
+            response = await asyncio.wait_for(func(self, *args, **kwargs), routed[1].timeout_seconds)
+        except Exception as e:
+            account(routed, task_class, started, "", e)
+            raise
+        account(routed, task_class, started, response, None)
+        return response
+    return wrapper
+
+
+_router: Optional[ModelRouter] = None
+
+
+def get_model_router() -> ModelRouter:
+    """Get the process-wide model router.
+
+    Returns:
+        ModelRouter using RoutingPolicy.from_env()
+    """
+    global _router
+    if _router is None:
+        _router = ModelRouter(RoutingPolicy.from_env())
+    return _router
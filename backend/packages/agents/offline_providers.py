@@ -0,0 +1,520 @@
+"""Offline AI providers for replaying and load-testing the agent pipeline.
+
+- ReplayAIProvider records real ``complete()`` request/response pairs to
+  a JSONL cassette and replays them later without network access.
+- SyntheticAIProvider answers every call with JSON that is valid against
+  a configurable JSON Schema, after a latency drawn from a configurable
+  distribution, so SquadOrchestrator and AgentRuntime can be driven at
+  high concurrency on a laptop.
+
+Both are selected with ``get_ai_provider("replay" | "synthetic")`` or the
+``AI_PROVIDER`` environment variable (see ai_providers.get_ai_provider).
+
+Environment:
+    AI_CASSETTE_PATH: Cassette file of ReplayAIProvider
+    AI_REPLAY_MODE: "replay", "record" or "auto"
+    AI_SYNTHETIC_LATENCY: Latency distribution of SyntheticAIProvider
+    AI_SYNTHETIC_LATENCY_MS: Mean latency in milliseconds
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import math
+import random
+import re
+import threading
+from abc import abstractmethod
+from pathlib import Path
+from typing import Any, AsyncGenerator, Dict, List, Optional, Sequence, Tuple
+
+from .ai_cache import make_cache_key
+from .ai_providers import AIProvider, AIResponse, BedrockAIProvider
+from .model_router import ModelRouter, get_model_router
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CASSETTE_PATH = "/tmp/t-developer/cassettes/bedrock.jsonl"
+REPLAY_MODES = ("replay", "record", "auto")
+LATENCY_DISTRIBUTIONS = ("constant", "uniform", "normal", "lognormal", "exponential")
+
+# Answer shape used when no schema rule matches the prompt
+DEFAULT_SCHEMA: Dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "summary": {"type": "string"},
+        "score": {"type": "number", "minimum": 0, "maximum": 100},
+        "items": {"type": "array", "items": {"type": "string"}, "minItems": 1, "maxItems": 3},
+    },
+    "required": ["summary", "score", "items"],
+}
+
+
+class CassetteMissError(KeyError):
+    """Raised when a replayed request was never recorded."""
+
+
+class CompletionAIProvider(AIProvider):
+    """AIProvider whose generate/stream methods are built on complete()."""
+
+    default_model_id = "offline"
+
+    @abstractmethod
+    async def complete(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: float = 0.7,
+        model_id: Optional[str] = None,
+        **kwargs: Any
+    ) -> str:
+        """Generate a completion (same signature as BedrockAIProvider.complete)."""
+
+    async def stream_complete(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: float = 0.7,
+        model_id: Optional[str] = None,
+        **kwargs: Any
+    ) -> AsyncGenerator[str, None]:
+        """Yield the completion as a single chunk."""
+        yield await self.complete(prompt, system, max_tokens, temperature, model_id, **kwargs)
+
+    async def generate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        **kwargs: Any
+    ) -> AIResponse:
+        """Generate a response (AIProvider interface)."""
+        try:
+            content = await self.complete(
+                prompt=prompt,
+                system=system_prompt,
+                temperature=kwargs.get("temperature", 0.7),
+                **_call_options(kwargs)
+            )
+            return AIResponse(content=content, success=True, metadata={"provider": self.config["provider"]})
+        except Exception as e:
+            return AIResponse(
+                content="", success=False, error=str(e), metadata={"provider": self.config["provider"]}
+            )
+
+    async def stream_generate(
+        self,
+        prompt: str,
+        system_prompt: Optional[str] = None,
+        **kwargs: Any
+    ) -> AsyncGenerator[str, None]:
+        """Stream a response (AIProvider interface)."""
+        async for chunk in self.stream_complete(
+            prompt=prompt,
+            system=system_prompt,
+            temperature=kwargs.get("temperature", 0.7),
+            **_call_options(kwargs)
+        ):
+            yield chunk
+
+
+def _call_options(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Options of a generate() call that are passed on only when given.
+
+    model_id and max_tokens are left unset unless the caller chose them,
+    so a task_class route can fill them in.
+    """
+    return {key: kwargs[key] for key in ("max_tokens", "model_id", "task_class") if key in kwargs}
+
+
+class ReplayAIProvider(CompletionAIProvider):
+    """Records complete() calls to a cassette and replays them.
+
+    Modes:
+        replay: Answer only from the cassette (misses raise CassetteMissError)
+        record: Always call the upstream provider and append the pair
+        auto: Replay recorded requests, record the rest
+
+    A request recorded several times is replayed round-robin, so varied
+    high-temperature answers are preserved.
+
+    Calls with a ``task_class`` are keyed by the model and max_tokens its
+    route selects, like the upstream call they record.
+
+    Attributes:
+        cassette_path: JSONL file of recorded pairs
+        mode: One of REPLAY_MODES
+        upstream: Provider used for recording (e.g. BedrockAIProvider)
+        model_router: Router resolving task_class routes (None: no routing)
+    """
+
+    def __init__(
+        self,
+        cassette_path: str = DEFAULT_CASSETTE_PATH,
+        mode: str = "replay",
+        upstream: Optional[AIProvider] = None,
+        model_id: Optional[str] = None,
+        model_router: Optional[ModelRouter] = None
+    ) -> None:
+        """Initialize the provider and load the cassette.
+
+        Args:
+            cassette_path: JSONL file of recorded pairs
+            mode: One of REPLAY_MODES
+            upstream: Provider used for recording (required unless mode is "replay")
+            model_id: Model ID assumed for calls without one (default:
+                the upstream model, else the first recorded model)
+            model_router: Router resolving task_class routes (default: the
+                upstream's router, or the process-wide one when replaying)
+        """
+        if mode not in REPLAY_MODES:
+            raise ValueError(f"Unknown replay mode: {mode}. Expected one of {REPLAY_MODES}")
+        if mode != "replay" and upstream is None:
+            raise ValueError(f"Replay mode '{mode}' needs an upstream provider to record from")
+
+        self.cassette_path = Path(cassette_path)
+        self.mode = mode
+        self.upstream = upstream
+        if model_router is None:
+            model_router = getattr(upstream, "model_router", None) if upstream else get_model_router()
+        self.model_router = model_router
+        self._models = getattr(upstream, "MODELS", None) or BedrockAIProvider.MODELS
+        self._responses: Dict[str, List[str]] = {}
+        self._cursors: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._stats = {"replayed": 0, "recorded": 0, "misses": 0}
+
+        first_model = self._load()
+        self.default_model_id = (
+            model_id or getattr(upstream, "default_model_id", None) or first_model or "replay"
+        )
+        super().__init__({"provider": "replay", "model_id": self.default_model_id, "mode": mode})
+
+    def _load(self) -> Optional[str]:
+        """Read the cassette into memory.
+
+        Returns:
+            Model ID of the first recorded pair, if any
+        """
+        first_model = None
+        if not self.cassette_path.exists():
+            return first_model
+        with open(self.cassette_path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                entry = json.loads(line)
+                first_model = first_model or entry["request"]["model_id"]
+                self._responses.setdefault(entry["key"], []).append(entry["response"])
+        return first_model
+
+    def _resolve(
+        self,
+        model_id: Optional[str],
+        max_tokens: Optional[int],
+        task_class: Any
+    ) -> Tuple[str, int]:
+        """Model and max_tokens a call runs with; the route fills unset ones.
+
+        Returns:
+            (model ID, max_tokens)
+        """
+        route = None
+        if task_class is not None and self.model_router is not None:
+            route = self.model_router.route(task_class)
+        if model_id is None:
+            model_id = self._models.get(route.model, route.model) if route else self.default_model_id
+        if max_tokens is None:
+            max_tokens = route.max_tokens if route else 4096
+        return model_id, max_tokens
+
+    async def complete(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: float = 0.7,
+        model_id: Optional[str] = None,
+        **kwargs: Any
+    ) -> str:
+        """Replay or record one completion.
+
+        Args:
+            prompt: The user prompt
+            system: Optional system prompt
+            max_tokens: Maximum tokens to generate (default: the route's, else 4096)
+            temperature: Temperature for generation
+            model_id: Optional specific model ID (default: the route's model)
+            **kwargs: Passed to the upstream complete() when recording
+                (e.g. task_class)
+
+        Returns:
+            The recorded (or freshly recorded) completion
+
+        Raises:
+            CassetteMissError: If the request is not recorded in replay mode
+        """
+        # Only explicit choices are passed upstream, so its router still routes
+        options = dict(kwargs)
+        if model_id is not None:
+            options["model_id"] = model_id
+        if max_tokens is not None:
+            options["max_tokens"] = max_tokens
+        model_id, max_tokens = self._resolve(model_id, max_tokens, kwargs.get("task_class"))
+        key = make_cache_key(model_id, system, prompt, max_tokens, temperature)
+
+        if self.mode != "record":
+            with self._lock:
+                recorded = self._responses.get(key)
+                if recorded:
+                    cursor = self._cursors.get(key, 0)
+                    self._cursors[key] = cursor + 1
+                    self._stats["replayed"] += 1
+                    return recorded[cursor % len(recorded)]
+                self._stats["misses"] += 1
+            if self.mode == "replay":
+                raise CassetteMissError(f"No recorded response for request {key[:12]} in {self.cassette_path}")
+
+        response = await self.upstream.complete(
+            prompt=prompt,
+            system=system,
+            temperature=temperature,
+            **options
+        )
+        entry = {
+            "key": key,
+            "request": {
+                "model_id": model_id,
+                "system": system,
+                "prompt": prompt,
+                "max_tokens": max_tokens,
+                "temperature": temperature,
+            },
+            "response": response,
+        }
+        await asyncio.to_thread(self._append, entry)
+        return response
+
+    def _append(self, entry: Dict[str, Any]) -> None:
+        """Append a recorded pair to the cassette."""
+        with self._lock:
+            self.cassette_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cassette_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self._responses.setdefault(entry["key"], []).append(entry["response"])
+            self._stats["recorded"] += 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get replay statistics.
+
+        Returns:
+            Replayed/recorded/miss counters and the number of recorded requests
+        """
+        return {**self._stats, "recorded_requests": len(self._responses), "mode": self.mode}
+
+
+class LatencyModel:
+    """Random latency distribution.
+
+    Attributes:
+        distribution: One of LATENCY_DISTRIBUTIONS
+        mean_ms: Mean latency in milliseconds
+        spread: Shape parameter (relative std-dev for normal, sigma for
+            lognormal, half-width ratio for uniform)
+    """
+
+    def __init__(
+        self,
+        distribution: str = "lognormal",
+        mean_ms: float = 800.0,
+        spread: float = 0.5,
+        seed: Optional[int] = None
+    ) -> None:
+        """Initialize the distribution.
+
+        Args:
+            distribution: One of LATENCY_DISTRIBUTIONS
+            mean_ms: Mean latency in milliseconds
+            spread: Shape parameter of the distribution
+            seed: Random seed for reproducible runs
+        """
+        if distribution not in LATENCY_DISTRIBUTIONS:
+            raise ValueError(
+                f"Unknown latency distribution: {distribution}. Expected one of {LATENCY_DISTRIBUTIONS}"
+            )
+        self.distribution = distribution
+        self.mean_ms = mean_ms
+        self.spread = spread
+        self._rng = random.Random(seed)
+
+    def sample(self) -> float:
+        """Draw one latency.
+
+        Returns:
+            Latency in seconds (never negative)
+        """
+        mean = self.mean_ms
+        if self.distribution == "constant":
+            ms = mean
+        elif self.distribution == "uniform":
+            ms = self._rng.uniform(mean * (1 - self.spread), mean * (1 + self.spread))
+        elif self.distribution == "normal":
+            ms = self._rng.gauss(mean, mean * self.spread)
+        elif self.distribution == "lognormal":
+            # mu chosen so that the distribution mean equals mean_ms
+            ms = self._rng.lognormvariate(math.log(mean) - self.spread ** 2 / 2, self.spread)
+        else:
+            ms = self._rng.expovariate(1 / mean) if mean > 0 else 0.0
+        return max(ms, 0.0) / 1000
+
+
+class SyntheticAIProvider(CompletionAIProvider):
+    """Answers with schema-valid synthetic JSON after a simulated latency.
+
+    The schema of an answer is chosen by the first rule whose regex
+    matches the prompt, else ``schema`` (DEFAULT_SCHEMA by default).
+    Supported JSON Schema keywords: type, properties, required, items,
+    minItems, maxItems, enum, const, minimum, maximum, minLength,
+    maxLength.
+
+    Attributes:
+        latency: Latency distribution
+        schema: Fallback answer schema
+        rules: (prompt regex, schema) pairs checked in order
+    """
+
+    def __init__(
+        self,
+        latency: Optional[LatencyModel] = None,
+        schema: Optional[Dict[str, Any]] = None,
+        rules: Optional[Sequence[Tuple[str, Dict[str, Any]]]] = None,
+        seed: Optional[int] = None,
+        model_id: str = "synthetic"
+    ) -> None:
+        """Initialize the provider.
+
+        Args:
+            latency: Latency distribution (default: lognormal, 800ms mean)
+            schema: Fallback answer schema
+            rules: (prompt regex, schema) pairs checked in order
+            seed: Random seed of the generated values
+            model_id: Model ID reported for the calls
+        """
+        self.latency = latency or LatencyModel(seed=seed)
+        self.schema = schema or DEFAULT_SCHEMA
+        self.rules = [(re.compile(pattern, re.IGNORECASE), rule) for pattern, rule in rules or []]
+        self.default_model_id = model_id
+        self._rng = random.Random(seed)
+        self._stats = {"calls": 0, "in_flight": 0, "max_in_flight": 0, "latency_seconds": 0.0}
+        super().__init__({"provider": "synthetic", "model_id": model_id})
+
+    async def complete(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: float = 0.7,
+        model_id: Optional[str] = None,
+        **kwargs: Any
+    ) -> str:
+        """Return a synthetic JSON answer after a simulated latency.
+
+        Args:
+            prompt: The user prompt (selects the schema)
+            system: Ignored
+            max_tokens: Ignored
+            temperature: Ignored
+            model_id: Ignored
+            **kwargs: Ignored
+
+        Returns:
+            JSON text valid against the selected schema
+        """
+        delay = self.latency.sample()
+        self._stats["calls"] += 1
+        self._stats["in_flight"] += 1
+        self._stats["max_in_flight"] = max(self._stats["max_in_flight"], self._stats["in_flight"])
+        self._stats["latency_seconds"] += delay
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            self._stats["in_flight"] -= 1
+        return json.dumps(self.synthesize(self.schema_for(prompt)), ensure_ascii=False)
+
+    def schema_for(self, prompt: str) -> Dict[str, Any]:
+        """Select the answer schema of a prompt.
+
+        Args:
+            prompt: The user prompt
+
+        Returns:
+            Schema of the first matching rule, else the fallback schema
+        """
+        for pattern, schema in self.rules:
+            if pattern.search(prompt):
+                return schema
+        return self.schema
+
+    def synthesize(self, schema: Dict[str, Any]) -> Any:
+        """Generate a value valid against a JSON Schema.
+
+        Args:
+            schema: JSON Schema (subset, see class docstring)
+
+        Returns:
+            The generated value
+        """
+        if "const" in schema:
+            return schema["const"]
+        if "enum" in schema:
+            return self._rng.choice(schema["enum"])
+
+        kind = schema.get("type", "object")
+        if isinstance(kind, list):
+            kind = self._rng.choice(kind)
+
+        if kind == "object":
+            properties = schema.get("properties", {})
+            required = set(schema.get("required", properties))
+            return {
+                name: self.synthesize(sub_schema)
+                for name, sub_schema in properties.items()
+                if name in required or self._rng.random() < 0.5
+            }
+        if kind == "array":
+            low = schema.get("minItems", 0)
+            high = schema.get("maxItems", max(low, 3))
+            item_schema = schema.get("items", {"type": "string"})
+            return [self.synthesize(item_schema) for _ in range(self._rng.randint(low, high))]
+        if kind in ("number", "integer"):
+            low = schema.get("minimum", 0)
+            high = schema.get("maximum", max(low, 100))
+            if kind == "integer":
+                return self._rng.randint(math.ceil(low), math.floor(high))
+            return round(self._rng.uniform(low, high), 2)
+        if kind == "boolean":
+            return self._rng.random() < 0.5
+        if kind == "null":
+            return None
+
+        low = schema.get("minLength", 1)
+        high = max(schema.get("maxLength", 24), low)
+        length = self._rng.randint(low, high)
+        words = ("synthetic", "agent", "module", "change", "risk", "plan", "test", "api")
+        text = " ".join(self._rng.choice(words) for _ in range(length // 4 + 1))
+        return text[:length].ljust(low, "x")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get load statistics.
+
+        Returns:
+            Call count, peak concurrency and mean simulated latency
+        """
+        calls = self._stats["calls"]
+        return {
+            **self._stats,
+            "mean_latency_seconds": self._stats["latency_seconds"] / calls if calls else 0.0,
+        }
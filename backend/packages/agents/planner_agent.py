@@ -87,14 +87,42 @@ from typing import Dict, Any, List, Optional
 from datetime import datetime
 from dataclasses import dataclass, field
 
+from pydantic import BaseModel
+
 from .base import BaseAgent, AgentTask, AgentResult, TaskStatus
 from .ai_providers import BedrockAIProvider
+from .structured_output import StructuredOutputError
 from ..memory.contexts import ContextType
 from ..safety import CircuitBreaker, ResourceLimiter
 
 logger = logging.getLogger(__name__)
 
 
+class PlanGoals(BaseModel):
+    """목표 분석 응답 스키마."""
+    goals: List[str]
+
+
+class PlanPhases(BaseModel):
+    """단계 생성 응답 스키마."""
+    phases: List[Dict[str, Any]]
+
+
+class PlanTasks(BaseModel):
+    """작업 분해 응답 스키마."""
+    tasks: List[Dict[str, Any]]
+
+
+class PlanDependencies(BaseModel):
+    """의존성 매핑 응답 스키마."""
+    dependencies: Dict[str, List[str]]
+
+
+class PlanRisks(BaseModel):
+    """리스크 평가 응답 스키마."""
+    risks: List[Dict[str, Any]]
+
+
 @dataclass
 class ExecutionPlan:
     """실행 계획."""
@@ -329,12 +357,11 @@ class PlannerAgent(BaseAgent):
         }}
         """
         
-        response = await self.ai_provider.complete(prompt)
+        response = await self.ai_provider.complete(prompt, task_class="extract")
         
         try:
-            data = json.loads(response)
-            return data.get("goals", [])
-        except:
+            return (await self.parse_ai_output(response, PlanGoals)).goals
+        except StructuredOutputError:
             return ["Complete the requirement successfully"]
     
     async def _create_phases(self, goals: List[str], requirement: str) -> List[Dict[str, Any]]:
@@ -381,9 +408,8 @@ class PlannerAgent(BaseAgent):
         response = await self.ai_provider.complete(prompt)
         
         try:
-            data = json.loads(response)
-            return data.get("phases", [])
-        except:
+            return (await self.parse_ai_output(response, PlanPhases)).phases
+        except StructuredOutputError:
             return [
                 {
                     "name": "Analysis",
@@ -458,9 +484,8 @@ class PlannerAgent(BaseAgent):
         response = await self.ai_provider.complete(prompt)
         
         try:
-            data = json.loads(response)
-            return data.get("tasks", [])
-        except:
+            return (await self.parse_ai_output(response, PlanTasks)).tasks
+        except StructuredOutputError:
             # Fallback tasks
             tasks = []
             for i, phase in enumerate(phases):
@@ -504,12 +529,11 @@ class PlannerAgent(BaseAgent):
         }}
         """
         
-        response = await self.ai_provider.complete(prompt)
+        response = await self.ai_provider.complete(prompt, task_class="extract")
         
         try:
-            data = json.loads(response)
-            return data.get("dependencies", {})
-        except:
+            return (await self.parse_ai_output(response, PlanDependencies)).dependencies
+        except StructuredOutputError:
             # Simple sequential dependencies
             deps = {}
             for i in range(1, len(tasks)):
@@ -614,9 +638,8 @@ class PlannerAgent(BaseAgent):
         response = await self.ai_provider.complete(prompt)
         
         try:
-            data = json.loads(response)
-            return data.get("risks", [])
-        except:
+            return (await self.parse_ai_output(response, PlanRisks)).risks
+        except StructuredOutputError:
             return [
                 {
                     "description": "AI API failures",
@@ -0,0 +1,387 @@
+"""Process-wide rate limiting for Bedrock calls.
+
+Every model invocation from BedrockAIProvider and AgentRuntime passes
+through one shared BedrockRateLimiter, which combines:
+
+- a token bucket on requests per second,
+- a token bucket on model tokens per minute (estimated prompt tokens plus
+  ``max_tokens`` are reserved up front; the unused part is refunded once
+  the response size is known), and
+- AIMD adaptive concurrency: the number of calls in flight grows
+  additively while calls succeed and is halved when Bedrock answers with
+  ``ThrottlingException``.
+
+So parallel agents queue in front of the limiter instead of all hitting
+the quota at once and then retrying in lockstep.
+
+The limiter is thread-safe and not tied to an event loop, so analyses
+running on worker-thread loops (the upgrade API) share the same budget.
+
+Environment:
+    BEDROCK_REQUESTS_PER_SECOND, BEDROCK_TOKENS_PER_MINUTE,
+    BEDROCK_MAX_CONCURRENCY, BEDROCK_INITIAL_CONCURRENCY
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Tuple
+
+from botocore.exceptions import ClientError
+
+from ..memory.context_builder import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REQUESTS_PER_SECOND = 10.0
+DEFAULT_TOKENS_PER_MINUTE = 400_000
+DEFAULT_MAX_CONCURRENCY = 32
+DEFAULT_INITIAL_CONCURRENCY = 8
+
+# Seconds over which the throttle rate is reported
+_RATE_WINDOW_SECONDS = 60.0
+
+
+def estimate_request_tokens(prompt: str, system: Optional[str], max_tokens: int) -> int:
+    """Estimate the tokens a call may consume (input estimate + max_tokens).
+
+    Args:
+        prompt: User prompt
+        system: System prompt
+        max_tokens: Maximum tokens to generate
+
+    Returns:
+        Tokens to reserve in the tokens-per-minute bucket
+    """
+    return estimate_tokens(prompt) + estimate_tokens(system or "") + max_tokens
+
+
+class TokenBucket:
+    """Token bucket with reservations.
+
+    A reservation always succeeds and may drive the balance negative; the
+    caller then waits until the refill covers the debt. Waiters are thus
+    served in reservation order without any loop-bound primitive.
+
+    Attributes:
+        rate: Tokens added per second
+        capacity: Maximum balance (burst size)
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum balance (default: one second of refill)
+        """
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last update (lock held)."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self, amount: float) -> float:
+        """Take tokens from the bucket.
+
+        Args:
+            amount: Tokens to take
+
+        Returns:
+            Seconds to wait before the reservation is covered
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= amount
+            return max(0.0, -self._tokens / self.rate)
+
+    def refund(self, amount: float) -> None:
+        """Return unused tokens.
+
+        Args:
+            amount: Tokens to give back
+        """
+        with self._lock:
+            self._refill()
+            self._tokens = min(self.capacity, self._tokens + amount)
+
+    @property
+    def available(self) -> float:
+        """Current balance (negative while reservations are pending)."""
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+
+class AdaptiveConcurrency:
+    """AIMD concurrency limit shared across threads and event loops.
+
+    Attributes:
+        limit: Current number of calls allowed in flight
+        min_limit: Lower bound of the limit
+        max_limit: Upper bound of the limit
+        decrease_factor: Multiplier applied on throttling
+        cooldown_seconds: Minimum time between two decreases
+    """
+
+    def __init__(
+        self,
+        initial: float = DEFAULT_INITIAL_CONCURRENCY,
+        min_limit: float = 1,
+        max_limit: float = DEFAULT_MAX_CONCURRENCY,
+        decrease_factor: float = 0.5,
+        cooldown_seconds: float = 1.0
+    ) -> None:
+        """Initialize the limit.
+
+        Args:
+            initial: Starting limit
+            min_limit: Lower bound of the limit
+            max_limit: Upper bound of the limit
+            decrease_factor: Multiplier applied on throttling
+            cooldown_seconds: Minimum time between two decreases, so a burst
+                of throttled calls only halves the limit once
+        """
+        self.limit = float(initial)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self.cooldown_seconds = cooldown_seconds
+        self.in_flight = 0
+        self._last_decrease = 0.0
+        self._waiters: Deque[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+        self._lock = threading.Lock()
+
+    async def acquire(self) -> None:
+        """Wait for a free slot."""
+        while True:
+            with self._lock:
+                if self.in_flight < int(self.limit):
+                    self.in_flight += 1
+                    return
+                loop = asyncio.get_running_loop()
+                waiter = loop.create_future()
+                self._waiters.append((loop, waiter))
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                with self._lock:
+                    if (loop, waiter) in self._waiters:
+                        self._waiters.remove((loop, waiter))
+                    else:
+                        # Woken and cancelled at once: pass the wake-up on
+                        self._wake()
+                raise
+
+    def release(self) -> None:
+        """Free a slot taken by acquire()."""
+        with self._lock:
+            self.in_flight -= 1
+            self._wake()
+
+    def on_success(self) -> None:
+        """Additive increase: about +1 per limit's worth of successes."""
+        with self._lock:
+            self.limit = min(self.max_limit, self.limit + 1.0 / self.limit)
+            self._wake()
+
+    def on_throttle(self) -> bool:
+        """Multiplicative decrease (at most once per cooldown).
+
+        Returns:
+            True if the limit was decreased
+        """
+        with self._lock:
+            now = time.monotonic()
+            if now - self._last_decrease < self.cooldown_seconds:
+                return False
+            self._last_decrease = now
+            self.limit = max(self.min_limit, self.limit * self.decrease_factor)
+            logger.info(f"Bedrock throttled, concurrency limit lowered to {int(self.limit)}")
+            return True
+
+    def _wake(self) -> None:
+        """Wake as many waiters as there are free slots (lock held)."""
+        free = int(self.limit) - self.in_flight
+        while free > 0 and self._waiters:
+            loop, waiter = self._waiters.popleft()
+            try:
+                loop.call_soon_threadsafe(_resolve, waiter)
+            except RuntimeError:
+                continue  # The waiter's loop is closed
+            free -= 1
+
+
+def _resolve(waiter: asyncio.Future) -> None:
+    """Complete a waiter future unless it was cancelled."""
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class RatePermit:
+    """One admitted call; reports its real token usage back to the limiter.
+
+    Attributes:
+        reserved_tokens: Tokens reserved when the call was admitted
+    """
+
+    def __init__(self, limiter: "BedrockRateLimiter", reserved_tokens: int) -> None:
+        """Initialize the permit.
+
+        Args:
+            limiter: The limiter that admitted the call
+            reserved_tokens: Tokens reserved for the call
+        """
+        self._limiter = limiter
+        self.reserved_tokens = reserved_tokens
+
+    def settle(self, used_tokens: int) -> None:
+        """Refund the reserved tokens the call did not use.
+
+        Args:
+            used_tokens: Tokens the call actually consumed
+        """
+        unused = self.reserved_tokens - used_tokens
+        if unused > 0:
+            self._limiter.tokens.refund(unused)
+        self.reserved_tokens = used_tokens
+
+
+class BedrockRateLimiter:
+    """Shared request, token and concurrency limits for Bedrock calls.
+
+    Attributes:
+        requests: Requests-per-second bucket
+        tokens: Tokens-per-minute bucket
+        concurrency: Adaptive in-flight limit
+    """
+
+    def __init__(
+        self,
+        requests_per_second: float = DEFAULT_REQUESTS_PER_SECOND,
+        tokens_per_minute: float = DEFAULT_TOKENS_PER_MINUTE,
+        initial_concurrency: float = DEFAULT_INITIAL_CONCURRENCY,
+        max_concurrency: float = DEFAULT_MAX_CONCURRENCY
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            requests_per_second: Sustained request rate
+            tokens_per_minute: Sustained token rate (burst of one minute)
+            initial_concurrency: Starting in-flight limit
+            max_concurrency: Upper bound of the in-flight limit
+        """
+        self.requests = TokenBucket(requests_per_second)
+        self.tokens = TokenBucket(tokens_per_minute / 60.0, capacity=tokens_per_minute)
+        self.concurrency = AdaptiveConcurrency(
+            initial=min(initial_concurrency, max_concurrency), max_limit=max_concurrency
+        )
+        self._events: Deque[Tuple[float, bool]] = deque()  # (time, throttled)
+        self._stats = {"admitted": 0, "throttled": 0, "succeeded": 0, "wait_seconds": 0.0}
+        self._lock = threading.Lock()
+
+    @asynccontextmanager
+    async def limit(self, estimated_tokens: int = 0) -> AsyncIterator[RatePermit]:
+        """Admit one call, waiting for concurrency, request and token budget.
+
+        ThrottlingException raised inside the block lowers the concurrency
+        limit; a normal exit raises it.
+
+        Args:
+            estimated_tokens: Tokens to reserve (prompt estimate + max_tokens)
+
+        Yields:
+            RatePermit whose settle() refunds unused tokens
+        """
+        start = time.monotonic()
+        await self.concurrency.acquire()
+        try:
+            wait = max(self.requests.reserve(1), self.tokens.reserve(estimated_tokens))
+            if wait > 0:
+                await asyncio.sleep(wait)
+            with self._lock:
+                self._stats["admitted"] += 1
+                self._stats["wait_seconds"] += time.monotonic() - start
+
+            try:
+                yield RatePermit(self, estimated_tokens)
+            except ClientError as e:
+                if e.response.get("Error", {}).get("Code") == "ThrottlingException":
+                    self.concurrency.on_throttle()
+                    self._record(throttled=True)
+                raise
+            else:
+                self.concurrency.on_success()
+                self._record(throttled=False)
+        finally:
+            self.concurrency.release()
+
+    def _record(self, throttled: bool) -> None:
+        """Record a call outcome for the throttle rate."""
+        now = time.monotonic()
+        with self._lock:
+            self._stats["throttled" if throttled else "succeeded"] += 1
+            self._events.append((now, throttled))
+            while self._events and self._events[0][0] < now - _RATE_WINDOW_SECONDS:
+                self._events.popleft()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get limiter statistics.
+
+        Returns:
+            Counters, the current concurrency limit and the throttle rate
+            over the last minute
+        """
+        with self._lock:
+            recent: List[Tuple[float, bool]] = list(self._events)
+            stats = dict(self._stats)
+        throttled = sum(1 for _, was_throttled in recent if was_throttled)
+        return {
+            **stats,
+            "concurrency_limit": int(self.concurrency.limit),
+            "in_flight": self.concurrency.in_flight,
+            "throttle_rate": throttled / len(recent) if recent else 0.0,
+            "available_tokens": int(self.tokens.available),
+        }
+
+
+_limiter: Optional[BedrockRateLimiter] = None
+_limiter_lock = threading.Lock()
+
+
+def get_bedrock_rate_limiter() -> BedrockRateLimiter:
+    """Get the process-wide Bedrock rate limiter.
+
+    Returns:
+        BedrockRateLimiter configured from the environment
+    """
+    global _limiter
+    with _limiter_lock:
+        if _limiter is None:
+            _limiter = BedrockRateLimiter(
+                requests_per_second=float(
+                    os.getenv("BEDROCK_REQUESTS_PER_SECOND", str(DEFAULT_REQUESTS_PER_SECOND))
+                ),
+                tokens_per_minute=float(
+                    os.getenv("BEDROCK_TOKENS_PER_MINUTE", str(DEFAULT_TOKENS_PER_MINUTE))
+                ),
+                initial_concurrency=float(
+                    os.getenv("BEDROCK_INITIAL_CONCURRENCY", str(DEFAULT_INITIAL_CONCURRENCY))
+                ),
+                max_concurrency=float(
+                    os.getenv("BEDROCK_MAX_CONCURRENCY", str(DEFAULT_MAX_CONCURRENCY))
+                ),
+            )
+    return _limiter
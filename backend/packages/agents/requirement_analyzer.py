@@ -44,7 +44,6 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass, field
@@ -52,6 +51,7 @@ from datetime import datetime
 
 from .base import BaseAgent, AgentTask, AgentResult, TaskStatus
 from .ai_providers import get_ai_provider
+from .structured_output import StructuredOutputError
 from ..memory.contexts import ContextType
 
 logger = logging.getLogger(__name__)
@@ -270,7 +270,8 @@ Focus on clarity, completeness, and implementability."""
         response = await self.ai_provider.generate(
             prompt=prompt,
             system_prompt=system_prompt,
-            temperature=0.3  # 낮은 temperature로 일관성 있는 분석
+            temperature=0.3,  # 낮은 temperature로 일관성 있는 분석
+            task_class="extract"  # 구조화된 JSON 추출은 경량 모델로 충분
         )
         
         if not response.success:
@@ -278,16 +279,10 @@ Focus on clarity, completeness, and implementability."""
         
         # JSON 파싱
         try:
-            # JSON 추출
-            content = response.content
-            if "```json" in content:
-                json_start = content.find("```json") + 7
-                json_end = content.find("```", json_start)
-                content = content[json_start:json_end].strip()
+            # JSON 추출/복구, 실패 시 깨진 부분만 재요청
+            analysis = await self.parse_ai_output(response.content, Dict[str, Any])
             
-            analysis = json.loads(content)
-            
-        except json.JSONDecodeError as e:
+        except StructuredOutputError as e:
             logger.warning(f"Failed to parse JSON response: {e}")
             # 기본 구조 반환
             analysis = {
@@ -425,13 +420,17 @@ Focus on clarity, completeness, and implementability."""
             ttl_seconds=86400  # 24시간
         )
         
-        # 컴포넌트 정보 공유 메모리에 저장
-        for component in spec.components:
-            await self.memory_hub.put(
-                context_type=ContextType.S_CTX,  # SHARED 컨텍스트
-                key=f"component:identified:{component.get('name', 'unknown')}",
-                value=component,
-                ttl_seconds=86400
-            )
+        # 컴포넌트 정보 공유 메모리에 한 번에 저장
+        await self.memory_hub.put_many(
+            ContextType.S_CTX,  # SHARED 컨텍스트
+            [
+                {
+                    "key": f"component:identified:{component.get('name', 'unknown')}",
+                    "value": component,
+                    "ttl_seconds": 86400,
+                }
+                for component in spec.components
+            ]
+        )
         
         logger.info(f"Stored analysis with {len(spec.components)} components")
\ No newline at end of file
@@ -0,0 +1,132 @@
+"""Single-flight coalescing of identical in-flight LLM calls.
+
+Agents often send the same prompt at the same time (persona research,
+report generation, risk scoring). With single-flight, the first caller
+runs the Bedrock invocation and every concurrent caller with the same
+request key awaits that invocation's result instead of sending a
+duplicate request.
+
+The in-flight table is process-wide because each agent owns its own
+provider instance. Calls are only coalesced within one event loop; the
+shared call runs as its own task, so cancelling one waiter does not
+cancel the others.
+
+``coalesced_completion`` adds the layer to a provider's ``complete``
+method; the provider supplies the table through a ``single_flight``
+attribute (None disables coalescing).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from .ai_cache import make_cache_key
+
+
+class SingleFlight:
+    """Table of in-flight calls keyed by request key."""
+
+    def __init__(self) -> None:
+        """Initialize an empty table."""
+        self._calls: Dict[Tuple[asyncio.AbstractEventLoop, str], asyncio.Task] = {}
+        self._stats = {"calls": 0, "executed": 0, "coalesced": 0}
+        self._lock = threading.Lock()
+
+    async def do(self, key: str, call: Callable[[], Awaitable[Any]]) -> Any:
+        """Run call() unless an identical call is already in flight.
+
+        Args:
+            key: Request key; equal keys share one invocation
+            call: Coroutine factory performing the invocation
+
+        Returns:
+            The result of the shared invocation
+
+        Raises:
+            Exception: Whatever the shared invocation raised
+        """
+        loop = asyncio.get_running_loop()
+        flight_key = (loop, key)
+        with self._lock:
+            self._stats["calls"] += 1
+            task = self._calls.get(flight_key)
+            if task is None:
+                self._stats["executed"] += 1
+                task = self._calls[flight_key] = loop.create_task(call())
+                task.add_done_callback(lambda _: self._forget(flight_key, task))
+            else:
+                self._stats["coalesced"] += 1
+        return await asyncio.shield(task)
+
+    def _forget(self, flight_key: Tuple[asyncio.AbstractEventLoop, str], task: asyncio.Task) -> None:
+        """Drop a finished call from the table."""
+        with self._lock:
+            if self._calls.get(flight_key) is task:
+                del self._calls[flight_key]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get coalescing statistics.
+
+        Returns:
+            Call counters, the share of coalesced calls and calls in flight
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            in_flight = len(self._calls)
+        return {
+            **stats,
+            "coalesce_rate": stats["coalesced"] / stats["calls"] if stats["calls"] else 0.0,
+            "in_flight": in_flight,
+        }
+
+
+def coalesced_completion(func: Callable) -> Callable:
+    """Add single-flight coalescing to a provider completion method.
+
+    The request key covers model, prompts, max_tokens, temperature and the
+    ``use_cache`` flag, so callers opting out of the response cache never
+    share a cached answer.
+
+    Args:
+        func: Coroutine method taking prompt, system, max_tokens, temperature and model_id
+
+    Returns:
+        The wrapped method
+    """
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    async def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+        flights: Optional[SingleFlight] = getattr(self, "single_flight", None)
+        if flights is None:
+            return await func(self, *args, **kwargs)
+        # use_cache is added by cached_completion and absent from the signature
+        options = {name: value for name, value in kwargs.items() if name != "use_cache"}
+        params = signature.bind(self, *args, **options)
+        params.apply_defaults()
+        call = params.arguments
+        key = make_cache_key(
+            call.get("model_id") or getattr(self, "default_model_id", ""),
+            call.get("system"),
+            call["prompt"],
+            call["max_tokens"],
+            call["temperature"],
+        ) + ("" if kwargs.get("use_cache", True) else ":uncached")
+        return await flights.do(key, lambda: func(self, *args, **kwargs))
+    return wrapper
+
+
+_single_flight = SingleFlight()
+
+
+def get_single_flight() -> SingleFlight:
+    """Get the process-wide single-flight table.
+
+    Returns:
+        SingleFlight instance
+    """
+    return _single_flight
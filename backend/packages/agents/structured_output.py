@@ -0,0 +1,623 @@
+"""Structured-output parsing for LLM responses.
+
+Agents ask the model for JSON and used to ``json.loads`` the raw text,
+silently falling back (or re-prompting the whole request) when the model
+wrapped the JSON in prose or a code fence, left a trailing comma, or got
+cut off at max_tokens. This module recovers those answers in order of cost:
+
+1. extract_json: take the JSON out of a ```json fence or surrounding prose
+2. repair_json: fix what is mechanically fixable (unclosed strings,
+   brackets and braces of a truncated answer, trailing commas, Python
+   literals, raw newlines in strings) without another model call
+3. schema validation with pydantic (a BaseModel or any type TypeAdapter
+   accepts)
+4. a targeted re-ask: the model only sees the broken part (the excerpt
+   around a syntax error, or the JSON Pointers of the fields that failed
+   validation) and its fix is spliced back into the answer
+
+IncrementalJSONParser applies the same repair to a streamed answer, so
+partial structured results are available before the stream ends.
+
+ParseMetrics counts the outcome of every parse per agent (see
+get_parse_metrics).
+"""
+
+from __future__ import annotations
+
+import copy
+import functools
+import json
+import logging
+import re
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from pydantic import TypeAdapter, ValidationError
+
+logger = logging.getLogger(__name__)
+
+# Outcomes recorded by ParseMetrics
+OUTCOMES = ("parsed", "repaired", "reasked", "failed")
+
+_PAIRS = {"{": "}", "[": "]"}
+_LITERALS = {"True": "true", "False": "false", "None": "null"}
+_FENCE = re.compile(r"```[A-Za-z]*[ \t]*\n?(.*?)(?:```|\Z)", re.DOTALL)
+_STRING_END = r'"(?:[^"\\]|\\.)*"$'
+_MAX_CANDIDATES = 8
+_EXCERPT_CHARS = 200
+
+
+class StructuredOutputError(ValueError):
+    """Raised when a response cannot be turned into the expected structure.
+
+    Attributes:
+        raw: JSON text extracted from the response
+        position: Offset of the syntax error in raw (None for validation
+            errors and answers without JSON)
+        document: Parsed JSON that failed validation (None for syntax errors)
+        errors: Validation errors as {"path": JSON Pointer, "message": ...}
+    """
+
+    def __init__(
+        self,
+        message: str,
+        raw: str = "",
+        position: Optional[int] = None,
+        document: Any = None,
+        errors: Iterable[Dict[str, str]] = ()
+    ) -> None:
+        super().__init__(message)
+        self.raw = raw
+        self.position = position
+        self.document = document
+        self.errors = list(errors)
+
+    @property
+    def fixable(self) -> bool:
+        """Whether a targeted re-ask can fix the answer (it contains JSON)."""
+        return self.document is not None or self.position is not None
+
+
+class _JSONRepairer:
+    """Single-pass JSON scanner that can close a truncated document.
+
+    Text before the first ``{`` or ``[`` is skipped and text after the
+    matching close is ignored, so the scanner can be fed a raw (possibly
+    streamed) model answer.
+    """
+
+    def __init__(self) -> None:
+        self._out: List[str] = []
+        self._stack: List[str] = []
+        self._word: List[str] = []
+        self._in_string = False
+        self._escape = False
+        self.started = False
+        self.complete = False
+
+    def feed(self, text: str) -> "_JSONRepairer":
+        """Scan more text."""
+        out = self._out
+        for ch in text:
+            if self.complete:
+                break
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                    out.append(ch)
+                elif ch == "\\":
+                    self._escape = True
+                    out.append(ch)
+                elif ch == '"':
+                    self._in_string = False
+                    out.append(ch)
+                elif ch in "\n\r\t":
+                    out.append({"\n": "\\n", "\r": "\\r", "\t": "\\t"}[ch])
+                else:
+                    out.append(ch)
+                continue
+            if not self.started:
+                if ch not in _PAIRS:
+                    continue
+                self.started = True
+            if ch.isalnum() or ch in "_.+-":
+                self._word.append(ch)
+                continue
+            self._flush_word()
+            if ch == '"':
+                self._in_string = True
+                out.append(ch)
+            elif ch in _PAIRS:
+                self._stack.append(ch)
+                out.append(ch)
+            elif ch in "}]":
+                if not self._stack or _PAIRS[self._stack[-1]] != ch:
+                    continue  # stray closer
+                self._drop_trailing_comma(out)
+                self._stack.pop()
+                out.append(ch)
+                self.complete = not self._stack
+            else:
+                out.append(ch)
+        return self
+
+    def _flush_word(self) -> None:
+        """Emit a bare token (number or literal)."""
+        if self._word:
+            word = "".join(self._word)
+            self._out.append(_LITERALS.get(word, word))
+            self._word.clear()
+
+    @staticmethod
+    def _drop_trailing_comma(out: List[str]) -> None:
+        """Remove a comma (and whitespace) before a closing bracket."""
+        end = len(out)
+        while end and out[end - 1].isspace():
+            end -= 1
+        if end and out[end - 1] == ",":
+            del out[end - 1:]
+
+    def text(self) -> str:
+        """The repaired document (closed if the scan stopped mid-document).
+
+        Returns:
+            JSON text, or "" if no document started
+        """
+        if not self.started:
+            return ""
+        text = "".join(self._out)
+        if self._in_string:
+            if self._escape:
+                text = text[:-1]
+            text += '"'
+        if self.complete:
+            return text
+
+        # A bare token at the cut may be unfinished ("7" of "72", "fal"), so
+        # it is dropped along with its key rather than guessed
+        text = text.rstrip().rstrip(",").rstrip()
+        if self._stack[-1] == "{":
+            if text.endswith(":"):
+                # key without a value
+                text = re.sub(r',?\s*' + _STRING_END[:-1] + r'\s*:$', "", text)
+            else:
+                dangling_key = re.search(r'([{,])\s*' + _STRING_END, text)
+                if dangling_key:
+                    text = text[:dangling_key.start()] + ("{" if dangling_key.group(1) == "{" else "")
+            text = text.rstrip().rstrip(",")
+        return text + "".join(_PAIRS[opener] for opener in reversed(self._stack))
+
+
+def repair_json(text: str) -> str:
+    """Mechanically repair a JSON document.
+
+    Closes unterminated strings, arrays and objects (dropping a dangling
+    key, and a number or literal cut off at the end together with its
+    key), removes trailing commas, converts Python literals and escapes
+    raw control characters inside strings. Text before the first bracket
+    and after the document is dropped.
+
+    Args:
+        text: Broken or truncated JSON
+
+    Returns:
+        Repaired JSON text ("" if the text holds no object or array)
+    """
+    return _JSONRepairer().feed(text).text()
+
+
+def _balanced_end(text: str, start: int) -> int:
+    """Offset just past the bracket closing the one at start (or len(text))."""
+    depth = 0
+    in_string = escape = False
+    for i in range(start, len(text)):
+        ch = text[i]
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == "\\":
+                escape = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch in "{[":
+            depth += 1
+        elif ch in "}]":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+    return len(text)
+
+
+def extract_json(text: str) -> str:
+    """Extract the JSON document of a model answer.
+
+    Fenced code blocks are preferred over the surrounding prose. Within a
+    block, the longest top-level ``{``/``[`` span that parses wins (so a
+    "[1]" in the prose does not shadow the answer); otherwise the longest
+    span is returned for repair. Spans nested in an earlier span are not
+    candidates, so a truncated document is repaired as a whole.
+
+    Args:
+        text: Model answer
+
+    Returns:
+        JSON text ("" if the answer has no object or array)
+    """
+    fallback = ""
+    for block in [match.group(1) for match in _FENCE.finditer(text)] + [text]:
+        best = ""
+        end = 0
+        for _ in range(_MAX_CANDIDATES):
+            start = min((i for i in (block.find("{", end), block.find("[", end)) if i >= 0), default=-1)
+            if start < 0:
+                break
+            end = _balanced_end(block, start)
+            span = block[start:end]
+            try:
+                json.loads(span)
+            except ValueError:
+                if len(span) > len(fallback):
+                    fallback = span
+                continue
+            if len(span) > len(best):
+                best = span
+        if best:
+            return best
+    return fallback
+
+
+def loads_lenient(text: str) -> Tuple[Any, bool]:
+    """Parse a model answer as JSON, repairing it if needed.
+
+    Args:
+        text: Model answer
+
+    Returns:
+        (value, whether repair was needed)
+
+    Raises:
+        StructuredOutputError: If no JSON can be recovered
+    """
+    raw = extract_json(text)
+    if not raw:
+        raise StructuredOutputError("No JSON object or array in the response", raw=text)
+    try:
+        return json.loads(raw), False
+    except json.JSONDecodeError as e:
+        error = e
+    try:
+        return json.loads(repair_json(raw)), True
+    except json.JSONDecodeError:
+        raise StructuredOutputError(f"Invalid JSON: {error.msg}", raw=raw, position=error.pos) from error
+
+
+@functools.lru_cache(maxsize=256)
+def _adapter(schema: Any) -> TypeAdapter:
+    """Cached TypeAdapter of a schema type."""
+    return TypeAdapter(schema)
+
+
+def _pointer(location: Iterable[Any]) -> str:
+    """JSON Pointer of a pydantic error location."""
+    return "".join("/" + str(part).replace("~", "~0").replace("/", "~1") for part in location)
+
+
+def set_pointer(document: Any, pointer: str, value: Any) -> Any:
+    """Set the value at a JSON Pointer, creating missing objects.
+
+    Args:
+        document: JSON document (modified in place)
+        pointer: JSON Pointer ("" replaces the document)
+        value: New value
+
+    Returns:
+        The updated document
+    """
+    if not pointer:
+        return value
+    parts = [part.replace("~1", "/").replace("~0", "~") for part in pointer.lstrip("/").split("/")]
+    target = document
+    for part, next_part in zip(parts, parts[1:]):
+        if isinstance(target, list):
+            target = target[int(part)]
+        else:
+            target = target.setdefault(part, [] if next_part.isdigit() else {})
+    last = parts[-1]
+    if isinstance(target, list):
+        index = int(last)
+        if index == len(target):
+            target.append(value)
+        else:
+            target[index] = value
+    else:
+        target[last] = value
+    return document
+
+
+class ParseMetrics:
+    """Per-agent counters of structured-output parse outcomes.
+
+    Outcomes:
+        parsed: Valid on the first try
+        repaired: Valid after extraction/mechanical repair
+        reasked: Valid after a targeted re-ask
+        failed: Not recovered
+    """
+
+    def __init__(self) -> None:
+        self._counts: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, agent_name: str, outcome: str) -> None:
+        """Count one parse.
+
+        Args:
+            agent_name: Agent that parsed the response
+            outcome: One of OUTCOMES
+        """
+        with self._lock:
+            counts = self._counts.setdefault(agent_name, dict.fromkeys(OUTCOMES, 0))
+            counts[outcome] += 1
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Get per-agent counts and rates.
+
+        Returns:
+            Outcome counts, failure_rate (responses that needed a re-ask or
+            failed) and unrecovered_rate (responses that failed) by agent
+        """
+        with self._lock:
+            stats = {}
+            for agent_name, counts in self._counts.items():
+                calls = sum(counts.values())
+                stats[agent_name] = {
+                    **counts,
+                    "calls": calls,
+                    "failure_rate": (counts["reasked"] + counts["failed"]) / calls,
+                    "unrecovered_rate": counts["failed"] / calls,
+                }
+            return stats
+
+
+class StructuredOutputParser:
+    """Parses an agent's model answers into a schema.
+
+    Attributes:
+        agent_name: Agent the metrics are recorded for
+        schema: pydantic model or type the answer must match (None: any JSON)
+        max_reasks: Targeted re-asks before giving up
+    """
+
+    def __init__(
+        self,
+        agent_name: str,
+        schema: Any = None,
+        max_reasks: int = 1,
+        metrics: Optional[ParseMetrics] = None
+    ) -> None:
+        """Initialize the parser.
+
+        Args:
+            agent_name: Agent the metrics are recorded for
+            schema: pydantic model or type the answer must match
+            max_reasks: Targeted re-asks before giving up
+            metrics: Outcome counters (default: the process-wide counters)
+        """
+        self.agent_name = agent_name
+        self.schema = schema
+        self.max_reasks = max_reasks
+        self.metrics = metrics or get_parse_metrics()
+
+    def parse(self, text: str) -> Any:
+        """Parse an answer without re-asking.
+
+        Args:
+            text: Model answer
+
+        Returns:
+            The validated value (a model instance for BaseModel schemas)
+
+        Raises:
+            StructuredOutputError: If the answer cannot be recovered
+        """
+        try:
+            value, repaired = self._parse(text)
+        except StructuredOutputError:
+            self.metrics.record(self.agent_name, "failed")
+            raise
+        self.metrics.record(self.agent_name, "repaired" if repaired else "parsed")
+        return value
+
+    async def parse_with_reask(self, text: str, ai_provider: Any) -> Any:
+        """Parse an answer, re-asking the model to fix only the broken part.
+
+        Args:
+            text: Model answer
+            ai_provider: Provider whose complete() answers the re-ask
+                (None disables re-asking)
+
+        Returns:
+            The validated value
+
+        Raises:
+            StructuredOutputError: If the answer cannot be recovered
+        """
+        try:
+            value, repaired = self._parse(text)
+            self.metrics.record(self.agent_name, "repaired" if repaired else "parsed")
+            return value
+        except StructuredOutputError as e:
+            error = e
+
+        for _ in range(self.max_reasks if ai_provider is not None else 0):
+            if not error.fixable:
+                break
+            try:
+                fix = await ai_provider.complete(
+                    self._reask_prompt(error), temperature=0.0, task_class="extract"
+                )
+                value = self._apply_fix(error, fix)
+            except StructuredOutputError as e:
+                error = e
+                continue
+            except Exception as e:
+                logger.warning(f"{self.agent_name}: structured-output re-ask failed: {e}")
+                break
+            self.metrics.record(self.agent_name, "reasked")
+            return value
+
+        self.metrics.record(self.agent_name, "failed")
+        raise error
+
+    def _parse(self, text: str) -> Tuple[Any, bool]:
+        """Parse and validate (value, repaired) without recording metrics."""
+        document, repaired = loads_lenient(text)
+        return self._validate(document), repaired
+
+    def _validate(self, document: Any) -> Any:
+        """Validate a parsed document against the schema."""
+        if self.schema is None:
+            return document
+        try:
+            return _adapter(self.schema).validate_python(document)
+        except ValidationError as e:
+            errors = [
+                {"path": _pointer(error["loc"]), "message": error["msg"]}
+                for error in e.errors()
+            ]
+            raise StructuredOutputError(
+                f"Response does not match the schema: {len(errors)} error(s)",
+                raw=json.dumps(document, ensure_ascii=False),
+                document=document,
+                errors=errors
+            ) from e
+
+    def _reask_prompt(self, error: StructuredOutputError) -> str:
+        """Build a re-ask prompt that shows only the broken part."""
+        if error.document is None:
+            start, end = self._excerpt_bounds(error)
+            return (
+                "The following excerpt of a JSON document is malformed "
+                f"({error}).\n\n"
+                f"<excerpt>\n{error.raw[start:end]}\n</excerpt>\n\n"
+                "Return only the corrected excerpt, covering exactly the same "
+                "part of the document, with no explanation."
+            )
+
+        fields = "\n".join(
+            f"- {item['path'] or '/'}: {item['message']} "
+            f"(current value: {json.dumps(_lookup(error.document, item['path']), ensure_ascii=False)})"
+            for item in error.errors
+        )
+        return (
+            "Some fields of a JSON answer are invalid:\n"
+            f"{fields}\n\n"
+            "Return only a JSON object that maps each listed JSON Pointer to its "
+            'corrected value, e.g. {"/tasks/0/id": "task_001"}.'
+        )
+
+    def _apply_fix(self, error: StructuredOutputError, fix: str) -> Any:
+        """Splice the model's fix into the broken answer and validate it."""
+        if error.document is None:
+            start, end = self._excerpt_bounds(error)
+            fence = _FENCE.search(fix)
+            excerpt = (fence.group(1) if fence else fix).strip()
+            excerpt = re.sub(r"^<excerpt>\s*|\s*</excerpt>$", "", excerpt)
+            value, _ = self._parse(error.raw[:start] + excerpt + error.raw[end:])
+            return value
+
+        patches, _ = loads_lenient(fix)
+        if not isinstance(patches, dict):
+            raise StructuredOutputError("Re-ask answer is not a JSON object", raw=fix)
+        document = copy.deepcopy(error.document)
+        for pointer, value in patches.items():
+            document = set_pointer(document, pointer if pointer != "/" else "", value)
+        return self._validate(document)
+
+    @staticmethod
+    def _excerpt_bounds(error: StructuredOutputError) -> Tuple[int, int]:
+        """Bounds of the excerpt around a syntax error."""
+        position = error.position or 0
+        return max(position - _EXCERPT_CHARS, 0), min(position + _EXCERPT_CHARS, len(error.raw))
+
+
+def _lookup(document: Any, pointer: str) -> Any:
+    """Value at a JSON Pointer (None if missing)."""
+    target = document
+    for part in pointer.split("/")[1:]:
+        part = part.replace("~1", "/").replace("~0", "~")
+        try:
+            target = target[int(part)] if isinstance(target, list) else target[part]
+        except (KeyError, IndexError, TypeError, ValueError):
+            return None
+    return target
+
+
+class IncrementalJSONParser:
+    """Repairs a streamed JSON answer chunk by chunk.
+
+    feed() returns the best-effort value of everything received so far,
+    so callers can act on partial structured results (e.g. the first
+    tasks of a plan) before the stream ends.
+    """
+
+    def __init__(self) -> None:
+        self._repairer = _JSONRepairer()
+        self._buffer: List[str] = []
+
+    def feed(self, chunk: str) -> Any:
+        """Add a chunk.
+
+        Args:
+            chunk: Next streamed text fragment
+
+        Returns:
+            The value parsed so far (None until a document starts)
+        """
+        self._buffer.append(chunk)
+        self._repairer.feed(chunk)
+        return self.value()
+
+    @property
+    def complete(self) -> bool:
+        """Whether the closing bracket of the document has arrived."""
+        return self._repairer.complete
+
+    def value(self) -> Any:
+        """Best-effort value of the text received so far."""
+        text = self._repairer.text()
+        if not text:
+            return None
+        try:
+            return json.loads(text)
+        except json.JSONDecodeError:
+            return None
+
+    def close(self) -> Any:
+        """Finish the stream.
+
+        Returns:
+            The parsed value
+
+        Raises:
+            StructuredOutputError: If the stream holds no recoverable JSON
+        """
+        value, _ = loads_lenient("".join(self._buffer))
+        return value
+
+
+_metrics: Optional[ParseMetrics] = None
+
+
+def get_parse_metrics() -> ParseMetrics:
+    """Get the process-wide parse outcome counters.
+
+    Returns:
+        ParseMetrics instance
+    """
+    global _metrics
+    if _metrics is None:
+        _metrics = ParseMetrics()
+    return _metrics
@@ -78,6 +78,7 @@ import asyncio
 import logging
 
 from .base import BaseAgent
+from .structured_output import StructuredOutputError
 
 logger = logging.getLogger(__name__)
 from .ai_providers import BedrockAIProvider
@@ -196,7 +197,7 @@ class SystemArchitect(BaseAgent):
         response = await self.ai_provider.complete(prompt)
         
         # 설계 파싱 및 검증
-        design = self._parse_architecture_design(response)
+        design = await self._parse_architecture_design(response)
         
         # 메모리에 저장 (메모리 허브가 있는 경우만)
         if self.memory_hub:
@@ -339,29 +340,11 @@ class SystemArchitect(BaseAgent):
         
         return prompt
     
-    def _parse_architecture_design(self, response: str) -> ArchitectureDesign:
-        """AI 응답을 아키텍처 설계로 파싱"""
+    async def _parse_architecture_design(self, response: str) -> ArchitectureDesign:
+        """AI 응답을 아키텍처 설계로 파싱 (스키마 검증 실패 시 깨진 필드만 재요청)"""
         try:
-            # JSON 추출
-            import re
-            json_match = re.search(r'\{.*\}', response, re.DOTALL)
-            if json_match:
-                design_dict = json.loads(json_match.group())
-            else:
-                # Fallback to basic design
-                design_dict = self._create_fallback_design()
-            
-            # ArchitectureDesign 객체 생성
-            return ArchitectureDesign(
-                agents=[AgentDesign(**agent) for agent in design_dict.get("agents", [])],
-                orchestrator=OrchestratorDesign(**design_dict.get("orchestrator", {})),
-                data_flows=[DataFlow(**flow) for flow in design_dict.get("data_flows", [])],
-                rationale=design_dict.get("rationale", ""),
-                trade_offs=design_dict.get("trade_offs", []),
-                estimated_complexity=design_dict.get("estimated_complexity", 5)
-            )
-            
-        except Exception as e:
+            return await self.parse_ai_output(response, ArchitectureDesign)
+        except StructuredOutputError as e:
             logger.error(f"Failed to parse architecture design: {e}")
             return self._create_fallback_design()
     
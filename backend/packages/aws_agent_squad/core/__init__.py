@@ -4,12 +4,17 @@ AWS Agent Squad 프레임워크의 핵심 모듈입니다.
 Bedrock AgentCore 런타임과 통합하여 에이전트 실행을 관리합니다.
 """
 
+from .agent_dag import AgentDAG
 from .agent_runtime import AgentRuntime, RuntimeConfig
+from .result_memo import ProjectDigest, ResultMemo
 from .squad_orchestrator import SquadOrchestrator, SquadConfig
 
 __all__ = [
+    "AgentDAG",
     "AgentRuntime",
     "RuntimeConfig", 
+    "ProjectDigest",
+    "ResultMemo",
     "SquadOrchestrator",
     "SquadConfig"
 ]
\ No newline at end of file
@@ -0,0 +1,276 @@
+"""에이전트 의존성 DAG와 ready-queue 스케줄러.
+
+각 에이전트가 읽는 문서(다른 에이전트의 보고서)로 의존성 그래프를 선언하고,
+입력 문서가 모두 준비된 에이전트부터 최대 동시 실행 수 안에서 바로 시작합니다.
+고정된 단계(phase) 순서 대신 그래프가 병렬성을 결정하므로, 예를 들어
+상태 분석 에이전트들은 요구사항 분석과 동시에 시작하고 PlannerAgent와
+TaskCreatorAgent는 갭 분석이 끝나면 함께 실행됩니다.
+
+실행이 끝나면 실제 소요 시간으로 임계 경로(critical path)를 계산합니다.
+임계 경로 길이는 동시 실행 수를 무한히 늘려도 줄일 수 없는 반복 시간의
+하한입니다.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 현재 상태 분석 에이전트
+STATE_ANALYZERS: Tuple[str, ...] = (
+    'StaticAnalyzer',
+    'CodeAnalysisAgent',
+    'BehaviorAnalyzer',
+    'ImpactAnalyzer',
+    'QualityGate'
+)
+
+# 에이전트별로 읽는 보고서 (scripts/run_evolution.py의 문서 참조 원칙)
+# - requirement, 현재 상태 보고서 → ExternalResearcher, GapAnalyzer
+# - external_research 보고서 → GapAnalyzer
+# - gap 보고서 → PlannerAgent, TaskCreatorAgent (SystemArchitect도 갭 보고서로 설계)
+# - planner, task_creator 보고서 → CodeGenerator
+DEFAULT_AGENT_INPUTS: Dict[str, Tuple[str, ...]] = {
+    'RequirementAnalyzer': (),
+    **{name: () for name in STATE_ANALYZERS},
+    'ExternalResearcher': ('RequirementAnalyzer',) + STATE_ANALYZERS,
+    'GapAnalyzer': ('RequirementAnalyzer',) + STATE_ANALYZERS + ('ExternalResearcher',),
+    'SystemArchitect': ('GapAnalyzer',),
+    'OrchestratorDesigner': ('SystemArchitect',),
+    'PlannerAgent': ('GapAnalyzer',),
+    'TaskCreatorAgent': ('GapAnalyzer',),
+    'CodeGenerator': ('PlannerAgent', 'TaskCreatorAgent'),
+    'TestAgent': ('CodeGenerator',),
+}
+
+
+@dataclass
+class DAGRun:
+    """DAG 한 번 실행한 결과.
+
+    Attributes:
+        results: 에이전트별 결과 (실패한 에이전트는 {'error': ...})
+        durations: 에이전트별 실행 시간 (초)
+        order: 시작 순서
+        critical_path: 실제 소요 시간 기준 임계 경로
+        critical_path_seconds: 임계 경로 길이 (초)
+        wall_seconds: 전체 실행 시간 (초)
+        max_concurrency: 동시에 실행된 최대 에이전트 수
+        reused: 입력이 바뀌지 않아 이전 보고서를 재사용한 에이전트
+    """
+    results: Dict[str, Any] = field(default_factory=dict)
+    durations: Dict[str, float] = field(default_factory=dict)
+    order: List[str] = field(default_factory=list)
+    critical_path: List[str] = field(default_factory=list)
+    critical_path_seconds: float = 0.0
+    wall_seconds: float = 0.0
+    max_concurrency: int = 0
+    reused: List[str] = field(default_factory=list)
+
+    def summary(self) -> Dict[str, Any]:
+        """보고용 스케줄 요약."""
+        return {
+            'order': list(self.order),
+            'critical_path': list(self.critical_path),
+            'critical_path_seconds': self.critical_path_seconds,
+            'wall_seconds': self.wall_seconds,
+            'max_concurrency': self.max_concurrency,
+            'reused': list(self.reused)
+        }
+
+
+class AgentDAG:
+    """에이전트 의존성 그래프.
+
+    Attributes:
+        inputs: 에이전트별 선행 에이전트 (선언 순서 유지)
+    """
+
+    def __init__(self, inputs: Mapping[str, Iterable[str]]):
+        """그래프 생성.
+
+        Args:
+            inputs: 에이전트 → 읽는 보고서를 만드는 에이전트들
+
+        Raises:
+            ValueError: 순환 의존성이 있는 경우
+        """
+        self.inputs: Dict[str, Tuple[str, ...]] = {
+            name: tuple(dict.fromkeys(deps)) for name, deps in inputs.items()
+        }
+        for deps in list(self.inputs.values()):
+            for dep in deps:
+                self.inputs.setdefault(dep, ())
+        self._order = self._topological_order()
+
+    @classmethod
+    def default(cls) -> 'AgentDAG':
+        """기본 문서 참조 원칙의 그래프."""
+        return cls(DEFAULT_AGENT_INPUTS)
+
+    def _topological_order(self) -> List[str]:
+        """선언 순서를 최대한 유지하는 위상 정렬."""
+        order: List[str] = []
+        state: Dict[str, int] = {}  # 1: 방문 중, 2: 완료
+
+        def visit(name: str, path: Tuple[str, ...]):
+            if state.get(name) == 2:
+                return
+            if state.get(name) == 1:
+                raise ValueError(f"Agent dependency cycle: {' -> '.join(path + (name,))}")
+            state[name] = 1
+            for dep in self.inputs[name]:
+                visit(dep, path + (name,))
+            state[name] = 2
+            order.append(name)
+
+        for name in self.inputs:
+            visit(name, ())
+        return order
+
+    def topological_order(self) -> List[str]:
+        """의존성을 만족하는 실행 순서."""
+        return list(self._order)
+
+    def ancestors(self, name: str) -> List[str]:
+        """name이 (간접적으로) 읽는 에이전트들 (위상 순서)."""
+        found = set()
+        stack = list(self.inputs.get(name, ()))
+        while stack:
+            dep = stack.pop()
+            if dep not in found:
+                found.add(dep)
+                stack.extend(self.inputs[dep])
+        return [n for n in self._order if n in found]
+
+    def descendants(self, name: str) -> List[str]:
+        """name의 보고서를 (간접적으로) 읽는 에이전트들 (위상 순서)."""
+        return [n for n in self._order if name in self.ancestors(n)]
+
+    def subgraph(self, names: Iterable[str]) -> 'AgentDAG':
+        """일부 에이전트만의 그래프.
+
+        빠진 에이전트를 거치는 의존성은 그 에이전트의 선행 에이전트로
+        이어 붙여 순서를 유지합니다 (예: GapAnalyzer가 없으면 PlannerAgent는
+        분석 에이전트들을 기다림).
+
+        Args:
+            names: 포함할 에이전트
+
+        Returns:
+            부분 그래프 (선언 순서 유지)
+        """
+        names = list(names)
+        keep = set(names)
+
+        def resolve(dep: str, seen: frozenset) -> List[str]:
+            if dep in keep:
+                return [dep]
+            if dep in seen:
+                return []
+            return [d for inner in self.inputs.get(dep, ()) for d in resolve(inner, seen | {dep})]
+
+        inputs = {}
+        for name in list(self.inputs) + [n for n in names if n not in self.inputs]:
+            if name in keep:
+                inputs[name] = [d for dep in self.inputs.get(name, ()) for d in resolve(dep, frozenset())]
+        return AgentDAG(inputs)
+
+    def critical_path(self, durations: Mapping[str, float]) -> Tuple[List[str], float]:
+        """실행 시간 기준 가장 긴 의존성 경로.
+
+        Args:
+            durations: 에이전트별 실행 시간 (없는 에이전트는 0)
+
+        Returns:
+            (경로, 길이)
+        """
+        finish: Dict[str, float] = {}
+        previous: Dict[str, Optional[str]] = {}
+        for name in self._order:
+            best = max(self.inputs[name], key=lambda dep: finish[dep], default=None)
+            finish[name] = (finish[best] if best else 0.0) + durations.get(name, 0.0)
+            previous[name] = best
+        if not finish:
+            return [], 0.0
+
+        node: Optional[str] = max(self._order, key=lambda n: finish[n])
+        length = finish[node]
+        path = []
+        while node is not None:
+            path.append(node)
+            node = previous[node]
+        return path[::-1], length
+
+    async def run(
+        self,
+        execute: Callable[[str], Awaitable[Any]],
+        max_parallel: int
+    ) -> DAGRun:
+        """ready-queue 스케줄링으로 그래프 실행.
+
+        선행 에이전트가 모두 끝난 에이전트를 선언 순서대로 준비 큐에 넣고,
+        실행 중인 에이전트가 max_parallel 미만이면 바로 시작합니다.
+        실패하거나 취소된 에이전트의 결과는 {'error': ...}로 기록하고 후속
+        에이전트는 계속 실행합니다 (execute_parallel과 같은 방식). run()
+        자체가 취소되면 실행 중인 에이전트도 취소합니다.
+
+        Args:
+            execute: 에이전트 이름을 받아 실행하는 코루틴 함수
+            max_parallel: 최대 동시 실행 수
+
+        Returns:
+            실행 결과와 임계 경로
+        """
+        run = DAGRun()
+        waiting = {name: set(deps) for name, deps in self.inputs.items()}
+        dependents: Dict[str, List[str]] = {name: [] for name in self.inputs}
+        for name, deps in self.inputs.items():
+            for dep in deps:
+                dependents[dep].append(name)
+
+        ready = [name for name in self._order if not waiting[name]]
+        running: Dict[asyncio.Task, Tuple[str, float]] = {}
+        start = time.perf_counter()
+
+        try:
+            while ready or running:
+                while ready and len(running) < max(max_parallel, 1):
+                    name = ready.pop(0)
+                    run.order.append(name)
+                    running[asyncio.ensure_future(execute(name))] = (name, time.perf_counter())
+                run.max_concurrency = max(run.max_concurrency, len(running))
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for finished in done:
+                    name, started = running.pop(finished)
+                    run.durations[name] = time.perf_counter() - started
+                    if finished.cancelled():
+                        logger.error(f"DAG 실행 중 에이전트 취소: {name}")
+                        run.results[name] = {'error': 'cancelled'}
+                    elif finished.exception() is not None:
+                        logger.error(f"DAG 실행 중 에러 발생: {name} - {finished.exception()}")
+                        run.results[name] = {'error': str(finished.exception())}
+                    else:
+                        run.results[name] = finished.result()
+
+                    newly_ready = []
+                    for dependent in dependents[name]:
+                        waiting[dependent].discard(name)
+                        if not waiting[dependent]:
+                            newly_ready.append(dependent)
+                    ready.extend(newly_ready)
+                    ready.sort(key=self._order.index)
+        finally:
+            # run()이 취소되거나 실패하면 실행 중인 에이전트도 함께 정리
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+        run.wall_seconds = time.perf_counter() - start
+        run.critical_path, run.critical_path_seconds = self.critical_path(run.durations)
+        return run
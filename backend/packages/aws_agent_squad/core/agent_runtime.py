@@ -14,12 +14,33 @@
 import asyncio
 import logging
 import os
-from typing import Dict, List, Optional, Any, Callable
+import random
+from collections import OrderedDict
+from typing import Dict, List, Optional, Any, Callable, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 import json
 import boto3
 from botocore.config import Config
+from botocore.exceptions import ClientError
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - aiohttp ships with the backend
+    aiohttp = None
+
+from backend.packages.agents.ai_cache import cached_completion, get_ai_response_cache
+from backend.packages.agents.ai_providers import AIProvider, BedrockAIProvider, get_ai_provider
+from backend.packages.agents.bedrock_transport import (
+    BedrockTransport,
+    get_bedrock_transport,
+    stream_chunk_text,
+)
+from backend.packages.agents.model_router import get_model_router, routed_completion
+from backend.packages.agents.rate_limiter import estimate_request_tokens, get_bedrock_rate_limiter
+from backend.packages.agents.single_flight import coalesced_completion, get_single_flight
+from backend.packages.agents.structured_output import get_parse_metrics
+from backend.packages.memory.context_builder import estimate_tokens
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +58,12 @@ class RuntimeConfig:
     model_id: str = os.getenv("BEDROCK_MODEL_ID", "anthropic.claude-3-sonnet-20240229-v1:0")
     max_tokens: int = int(os.getenv("BEDROCK_MAX_TOKENS", "4096"))
     temperature: float = float(os.getenv("BEDROCK_TEMPERATURE", "0.7"))
+    endpoint_url: Optional[str] = os.getenv("BEDROCK_ENDPOINT_URL") or None
+    # "bedrock" 또는 오프라인 Provider ("replay", "synthetic")
+    ai_provider: str = os.getenv("AI_PROVIDER", "bedrock")
+    # 안정적인 prompt prefix에 Bedrock 프롬프트 캐싱 마커 사용 (Claude 최소 1024 토큰)
+    prompt_caching: bool = os.getenv("BEDROCK_PROMPT_CACHING", "1") != "0"
+    prompt_cache_min_tokens: int = int(os.getenv("BEDROCK_PROMPT_CACHE_MIN_TOKENS", "1024"))
     
     # 실행 설정
     max_parallel_agents: int = 5
@@ -59,6 +86,24 @@ class RuntimeConfig:
     gap_tolerance: float = 0.01
 
 
+@dataclass
+class PromptSegments:
+    """Bedrock 호출 프롬프트 구성.
+    
+    Attributes:
+        prefix_blocks: 호출 간 재사용되는 블록 (여러 에이전트가 공유하는 블록이 앞)
+        suffix: 호출마다 바뀌는 부분 (기타 컨텍스트와 작업)
+    """
+    
+    prefix_blocks: List[str]
+    suffix: str
+    
+    @property
+    def prefix(self) -> str:
+        """prefix 블록을 이어 붙인 system 프롬프트."""
+        return "\n\n".join(self.prefix_blocks)
+
+
 class AgentRuntime:
     """AWS Bedrock AgentCore 런타임.
     
@@ -66,6 +111,19 @@ class AgentRuntime:
     AWS Agent Squad 프레임워크의 모든 에이전트는 이 런타임을 통해 실행됩니다.
     """
     
+    # (에이전트, 컨텍스트 버전)별로 보관하는 렌더링된 prefix 수
+    MAX_CACHED_PREFIXES = 128
+    # 라우트의 모델 이름 -> Bedrock 모델 ID (routed_completion이 사용)
+    MODELS = BedrockAIProvider.MODELS
+    # 재시도할 Bedrock 오류 코드와 첫 재시도 대기 시간 (이후 지수 증가)
+    RETRYABLE_ERROR_CODES = frozenset({
+        'ThrottlingException',
+        'ServiceUnavailableException',
+        'InternalServerException',
+        'ModelNotReadyException',
+    })
+    RETRY_BASE_DELAY_SECONDS = 1.0
+    
     def __init__(self, config: RuntimeConfig):
         """런타임 초기화.
         
@@ -75,6 +133,17 @@ class AgentRuntime:
         self.config = config
         self.bedrock_client = self._init_bedrock_client()
         self.bedrock_runtime = self._init_bedrock_runtime()
+        self.bedrock_transport = self._init_bedrock_transport()
+        # 오프라인 실행/부하 테스트용 Provider (bedrock이면 None)
+        self.ai_provider = self._init_ai_provider()
+        # 동일한 프롬프트 응답 재사용 (Evolution Loop 재실행 등)
+        self.response_cache = get_ai_response_cache()
+        # BedrockAIProvider와 같은 요청/토큰 한도 및 적응형 동시성 적용
+        self.rate_limiter = get_bedrock_rate_limiter()
+        # task_class별 모델 티어 라우팅 (BedrockAIProvider와 통계 공유)
+        self.model_router = get_model_router()
+        # 동시에 들어온 동일한 요청을 한 번의 호출로 합침 (BedrockAIProvider와 공유)
+        self.single_flight = get_single_flight()
         self.active_agents: Dict[str, Any] = {}
         self.execution_history: List[Dict[str, Any]] = []
         
@@ -84,8 +153,29 @@ class AgentRuntime:
         # 문서 컨텍스트 (모든 에이전트가 공유)
         self.shared_document_context: Dict[str, Any] = {}
         
+        # 프롬프트 prefix 재사용: 공유 문서/페르소나가 바뀔 때마다 버전 증가
+        self._context_version = 0
+        self._prefix_cache: "OrderedDict[Tuple[Optional[str], int, bool], Tuple[str, ...]]" = OrderedDict()
+        self._digest_cache: Optional[Tuple[int, str]] = None
+        self.prompt_caching_supported = True
+        self.prompt_cache_stats: Dict[str, int] = {
+            'prefix_renders': 0,
+            'prefix_reuses': 0,
+            'input_tokens': 0,
+            'cache_read_input_tokens': 0,
+            'cache_write_input_tokens': 0
+        }
+        
+        # 스트리밍 AI 출력 수신자 (agent_name, chunk)
+        self.stream_callbacks: List[Callable] = []
+        
         logger.info(f"🚀 Bedrock AgentCore Runtime 초기화 완료 (Region: {config.region})")
     
+    @property
+    def default_model_id(self) -> str:
+        """task_class나 model_id 없이 호출할 때 쓰는 모델."""
+        return self.config.model_id
+    
     def _init_bedrock_client(self):
         """Bedrock 클라이언트 초기화."""
         config = Config(
@@ -102,6 +192,17 @@ class AgentRuntime:
         )
         return boto3.client('bedrock-runtime', config=config)
     
+    def _init_bedrock_transport(self) -> BedrockTransport:
+        """모델 호출용 비동기 전송 계층 (BedrockAIProvider와 커넥션 풀 공유)."""
+        return get_bedrock_transport(self.config.region, self.config.endpoint_url)
+    
+    def _init_ai_provider(self) -> Optional[AIProvider]:
+        """오프라인 AI Provider 초기화 (replay/synthetic 설정 시)."""
+        if self.config.ai_provider == "bedrock":
+            return None
+        logger.info(f"🧪 오프라인 AI Provider 사용: {self.config.ai_provider}")
+        return get_ai_provider(self.config.ai_provider, {"model_id": self.config.model_id})
+    
     async def execute_agent(
         self,
         agent_name: str,
@@ -138,12 +239,7 @@ class AgentRuntime:
             else:
                 agent_task = task
             
-            # 페르소나 적용
-            if agent_name in self.personas:
-                persona = self.personas[agent_name]
-                # 페르소나를 inputs에 적용
-                if hasattr(agent_task, 'inputs'):
-                    agent_task.inputs = self._apply_persona(agent_task.inputs, persona)
+            # 페르소나는 _invoke_bedrock에서 프롬프트 prefix로 적용
             
             # 공유 문서 컨텍스트 추가
             if context is None:
@@ -162,7 +258,10 @@ class AgentRuntime:
                 try:
                     ai_response = await self._invoke_bedrock(
                         prompt=agent_task.inputs.get('prompt', ''),
-                        context=context
+                        context=context,
+                        agent_name=agent_name,
+                        use_cache=agent_task.inputs.get('use_cache', True),
+                        task_class=agent_task.inputs.get('task_class')
                     )
                     agent_task.inputs['ai_response'] = ai_response
                     logger.info(f"🤖 Bedrock AI response received for {agent_name}")
@@ -189,6 +288,7 @@ class AgentRuntime:
                 'result': result,
                 'timestamp': datetime.now().isoformat()
             }
+            self._context_version += 1
             
             # 실행 기록
             execution_time = (datetime.now() - start_time).total_seconds()
@@ -271,107 +371,408 @@ class AgentRuntime:
         
         return final_results
     
-    async def _invoke_bedrock(self, prompt: str, context: Dict[str, Any]) -> str:
+    def add_stream_callback(self, callback: Callable):
+        """스트리밍 AI 출력 콜백 등록.
+        
+        콜백은 (agent_name, chunk)로 호출되며, 코루틴을 반환하면 대기합니다.
+        콜백이 등록되어 있으면 Bedrock 호출은 스트리밍으로 수행됩니다.
+        
+        Args:
+            callback: 출력 조각을 받을 콜백
+        """
+        self.stream_callbacks.append(callback)
+    
+    async def publish_stream(self, agent_name: str, chunk: str):
+        """AI 출력 조각을 등록된 콜백에 전달.
+        
+        에이전트의 stream_callback으로 연결하여 에이전트 내부의
+        스트리밍 출력도 같은 경로로 전달할 수 있습니다.
+        
+        Args:
+            agent_name: 출력을 만든 에이전트
+            chunk: 텍스트 조각
+        """
+        for callback in self.stream_callbacks:
+            try:
+                result = callback(agent_name, chunk)
+                if asyncio.iscoroutine(result):
+                    await result
+            except Exception as e:
+                logger.warning(f"스트림 콜백 실패: {str(e)}")
+    
+    async def _invoke_bedrock(
+        self,
+        prompt: str,
+        context: Dict[str, Any],
+        agent_name: Optional[str] = None,
+        use_cache: bool = True,
+        task_class: Optional[str] = None
+    ) -> str:
         """Bedrock AI 모델 호출.
         
+        프롬프트는 호출 간 재사용되는 prefix(공유 문서 요약, 페르소나)와
+        호출마다 바뀌는 suffix(기타 컨텍스트, 작업)로 구성됩니다. prefix는
+        system 블록으로 보내고, 충분히 길면 Bedrock 프롬프트 캐싱 마커
+        (cache_control)를 붙여 반복 호출의 입력 토큰 비용과 지연을 줄입니다.
+        
+        스트림 콜백이 등록되어 있으면 응답을 토큰 단위로 받아
+        도착하는 대로 콜백에 전달합니다. 같은 프롬프트의 응답은
+        response_cache에서 재사용하고, 동시에 들어온 같은 프롬프트는 한 번만
+        호출합니다 (캐시 적중이나 합쳐진 호출의 응답은 한 조각으로 전달).
+        
+        task_class가 주어지면 model_router의 라우트가 모델, max_tokens,
+        타임아웃을 정하고 호출 지연/비용이 라우트별로 집계됩니다.
+        
         Args:
             prompt: AI 프롬프트
             context: 추가 컨텍스트
+            agent_name: 호출한 에이전트 (페르소나 선택, 스트림 출력에 표시)
+            use_cache: 응답 캐시 사용 여부
+            task_class: 작업 종류 ("classify", "extract", "generate_code" 등)
             
         Returns:
             AI 응답
+            
+        Raises:
+            asyncio.TimeoutError: 라우트 타임아웃을 넘긴 경우
         """
         try:
-            # 컨텍스트를 프롬프트에 추가
-            full_prompt = self._build_prompt_with_context(prompt, context)
-            
-            # Bedrock Runtime 호출
-            request_body = {
-                'anthropic_version': 'bedrock-2023-05-31',
-                'max_tokens': self.config.max_tokens,
-                'temperature': self.config.temperature,
-                'messages': [
-                    {
-                        'role': 'user',
-                        'content': full_prompt
-                    }
-                ]
-            }
+            segments = self._build_prompt_segments(prompt, context, agent_name)
+            streamed: List[str] = []
+            on_chunk = None
+            if self.stream_callbacks:
+                async def on_chunk(text: str) -> None:
+                    streamed.append(text)
+                    await self.publish_stream(agent_name or 'runtime', text)
             
-            # JSON serialization with datetime handling
-            import json
-            from datetime import datetime
+            options: Dict[str, Any] = {}
+            if task_class is None or self.model_router is None:
+                # 라우팅하지 않는 호출은 설정의 max_tokens (라우팅하면 라우트 값)
+                options['max_tokens'] = self.config.max_tokens
             
-            def json_serial(obj):
-                """JSON serializer for objects not serializable by default json code"""
-                if isinstance(obj, datetime):
-                    return obj.isoformat()
-                raise TypeError(f"Type {type(obj)} not serializable")
-            
-            logger.info(f"🌐 Bedrock API 호출 중... (model: {self.config.model_id})")
-            response = self.bedrock_runtime.invoke_model(
-                modelId=self.config.model_id,
-                contentType='application/json',
-                accept='application/json',
-                body=json.dumps(request_body, default=json_serial)
+            response_text = await self._complete(
+                segments.suffix,
+                system=segments.prefix or None,
+                temperature=self.config.temperature,
+                prefix_blocks=segments.prefix_blocks,
+                on_chunk=on_chunk,
+                # 오프라인 Provider 응답은 공유 응답 캐시에 섞지 않음
+                use_cache=use_cache and self.ai_provider is None,
+                task_class=task_class,
+                **options
             )
-            logger.info("🌐 Bedrock API 응답 수신")
             
-            # 응답 파싱
-            response_body = json.loads(response['body'].read())
-            return response_body['content'][0]['text']
+            # 캐시 적중, 합쳐진 호출, 오프라인 Provider 응답은 한 조각으로 전달
+            if on_chunk is not None and not streamed and response_text:
+                await self.publish_stream(agent_name or 'runtime', response_text)
+            return response_text
             
         except Exception as e:
             logger.error(f"Bedrock 호출 실패: {str(e)}")
             raise
     
-    def _build_prompt_with_context(self, prompt: str, context: Dict[str, Any]) -> str:
-        """컨텍스트를 포함한 프롬프트 생성.
+    @routed_completion
+    @coalesced_completion
+    @cached_completion
+    async def _complete(
+        self,
+        prompt: str,
+        system: Optional[str] = None,
+        max_tokens: Optional[int] = None,
+        temperature: float = 0.7,
+        model_id: Optional[str] = None,
+        prefix_blocks: Optional[List[str]] = None,
+        on_chunk: Optional[Callable] = None
+    ) -> str:
+        """오프라인 Provider 또는 Bedrock에서 응답을 구함.
+        
+        BedrockAIProvider.complete와 같은 데코레이터로 task_class 라우팅,
+        동시 동일 요청 합치기, 응답 캐시(use_cache)를 적용합니다.
         
         Args:
-            prompt: 기본 프롬프트
-            context: 추가 컨텍스트
+            prompt: 호출마다 바뀌는 suffix
+            system: prefix 블록을 이어 붙인 system 프롬프트 (캐시 키)
+            max_tokens: 최대 생성 토큰 수 (기본값: config.max_tokens)
+            temperature: 생성 온도
+            model_id: 호출할 모델 ID (기본값: config.model_id)
+            prefix_blocks: system으로 보낼 prefix 블록
+            on_chunk: 스트리밍 응답 조각을 받을 코루틴 함수 (None이면 스트리밍 안 함)
             
         Returns:
-            완성된 프롬프트
+            AI 응답
         """
-        context_str = ""
+        model_id = model_id or self.default_model_id
+        max_tokens = max_tokens or self.config.max_tokens
+        
+        if self.ai_provider is not None:
+            return await self.ai_provider.complete(
+                prompt,
+                system=system,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                model_id=model_id
+            )
+        
+        segments = PromptSegments(prefix_blocks=list(prefix_blocks or []), suffix=prompt)
+        logger.info(f"🌐 Bedrock API 호출 중... (model: {model_id})")
+        cache_prefix = self.config.prompt_caching and self.prompt_caching_supported
+        try:
+            return await self._send_request(segments, cache_prefix, on_chunk, model_id, max_tokens)
+        except ClientError as e:
+            error = e.response['Error']
+            if (
+                not cache_prefix
+                or error['Code'] != 'ValidationException'
+                or 'cache_control' not in error.get('Message', '')
+            ):
+                raise
+            # 프롬프트 캐싱을 지원하지 않는 모델: 마커 없이 재시도하고 이후 호출에서도 생략
+            logger.warning(f"프롬프트 캐싱 미지원으로 판단, 캐시 마커 없이 재시도: {e}")
+            self.prompt_caching_supported = False
+            return await self._send_request(segments, False, on_chunk, model_id, max_tokens)
+    
+    async def _send_request(
+        self,
+        segments: PromptSegments,
+        cache_prefix: bool,
+        on_chunk: Optional[Callable] = None,
+        model_id: Optional[str] = None,
+        max_tokens: Optional[int] = None
+    ) -> str:
+        """공유 rate limiter를 거쳐 Bedrock에 요청을 보냄.
+        
+        스로틀링, 5xx, 연결 오류는 지터가 섞인 지수 백오프로 최대
+        config.retry_count번까지 시도합니다. 스트리밍은 첫 조각을 받기
+        전에 난 오류만 재시도합니다.
+        
+        Args:
+            segments: 프롬프트 구성
+            cache_prefix: prefix에 프롬프트 캐싱 마커를 붙일지 여부
+            on_chunk: 스트리밍 응답 조각을 받을 코루틴 함수 (None이면 스트리밍 안 함)
+            model_id: 호출할 모델 ID (기본값: config.model_id)
+            max_tokens: 최대 생성 토큰 수 (기본값: config.max_tokens)
+            
+        Returns:
+            AI 응답
+        """
+        model_id = model_id or self.config.model_id
+        max_tokens = max_tokens or self.config.max_tokens
+        body = json.dumps(self._build_request_body(segments, cache_prefix, max_tokens), ensure_ascii=False)
+        reserved = estimate_request_tokens(segments.suffix, segments.prefix, max_tokens)
+        attempts = max(self.config.retry_count, 1)
         
-        # 공유 문서 컨텍스트 추가
-        if 'shared_documents' in context:
-            from datetime import datetime
+        for attempt in range(attempts):
+            parts: List[str] = []
+            try:
+                async with self.rate_limiter.limit(reserved) as permit:
+                    if on_chunk is not None:
+                        async for chunk in self.bedrock_transport.invoke_model_stream(model_id, body):
+                            if chunk.get('type') == 'message_start':
+                                self._record_usage(chunk.get('message', {}).get('usage', {}))
+                            text = stream_chunk_text(chunk)
+                            if text:
+                                parts.append(text)
+                                await on_chunk(text)
+                        logger.info("🌐 Bedrock API 스트리밍 응답 완료")
+                        response_text = "".join(parts)
+                    else:
+                        # 이벤트 루프를 막지 않도록 비동기 전송 계층으로 호출
+                        response_body = await self.bedrock_transport.invoke_model(model_id, body)
+                        logger.info("🌐 Bedrock API 응답 수신")
+                        self._record_usage(response_body.get('usage', {}))
+                        response_text = response_body['content'][0]['text']
+                    permit.settle(reserved - max_tokens + estimate_tokens(response_text))
+                return response_text
+            except Exception as e:
+                if parts or attempt == attempts - 1 or not self._is_retryable(e):
+                    raise
+                # 병렬 에이전트가 같은 시점에 재시도하지 않도록 지터 적용
+                wait_time = round(self.RETRY_BASE_DELAY_SECONDS * 2 ** attempt * random.uniform(0.5, 1.5), 2)
+                logger.warning(
+                    f"Bedrock 호출 실패: {str(e)}. {wait_time}초 후 재시도 ({attempt + 1}/{attempts})"
+                )
+                await asyncio.sleep(wait_time)
+    
+    def _is_retryable(self, error: Exception) -> bool:
+        """재시도할 Bedrock 오류인지 판단 (스로틀링, 5xx, 연결 오류).
+        
+        Args:
+            error: 호출 중 발생한 예외
             
-            def json_serial(obj):
-                """JSON serializer for objects not serializable by default json code"""
-                if isinstance(obj, datetime):
-                    return obj.isoformat()
-                return str(obj)
+        Returns:
+            재시도 여부
+        """
+        if isinstance(error, ClientError):
+            code = error.response.get('Error', {}).get('Code', '')
+            status = error.response.get('ResponseMetadata', {}).get('HTTPStatusCode', 0)
+            return code in self.RETRYABLE_ERROR_CODES or status == 429 or status >= 500
+        return isinstance(error, (OSError, asyncio.TimeoutError)) or (
+            aiohttp is not None and isinstance(error, aiohttp.ClientError)
+        )
+    
+    def _build_request_body(
+        self,
+        segments: PromptSegments,
+        cache_prefix: bool,
+        max_tokens: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Claude Messages API 요청 본문 생성.
+        
+        prefix 블록은 system으로 보내며, cache_prefix이면 누적 길이가
+        prompt_cache_min_tokens 이상인 블록 끝마다 cache_control 마커를 붙입니다.
+        
+        Args:
+            segments: 프롬프트 구성
+            cache_prefix: 프롬프트 캐싱 마커 사용 여부
+            max_tokens: 최대 생성 토큰 수 (기본값: config.max_tokens)
             
-            context_str += "\n### 공유 문서 컨텍스트:\n"
-            for agent, doc in context['shared_documents'].items():
-                if isinstance(doc, dict) and 'result' in doc:
-                    context_str += f"\n**{agent}:**\n{json.dumps(doc['result'], indent=2, ensure_ascii=False, default=json_serial)}\n"
+        Returns:
+            요청 본문
+        """
+        request_body: Dict[str, Any] = {
+            'anthropic_version': 'bedrock-2023-05-31',
+            'max_tokens': max_tokens or self.config.max_tokens,
+            'temperature': self.config.temperature,
+            'messages': [
+                {
+                    'role': 'user',
+                    'content': segments.suffix
+                }
+            ]
+        }
+        
+        system_blocks = []
+        prefix_tokens = 0
+        for text in segments.prefix_blocks:
+            block: Dict[str, Any] = {'type': 'text', 'text': text}
+            prefix_tokens += estimate_tokens(text)
+            if cache_prefix and prefix_tokens >= self.config.prompt_cache_min_tokens:
+                block['cache_control'] = {'type': 'ephemeral'}
+            system_blocks.append(block)
+        if system_blocks:
+            request_body['system'] = system_blocks
+        
+        return request_body
+    
+    def _record_usage(self, usage: Dict[str, Any]) -> None:
+        """응답의 입력 토큰 사용량(프롬프트 캐시 읽기/쓰기 포함) 집계."""
+        self.prompt_cache_stats['input_tokens'] += usage.get('input_tokens', 0)
+        self.prompt_cache_stats['cache_read_input_tokens'] += usage.get('cache_read_input_tokens', 0)
+        self.prompt_cache_stats['cache_write_input_tokens'] += usage.get('cache_creation_input_tokens', 0)
+    
+    def _build_prompt_segments(
+        self,
+        prompt: str,
+        context: Dict[str, Any],
+        agent_name: Optional[str] = None
+    ) -> PromptSegments:
+        """컨텍스트를 포함한 프롬프트 구성.
+        
+        런타임의 공유 문서 컨텍스트를 쓰는 호출은 prefix 블록을
+        (에이전트, 컨텍스트 버전)별로 한 번만 렌더링해 재사용합니다.
+        
+        Args:
+            prompt: 기본 프롬프트
+            context: 추가 컨텍스트
+            agent_name: 호출한 에이전트 (페르소나 선택)
+            
+        Returns:
+            prefix 블록과 suffix
+        """
+        shared_documents = context.get('shared_documents')
+        memo_key = None
+        prefix_blocks = None
+        if shared_documents is None or shared_documents is self.shared_document_context:
+            memo_key = (agent_name, self._context_version, shared_documents is not None)
+            prefix_blocks = self._prefix_cache.get(memo_key)
+        
+        if prefix_blocks is None:
+            prefix_blocks = self._render_prefix_blocks(agent_name, shared_documents)
+            self.prompt_cache_stats['prefix_renders'] += 1
+            if memo_key is not None:
+                self._prefix_cache[memo_key] = prefix_blocks
+                while len(self._prefix_cache) > self.MAX_CACHED_PREFIXES:
+                    self._prefix_cache.popitem(last=False)
+        else:
+            self._prefix_cache.move_to_end(memo_key)
+            self.prompt_cache_stats['prefix_reuses'] += 1
         
         # 기타 컨텍스트 추가
+        context_str = ""
         for key, value in context.items():
             if key != 'shared_documents':
                 context_str += f"\n### {key}:\n{json.dumps(value, indent=2, ensure_ascii=False)}\n"
         
-        return f"{context_str}\n\n### 작업:\n{prompt}"
+        return PromptSegments(
+            prefix_blocks=list(prefix_blocks),
+            suffix=f"{context_str}\n\n### 작업:\n{prompt}"
+        )
+    
+    def _render_prefix_blocks(
+        self,
+        agent_name: Optional[str],
+        shared_documents: Optional[Dict[str, Any]]
+    ) -> Tuple[str, ...]:
+        """prefix 블록 렌더링 (여러 에이전트가 공유하는 블록이 앞).
+        
+        Args:
+            agent_name: 호출한 에이전트
+            shared_documents: 공유 문서 컨텍스트
+            
+        Returns:
+            (공유 문서 요약, 페르소나) 중 내용이 있는 블록
+        """
+        blocks = []
+        if shared_documents:
+            if shared_documents is self.shared_document_context:
+                # 같은 버전의 요약은 모든 에이전트가 공유
+                if self._digest_cache is None or self._digest_cache[0] != self._context_version:
+                    self._digest_cache = (self._context_version, self._render_document_digest(shared_documents))
+                digest = self._digest_cache[1]
+            else:
+                digest = self._render_document_digest(shared_documents)
+            if digest:
+                blocks.append(digest)
+        
+        persona = self.personas.get(agent_name) if agent_name else None
+        if persona:
+            blocks.append(self._render_persona(persona))
+        return tuple(blocks)
     
-    def _apply_persona(self, task: Dict[str, Any], persona: Dict[str, Any]) -> Dict[str, Any]:
-        """페르소나를 작업에 적용.
+    def _render_document_digest(self, shared_documents: Dict[str, Any]) -> str:
+        """공유 문서 요약 (에이전트 이름순, 압축 JSON).
         
         Args:
-            task: 원본 작업
-            persona: 적용할 페르소나
+            shared_documents: 공유 문서 컨텍스트
             
         Returns:
-            페르소나가 적용된 작업
+            공유 문서 컨텍스트 블록 (결과가 없으면 빈 문자열)
         """
-        if 'prompt' in task:
-            persona_prompt = f"""
-당신은 {persona.get('name', '에이전트')}입니다.
+        def json_serial(obj):
+            """JSON serializer for objects not serializable by default json code"""
+            if isinstance(obj, datetime):
+                return obj.isoformat()
+            return str(obj)
+        
+        sections = [
+            f"**{agent}:**\n{json.dumps(doc['result'], ensure_ascii=False, separators=(',', ':'), default=json_serial)}"
+            for agent, doc in sorted(shared_documents.items())
+            if isinstance(doc, dict) and 'result' in doc
+        ]
+        if not sections:
+            return ""
+        return "### 공유 문서 컨텍스트:\n" + "\n".join(sections)
+    
+    def _render_persona(self, persona: Dict[str, Any]) -> str:
+        """페르소나 블록 렌더링.
+        
+        Args:
+            persona: 페르소나 정보
+            
+        Returns:
+            페르소나 지시문
+        """
+        return f"""당신은 {persona.get('name', '에이전트')}입니다.
 역할: {persona.get('role', '')}
 성격: {', '.join(persona.get('personality_traits', []))}
 전문분야: {', '.join(persona.get('expertise', []))}
@@ -379,11 +780,7 @@ class AgentRuntime:
 핵심 가치: {', '.join(persona.get('core_values', []))}
 캐치프레이즈: "{persona.get('catchphrase', '')}"
 
-이 페르소나를 유지하면서 다음 작업을 수행하세요:
-"""
-            task['prompt'] = persona_prompt + task['prompt']
-        
-        return task
+이 페르소나를 유지하면서 작업을 수행하세요."""
     
     def register_persona(self, agent_name: str, persona: Dict[str, Any]):
         """에이전트 페르소나 등록.
@@ -393,6 +790,7 @@ class AgentRuntime:
             persona: 페르소나 정보
         """
         self.personas[agent_name] = persona
+        self._context_version += 1
         logger.info(f"🎭 {agent_name} 페르소나 등록: {persona.get('name', 'Unknown')}")
     
     def get_shared_context(self) -> Dict[str, Any]:
@@ -414,6 +812,7 @@ class AgentRuntime:
             'document': document,
             'timestamp': datetime.now().isoformat()
         }
+        self._context_version += 1
         logger.debug(f"📄 {agent_name} 문서가 공유 컨텍스트에 추가됨")
     
     def get_execution_metrics(self) -> Dict[str, Any]:
@@ -437,5 +836,8 @@ class AgentRuntime:
             'success_rate': successful / total_executions if total_executions > 0 else 0,
             'average_duration': avg_duration,
             'active_agents': len([a for a in self.active_agents.values() if a['status'] == 'running']),
-            'history': self.execution_history[-10:]  # 최근 10개
+            'history': self.execution_history[-10:],  # 최근 10개
+            'prompt_cache': dict(self.prompt_cache_stats),
+            'model_routes': self.model_router.get_stats() if self.model_router else {},
+            'structured_output': get_parse_metrics().get_stats()
         }
\ No newline at end of file
@@ -0,0 +1,189 @@
+"""에이전트 입력 fingerprint와 결과 메모이제이션.
+
+Evolution Loop의 2번째 반복부터는 보통 일부 파일만 바뀝니다. 에이전트별로
+입력(작업 필드, 읽는 상위 보고서, 프로젝트 파일 digest)의 fingerprint를
+계산하고, 지난번과 같으면 저장해 둔 보고서를 바로 돌려줘 변경된 부분만큼만
+비용이 들도록 합니다.
+
+프로젝트 파일 digest는 (mtime, 크기)가 바뀐 파일만 다시 해시하므로
+디렉토리 순회 외의 비용도 변경량에 비례합니다.
+"""
+
+import hashlib
+import logging
+import os
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
+
+from backend.packages.memory.codecs import content_fingerprint
+
+from .agent_dag import STATE_ANALYZERS
+
+logger = logging.getLogger(__name__)
+
+# 프로젝트 파일을 직접 읽는 에이전트 (나머지는 작업 필드와 상위 보고서로만 입력이 정해짐)
+PROJECT_READERS: Tuple[str, ...] = STATE_ANALYZERS
+
+# 반복마다 바뀌지만 에이전트 결과에는 영향이 없는 작업 필드
+# (shared_context는 상위 보고서 fingerprint로 대신함)
+VOLATILE_TASK_FIELDS: Tuple[str, ...] = ('iteration', 'previous_results', 'shared_context', 'retry_count')
+
+# 프로젝트 digest에서 제외할 디렉토리
+IGNORED_DIRS = frozenset({
+    '.git', '__pycache__', 'node_modules', '.venv', 'venv',
+    '.mypy_cache', '.pytest_cache', '.ruff_cache', '.tox'
+})
+
+
+def fingerprint(*parts: Any) -> str:
+    """값들의 내용 기반 해시.
+
+    Args:
+        *parts: JSON으로 직렬화할 값 (직렬화할 수 없는 값은 str로 변환)
+
+    Returns:
+        내용이 같으면 같은 SHA-256 hex 문자열
+    """
+    return content_fingerprint(parts)
+
+
+class ProjectDigest:
+    """프로젝트 파일별 digest (변경된 파일만 다시 해시).
+
+    Attributes:
+        files: 마지막 스냅샷의 상대 경로 → 파일 digest
+    """
+
+    def __init__(self):
+        """digest 초기화."""
+        # 절대 경로 → (mtime_ns, 크기, digest)
+        self._stat_cache: Dict[str, Tuple[int, int, str]] = {}
+        self.files: Dict[str, str] = {}
+
+    def snapshot(self, root: Optional[str], exclude: Iterable[str] = ()) -> str:
+        """프로젝트 전체 digest 계산.
+
+        Args:
+            root: 프로젝트 경로 (없으면 빈 digest)
+            exclude: 제외할 경로 (예: 프로젝트 안의 보고서 출력 디렉토리)
+
+        Returns:
+            파일 경로와 내용이 같으면 같은 digest
+        """
+        files: Dict[str, str] = {}
+        if root and os.path.isdir(root):
+            excluded = {os.path.abspath(path) for path in exclude if path}
+            for directory, dirnames, filenames in os.walk(root):
+                dirnames[:] = sorted(
+                    name for name in dirnames
+                    if name not in IGNORED_DIRS and os.path.abspath(os.path.join(directory, name)) not in excluded
+                )
+                for filename in filenames:
+                    path = os.path.join(directory, filename)
+                    digest = self._file_digest(path)
+                    if digest is not None:
+                        files[os.path.relpath(path, root)] = digest
+
+        changed = sum(1 for path, digest in files.items() if self.files.get(path) != digest)
+        removed = len(self.files.keys() - files.keys())
+        if self.files and (changed or removed):
+            logger.info(f"📁 프로젝트 변경: {changed}개 파일 추가/수정, {removed}개 파일 삭제")
+        self.files = files
+        return fingerprint(sorted(files.items()))
+
+    def _file_digest(self, path: str) -> Optional[str]:
+        """(mtime, 크기)가 그대로면 이전 digest를 재사용."""
+        try:
+            stat = os.stat(path)
+            cached = self._stat_cache.get(path)
+            if cached and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                return cached[2]
+            digest = hashlib.sha256()
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 16), b''):
+                    digest.update(chunk)
+        except OSError:
+            return None
+        self._stat_cache[path] = (stat.st_mtime_ns, stat.st_size, digest.hexdigest())
+        return self._stat_cache[path][2]
+
+
+class ResultMemo:
+    """에이전트별 마지막 입력 fingerprint와 결과 저장소."""
+
+    def __init__(self):
+        """저장소 초기화."""
+        self._entries: Dict[str, Tuple[str, Any]] = {}
+        self.hits: Dict[str, int] = {}
+        self.misses: Dict[str, int] = {}
+
+    def input_fingerprint(
+        self,
+        agent_name: str,
+        task: Mapping[str, Any],
+        upstream: Mapping[str, str],
+        project_digest: str = ''
+    ) -> str:
+        """에이전트 입력 fingerprint.
+
+        Args:
+            agent_name: 에이전트 이름
+            task: 에이전트 작업 (VOLATILE_TASK_FIELDS 제외)
+            upstream: 읽는 상위 보고서 이름 → 보고서 fingerprint
+            project_digest: 프로젝트 digest (PROJECT_READERS만 반영)
+
+        Returns:
+            입력 fingerprint
+        """
+        relevant = {key: value for key, value in task.items() if key not in VOLATILE_TASK_FIELDS}
+        return fingerprint(
+            agent_name,
+            relevant,
+            sorted(upstream.items()),
+            project_digest if agent_name in PROJECT_READERS else ''
+        )
+
+    def lookup(self, agent_name: str, input_fingerprint: str) -> Tuple[bool, Any]:
+        """fingerprint가 같으면 저장된 결과 반환.
+
+        Returns:
+            (적중 여부, 결과)
+        """
+        entry = self._entries.get(agent_name)
+        if entry is not None and entry[0] == input_fingerprint:
+            self.hits[agent_name] = self.hits.get(agent_name, 0) + 1
+            return True, entry[1]
+        self.misses[agent_name] = self.misses.get(agent_name, 0) + 1
+        return False, None
+
+    def store(self, agent_name: str, input_fingerprint: str, result: Any):
+        """성공한 결과 저장 (에러 결과는 다음에 다시 실행되도록 저장하지 않음)."""
+        if isinstance(result, dict) and 'error' in result:
+            self._entries.pop(agent_name, None)
+            return
+        self._entries[agent_name] = (input_fingerprint, result)
+
+    def invalidate(self, agent_name: Optional[str] = None):
+        """저장된 결과 삭제.
+
+        Args:
+            agent_name: 삭제할 에이전트 (None이면 전체)
+        """
+        if agent_name is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(agent_name, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """에이전트별 재사용 통계."""
+        agents = sorted(self.hits.keys() | self.misses.keys())
+        total_hits = sum(self.hits.values())
+        total = total_hits + sum(self.misses.values())
+        return {
+            'hits': total_hits,
+            'misses': total - total_hits,
+            'hit_rate': total_hits / total if total else 0.0,
+            'agents': {
+                name: {'hits': self.hits.get(name, 0), 'misses': self.misses.get(name, 0)}
+                for name in agents
+            }
+        }
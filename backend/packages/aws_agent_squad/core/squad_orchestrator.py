@@ -11,7 +11,11 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 
+from backend.packages.agents.structured_output import StructuredOutputError, StructuredOutputParser
+
+from .agent_dag import DEFAULT_AGENT_INPUTS, AgentDAG, DAGRun, STATE_ANALYZERS
 from .agent_runtime import AgentRuntime, RuntimeConfig
+from .result_memo import ProjectDigest, ResultMemo, fingerprint
 
 logger = logging.getLogger(__name__)
 
@@ -43,6 +47,12 @@ class SquadConfig:
     # 문서 공유 설정
     share_all_documents: bool = True
     document_retention_days: int = 30
+    
+    # 스케줄링 설정 (에이전트 → 읽는 보고서를 만드는 에이전트, 기본 의존성 재정의)
+    agent_inputs: Optional[Dict[str, List[str]]] = None
+    
+    # 증분 실행 (입력 fingerprint가 같은 분석 에이전트는 이전 보고서 재사용)
+    enable_incremental: bool = True
 
 
 class SquadOrchestrator:
@@ -66,27 +76,128 @@ class SquadOrchestrator:
         self.current_iteration = 0
         self.gap_score = 1.0
         
+        # 문서 의존성 DAG (에이전트 → 읽는 보고서를 만드는 에이전트)
+        self.agent_inputs: Dict[str, List[str]] = {
+            name: list(deps) for name, deps in DEFAULT_AGENT_INPUTS.items()
+        }
+        self.agent_inputs.update(config.agent_inputs or {})
+        
+        # 증분 실행용 결과 저장소와 프로젝트 파일 digest
+        self.result_memo = ResultMemo()
+        self.project_digest = ProjectDigest()
+        
+        # 반복 완료 콜백 (iteration, iteration_result)
+        self.iteration_callbacks: List[Callable] = []
+        
         # 페르소나
         self.persona = None
         
         logger.info(f"🎯 Squad Orchestrator '{config.name}' 초기화 (전략: {config.strategy.value})")
     
-    def register_agent(self, name: str, agent_func: Callable, persona: Optional[Dict[str, Any]] = None):
+    def register_agent(
+        self,
+        name: str,
+        agent_func: Callable,
+        persona: Optional[Dict[str, Any]] = None,
+        inputs: Optional[List[str]] = None
+    ):
         """에이전트 등록.
         
         Args:
             name: 에이전트 이름
             agent_func: 에이전트 실행 함수
             persona: 에이전트 페르소나
+            inputs: 이 에이전트가 읽는 보고서를 만드는 에이전트들 (기본 의존성 재정의)
         """
         self.agents[name] = agent_func
         
+        if inputs is not None:
+            self.agent_inputs[name] = list(inputs)
+        
         if persona:
             self.runtime.register_persona(name, persona)
             logger.info(f"✅ 에이전트 '{name}' 등록 (페르소나: {persona.get('name', 'Unknown')})")
         else:
             logger.info(f"✅ 에이전트 '{name}' 등록")
     
+    def add_iteration_callback(self, callback: Callable):
+        """Evolution Loop 반복 완료 콜백 등록.
+        
+        반복이 끝날 때마다 ``callback(iteration, iteration_result)``가
+        호출됩니다. 코루틴 함수도 등록할 수 있습니다.
+        
+        Args:
+            callback: 반복 완료 시 호출할 함수
+        """
+        self.iteration_callbacks.append(callback)
+    
+    def build_dag(self, names: Optional[List[str]] = None) -> AgentDAG:
+        """등록된 에이전트의 의존성 DAG 생성.
+        
+        등록되지 않은 에이전트를 거치는 의존성은 그 선행 에이전트로 이어집니다.
+        
+        Args:
+            names: 포함할 에이전트 (기본값: 등록된 모든 에이전트)
+            
+        Returns:
+            에이전트 DAG
+            
+        Raises:
+            ValueError: 순환 의존성이 있는 경우
+        """
+        names = [name for name in (self.agents if names is None else names) if name in self.agents]
+        return AgentDAG(self.agent_inputs).subgraph(names)
+    
+    async def _run_dag(
+        self,
+        dag: AgentDAG,
+        make_task: Callable[[str], Dict[str, Any]],
+        project_digest: Optional[str] = None
+    ) -> DAGRun:
+        """DAG를 런타임의 최대 병렬 수 안에서 실행.
+        
+        작업은 에이전트가 시작될 때 만들어지므로 그때까지 끝난 에이전트의
+        보고서가 공유 컨텍스트에 반영됩니다. project_digest가 주어지면
+        작업 필드, 상위 보고서, 프로젝트 digest로 만든 입력 fingerprint가
+        지난번과 같은 에이전트는 실행하지 않고 저장된 보고서를 돌려줍니다.
+        
+        Args:
+            dag: 실행할 DAG
+            make_task: 에이전트 이름 → 작업
+            project_digest: 프로젝트 파일 digest (None이면 메모이제이션 안 함)
+            
+        Returns:
+            실행 결과
+        """
+        # 이번 실행에서 만들어진 보고서의 fingerprint
+        documents: Dict[str, str] = {}
+        reused: List[str] = []
+        
+        async def execute(name: str):
+            task = make_task(name)
+            if project_digest is None:
+                return await self.runtime.execute_agent(name, self.agents[name], task)
+            
+            upstream = {dep: documents[dep] for dep in dag.inputs[name] if dep in documents}
+            key = self.result_memo.input_fingerprint(name, task, upstream, project_digest)
+            hit, result = self.result_memo.lookup(name, key)
+            if hit:
+                logger.info(f"♻️ {name} 입력 변경 없음 - 이전 보고서 재사용")
+                reused.append(name)
+            else:
+                result = await self.runtime.execute_agent(name, self.agents[name], task)
+                self.result_memo.store(name, key, result)
+            documents[name] = fingerprint(result)
+            return result
+        
+        run = await dag.run(execute, self.runtime.config.max_parallel_agents)
+        run.reused = reused
+        logger.info(
+            f"🧭 임계 경로: {' -> '.join(run.critical_path) or '-'} "
+            f"({run.critical_path_seconds:.1f}s, 전체 {run.wall_seconds:.1f}s, 최대 동시 {run.max_concurrency})"
+        )
+        return run
+    
     def set_execution_order(self, order: List[str]):
         """실행 순서 설정.
         
@@ -124,6 +235,11 @@ class SquadOrchestrator:
         """Evolution Loop 실행.
         
         갭이 0이 될 때까지 반복하여 시스템을 진화시킵니다.
+        각 반복은 갭 분석까지의 분석 DAG와 갭 보고서를 읽는 개선 DAG로
+        나뉘며, 각 DAG 안에서는 입력 보고서가 준비된 에이전트부터 병렬로
+        실행됩니다. 반복별 임계 경로는 iteration_result['schedule']에 기록됩니다.
+        enable_incremental이면 입력이 바뀌지 않은 분석 에이전트는 다시 실행하지
+        않으므로 2번째 반복부터는 변경된 만큼만 비용이 듭니다.
         
         Args:
             initial_task: 초기 작업
@@ -135,6 +251,7 @@ class SquadOrchestrator:
         
         task = initial_task
         results = {'iterations': []}
+        full_dag = AgentDAG(self.agent_inputs)
         
         while self.current_iteration < self.config.max_iterations:
             self.current_iteration += 1
@@ -142,56 +259,46 @@ class SquadOrchestrator:
             
             iteration_result = {}
             
-            # 1. 요구사항 분석
-            if 'RequirementAnalyzer' in self.agents:
-                req_result = await self.runtime.execute_agent(
-                    'RequirementAnalyzer',
-                    self.agents['RequirementAnalyzer'],
-                    task
+            # 1~4. 요구사항/현재 상태/외부 리서치/갭 분석 (문서 의존성 DAG로 스케줄링)
+            analysis_dag = self.build_dag(full_dag.ancestors('GapAnalyzer') + ['GapAnalyzer'])
+            
+            # 분석 에이전트는 부수 효과가 없으므로 입력이 같으면 이전 보고서를 재사용
+            project_digest = None
+            if self.config.enable_incremental:
+                project_digest = await asyncio.to_thread(
+                    self.project_digest.snapshot,
+                    task.get('project_path') or task.get('input_data', {}).get('project_path'),
+                    [task.get('output_dir')]
                 )
-                iteration_result['requirements'] = req_result
             
-            # 2. 현재 상태 분석 (병렬 실행)
-            state_agents = [
-                ('StaticAnalyzer', self.agents.get('StaticAnalyzer'), task),
-                ('CodeAnalysisAgent', self.agents.get('CodeAnalysisAgent'), task),
-                ('BehaviorAnalyzer', self.agents.get('BehaviorAnalyzer'), task),
-                ('ImpactAnalyzer', self.agents.get('ImpactAnalyzer'), task),
-                ('QualityGate', self.agents.get('QualityGate'), task)
-            ]
+            def analysis_task(name: str, task: Dict[str, Any] = task) -> Dict[str, Any]:
+                if name in ('ExternalResearcher', 'GapAnalyzer'):
+                    return {**task, 'shared_context': self.runtime.get_shared_context()}
+                return task
+            
+            analysis_run = await self._run_dag(analysis_dag, analysis_task, project_digest)
+            analysis = analysis_run.results
             
-            state_agents = [(n, f, t) for n, f, t in state_agents if f is not None]
+            if 'RequirementAnalyzer' in analysis:
+                iteration_result['requirements'] = analysis['RequirementAnalyzer']
             
-            if state_agents:
-                state_results = await self.runtime.execute_parallel(state_agents)
+            state_results = [analysis[name] for name in STATE_ANALYZERS if name in analysis]
+            if state_results:
                 iteration_result['current_state'] = state_results
             
-            # 3. 외부 리서치
-            if 'ExternalResearcher' in self.agents:
-                research_result = await self.runtime.execute_agent(
-                    'ExternalResearcher',
-                    self.agents['ExternalResearcher'],
-                    task
-                )
-                iteration_result['research'] = research_result
+            if 'ExternalResearcher' in analysis:
+                iteration_result['research'] = analysis['ExternalResearcher']
             
-            # 4. 갭 분석
-            if 'GapAnalyzer' in self.agents:
-                gap_task = {
-                    **task,
-                    'shared_context': self.runtime.get_shared_context()
-                }
-                gap_result = await self.runtime.execute_agent(
-                    'GapAnalyzer',
-                    self.agents['GapAnalyzer'],
-                    gap_task
-                )
+            if 'GapAnalyzer' in analysis:
+                gap_result = analysis['GapAnalyzer']
                 iteration_result['gap_analysis'] = gap_result
                 
                 # 갭 스코어 업데이트
                 self.gap_score = gap_result.get('gap_score', self.gap_score)
                 logger.info(f"📊 현재 갭 스코어: {self.gap_score:.2%}")
             
+            iteration_result['schedule'] = analysis_run.summary()
+            
             # 5. 갭이 임계값 이하면 종료
             if self.gap_score <= (1 - self.config.convergence_threshold):
                 logger.info(f"✅ 수렴 달성! 갭 스코어: {self.gap_score:.2%}")
@@ -199,34 +306,45 @@ class SquadOrchestrator:
                 results['final_gap_score'] = self.gap_score
                 break
             
-            # 6. 개선 작업 실행
-            improvement_agents = [
-                'SystemArchitect',
-                'OrchestratorDesigner',
-                'PlannerAgent',
-                'TaskCreatorAgent',
-                'CodeGenerator',
-                'TestAgent'
-            ]
-            
-            for agent_name in improvement_agents:
-                if agent_name in self.agents:
-                    improvement_task = {
-                        **task,
-                        'gap_analysis': iteration_result.get('gap_analysis', {}),
-                        'shared_context': self.runtime.get_shared_context()
-                    }
-                    
-                    result = await self.runtime.execute_agent(
-                        agent_name,
-                        self.agents[agent_name],
-                        improvement_task
-                    )
-                    iteration_result[agent_name.lower()] = result
+            # 6. 개선 작업 실행 (갭 보고서를 읽는 에이전트들, 의존성이 없는 에이전트끼리는 병렬)
+            #    코드/테스트를 만드는 부수 효과가 있으므로 항상 실행
+            improvement_dag = self.build_dag(full_dag.descendants('GapAnalyzer'))
+            
+            gap_analysis = iteration_result.get('gap_analysis', {})
+            
+            def improvement_task(
+                name: str,
+                task: Dict[str, Any] = task,
+                gap_analysis: Dict[str, Any] = gap_analysis
+            ) -> Dict[str, Any]:
+                return {
+                    **task,
+                    'gap_analysis': gap_analysis,
+                    'shared_context': self.runtime.get_shared_context()
+                }
+            
+            improvement_run = await self._run_dag(improvement_dag, improvement_task)
+            for agent_name in improvement_run.order:
+                iteration_result[agent_name.lower()] = improvement_run.results[agent_name]
+            
+            # 개선 단계는 갭 분석이 끝난 뒤 시작하므로 반복의 임계 경로는 두 단계의 합
+            iteration_result['schedule'] = {
+                'order': analysis_run.order + improvement_run.order,
+                'critical_path': analysis_run.critical_path + improvement_run.critical_path,
+                'critical_path_seconds': analysis_run.critical_path_seconds + improvement_run.critical_path_seconds,
+                'wall_seconds': analysis_run.wall_seconds + improvement_run.wall_seconds,
+                'max_concurrency': max(analysis_run.max_concurrency, improvement_run.max_concurrency),
+                'reused': analysis_run.reused + improvement_run.reused
+            }
             
             # 반복 결과 저장
             results['iterations'].append(iteration_result)
             
+            for callback in self.iteration_callbacks:
+                callback_result = callback(self.current_iteration, iteration_result)
+                if asyncio.iscoroutine(callback_result):
+                    await callback_result
+            
             # 다음 반복을 위한 작업 업데이트
             task = {
                 **task,
@@ -238,6 +356,7 @@ class SquadOrchestrator:
         results['total_iterations'] = self.current_iteration
         results['final_context'] = self.runtime.get_shared_context()
         results['execution_metrics'] = self.runtime.get_execution_metrics()
+        results['incremental'] = self.result_memo.get_stats()
         
         logger.info(f"🏁 Evolution Loop 완료 (총 {self.current_iteration}회 반복)")
         
@@ -276,18 +395,19 @@ class SquadOrchestrator:
 }}
 """
             
+            # 라우팅 결정은 짧은 분류 작업이므로 경량 모델로 라우팅
             ai_decision = await self.runtime._invoke_bedrock(
                 decision_prompt,
-                {'task': task}
+                {'task': task},
+                task_class="classify"
             )
             
-            # AI 결정 파싱 (간단한 예시)
-            import json
+            # AI 결정 파싱 (코드 펜스/잘린 JSON 복구, 실패율은 에이전트별로 집계)
             try:
-                decision = json.loads(ai_decision)
+                decision = StructuredOutputParser("SquadOrchestrator", Dict[str, Any]).parse(ai_decision)
                 next_agents = decision.get('next_agents', [remaining_agents[0]])
                 execution_type = decision.get('execution_type', 'sequential')
-            except:
+            except StructuredOutputError:
                 # 파싱 실패 시 순차 실행
                 next_agents = [remaining_agents[0]]
                 execution_type = 'sequential'
@@ -383,7 +503,7 @@ class SquadOrchestrator:
     async def _execute_hybrid(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """하이브리드 실행.
         
-        일부는 순차, 일부는 병렬로 실행합니다.
+        의존성이 있는 에이전트는 순차, 없는 에이전트는 병렬로 실행합니다.
         
         Args:
             task: 작업
@@ -393,34 +513,18 @@ class SquadOrchestrator:
         """
         logger.info("🔀 하이브리드 실행 시작")
         
-        results = {}
-        
-        # 예시: 분석 에이전트는 병렬, 실행 에이전트는 순차
+        # 분석 에이전트와 실행 에이전트를 문서 의존성 DAG로 스케줄링
         analysis_agents = ['RequirementAnalyzer', 'StaticAnalyzer', 'CodeAnalysisAgent']
         execution_agents = ['PlannerAgent', 'TaskCreatorAgent', 'CodeGenerator']
         
-        # 분석 단계 (병렬)
-        parallel_tasks = [
-            (name, self.agents[name], task)
-            for name in analysis_agents if name in self.agents
-        ]
-        
-        if parallel_tasks:
-            parallel_results = await self.runtime.execute_parallel(parallel_tasks)
-            for name, result in zip([t[0] for t in parallel_tasks], parallel_results):
-                results[name] = result
+        dag = self.build_dag(analysis_agents + execution_agents)
+        run = await self._run_dag(
+            dag,
+            lambda name: task if name in analysis_agents
+            else {**task, 'shared_context': self.runtime.get_shared_context()}
+        )
         
-        # 실행 단계 (순차)
-        for agent_name in execution_agents:
-            if agent_name in self.agents:
-                result = await self.runtime.execute_agent(
-                    agent_name,
-                    self.agents[agent_name],
-                    {**task, 'shared_context': self.runtime.get_shared_context()}
-                )
-                results[agent_name] = result
-        
-        return results
+        return {name: run.results[name] for name in run.order}
     
     def get_gap_score(self) -> float:
         """현재 갭 스코어 반환.
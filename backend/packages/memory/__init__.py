@@ -8,14 +8,50 @@ Manages 5 types of contexts for the T-Developer system:
 - OBS_CTX: Observer context (metrics, anomalies)
 """
 
+from .client import MemoryHubClient
+from .codecs import MemoryCodec, content_fingerprint, get_codec
+from .context_builder import ContextBuilder
 from .contexts import ContextType, MemoryContext
+from .eviction import (
+    EvictionPolicy,
+    LFUEvictionPolicy,
+    LRUEvictionPolicy,
+    TTLFirstEvictionPolicy,
+    get_eviction_policy,
+)
 from .hub import MemoryHub
-from .storage import MemoryStorage, JSONMemoryStorage
+from .metrics import MemoryMetrics, get_memory_metrics
+from .query import MemoryQuery
+from .server import MemoryHubServer
+from .storage import (
+    MemoryStorage,
+    JSONMemoryStorage,
+    SQLiteMemoryStorage,
+    WALMemoryStorage,
+    get_memory_storage,
+)
 
 __all__ = [
     "ContextType",
     "MemoryContext",
+    "ContextBuilder",
+    "MemoryCodec",
+    "get_codec",
+    "content_fingerprint",
+    "EvictionPolicy",
+    "LRUEvictionPolicy",
+    "LFUEvictionPolicy",
+    "TTLFirstEvictionPolicy",
+    "get_eviction_policy",
     "MemoryHub",
+    "MemoryMetrics",
+    "get_memory_metrics",
+    "MemoryQuery",
+    "MemoryHubServer",
+    "MemoryHubClient",
     "MemoryStorage",
     "JSONMemoryStorage",
+    "SQLiteMemoryStorage",
+    "WALMemoryStorage",
+    "get_memory_storage",
 ]
\ No newline at end of file
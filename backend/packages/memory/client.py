@@ -0,0 +1,378 @@
+"""Async client for MemoryHubServer.
+
+MemoryHubClient implements the MemoryHub API (put/get/search/delete/...)
+on top of a Unix socket connection, so code written against MemoryHub can
+use a hub owned by another thread or process unchanged. Concurrent calls
+are pipelined over the single connection and matched to their responses
+by request id.
+
+The client is bound to the event loop it was initialized in; a thread
+running its own loop should create its own client.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
+
+from .codecs import MemoryCodec
+from .contexts import ContextType
+from .protocol import encode_frame, get_socket_path, get_wire_codec, read_frame
+from .query import MemoryQuery
+
+logger = logging.getLogger(__name__)
+
+# Server-side exception types re-raised as the same builtin on the client
+_ERROR_TYPES = {
+    "ValueError": ValueError,
+    "KeyError": KeyError,
+    "TypeError": TypeError,
+}
+
+
+class MemoryHubClient:
+    """Drop-in async replacement for MemoryHub backed by a MemoryHubServer.
+
+    Attributes:
+        socket_path: Path of the server's Unix domain socket
+        codec: Codec used for frame payloads (must match the server)
+        timeout: Seconds to wait for a response (None waits forever)
+    """
+
+    def __init__(
+        self,
+        socket_path: Optional[str] = None,
+        codec: Union[str, MemoryCodec, None] = None,
+        timeout: Optional[float] = 30.0
+    ) -> None:
+        """Initialize the client.
+
+        Args:
+            socket_path: Socket path (defaults to MEMORY_SOCKET or
+                /tmp/t-developer/memory.sock)
+            codec: Wire codec (compact JSON by default)
+            timeout: Seconds to wait for each response
+        """
+        self.socket_path = get_socket_path(socket_path)
+        self.codec = get_wire_codec(codec)
+        self.timeout = timeout
+        self._reader: Optional[asyncio.StreamReader] = None
+        self._writer: Optional[asyncio.StreamWriter] = None
+        self._reader_task: Optional[asyncio.Task] = None
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._ids = itertools.count(1)
+        self._initialized = False
+
+    async def initialize(self) -> None:
+        """Connect to the server.
+
+        Raises:
+            ConnectionError: If no server listens on the socket
+        """
+        if self._initialized:
+            return
+
+        try:
+            self._reader, self._writer = await asyncio.open_unix_connection(self.socket_path)
+        except (FileNotFoundError, ConnectionRefusedError) as e:
+            raise ConnectionError(f"No memory hub server at {self.socket_path}") from e
+
+        self._reader_task = asyncio.create_task(self._read_responses())
+        self._initialized = True
+
+    async def shutdown(self) -> None:
+        """Close the connection. The served hub keeps running."""
+        self._initialized = False
+        if self._writer:
+            self._writer.close()
+            try:
+                await self._writer.wait_closed()
+            except ConnectionError:
+                pass
+        if self._reader_task:
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except asyncio.CancelledError:
+                pass
+        self._fail_pending(ConnectionError("Memory hub client closed"))
+        self._reader = self._writer = self._reader_task = None
+
+    async def _read_responses(self) -> None:
+        """Resolve pending requests as their responses arrive."""
+        error: Exception = ConnectionError("Memory hub server closed the connection")
+        try:
+            while True:
+                response = await read_frame(self._reader, self.codec)
+                if response is None:
+                    break
+                future = self._pending.pop(response.get("id"), None)
+                if future and not future.done():
+                    future.set_result(response)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            error = ConnectionError(f"Memory hub connection failed: {e}")
+        self._initialized = False
+        self._fail_pending(error)
+
+    def _fail_pending(self, error: Exception) -> None:
+        """Fail every request still waiting for a response."""
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
+
+    async def _call(self, op: str, **args: Any) -> Any:
+        """Send one request and wait for its response.
+
+        Args:
+            op: Hub operation name
+            **args: Operation arguments
+
+        Returns:
+            The operation result
+
+        Raises:
+            RuntimeError: If the client is not initialized or the hub failed
+        """
+        if not self._initialized:
+            raise RuntimeError("Memory Hub not initialized")
+
+        if isinstance(args.get("context_type"), ContextType):
+            args["context_type"] = args["context_type"].value
+
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            self._writer.write(
+                encode_frame(self.codec, {"id": request_id, "op": op, "args": args})
+            )
+            await self._writer.drain()
+            response = await asyncio.wait_for(future, self.timeout)
+        finally:
+            self._pending.pop(request_id, None)
+
+        if not response.get("ok"):
+            error_type = _ERROR_TYPES.get(response.get("error_type"), RuntimeError)
+            raise error_type(response.get("error"))
+        return response.get("result")
+
+    async def ping(self) -> bool:
+        """Check that the server responds.
+
+        Returns:
+            True if the server answered
+        """
+        return await self._call("ping") == "pong"
+
+    async def put(
+        self,
+        context_type: ContextType,
+        key: str,
+        value: Any,
+        ttl_seconds: Optional[int] = None,
+        tags: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> bool:
+        """Store a value in the specified context.
+
+        Args:
+            context_type: The context to store in
+            key: Unique key for the value
+            value: The value to store
+            ttl_seconds: Optional time to live in seconds
+            tags: Optional tags for categorization
+            metadata: Optional metadata dictionary
+
+        Returns:
+            True if successful, False otherwise
+        """
+        return await self._call(
+            "put", context_type=context_type, key=key, value=value,
+            ttl_seconds=ttl_seconds, tags=tags, metadata=metadata
+        )
+
+    async def put_many(
+        self,
+        context_type: ContextType,
+        items: List[Dict[str, Any]]
+    ) -> bool:
+        """Store several values in one context with one round trip.
+
+        Args:
+            context_type: The context to store in
+            items: Dictionaries with the arguments of put()
+
+        Returns:
+            True if every item was stored, False otherwise
+        """
+        return await self._call("put_many", context_type=context_type, items=list(items))
+
+    async def get(self, context_type: ContextType, key: str) -> Optional[Any]:
+        """Retrieve a value from the specified context.
+
+        Args:
+            context_type: The context to retrieve from
+            key: The key to look up
+
+        Returns:
+            The stored value or None if not found/expired
+        """
+        return await self._call("get", context_type=context_type, key=key)
+
+    async def get_many(self, context_type: ContextType, keys: List[str]) -> Dict[str, Any]:
+        """Retrieve several values from one context with one round trip.
+
+        Args:
+            context_type: The context to retrieve from
+            keys: The keys to look up
+
+        Returns:
+            Dictionary of key to value for the keys found
+        """
+        return await self._call("get_many", context_type=context_type, keys=list(keys))
+
+    async def write(
+        self,
+        context_type: ContextType,
+        key: str,
+        value: Any,
+        **kwargs
+    ) -> bool:
+        """Alias for put() method for backward compatibility."""
+        return await self.put(context_type, key, value, **kwargs)
+
+    async def read(self, context_type: ContextType, key: str) -> Optional[Any]:
+        """Alias for get() method for backward compatibility."""
+        return await self.get(context_type, key)
+
+    async def search(
+        self,
+        context_type: ContextType,
+        tags: Optional[List[str]] = None,
+        limit: int = 100
+    ) -> List[Dict[str, Any]]:
+        """Search for entries in a context.
+
+        Args:
+            context_type: The context to search in
+            tags: Optional tags to filter by
+            limit: Maximum number of results
+
+        Returns:
+            List of matching entries as dictionaries
+        """
+        return await self._call("search", context_type=context_type, tags=tags, limit=limit)
+
+    async def query(
+        self,
+        context_type: ContextType,
+        query: Union[MemoryQuery, Dict[str, Any], None] = None,
+        **criteria: Any
+    ) -> Dict[str, Any]:
+        """Query a context with tag logic, predicates, projection and paging.
+
+        Args:
+            context_type: The context to query
+            query: A MemoryQuery (or its dictionary form)
+            **criteria: MemoryQuery attributes
+
+        Returns:
+            Dictionary with ``items`` and ``next_cursor``
+        """
+        query = MemoryQuery.coerce(query, **criteria)
+        return await self._call("query", context_type=context_type, query=query.to_dict())
+
+    async def scan(
+        self,
+        context_type: ContextType,
+        query: Union[MemoryQuery, Dict[str, Any], None] = None,
+        **criteria: Any
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over every match of a query, one page per round trip.
+
+        Args:
+            context_type: The context to query
+            query: A MemoryQuery (or its dictionary form)
+            **criteria: MemoryQuery attributes
+
+        Yields:
+            Projected entries
+        """
+        query = MemoryQuery.coerce(query, **criteria)
+        while True:
+            page = await self.query(context_type, query)
+            for item in page["items"]:
+                yield item
+            if not page["next_cursor"]:
+                return
+            query = MemoryQuery.coerce(query, cursor=page["next_cursor"])
+
+    async def delete(self, context_type: ContextType, key: str) -> bool:
+        """Delete an entry from a context.
+
+        Args:
+            context_type: The context to delete from
+            key: The key to delete
+
+        Returns:
+            True if deleted, False if not found
+        """
+        return await self._call("delete", context_type=context_type, key=key)
+
+    async def delete_many(self, context_type: ContextType, keys: List[str]) -> int:
+        """Delete several entries from one context with one round trip.
+
+        Args:
+            context_type: The context to delete from
+            keys: The keys to delete
+
+        Returns:
+            Number of entries deleted
+        """
+        return await self._call("delete_many", context_type=context_type, keys=list(keys))
+
+    async def clear_context(self, context_type: ContextType) -> bool:
+        """Clear all entries in a context.
+
+        Args:
+            context_type: The context to clear
+
+        Returns:
+            True if successful, False otherwise
+        """
+        return await self._call("clear_context", context_type=context_type)
+
+    async def get_context_stats(self, context_type: ContextType) -> Dict[str, Any]:
+        """Get statistics about a context.
+
+        Args:
+            context_type: The context to get stats for
+
+        Returns:
+            Dictionary containing context statistics
+        """
+        return await self._call("get_context_stats", context_type=context_type)
+
+    async def flush(self) -> bool:
+        """Persist the served hub's pending write-behind changes now.
+
+        Returns:
+            True if every context was persisted, False otherwise
+        """
+        return await self._call("flush")
+
+    async def get_write_behind_stats(self) -> Dict[str, Any]:
+        """Get the served hub's write-behind counters.
+
+        Unlike MemoryHub.get_write_behind_stats() this is a coroutine, as it
+        needs a round trip to the server.
+
+        Returns:
+            Dictionary with write, coalescing and flush latency counters
+        """
+        return await self._call("get_write_behind_stats")
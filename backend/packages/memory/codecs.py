@@ -0,0 +1,251 @@
+"""Serialization codecs for memory persistence and document exports.
+
+A codec turns plain Python data (dicts, lists, strings, numbers and
+datetimes) into bytes and back. Datetimes are round-tripped in every
+codec, matching what JSONMemoryStorage does for entry timestamps:
+
+- ``json``: stdlib json with ``indent=2`` (the historical on-disk format)
+- ``orjson``: compact JSON through orjson, several times faster
+- ``msgpack``: compact binary format, smallest on disk
+
+orjson and msgpack are optional dependencies; asking for a codec whose
+package is not installed raises ImportError with an install hint.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Any, Dict, Optional, Union
+
+# Marker used to tag datetimes inside JSON documents
+DATETIME_TAG = "__datetime__"
+_DATETIME_TAG_BYTES = DATETIME_TAG.encode()
+# msgpack extension type code for datetimes
+_MSGPACK_DATETIME_EXT = 1
+
+
+def _encode_default(value: Any) -> Any:
+    """Fallback encoder: tag datetimes, stringify anything else."""
+    if isinstance(value, datetime):
+        return {DATETIME_TAG: value.isoformat()}
+    if isinstance(value, (set, tuple)):
+        return list(value)
+    return str(value)
+
+
+def _restore_datetimes(value: Any) -> Any:
+    """Replace tagged datetime dicts in decoded JSON data."""
+    if isinstance(value, dict):
+        if len(value) == 1 and DATETIME_TAG in value:
+            return datetime.fromisoformat(value[DATETIME_TAG])
+        return {key: _restore_datetimes(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_restore_datetimes(item) for item in value]
+    return value
+
+
+def content_fingerprint(value: Any) -> str:
+    """Content hash of JSON-like data, stable across key order.
+
+    Args:
+        value: Data to hash (values json cannot encode are stringified)
+
+    Returns:
+        SHA-256 hex digest, equal for equal content
+    """
+    try:
+        encoded = json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+    except TypeError:
+        # Keys of mixed types cannot be sorted
+        encoded = json.dumps(value, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class MemoryCodec(ABC):
+    """Abstract base class for serialization codecs.
+
+    Attributes:
+        name: Codec name used for configuration
+        extension: File extension for files written with this codec
+    """
+
+    name: str = "base"
+    extension: str = ".bin"
+
+    @abstractmethod
+    def encode(self, data: Any) -> bytes:
+        """Encode data to bytes.
+
+        Args:
+            data: Data to encode
+
+        Returns:
+            Encoded bytes
+        """
+        pass
+
+    @abstractmethod
+    def decode(self, payload: bytes) -> Any:
+        """Decode bytes produced by encode().
+
+        Args:
+            payload: Encoded bytes
+
+        Returns:
+            Decoded data with datetimes restored
+        """
+        pass
+
+
+class JSONCodec(MemoryCodec):
+    """Stdlib json codec (human readable, the default on-disk format)."""
+
+    name = "json"
+    extension = ".json"
+
+    def __init__(self, indent: Optional[int] = 2, ensure_ascii: bool = True) -> None:
+        """Initialize the JSON codec.
+
+        Args:
+            indent: Indentation (None for compact output)
+            ensure_ascii: Escape non-ASCII characters
+        """
+        self.indent = indent
+        self.ensure_ascii = ensure_ascii
+
+    def encode(self, data: Any) -> bytes:
+        """Encode data as (indented) JSON."""
+        return json.dumps(
+            data, indent=self.indent, ensure_ascii=self.ensure_ascii, default=_encode_default
+        ).encode("utf-8")
+
+    def decode(self, payload: bytes) -> Any:
+        """Decode JSON, restoring tagged datetimes."""
+        data = json.loads(payload)
+        if _DATETIME_TAG_BYTES in payload:
+            data = _restore_datetimes(data)
+        return data
+
+
+class OrjsonCodec(MemoryCodec):
+    """orjson codec (compact JSON, native speed)."""
+
+    name = "orjson"
+    extension = ".json"
+
+    def __init__(self) -> None:
+        """Initialize the orjson codec.
+
+        Raises:
+            ImportError: If orjson is not installed
+        """
+        try:
+            import orjson
+        except ImportError as e:
+            raise ImportError("orjson codec requires 'pip install orjson'") from e
+
+        self._orjson = orjson
+        # Route datetimes through _encode_default so they are tagged
+        self._options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+    def encode(self, data: Any) -> bytes:
+        """Encode data as compact JSON."""
+        return self._orjson.dumps(data, default=_encode_default, option=self._options)
+
+    def decode(self, payload: bytes) -> Any:
+        """Decode JSON, restoring tagged datetimes."""
+        data = self._orjson.loads(payload)
+        if _DATETIME_TAG_BYTES in payload:
+            data = _restore_datetimes(data)
+        return data
+
+
+class MsgpackCodec(MemoryCodec):
+    """msgpack codec (compact binary)."""
+
+    name = "msgpack"
+    extension = ".msgpack"
+
+    def __init__(self) -> None:
+        """Initialize the msgpack codec.
+
+        Raises:
+            ImportError: If msgpack is not installed
+        """
+        try:
+            import msgpack
+        except ImportError as e:
+            raise ImportError("msgpack codec requires 'pip install msgpack'") from e
+
+        self._msgpack = msgpack
+
+    def _default(self, value: Any) -> Any:
+        """Encode datetimes as an extension type, fall back otherwise."""
+        if isinstance(value, datetime):
+            return self._msgpack.ExtType(_MSGPACK_DATETIME_EXT, value.isoformat().encode())
+        return _encode_default(value)
+
+    @staticmethod
+    def _ext_hook(code: int, data: bytes) -> Any:
+        """Decode the datetime extension type."""
+        if code == _MSGPACK_DATETIME_EXT:
+            return datetime.fromisoformat(data.decode())
+        raise ValueError(f"Unknown msgpack extension type: {code}")
+
+    def encode(self, data: Any) -> bytes:
+        """Encode data as msgpack."""
+        return self._msgpack.packb(data, default=self._default, use_bin_type=True)
+
+    def decode(self, payload: bytes) -> Any:
+        """Decode msgpack, restoring datetimes."""
+        return self._msgpack.unpackb(
+            payload, ext_hook=self._ext_hook, raw=False, strict_map_key=False
+        )
+
+
+CODECS = {
+    JSONCodec.name: JSONCodec,
+    OrjsonCodec.name: OrjsonCodec,
+    MsgpackCodec.name: MsgpackCodec,
+}
+
+
+def get_codec(codec: Union[str, MemoryCodec, None] = None) -> MemoryCodec:
+    """Codec 인스턴스를 가져옵니다.
+
+    Args:
+        codec: Codec 이름 ("json", "orjson", "msgpack"), 인스턴스 또는 None(json)
+
+    Returns:
+        MemoryCodec 인스턴스
+
+    Raises:
+        ValueError: 알 수 없는 codec 이름
+        ImportError: 필요한 패키지가 설치되지 않은 경우
+    """
+    if isinstance(codec, MemoryCodec):
+        return codec
+
+    codec_class = CODECS.get((codec or "json").lower())
+    if codec_class is None:
+        raise ValueError(f"Unknown codec: {codec}. Available: {', '.join(CODECS)}")
+    return codec_class()
+
+
+def available_codecs() -> Dict[str, bool]:
+    """Report which codecs can be used in this environment.
+
+    Returns:
+        Dictionary of codec name to availability
+    """
+    availability = {}
+    for name in CODECS:
+        try:
+            get_codec(name)
+            availability[name] = True
+        except ImportError:
+            availability[name] = False
+    return availability
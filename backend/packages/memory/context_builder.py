@@ -0,0 +1,242 @@
+"""ContextBuilder - 토큰 예산 기반 AI 프롬프트 컨텍스트 생성
+
+SharedDocumentContext의 문서를 호출한 에이전트와의 관련도 순으로 정렬하고,
+토큰 예산 안에 들어가는 문서는 전체를, 넘치는 문서는 요약을 넣습니다.
+요약도 들어가지 않는 문서는 이름만 omitted_documents에 남깁니다.
+
+문서별로 렌더링한 조각은 내용 fingerprint를 키로 캐시하므로,
+바뀌지 않은 문서는 다시 직렬화하지 않습니다.
+"""
+
+import json
+import logging
+import math
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from .codecs import content_fingerprint
+
+if TYPE_CHECKING:
+    from .document_context import SharedDocumentContext
+
+logger = logging.getLogger(__name__)
+
+# BaseAgent 프롬프트에 기본으로 허용하는 컨텍스트 토큰 수
+DEFAULT_CONTEXT_TOKEN_BUDGET = 8000
+
+# 에이전트별로 우선 참조하는 문서 (Evolution Loop 실행 순서 기준)
+DEFAULT_RELEVANCE: Dict[str, List[str]] = {
+    "ImpactAnalyzer": ["StaticAnalyzer", "CodeAnalysisAgent"],
+    "QualityGate": ["StaticAnalyzer", "CodeAnalysisAgent", "ImpactAnalyzer"],
+    "GapAnalyzer": [
+        "RequirementAnalyzer",
+        "StaticAnalyzer",
+        "CodeAnalysisAgent",
+        "BehaviorAnalyzer",
+        "ImpactAnalyzer",
+        "QualityGate",
+    ],
+    "SystemArchitect": ["RequirementAnalyzer", "GapAnalyzer", "ExternalResearcher"],
+    "OrchestratorDesigner": ["SystemArchitect", "GapAnalyzer"],
+    "PlannerAgent": ["GapAnalyzer", "SystemArchitect", "OrchestratorDesigner"],
+    "TaskCreatorAgent": ["PlannerAgent", "SystemArchitect"],
+    "CodeGenerator": ["TaskCreatorAgent", "SystemArchitect", "CodeAnalysisAgent"],
+    "TestAgent": ["CodeGenerator", "TaskCreatorAgent"],
+}
+
+
+def estimate_tokens(text: str) -> int:
+    """텍스트의 토큰 수 추정
+
+    UTF-8 4바이트당 1토큰으로 계산합니다 (영문 약 4자, 한글 약 1.3자).
+
+    Args:
+        text: 토큰 수를 추정할 텍스트
+
+    Returns:
+        추정 토큰 수
+    """
+    return math.ceil(len(text.encode("utf-8")) / 4)
+
+
+class ContextBuilder:
+    """토큰 예산과 관련도를 반영하는 프롬프트 컨텍스트 빌더
+
+    Attributes:
+        document_context: 문서를 가져올 SharedDocumentContext
+        relevance: 에이전트별 우선 참조 문서 목록
+        max_cached_fragments: 캐시할 최대 조각 수
+    """
+
+    def __init__(
+        self,
+        document_context: "SharedDocumentContext",
+        relevance: Optional[Dict[str, List[str]]] = None,
+        max_cached_fragments: int = 1024,
+    ):
+        """ContextBuilder 초기화
+
+        Args:
+            document_context: 문서를 가져올 SharedDocumentContext
+            relevance: 에이전트별 우선 참조 문서 목록 (기본 DEFAULT_RELEVANCE)
+            max_cached_fragments: 캐시할 최대 조각 수
+        """
+        self.document_context = document_context
+        self.relevance = DEFAULT_RELEVANCE if relevance is None else relevance
+        self.max_cached_fragments = max_cached_fragments
+        # (fingerprint, "full" | "summary") -> 렌더링된 JSON 조각
+        self._fragments: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+        self._stats = {"hits": 0, "misses": 0}
+
+    def _fragment(self, doc: dict[str, Any], agent_name: str, loop: int, mode: str) -> str:
+        """문서 content를 렌더링한 JSON 조각 (캐시 사용)
+
+        Args:
+            doc: 메타데이터가 포함된 문서
+            agent_name: 문서를 만든 에이전트
+            loop: 문서의 루프 번호
+            mode: "full"이면 content 전체, "summary"면 요약
+
+        Returns:
+            content (또는 요약)의 JSON 텍스트
+        """
+        content = doc.get("content")
+        fingerprint = self.document_context.get_fingerprint(agent_name, loop)
+        if fingerprint is None:
+            fingerprint = content_fingerprint(content)
+
+        key = (fingerprint, mode)
+        fragment = self._fragments.get(key)
+        if fragment is not None:
+            self._fragments.move_to_end(key)
+            self._stats["hits"] += 1
+            return fragment
+
+        self._stats["misses"] += 1
+        if mode == "full":
+            fragment = json.dumps(content, indent=2, ensure_ascii=False, default=str)
+        else:
+            fragment = json.dumps(
+                self.document_context._summarize_content(content), ensure_ascii=False
+            )
+        self._fragments[key] = fragment
+        if len(self._fragments) > self.max_cached_fragments:
+            self._fragments.popitem(last=False)
+        return fragment
+
+    def rank(self, agent_name: Optional[str], documents: dict[str, dict[str, Any]]) -> List[str]:
+        """문서를 에이전트와의 관련도 순으로 정렬
+
+        우선 참조 문서, 에이전트 자신의 문서, 나머지 최신 문서 순입니다.
+        agent_name이 없으면 추가된 순서를 유지합니다.
+
+        Args:
+            agent_name: 컨텍스트를 요청한 에이전트
+            documents: 에이전트 이름별 문서
+
+        Returns:
+            정렬된 에이전트 이름 목록
+        """
+        if agent_name is None:
+            return list(documents)
+
+        preferred = [name for name in self.relevance.get(agent_name, []) if name in documents]
+        if agent_name in documents and agent_name not in preferred:
+            preferred.append(agent_name)
+        rest = sorted(
+            ((documents[name].get("created_at") or "", idx, name)
+             for idx, name in enumerate(documents) if name not in preferred),
+            reverse=True,
+        )
+        return preferred + [name for _, _, name in rest]
+
+    def build(
+        self,
+        agent_name: Optional[str] = None,
+        token_budget: Optional[int] = None,
+        include_history: bool = False,
+        max_history_loops: int = 2,
+    ) -> str:
+        """AI 프롬프트용 컨텍스트 생성
+
+        Args:
+            agent_name: 컨텍스트를 요청한 에이전트 (관련도 정렬에 사용)
+            token_budget: 문서에 쓸 최대 토큰 수 (None이면 제한 없음)
+            include_history: 이전 루프 요약 포함 여부
+            max_history_loops: 포함할 최대 히스토리 루프 수
+
+        Returns:
+            JSON 형식의 문서 컨텍스트
+        """
+        context = self.document_context
+        remaining = math.inf if token_budget is None else token_budget
+        loop = context.current_loop_number
+        documents = context.current_loop_documents
+        omitted: List[str] = []
+
+        current_parts = []
+        for name in self.rank(agent_name, documents):
+            doc = documents[name]
+            header = '"type": %s, "created_at": %s' % (
+                json.dumps(doc.get("type")),
+                json.dumps(doc.get("created_at"), default=str),
+            )
+            full = self._fragment(doc, name, doc.get("loop_number", loop), "full")
+            part = '%s: {%s, "content": %s}' % (json.dumps(name, ensure_ascii=False), header, full)
+            tokens = estimate_tokens(part)
+            if tokens > remaining:
+                summary = self._fragment(doc, name, doc.get("loop_number", loop), "summary")
+                part = '%s: {%s, "content_summary": %s}' % (
+                    json.dumps(name, ensure_ascii=False), header, summary
+                )
+                tokens = estimate_tokens(part)
+                if tokens > remaining:
+                    omitted.append(name)
+                    continue
+            remaining -= tokens
+            current_parts.append(part)
+
+        sections = [
+            '"current_loop": %d' % loop,
+            '"current_documents": {%s}' % ", ".join(current_parts),
+        ]
+
+        history = context.all_documents_history
+        if include_history and history:
+            loop_parts = []
+            start_idx = max(0, len(history) - max_history_loops)
+            for idx in range(start_idx, len(history)):
+                doc_parts = []
+                for name, doc in history[idx].items():
+                    summary = self._fragment(doc, name, doc.get("loop_number", idx), "summary")
+                    part = '%s: {"type": %s, "content_summary": %s}' % (
+                        json.dumps(name, ensure_ascii=False), json.dumps(doc.get("type")), summary
+                    )
+                    tokens = estimate_tokens(part)
+                    if tokens > remaining:
+                        omitted.append(f"loop {idx}: {name}")
+                        continue
+                    remaining -= tokens
+                    doc_parts.append(part)
+                loop_parts.append(
+                    '{"loop_number": %d, "documents": {%s}}' % (idx, ", ".join(doc_parts))
+                )
+            sections.append('"previous_loops": [%s]' % ", ".join(loop_parts))
+
+        if omitted:
+            sections.append('"omitted_documents": %s' % json.dumps(omitted, ensure_ascii=False))
+            logger.debug(f"Context budget exceeded, omitted {len(omitted)} documents")
+
+        return "{%s}" % ", ".join(sections)
+
+    def get_stats(self) -> Dict[str, int]:
+        """조각 캐시 통계
+
+        Returns:
+            캐시 적중/미스 횟수와 캐시된 조각 수
+        """
+        return {**self._stats, "cached_fragments": len(self._fragments)}
+
+    def clear_cache(self) -> None:
+        """조각 캐시 비우기"""
+        self._fragments.clear()
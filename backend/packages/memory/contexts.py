@@ -6,12 +6,130 @@ following the AGCORE-001 specification.
 
 from __future__ import annotations
 
+import heapq
+import json
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
 from uuid import uuid4
 
+if TYPE_CHECKING:
+    from .eviction import EvictionPolicy
+
+# Serialized size of the fixed entry fields (id, timestamps, ttl, field names)
+ENTRY_OVERHEAD_BYTES = 200
+
+
+def estimate_size(value: Any) -> int:
+    """Estimate the compact JSON-serialized size of a value in bytes.
+    
+    Walks the value once without building the JSON string, so it is cheap
+    enough to run on every write.
+    
+    Args:
+        value: The value to measure
+        
+    Returns:
+        Estimated size in bytes
+    """
+    if value is None or value is True:
+        return 4
+    if value is False:
+        return 5
+    if isinstance(value, str):
+        return (len(value) if value.isascii() else len(value.encode("utf-8"))) + 2
+    if isinstance(value, (int, float)):
+        return len(repr(value))
+    if isinstance(value, dict):
+        # "{" + each '"key":value,' (the last comma becomes "}")
+        if not value:
+            return 2
+        return 1 + sum(
+            estimate_size(str(key)) + estimate_size(item) + 2 for key, item in value.items()
+        )
+    if isinstance(value, (list, tuple, set)):
+        if not value:
+            return 2
+        return 1 + sum(estimate_size(item) + 1 for item in value)
+    return len(str(value)) + 2
+
+
+class LazyValue:
+    """Placeholder for an entry value that is still on disk.
+    
+    Storage loaders create it for large values so that loading a context
+    does not decode them. ``MemoryEntry.value`` reads and decodes the value
+    on first access and keeps the result.
+    
+    Attributes:
+        path: File holding the value as one JSON document
+        offset: Byte offset of the value in the file
+        length: Length of the encoded value in bytes
+    """
+    
+    __slots__ = ("path", "offset", "length")
+    
+    def __init__(self, path: str, offset: int, length: int) -> None:
+        """Initialize the placeholder.
+        
+        Args:
+            path: File holding the value
+            offset: Byte offset of the value in the file
+            length: Length of the encoded value in bytes
+        """
+        self.path = path
+        self.offset = offset
+        self.length = length
+    
+    def read_raw(self) -> bytes:
+        """Read the encoded value without decoding it.
+        
+        Returns:
+            The JSON-encoded value
+            
+        Raises:
+            ValueError: If the file is shorter than expected
+        """
+        with open(self.path, "rb") as f:
+            f.seek(self.offset)
+            raw = f.read(self.length)
+        if len(raw) != self.length:
+            raise ValueError(f"Truncated value at {self.path}:{self.offset}")
+        return raw
+    
+    def load(self) -> Any:
+        """Read and decode the value.
+        
+        Returns:
+            The decoded value
+        """
+        return json.loads(self.read_raw())
+    
+    def __repr__(self) -> str:
+        return f"LazyValue({self.path!r}, offset={self.offset}, length={self.length})"
+
+
+class _HydratingValue:
+    """Data descriptor for ``MemoryEntry.value`` that resolves LazyValue on read."""
+    
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.attr = f"_{name}"
+    
+    def __get__(self, obj: Any, objtype: Optional[type] = None) -> Any:
+        if obj is None:
+            # Dataclass default
+            return None
+        value = obj.__dict__[self.attr]
+        if type(value) is LazyValue:
+            value = value.load()
+            obj.__dict__[self.attr] = value
+        return value
+    
+    def __set__(self, obj: Any, value: Any) -> None:
+        obj.__dict__[self.attr] = value
+
 
 class ContextType(Enum):
     """Memory context types as defined in AGCORE-001.
@@ -39,34 +157,88 @@ class MemoryEntry:
         id: Unique identifier for the entry
         context_type: Type of context this entry belongs to
         key: Unique key within the context
-        value: The actual memory data
+        value: The actual memory data (a LazyValue given here is decoded
+            on first access)
         metadata: Additional metadata about the entry
         created_at: Timestamp of creation
         updated_at: Timestamp of last update
         ttl_seconds: Time to live in seconds (None = permanent)
         tags: List of tags for categorization and search
+        size_bytes: Estimated serialized size (maintained by MemoryContext)
+        access_count: Number of reads and writes (used by LFU eviction)
     """
     
     id: str = field(default_factory=lambda: str(uuid4()))
     context_type: ContextType = ContextType.S_CTX
     key: str = ""
-    value: Any = None
+    value: Any = _HydratingValue()
     metadata: Dict[str, Any] = field(default_factory=dict)
     created_at: datetime = field(default_factory=datetime.utcnow)
     updated_at: datetime = field(default_factory=datetime.utcnow)
     ttl_seconds: Optional[int] = None
     tags: List[str] = field(default_factory=list)
+    size_bytes: int = field(default=0, compare=False)
+    access_count: int = field(default=0, compare=False)
     
-    def is_expired(self) -> bool:
+    def raw_value(self) -> Any:
+        """Get the value without decoding a pending LazyValue.
+        
+        Returns:
+            The value, or its LazyValue placeholder if not loaded yet
+        """
+        return self.__dict__["_value"]
+    
+    def is_loaded(self) -> bool:
+        """Check whether the value has been decoded.
+        
+        Returns:
+            False while the value is still a LazyValue on disk
+        """
+        return type(self.raw_value()) is not LazyValue
+    
+    def estimate_size(self) -> int:
+        """Estimate the serialized size of this entry in bytes.
+        
+        Pending lazy values are measured by their encoded length, so sizing
+        an entry never loads its value.
+        
+        Returns:
+            Estimated size including key, value, metadata and tags
+        """
+        raw = self.raw_value()
+        value_size = raw.length if type(raw) is LazyValue else estimate_size(raw)
+        return (
+            ENTRY_OVERHEAD_BYTES
+            + estimate_size(self.key)
+            + value_size
+            + estimate_size(self.metadata)
+            + estimate_size(self.tags)
+        )
+    
+    def expires_at(self) -> Optional[datetime]:
+        """Get the moment the entry expires.
+        
+        Returns:
+            Expiry time (UTC) or None if the entry is permanent
+        """
+        if self.ttl_seconds is None:
+            return None
+        
+        return self.created_at + timedelta(seconds=self.ttl_seconds)
+    
+    def is_expired(self, now: Optional[datetime] = None) -> bool:
         """Check if the memory entry has expired.
         
+        Args:
+            now: Current UTC time (computed if not given)
+        
         Returns:
             True if the entry has expired, False otherwise
         """
         if self.ttl_seconds is None:
             return False
         
-        age_seconds = (datetime.utcnow() - self.created_at).total_seconds()
+        age_seconds = ((now or datetime.utcnow()) - self.created_at).total_seconds()
         return age_seconds > self.ttl_seconds
     
     def update(self, value: Any, metadata: Optional[Dict[str, Any]] = None) -> None:
@@ -87,12 +259,33 @@ class MemoryEntry:
 class MemoryContext:
     """A memory context containing multiple entries.
     
+    Besides the entries themselves the context maintains, incrementally on
+    every add/update/remove:
+    
+    - a tag -> keys inverted index, so tag search costs O(matches)
+    - a min-heap of (expires_at, key), so expiry cleanup costs O(expired)
+    - an access order (LRU) and the estimated total size of all entries
+    
+    Entries must therefore be added and removed through the methods below
+    (``restore_entry`` for storage loaders), not by writing ``entries``.
+    
+    When ``max_entries`` or ``max_size_bytes`` is exceeded and an eviction
+    policy is set, expired entries and then the coldest entries are shed.
+    Keys removed implicitly (eviction, expiry found on read) are queued
+    until ``take_evictions()`` so the owner can persist the removals.
+    Without a policy, writes over the limit raise.
+    
     Attributes:
         type: The type of this context
         entries: Dictionary of entries keyed by their unique key
         max_entries: Maximum number of entries allowed (None = unlimited)
         total_size_bytes: Current total size of all entries
         max_size_bytes: Maximum total size allowed (None = unlimited)
+        eviction_policy: Policy choosing entries to shed when over a limit
+        eviction_headroom: Fraction below the limits to evict down to, so
+            policies that rank all entries (LFU) run less often
+        evictions: Number of entries evicted by the policy
+        expirations: Number of entries removed because they expired
     """
     
     type: ContextType
@@ -100,6 +293,166 @@ class MemoryContext:
     max_entries: Optional[int] = None
     total_size_bytes: int = 0
     max_size_bytes: Optional[int] = None
+    eviction_policy: Optional[EvictionPolicy] = field(default=None, compare=False)
+    eviction_headroom: float = field(default=0.0, compare=False)
+    evictions: int = field(default=0, compare=False)
+    expirations: int = field(default=0, compare=False)
+    _access_order: Dict[str, None] = field(
+        default_factory=OrderedDict, init=False, repr=False, compare=False
+    )
+    _pending_evictions: List[str] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    _tag_index: Dict[str, Dict[str, None]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _expiry_heap: List[Tuple[datetime, int, str, str]] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+    _sequence: Dict[str, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _next_sequence: int = field(default=0, init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        """Build the indexes for entries passed to the constructor."""
+        self.total_size_bytes = 0
+        for entry in self.entries.values():
+            self._index_entry(entry)
+    
+    def _index_entry(self, entry: MemoryEntry) -> None:
+        """Add an entry to the indexes and the size accounting."""
+        if entry.key not in self._sequence:
+            self._sequence[entry.key] = self._next_sequence
+            self._next_sequence += 1
+        
+        entry.size_bytes = entry.estimate_size()
+        self.total_size_bytes += entry.size_bytes
+        self._access_order[entry.key] = None
+        self._access_order.move_to_end(entry.key)
+        
+        for tag in entry.tags:
+            self._tag_index.setdefault(tag, {})[entry.key] = None
+        
+        expires_at = entry.expires_at()
+        if expires_at is not None:
+            heapq.heappush(
+                self._expiry_heap,
+                (expires_at, self._sequence[entry.key], entry.key, entry.id)
+            )
+    
+    def _unindex_entry(self, entry: MemoryEntry) -> None:
+        """Remove an entry from the tag index and the size accounting.
+        
+        Heap items are discarded lazily when they reach the top, and the
+        heap is rebuilt once stale items outnumber live ones.
+        """
+        self.total_size_bytes -= entry.size_bytes
+        
+        for tag in entry.tags:
+            keys = self._tag_index.get(tag)
+            if keys is not None:
+                keys.pop(entry.key, None)
+                if not keys:
+                    del self._tag_index[tag]
+        
+        if len(self._expiry_heap) > 2 * len(self.entries) + 64:
+            self._rebuild_expiry_heap()
+    
+    def _rebuild_expiry_heap(self) -> None:
+        """Rebuild the expiry heap from the live entries."""
+        self._expiry_heap = [
+            (expires_at, self._sequence[key], key, entry.id)
+            for key, entry in self.entries.items()
+            if (expires_at := entry.expires_at()) is not None
+        ]
+        heapq.heapify(self._expiry_heap)
+    
+    def _drop(self, key: str) -> Optional[MemoryEntry]:
+        """Remove an entry from the dict and the indexes."""
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self._unindex_entry(entry)
+            self._sequence.pop(key, None)
+            self._access_order.pop(key, None)
+        return entry
+    
+    def _touch(self, entry: MemoryEntry) -> None:
+        """Record an access for LRU/LFU eviction."""
+        entry.access_count += 1
+        self._access_order.move_to_end(entry.key)
+    
+    def access_order(self) -> Iterator[str]:
+        """Iterate keys from least to most recently used.
+        
+        Returns:
+            Iterator over entry keys
+        """
+        return iter(self._access_order)
+    
+    def _over_limits(self, headroom: float = 0.0) -> bool:
+        """Check whether the context exceeds its limits (minus headroom)."""
+        if self.max_entries is not None:
+            if len(self.entries) > self.max_entries * (1 - headroom):
+                return True
+        if self.max_size_bytes is not None:
+            if self.total_size_bytes > self.max_size_bytes * (1 - headroom):
+                return True
+        return False
+    
+    def enforce_limits(self, protect: Optional[str] = None) -> List[str]:
+        """Shed entries until the context is within its limits.
+        
+        Expired entries go first; then, if an eviction policy is set, the
+        coldest entries in policy order. The removed keys are also queued
+        for take_evictions().
+        
+        Args:
+            protect: Key that must not be evicted (the entry just written)
+            
+        Returns:
+            Keys removed by this call
+        """
+        if not self._over_limits():
+            return []
+        
+        removed = self.pop_expired()
+        
+        if self.eviction_policy is not None and self._over_limits():
+            for key in self.eviction_policy.candidates(self):
+                if not self._over_limits(self.eviction_headroom):
+                    break
+                if key == protect or key not in self.entries:
+                    continue
+                self._drop(key)
+                self.evictions += 1
+                removed.append(key)
+        
+        self._pending_evictions.extend(removed)
+        return removed
+    
+    def take_evictions(self) -> List[str]:
+        """Return and clear the keys removed implicitly by expiry or eviction.
+        
+        Returns:
+            Keys removed since the last call
+        """
+        evicted, self._pending_evictions = self._pending_evictions, []
+        return evicted
+    
+    def restore_entry(self, entry: MemoryEntry) -> None:
+        """Insert or replace an existing entry (used by storage loaders).
+        
+        Unlike add_entry this keeps the entry as-is and does not enforce
+        max_entries.
+        
+        Args:
+            entry: The entry to insert
+        """
+        previous = self.entries.get(entry.key)
+        if previous is not None:
+            self._unindex_entry(previous)
+        
+        self.entries[entry.key] = entry
+        self._index_entry(entry)
     
     def add_entry(self, key: str, value: Any, **kwargs: Any) -> MemoryEntry:
         """Add a new entry to the context.
@@ -113,10 +466,11 @@ class MemoryContext:
             The created MemoryEntry
             
         Raises:
-            ValueError: If max_entries would be exceeded
+            ValueError: If a limit would be exceeded and no eviction policy is set
         """
-        if self.max_entries and len(self.entries) >= self.max_entries:
-            raise ValueError(f"Context {self.type.value} has reached maximum entries limit")
+        if self.eviction_policy is None:
+            if self.max_entries and len(self.entries) >= self.max_entries:
+                raise ValueError(f"Context {self.type.value} has reached maximum entries limit")
         
         entry = MemoryEntry(
             context_type=self.type,
@@ -125,7 +479,41 @@ class MemoryContext:
             **kwargs
         )
         
-        self.entries[key] = entry
+        if self.eviction_policy is None and self.max_size_bytes is not None:
+            if self.total_size_bytes + entry.estimate_size() > self.max_size_bytes:
+                raise ValueError(f"Context {self.type.value} has reached maximum size limit")
+        
+        self.restore_entry(entry)
+        self.enforce_limits(protect=key)
+        return entry
+    
+    def update_entry(
+        self,
+        key: str,
+        value: Any,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> Optional[MemoryEntry]:
+        """Update an existing entry and its size accounting.
+        
+        Args:
+            key: The key to update
+            value: New value for the entry
+            metadata: Optional metadata to merge with existing
+            
+        Returns:
+            The updated entry, or None if not found/expired
+        """
+        entry = self.get_entry(key)
+        if entry is None:
+            return None
+        
+        entry.update(value, metadata)
+        self.total_size_bytes -= entry.size_bytes
+        entry.size_bytes = entry.estimate_size()
+        self.total_size_bytes += entry.size_bytes
+        
+        if self.eviction_policy is not None:
+            self.enforce_limits(protect=key)
         return entry
     
     def get_entry(self, key: str) -> Optional[MemoryEntry]:
@@ -140,9 +528,13 @@ class MemoryContext:
         entry = self.entries.get(key)
         
         if entry and entry.is_expired():
-            del self.entries[key]
+            self._drop(key)
+            self.expirations += 1
+            self._pending_evictions.append(key)
             return None
         
+        if entry:
+            self._touch(entry)
         return entry
     
     def remove_entry(self, key: str) -> bool:
@@ -154,10 +546,42 @@ class MemoryContext:
         Returns:
             True if removed, False if not found
         """
-        if key in self.entries:
-            del self.entries[key]
-            return True
-        return False
+        return self._drop(key) is not None
+    
+    def pop_expired(self, now: Optional[datetime] = None) -> List[str]:
+        """Remove expired entries using the expiry heap.
+        
+        Only heap items whose expiry time has passed are visited, so the
+        cost is proportional to the number of expired (or stale) items.
+        
+        Args:
+            now: Current UTC time (computed if not given)
+            
+        Returns:
+            Keys of the removed entries
+        """
+        now = now or datetime.utcnow()
+        removed = []
+        
+        while self._expiry_heap and self._expiry_heap[0][0] < now:
+            _, _, key, entry_id = heapq.heappop(self._expiry_heap)
+            entry = self.entries.get(key)
+            
+            # Stale item: the entry was removed or replaced since it was pushed
+            if entry is None or entry.id != entry_id:
+                continue
+            
+            if entry.is_expired(now):
+                self._drop(key)
+                self.expirations += 1
+                removed.append(key)
+            elif (expires_at := entry.expires_at()) is not None:
+                # TTL or creation time changed after indexing
+                heapq.heappush(
+                    self._expiry_heap, (expires_at, self._sequence[key], key, entry.id)
+                )
+        
+        return removed
     
     def cleanup_expired(self) -> int:
         """Remove all expired entries.
@@ -165,29 +589,95 @@ class MemoryContext:
         Returns:
             Number of entries removed
         """
-        expired_keys = [
-            key for key, entry in self.entries.items()
-            if entry.is_expired()
-        ]
-        
-        for key in expired_keys:
-            del self.entries[key]
+        return len(self.pop_expired())
+    
+    def live_entries(self, now: Optional[datetime] = None) -> List[MemoryEntry]:
+        """Get all non-expired entries in insertion order.
         
-        return len(expired_keys)
+        Args:
+            now: Current UTC time (computed if not given)
+            
+        Returns:
+            List of non-expired entries
+        """
+        now = now or datetime.utcnow()
+        return [entry for entry in self.entries.values() if not entry.is_expired(now)]
     
     def search_by_tags(self, tags: List[str]) -> List[MemoryEntry]:
-        """Search entries by tags.
+        """Search entries by tags using the inverted index.
         
         Args:
             tags: List of tags to search for (OR operation)
             
         Returns:
-            List of matching entries
+            List of matching entries in insertion order
         """
-        results = []
+        now = datetime.utcnow()
+        keys: Dict[str, None] = {}
         
-        for entry in self.entries.values():
-            if not entry.is_expired() and any(tag in entry.tags for tag in tags):
+        for tag in tags:
+            keys.update(self._tag_index.get(tag, {}))
+        
+        results = []
+        for key in sorted(keys, key=self._sequence.__getitem__):
+            entry = self.entries[key]
+            if not entry.is_expired(now):
                 results.append(entry)
         
-        return results
\ No newline at end of file
+        return results
+    
+    def iter_entries(
+        self,
+        all_tags: Optional[List[str]] = None,
+        any_tags: Optional[List[str]] = None,
+        after_sequence: int = -1
+    ) -> Iterator[Tuple[int, MemoryEntry]]:
+        """Lazily yield non-expired entries in insertion order.
+        
+        Candidates come from the inverted index when tags are given, so
+        only entries carrying the tags are visited.
+        
+        Args:
+            all_tags: Tags an entry must all have (AND)
+            any_tags: Tags of which an entry must have at least one (OR)
+            after_sequence: Only yield entries inserted after this position
+            
+        Yields:
+            (insertion position, entry) pairs
+        """
+        now = datetime.utcnow()
+        
+        if all_tags:
+            indexes = sorted(
+                (self._tag_index.get(tag, {}) for tag in all_tags), key=len
+            )
+            keys = [key for key in indexes[0] if all(key in index for index in indexes[1:])]
+            if any_tags:
+                keys = [
+                    key for key in keys
+                    if any(key in self._tag_index.get(tag, {}) for tag in any_tags)
+                ]
+            keys.sort(key=self._sequence.__getitem__)
+        elif any_tags:
+            union: Dict[str, None] = {}
+            for tag in any_tags:
+                union.update(self._tag_index.get(tag, {}))
+            keys = sorted(union, key=self._sequence.__getitem__)
+        else:
+            keys = self.entries
+        
+        for key in keys:
+            sequence = self._sequence[key]
+            if sequence <= after_sequence:
+                continue
+            entry = self.entries[key]
+            if not entry.is_expired(now):
+                yield sequence, entry
+    
+    def tag_counts(self) -> Dict[str, int]:
+        """Get the number of entries per tag from the inverted index.
+        
+        Returns:
+            Dictionary of tag to entry count
+        """
+        return {tag: len(keys) for tag, keys in self._tag_index.items()}
\ No newline at end of file
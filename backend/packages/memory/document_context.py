@@ -8,24 +8,37 @@
 2. 루프별 문서 히스토리 관리
 3. 에이전트 간 문서 참조 체계 제공
 4. AI 프롬프트용 문서 컨텍스트 생성
+5. 변경분만 담는 버전별 델타 스냅샷 (증분 저장)
+
+루프 간 내용이 같은 문서는 하나의 content 객체를 공유하므로(copy-on-write)
+반복 횟수가 늘어도 메모리 사용량이 일정하게 유지됩니다.
 
 이를 통해 AI 드리븐 동적 오케스트레이터가 모든 정보를 바탕으로
 최적의 의사결정을 할 수 있습니다.
 """
 
-import json
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Optional, Tuple, Union
+
+from .codecs import MemoryCodec, content_fingerprint, get_codec
+from .context_builder import ContextBuilder
 
 logger = logging.getLogger(__name__)
 
+DELTA_FORMAT = "shared-document-context-delta"
+
 
 class SharedDocumentContext:
     """루프 내 모든 문서를 공유하는 컨텍스트
 
     Evolution Loop의 각 반복에서 생성되는 모든 문서를 중앙에서 관리하며,
     모든 에이전트가 필요한 정보를 즉시 참조할 수 있도록 합니다.
+
+    문서가 추가될 때마다 version이 증가하고 변경된 (루프, 에이전트)가
+    기록됩니다. export_delta()/save_incremental()은 마지막 델타 이후 변경된
+    문서만 내보내며, 이전 루프와 내용이 같은 문서는 참조로만 기록합니다.
     """
 
     def __init__(self):
@@ -38,6 +51,38 @@ class SharedDocumentContext:
             "total_documents": 0,
             "total_loops": 0,
         }
+        self.version: int = 0
+        # 루프 번호별 에이전트 문서 내용 fingerprint
+        self._fingerprints: dict[int, dict[str, str]] = {}
+        # 마지막 델타 이후 변경된 (루프 번호, 에이전트)
+        self._changes: set[Tuple[int, str]] = set()
+        self._delta_version: int = 0
+        self._context_builder: Optional[ContextBuilder] = None
+
+    def _previous_document(self, agent_name: str) -> Tuple[Optional[int], Optional[dict[str, Any]]]:
+        """같은 에이전트가 이전 루프에서 만든 가장 최근 문서 조회
+
+        Returns:
+            (루프 번호, 문서) 또는 (None, None)
+        """
+        for loop_documents in reversed(self.all_documents_history):
+            doc = loop_documents.get(agent_name)
+            if doc is not None:
+                return doc.get("loop_number"), doc
+        return None, None
+
+    def get_fingerprint(self, agent_name: str, loop_number: Optional[int] = None) -> Optional[str]:
+        """문서 내용 fingerprint 조회 (변경 여부 확인용)
+
+        Args:
+            agent_name: 에이전트 이름
+            loop_number: 루프 번호 (None이면 현재 루프)
+
+        Returns:
+            fingerprint 또는 None
+        """
+        loop = self.current_loop_number if loop_number is None else loop_number
+        return self._fingerprints.get(loop, {}).get(agent_name)
 
     def add_document(
         self, agent_name: str, document: dict[str, Any], document_type: str = "analysis"
@@ -49,6 +94,13 @@ class SharedDocumentContext:
             document: 문서 내용
             document_type: 문서 타입 (analysis, design, plan, code 등)
         """
+        fingerprint = content_fingerprint(document)
+
+        # 이전 루프와 내용이 같으면 기존 content 객체를 공유
+        previous_loop, previous = self._previous_document(agent_name)
+        if previous is not None and self.get_fingerprint(agent_name, previous_loop) == fingerprint:
+            document = previous["content"]
+
         doc_with_metadata = {
             "content": document,
             "type": document_type,
@@ -59,6 +111,9 @@ class SharedDocumentContext:
 
         self.current_loop_documents[agent_name] = doc_with_metadata
         self.metadata["total_documents"] += 1
+        self._fingerprints.setdefault(self.current_loop_number, {})[agent_name] = fingerprint
+        self._changes.add((self.current_loop_number, agent_name))
+        self.version += 1
 
         logger.info(
             f"Document added by {agent_name} (type: {document_type}) to loop {self.current_loop_number}"
@@ -101,14 +156,15 @@ class SharedDocumentContext:
     def start_new_loop(self) -> None:
         """새 루프 시작 - 이전 문서는 히스토리로 이동"""
         if self.current_loop_documents:
-            # 현재 문서를 히스토리에 저장
-            self.all_documents_history.append(self.current_loop_documents.copy())
+            # 현재 문서를 히스토리로 이동 (복사 없이 그대로 보관)
+            self.all_documents_history.append(self.current_loop_documents)
             logger.info(f"Loop {self.current_loop_number} documents archived to history")
 
         # 새 루프 초기화
         self.current_loop_documents = {}
         self.current_loop_number += 1
         self.metadata["total_loops"] = self.current_loop_number
+        self.version += 1
 
         logger.info(f"Started new loop {self.current_loop_number}")
 
@@ -127,43 +183,39 @@ class SharedDocumentContext:
             return None
         return self.all_documents_history
 
-    def get_context_for_ai(self, include_history: bool = False, max_history_loops: int = 2) -> str:
+    @property
+    def context_builder(self) -> ContextBuilder:
+        """AI 프롬프트용 컨텍스트 빌더 (렌더링 조각 캐시 보유)"""
+        if self._context_builder is None:
+            self._context_builder = ContextBuilder(self)
+        return self._context_builder
+
+    def get_context_for_ai(
+        self,
+        include_history: bool = False,
+        max_history_loops: int = 2,
+        agent_name: Optional[str] = None,
+        token_budget: Optional[int] = None,
+    ) -> str:
         """AI 프롬프트용 컨텍스트 생성
 
+        바뀌지 않은 문서는 캐시된 렌더링 결과를 재사용합니다.
+
         Args:
             include_history: 히스토리 포함 여부
             max_history_loops: 포함할 최대 히스토리 루프 수
+            agent_name: 요청한 에이전트 (관련 문서를 먼저 배치)
+            token_budget: 문서에 쓸 최대 토큰 수 (넘치는 문서는 요약)
 
         Returns:
             AI가 참조할 수 있는 형식의 문서 컨텍스트
         """
-        context: Dict[str, Any] = {
-            "current_loop": self.current_loop_number,
-            "current_documents": {},
-        }
-
-        # 현재 루프 문서 추가
-        for agent_name, doc in self.current_loop_documents.items():
-            context["current_documents"][agent_name] = {
-                "type": doc.get("type"),
-                "created_at": doc.get("created_at"),
-                "content": doc.get("content"),
-            }
-
-        # 히스토리 추가 (선택적)
-        if include_history and self.all_documents_history:
-            context["previous_loops"] = []
-            start_idx = max(0, len(self.all_documents_history) - max_history_loops)
-            for idx in range(start_idx, len(self.all_documents_history)):
-                loop_data: Dict[str, Any] = {"loop_number": idx, "documents": {}}
-                for agent_name, doc in self.all_documents_history[idx].items():
-                    loop_data["documents"][agent_name] = {
-                        "type": doc.get("type"),
-                        "content_summary": self._summarize_content(doc.get("content")),
-                    }
-                context["previous_loops"].append(loop_data)
-
-        return json.dumps(context, indent=2, ensure_ascii=False)
+        return self.context_builder.build(
+            agent_name=agent_name,
+            token_budget=token_budget,
+            include_history=include_history,
+            max_history_loops=max_history_loops,
+        )
 
     def _summarize_content(self, content: Any, max_length: int = 500) -> str:
         """컨텐츠 요약 (긴 문서를 위해)
@@ -179,8 +231,8 @@ class SharedDocumentContext:
             return content[:max_length] + "..." if len(content) > max_length else content
         elif isinstance(content, dict):
             # 주요 키만 추출
-            summary = dict(list(content.items())[:5])
-            return str(summary)
+            summary = str(dict(list(content.items())[:5]))
+            return summary[:max_length] + "..." if len(summary) > max_length else summary
         else:
             return str(content)[:max_length]
 
@@ -217,6 +269,10 @@ class SharedDocumentContext:
             "total_documents": 0,
             "total_loops": 0,
         }
+        self.version = 0
+        self._fingerprints = {}
+        self._changes = set()
+        self._delta_version = 0
         logger.info("SharedDocumentContext cleared")
 
     def export_all(self) -> dict[str, Any]:
@@ -227,6 +283,7 @@ class SharedDocumentContext:
         """
         return {
             "metadata": self.metadata,
+            "version": self.version,
             "current_loop_number": self.current_loop_number,
             "current_loop_documents": self.current_loop_documents,
             "all_documents_history": self.all_documents_history,
@@ -242,4 +299,182 @@ class SharedDocumentContext:
         self.current_loop_number = data.get("current_loop_number", 0)
         self.current_loop_documents = data.get("current_loop_documents", {})
         self.all_documents_history = data.get("all_documents_history", [])
-        logger.info("SharedDocumentContext data imported")
\ No newline at end of file
+        self.version = data.get("version", 0)
+        self._delta_version = self.version
+        self._changes = set()
+
+        # fingerprint를 다시 계산하고 루프 간 같은 내용은 공유
+        self._fingerprints = {}
+        shared: dict[str, Any] = {}
+        for loop_documents in [*self.all_documents_history, self.current_loop_documents]:
+            for agent_name, doc in loop_documents.items():
+                fingerprint = content_fingerprint(doc.get("content"))
+                doc["content"] = shared.setdefault(fingerprint, doc.get("content"))
+                loop = doc.get("loop_number", self.current_loop_number)
+                self._fingerprints.setdefault(loop, {})[agent_name] = fingerprint
+        logger.info("SharedDocumentContext data imported")
+
+    def export_bytes(self, codec: Union[str, MemoryCodec, None] = None) -> bytes:
+        """모든 데이터를 codec으로 인코딩하여 내보내기
+
+        Args:
+            codec: 사용할 codec ("json", "orjson", "msgpack", 기본 json)
+
+        Returns:
+            인코딩된 컨텍스트 데이터
+        """
+        return get_codec(codec).encode(self.export_all())
+
+    def import_bytes(self, payload: bytes, codec: Union[str, MemoryCodec, None] = None) -> None:
+        """export_bytes()로 내보낸 데이터 가져오기
+
+        Args:
+            payload: 인코딩된 컨텍스트 데이터
+            codec: 내보낼 때 사용한 codec
+        """
+        self.import_data(get_codec(codec).decode(payload))
+
+    def _loop_documents(self) -> dict[int, dict[str, dict[str, Any]]]:
+        """루프 번호별 문서 (히스토리 + 현재 루프)"""
+        loops: dict[int, dict[str, dict[str, Any]]] = {}
+        for loop_documents in self.all_documents_history:
+            for agent_name, doc in loop_documents.items():
+                loops.setdefault(doc.get("loop_number", 0), {})[agent_name] = doc
+        loops[self.current_loop_number] = self.current_loop_documents
+        return loops
+
+    def has_changes(self) -> bool:
+        """마지막 델타 이후 변경 사항이 있는지 확인
+
+        Returns:
+            내보내지 않은 변경 사항이 있으면 True
+        """
+        return bool(self._changes) or self.version != self._delta_version
+
+    def export_delta(self) -> dict[str, Any]:
+        """마지막 델타 이후 변경된 문서만 내보내기
+
+        이전 루프의 같은 에이전트 문서와 내용이 같으면 content 대신
+        ``same_as_loop`` 참조만 기록합니다. 호출 후 변경 기록은 초기화됩니다.
+
+        Returns:
+            base_version에서 version으로 가는 델타
+        """
+        loops = self._loop_documents()
+        records = []
+        for loop, agent_name in sorted(self._changes):
+            doc = loops.get(loop, {}).get(agent_name)
+            if doc is None:
+                continue
+
+            record: dict[str, Any] = {"loop": loop, "agent": agent_name}
+            fingerprint = self.get_fingerprint(agent_name, loop)
+            previous_loop = max(
+                (
+                    other for other, fingerprints in self._fingerprints.items()
+                    if other < loop and agent_name in fingerprints
+                ),
+                default=None,
+            )
+            if previous_loop is not None and self.get_fingerprint(agent_name, previous_loop) == fingerprint:
+                record["document"] = {key: value for key, value in doc.items() if key != "content"}
+                record["same_as_loop"] = previous_loop
+            else:
+                record["document"] = doc
+            records.append(record)
+
+        delta = {
+            "format": DELTA_FORMAT,
+            "base_version": self._delta_version,
+            "version": self.version,
+            "metadata": self.metadata,
+            "current_loop_number": self.current_loop_number,
+            "documents": records,
+        }
+        self._changes = set()
+        self._delta_version = self.version
+        return delta
+
+    def apply_delta(self, delta: dict[str, Any]) -> None:
+        """export_delta()로 내보낸 델타 적용
+
+        Args:
+            delta: 적용할 델타
+
+        Raises:
+            ValueError: 형식이 다르거나 현재 version과 이어지지 않는 경우
+        """
+        if delta.get("format") != DELTA_FORMAT:
+            raise ValueError("Not a SharedDocumentContext delta")
+        if delta.get("base_version") != self.version:
+            raise ValueError(
+                f"Delta starts at version {delta.get('base_version')}, context is at {self.version}"
+            )
+
+        loops = self._loop_documents()
+        for record in delta.get("documents", []):
+            loop, agent_name = record["loop"], record["agent"]
+            doc = dict(record["document"])
+            if "same_as_loop" in record:
+                source = loops[record["same_as_loop"]][agent_name]
+                doc["content"] = source["content"]
+                fingerprint = self.get_fingerprint(agent_name, record["same_as_loop"])
+            else:
+                fingerprint = content_fingerprint(doc.get("content"))
+            loops.setdefault(loop, {})[agent_name] = doc
+            self._fingerprints.setdefault(loop, {})[agent_name] = fingerprint
+
+        self.current_loop_number = delta.get("current_loop_number", self.current_loop_number)
+        self.all_documents_history = [
+            loops[loop] for loop in sorted(loops)
+            if loop < self.current_loop_number and loops[loop]
+        ]
+        self.current_loop_documents = loops.get(self.current_loop_number, {})
+        self.metadata = delta.get("metadata", self.metadata)
+        self.version = delta["version"]
+        self._delta_version = self.version
+
+    def save_incremental(
+        self, directory: Union[str, Path], codec: Union[str, MemoryCodec, None] = None
+    ) -> Optional[Path]:
+        """변경된 문서만 델타 파일로 저장
+
+        Args:
+            directory: 델타 파일을 저장할 디렉터리
+            codec: 사용할 codec (기본 json)
+
+        Returns:
+            저장된 파일 경로 또는 변경 사항이 없으면 None
+        """
+        if not self.has_changes():
+            return None
+
+        codec = get_codec(codec)
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        delta = self.export_delta()
+        path = directory / f"document_context.delta.{delta['version']:08d}{codec.extension}"
+        path.write_bytes(codec.encode(delta))
+        logger.info(f"Saved {len(delta['documents'])} changed documents to {path.name}")
+        return path
+
+    @classmethod
+    def load_incremental(
+        cls, directory: Union[str, Path], codec: Union[str, MemoryCodec, None] = None
+    ) -> "SharedDocumentContext":
+        """save_incremental()로 저장한 델타 파일들로 컨텍스트 복원
+
+        Args:
+            directory: 델타 파일이 저장된 디렉터리
+            codec: 저장할 때 사용한 codec
+
+        Returns:
+            복원된 SharedDocumentContext
+        """
+        codec = get_codec(codec)
+        context = cls()
+        paths = sorted(Path(directory).glob(f"document_context.delta.*{codec.extension}"))
+        for path in paths:
+            context.apply_delta(codec.decode(path.read_bytes()))
+        return context
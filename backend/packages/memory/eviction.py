@@ -0,0 +1,145 @@
+"""Eviction policies for bounded memory contexts.
+
+When a MemoryContext with ``max_entries`` or ``max_size_bytes`` is full,
+its eviction policy picks the coldest entries to shed instead of failing
+the write. Policies only rank entries; the context removes them and keeps
+its indexes and size accounting consistent.
+"""
+
+from __future__ import annotations
+
+import heapq
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Iterator, Optional, Union
+
+if TYPE_CHECKING:
+    from .contexts import MemoryContext
+
+
+class EvictionPolicy(ABC):
+    """Abstract base class for eviction policies.
+
+    Attributes:
+        name: Policy name used in stats and configuration
+    """
+
+    name: str = "base"
+
+    @abstractmethod
+    def candidates(self, context: MemoryContext) -> Iterator[str]:
+        """Yield keys in eviction order (coldest first).
+
+        Implementations should be lazy so that evicting k entries does not
+        require ranking the whole context when avoidable.
+
+        Args:
+            context: The context to pick victims from
+
+        Yields:
+            Entry keys, coldest first
+        """
+        pass
+
+
+class LRUEvictionPolicy(EvictionPolicy):
+    """Evict the least recently used entries first.
+
+    Uses the context's access order, so picking k victims costs O(k).
+    """
+
+    name = "lru"
+
+    def candidates(self, context: MemoryContext) -> Iterator[str]:
+        """Yield keys from least to most recently used.
+
+        The access order is re-read from the front after every yield, as
+        the caller removes entries in between.
+        """
+        seen = set()
+        while True:
+            for key in context.access_order():
+                if key not in seen:
+                    break
+            else:
+                return
+            seen.add(key)
+            yield key
+
+
+class LFUEvictionPolicy(EvictionPolicy):
+    """Evict the least frequently used entries first.
+
+    Ties are broken by recency (older access evicted first).
+    """
+
+    name = "lfu"
+
+    def candidates(self, context: MemoryContext) -> Iterator[str]:
+        """Yield keys from least to most frequently used."""
+        recency = {key: rank for rank, key in enumerate(context.access_order())}
+        heap = [
+            (entry.access_count, recency.get(key, 0), key)
+            for key, entry in context.entries.items()
+        ]
+        heapq.heapify(heap)
+        while heap:
+            yield heapq.heappop(heap)[2]
+
+
+class TTLFirstEvictionPolicy(EvictionPolicy):
+    """Evict entries closest to expiry first, then fall back to LRU.
+
+    Entries with a TTL are going away anyway, so shedding them early loses
+    the least information. Permanent entries are evicted in LRU order.
+    """
+
+    name = "ttl_first"
+
+    def candidates(self, context: MemoryContext) -> Iterator[str]:
+        """Yield expiring keys by expiry time, then the rest in LRU order."""
+        heap = []
+        for rank, key in enumerate(context.access_order()):
+            expires_at = context.entries[key].expires_at()
+            if expires_at is not None:
+                heap.append((expires_at, rank, key))
+        heapq.heapify(heap)
+
+        expiring = set()
+        while heap:
+            key = heapq.heappop(heap)[2]
+            expiring.add(key)
+            yield key
+
+        for key in list(context.access_order()):
+            if key not in expiring:
+                yield key
+
+
+EVICTION_POLICIES = {
+    LRUEvictionPolicy.name: LRUEvictionPolicy,
+    LFUEvictionPolicy.name: LFUEvictionPolicy,
+    TTLFirstEvictionPolicy.name: TTLFirstEvictionPolicy,
+}
+
+
+def get_eviction_policy(
+    policy: Optional[Union[str, EvictionPolicy]]
+) -> Optional[EvictionPolicy]:
+    """Eviction policy 인스턴스를 가져옵니다.
+
+    Args:
+        policy: Policy 이름 ("lru", "lfu", "ttl_first"), 인스턴스 또는 None
+
+    Returns:
+        EvictionPolicy 인스턴스 또는 None
+    """
+    if policy is None or isinstance(policy, EvictionPolicy):
+        return policy
+
+    policy_class = EVICTION_POLICIES.get(policy.lower())
+    if policy_class is None:
+        raise ValueError(
+            f"Unknown eviction policy: {policy}. "
+            f"Available: {', '.join(EVICTION_POLICIES)}"
+        )
+    return policy_class()
@@ -7,9 +7,14 @@ and orchestrators use to store and retrieve context information.
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Dict, List, Optional
+import threading
+import time
+from typing import Any, AsyncIterator, Awaitable, Dict, Iterable, List, Optional, Union
 
 from .contexts import ContextType, MemoryContext, MemoryEntry
+from .eviction import EvictionPolicy, get_eviction_policy
+from .metrics import MemoryMetrics, get_memory_metrics, timed
+from .query import MemoryQuery, collect_page, iter_matches
 from .storage import MemoryStorage, JSONMemoryStorage
 
 
@@ -26,70 +31,246 @@ class MemoryHub:
     This class follows the Single Responsibility Principle (SRP) by focusing
     solely on memory management operations.
     
+    In write-behind mode put()/delete() only update the in-memory context
+    and record the key as dirty. A background flusher persists dirty keys
+    every ``flush_interval_ms`` or once ``flush_max_mutations`` writes are
+    pending, so repeated writes to the same key are coalesced into one.
+    Write-behind is ignored for queryable storage, which is shared across
+    processes and must see every write immediately. Queryable storage is
+    not loaded into memory, so eviction policies and context limits are
+    not supported for it.
+    
+    In lazy mode initialize() loads nothing; each context is loaded from
+    storage the first time it is accessed, so startup time does not grow
+    with the amount of stored memory.
+    
     Attributes:
-        storage: The storage backend to use
+        storage: The storage backend to use (JSON, WAL, ...)
         contexts: In-memory cache of loaded contexts
         auto_cleanup_interval: Seconds between automatic cleanup cycles
+        write_behind: Whether writes are persisted asynchronously in batches
+        flush_interval_ms: Maximum time a dirty key waits before a flush
+        flush_max_mutations: Pending writes that trigger an early flush
+        eviction_policy: Policy used to shed cold entries of full contexts
+        context_limits: Per-context max_entries / max_size_bytes overrides
+        lazy_load: Whether contexts are loaded on first access
     """
     
     def __init__(
         self,
         storage: Optional[MemoryStorage] = None,
-        auto_cleanup_interval: int = 3600
+        auto_cleanup_interval: int = 3600,
+        write_behind: bool = False,
+        flush_interval_ms: int = 200,
+        flush_max_mutations: int = 100,
+        eviction_policy: Optional[Union[str, EvictionPolicy]] = None,
+        context_limits: Optional[Dict[ContextType, Dict[str, int]]] = None,
+        lazy_load: bool = False,
+        metrics: Optional[MemoryMetrics] = None
     ) -> None:
         """Initialize the Memory Hub.
         
         Args:
             storage: Storage backend to use (defaults to JSONMemoryStorage)
             auto_cleanup_interval: Seconds between automatic cleanup cycles
+            write_behind: Persist writes in background batches
+            flush_interval_ms: Flush period for write-behind mode
+            flush_max_mutations: Pending writes that trigger an early flush
+            eviction_policy: "lru", "lfu", "ttl_first" or an EvictionPolicy;
+                None keeps the old behaviour of rejecting writes when full
+            context_limits: e.g. {ContextType.A_CTX: {"max_entries": 10000,
+                "max_size_bytes": 50_000_000}}
+            lazy_load: Load each context on first access instead of in
+                initialize()
+            metrics: Metrics registry (defaults to the process-wide one,
+                shared with the storage backend)
+            
+        Raises:
+            ValueError: If eviction_policy or context_limits is given for
+                queryable storage
         """
         self.storage = storage or JSONMemoryStorage()
+        if self.storage.queryable and (eviction_policy is not None or context_limits):
+            raise ValueError(
+                f"{type(self.storage).__name__} does not support eviction_policy or context_limits"
+            )
         self.contexts: Dict[ContextType, MemoryContext] = {}
         self.auto_cleanup_interval = auto_cleanup_interval
+        self.write_behind = write_behind and not self.storage.queryable
+        self.flush_interval_ms = flush_interval_ms
+        self.flush_max_mutations = flush_max_mutations
+        self.eviction_policy = get_eviction_policy(eviction_policy)
+        self.context_limits = context_limits or {}
+        self.lazy_load = lazy_load
+        self.metrics = metrics or get_memory_metrics()
+        if self.storage.metrics is None:
+            self.storage.metrics = self.metrics
+        self._load_locks: Dict[ContextType, asyncio.Lock] = {}
         self._cleanup_task: Optional[asyncio.Task] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_event: Optional[asyncio.Event] = None
+        self._flush_lock: Optional[asyncio.Lock] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Pending writes per context: key -> entry (put) or None (delete)
+        self._dirty: Dict[ContextType, Dict[str, Optional[MemoryEntry]]] = {}
+        self._pending_mutations = 0
+        # Guards _dirty and _pending_mutations: put() may run on other threads' loops
+        self._dirty_lock = threading.Lock()
+        self._write_behind_stats: Dict[str, float] = {
+            "writes": 0,
+            "coalesced_writes": 0,
+            "flushes": 0,
+            "flushed_entries": 0,
+            "failed_flushes": 0,
+            "last_flush_ms": 0.0,
+            "max_flush_ms": 0.0,
+            "total_flush_ms": 0.0,
+        }
         self._initialized = False
     
     async def initialize(self) -> None:
         """Initialize the Memory Hub by loading existing contexts.
         
         This method should be called once before using the hub.
-        It loads all existing contexts from storage and starts
-        the automatic cleanup task.
+        It loads all existing contexts from storage (unless lazy_load is
+        set) and starts the automatic cleanup task.
         """
         if self._initialized:
             return
         
         # Load all existing contexts
-        for context_type in ContextType:
-            context = await self.storage.load_context(context_type)
-            if context:
-                self.contexts[context_type] = context
-            else:
-                # Create new empty context
-                self.contexts[context_type] = MemoryContext(type=context_type)
+        if not self.lazy_load:
+            for context_type in ContextType:
+                await self._get_context(context_type)
         
         # Start cleanup task
         if self.auto_cleanup_interval > 0:
             self._cleanup_task = asyncio.create_task(self._auto_cleanup())
         
+        # Loads and flushes from other threads' loops are run on this loop
+        self._loop = asyncio.get_running_loop()
+        
+        # Start write-behind flusher
+        if self.write_behind:
+            self._flush_event = asyncio.Event()
+            self._flush_lock = asyncio.Lock()
+            self._flush_task = asyncio.create_task(self._auto_flush())
+        
         self._initialized = True
     
+    async def _run_on_hub_loop(self, coro: Awaitable[Any]) -> Any:
+        """Run a coroutine on the loop the hub was initialized on.
+        
+        The hub may be shared with threads that run their own event loop.
+        Its locks belong to the initializing loop, so code that takes them
+        is handed over to that loop and awaited from the caller's loop.
+        
+        Args:
+            coro: The coroutine to run
+            
+        Returns:
+            The coroutine's result
+        """
+        loop = self._loop
+        if loop is None or not loop.is_running() or loop is asyncio.get_running_loop():
+            return await coro
+        
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, loop))
+    
+    async def _get_context(self, context_type: ContextType) -> MemoryContext:
+        """Get a context, loading it from storage on first access.
+        
+        Concurrent first accesses share a single load, also when they come
+        from different event loops.
+        
+        Args:
+            context_type: The context to get
+            
+        Returns:
+            The loaded (or new empty) context
+        """
+        context = self.contexts.get(context_type)
+        if context is not None:
+            return context
+        
+        return await self._run_on_hub_loop(self._load_context(context_type))
+    
+    async def _load_context(self, context_type: ContextType) -> MemoryContext:
+        """Load a context once; runs on the hub's loop.
+        
+        Args:
+            context_type: The context to load
+            
+        Returns:
+            The loaded (or new empty) context
+        """
+        lock = self._load_locks.setdefault(context_type, asyncio.Lock())
+        async with lock:
+            context = self.contexts.get(context_type)
+            if context is not None:
+                return context
+            
+            if self.storage.queryable:
+                # Queryable storage is the source of truth; nothing to preload
+                context = MemoryContext(type=context_type)
+            else:
+                context = await self.storage.load_context(context_type)
+                if not context:
+                    # Create new empty context
+                    context = MemoryContext(type=context_type)
+            self._configure_context(context)
+            self.contexts[context_type] = context
+            
+            evicted = context.take_evictions()
+            if evicted:
+                await self.storage.apply_mutations(context, [], evicted)
+        
+        return context
+    
+    def _configure_context(self, context: MemoryContext) -> None:
+        """Apply the hub's eviction policy and limits to a context.
+        
+        Args:
+            context: The context to configure
+        """
+        limits = self.context_limits.get(context.type, {})
+        if "max_entries" in limits:
+            context.max_entries = limits["max_entries"]
+        if "max_size_bytes" in limits:
+            context.max_size_bytes = limits["max_size_bytes"]
+        context.eviction_policy = self.eviction_policy
+        
+        # Contexts loaded over a (new) limit are trimmed right away
+        context.enforce_limits()
+    
     async def shutdown(self) -> None:
         """Shutdown the Memory Hub gracefully.
         
-        Saves all contexts to storage and cancels the cleanup task.
+        Flushes pending write-behind changes, saves all contexts to storage
+        and cancels the background tasks.
         """
-        # Cancel cleanup task
-        if self._cleanup_task:
-            self._cleanup_task.cancel()
-            try:
-                await self._cleanup_task
-            except asyncio.CancelledError:
-                pass
-        
-        # Save all contexts
-        for context in self.contexts.values():
-            await self.storage.save_context(context)
+        await self._run_on_hub_loop(self._shutdown())
+    
+    async def _shutdown(self) -> None:
+        """Stop the background tasks and persist; runs on the hub's loop."""
+        # Cancel background tasks
+        for task in (self._cleanup_task, self._flush_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self._flush_task = None
+        
+        # Flush pending writes synchronously
+        if self.write_behind and self._dirty:
+            await self._flush_dirty()
+        
+        # Save all contexts (queryable storage persists every write itself)
+        if not self.storage.queryable:
+            for context in self.contexts.values():
+                await self.storage.save_context(context)
         
         self._initialized = False
     
@@ -103,11 +284,8 @@ class MemoryHub:
                 await asyncio.sleep(self.auto_cleanup_interval)
                 
                 # Cleanup expired entries in all contexts
-                for context in self.contexts.values():
-                    removed = context.cleanup_expired()
-                    if removed > 0:
-                        # Save context if entries were removed
-                        await self.storage.save_context(context)
+                for context_type in list(self.contexts):
+                    await self._expire_entries(context_type)
                 
             except asyncio.CancelledError:
                 break
@@ -115,6 +293,169 @@ class MemoryHub:
                 # In production, use proper logging
                 print(f"Error in auto cleanup: {e}")
     
+    async def _expire_entries(self, context_type: ContextType) -> int:
+        """Remove expired entries of a context and persist the removal.
+        
+        Uses the context's expiry heap, so only expired entries are visited,
+        and persists just the removed keys.
+        
+        Args:
+            context_type: The context to clean up
+            
+        Returns:
+            Number of entries removed
+        """
+        if self.storage.queryable:
+            return await self.storage.cleanup_expired(context_type)
+        
+        context = self.contexts.get(context_type)
+        if not context:
+            return 0
+        
+        removed = context.pop_expired() + context.take_evictions()
+        if removed:
+            if self.write_behind:
+                for key in removed:
+                    self._mark_dirty(context_type, key, None)
+            else:
+                await self.storage.apply_mutations(context, [], removed)
+        
+        return len(removed)
+    
+    async def _auto_flush(self) -> None:
+        """Write-behind flusher that persists dirty keys periodically.
+        
+        Wakes up every flush_interval_ms, or earlier when
+        flush_max_mutations writes are pending.
+        """
+        while True:
+            try:
+                try:
+                    await asyncio.wait_for(
+                        self._flush_event.wait(),
+                        timeout=self.flush_interval_ms / 1000
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                
+                self._flush_event.clear()
+                if self._dirty:
+                    # Shielded so shutdown() never cancels a flush half-way
+                    await asyncio.shield(self.flush())
+                
+            except asyncio.CancelledError:
+                break
+            except Exception as e:
+                # In production, use proper logging
+                print(f"Error in write-behind flush: {e}")
+    
+    def _mark_dirty(self, context_type: ContextType, key: str, entry: Optional[MemoryEntry]) -> None:
+        """Record a pending write, coalescing it with an earlier one for the key.
+        
+        Args:
+            context_type: The context that was written
+            key: The written key
+            entry: The current entry, or None for a delete
+        """
+        with self._dirty_lock:
+            pending = self._dirty.setdefault(context_type, {})
+            if key in pending:
+                self._write_behind_stats["coalesced_writes"] += 1
+            pending[key] = entry
+            
+            self._write_behind_stats["writes"] += 1
+            self._pending_mutations += 1
+            full = self._pending_mutations >= self.flush_max_mutations
+        if full and self._flush_event:
+            self._wake_flusher()
+    
+    def _wake_flusher(self) -> None:
+        """Wake the flusher, also from threads running their own event loop."""
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        
+        if running is self._loop:
+            self._flush_event.set()
+        elif self._loop and not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._flush_event.set)
+    
+    async def flush(self) -> bool:
+        """Persist all pending write-behind changes now.
+        
+        Each dirty context is written with one storage call. Changes that
+        fail to persist are put back unless the key was written again
+        in the meantime. A flush already in progress is waited for, so
+        every earlier write is persisted on return.
+        
+        Returns:
+            True if every context was persisted, False otherwise
+        """
+        if not self._dirty and not (self._flush_lock and self._flush_lock.locked()):
+            return True
+        
+        return await self._run_on_hub_loop(self._flush_dirty())
+    
+    async def _flush_dirty(self) -> bool:
+        """Persist the pending changes; runs on the hub's loop.
+        
+        Returns:
+            True if every context was persisted, False otherwise
+        """
+        lock = self._flush_lock or asyncio.Lock()
+        async with lock:
+            with self._dirty_lock:
+                dirty, self._dirty = self._dirty, {}
+                self._pending_mutations = 0
+            started = time.perf_counter()
+            success = True
+            
+            for context_type, pending in dirty.items():
+                context = self.contexts.get(context_type)
+                if context is None:
+                    continue
+                
+                changed = [entry for entry in pending.values() if entry is not None]
+                deleted = [key for key, entry in pending.items() if entry is None]
+                
+                if await self.storage.apply_mutations(context, changed, deleted):
+                    self._write_behind_stats["flushed_entries"] += len(pending)
+                    continue
+                
+                success = False
+                self._write_behind_stats["failed_flushes"] += 1
+                with self._dirty_lock:
+                    retry = self._dirty.setdefault(context_type, {})
+                    for key, entry in pending.items():
+                        retry.setdefault(key, entry)
+                    self._pending_mutations += len(pending)
+            
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            stats = self._write_behind_stats
+            stats["flushes"] += 1
+            stats["last_flush_ms"] = elapsed_ms
+            stats["max_flush_ms"] = max(stats["max_flush_ms"], elapsed_ms)
+            stats["total_flush_ms"] += elapsed_ms
+            
+            return success
+    
+    def get_write_behind_stats(self) -> Dict[str, Any]:
+        """Get write-behind counters.
+        
+        Returns:
+            Dictionary with write, coalescing and flush latency counters
+        """
+        stats: Dict[str, Any] = dict(self._write_behind_stats)
+        stats["enabled"] = self.write_behind
+        with self._dirty_lock:
+            stats["pending_keys"] = sum(len(pending) for pending in self._dirty.values())
+        stats["avg_flush_ms"] = (
+            stats["total_flush_ms"] / stats["flushes"] if stats["flushes"] else 0.0
+        )
+        return stats
+    
+    @timed("put")
     async def put(
         self,
         context_type: ContextType,
@@ -144,24 +485,26 @@ class MemoryHub:
             raise RuntimeError("Memory Hub not initialized")
         
         try:
-            context = self.contexts[context_type]
-            
-            # Check if entry exists and update it
-            existing = context.get_entry(key)
-            if existing:
-                existing.update(value, metadata)
-            else:
-                # Create new entry
-                context.add_entry(
-                    key=key,
-                    value=value,
-                    ttl_seconds=ttl_seconds,
-                    tags=tags or [],
-                    metadata=metadata or {}
+            if self.storage.queryable:
+                await self.storage.put_entry(
+                    context_type, key, value,
+                    ttl_seconds=ttl_seconds, tags=tags, metadata=metadata
                 )
+                return True
+            
+            context = await self._get_context(context_type)
+            entry = self._put_entry(context, key, value, ttl_seconds, tags, metadata)
+            evicted = context.take_evictions()
             
             # Save to storage
-            await self.storage.save_context(context)
+            if self.write_behind:
+                self._mark_dirty(context_type, key, entry)
+                for evicted_key in evicted:
+                    self._mark_dirty(context_type, evicted_key, None)
+            elif evicted:
+                await self.storage.apply_mutations(context, [entry], evicted)
+            else:
+                await self.storage.save_entry(context, entry)
             return True
             
         except Exception as e:
@@ -169,6 +512,119 @@ class MemoryHub:
             print(f"Error storing in {context_type.value}: {e}")
             return False
     
+    @staticmethod
+    def _put_entry(
+        context: MemoryContext,
+        key: str,
+        value: Any,
+        ttl_seconds: Optional[int],
+        tags: Optional[List[str]],
+        metadata: Optional[Dict[str, Any]]
+    ) -> MemoryEntry:
+        """Create or update an entry in memory (without persisting it).
+        
+        Args:
+            context: The context to store in
+            key: Unique key for the value
+            value: The value to store
+            ttl_seconds: Optional time to live for new entries
+            tags: Optional tags for new entries
+            metadata: Optional metadata to merge
+            
+        Returns:
+            The stored entry
+        """
+        # Check if entry exists and update it
+        entry = context.update_entry(key, value, metadata)
+        if not entry:
+            # Create new entry (may evict cold entries when full)
+            entry = context.add_entry(
+                key=key,
+                value=value,
+                ttl_seconds=ttl_seconds,
+                tags=tags or [],
+                metadata=metadata or {}
+            )
+        return entry
+    
+    @timed("put_many")
+    async def put_many(
+        self,
+        context_type: ContextType,
+        items: Iterable[Dict[str, Any]]
+    ) -> bool:
+        """Store several values in one context and persist them once.
+        
+        Each item is a dictionary with the arguments of put(): ``key``,
+        ``value`` and optionally ``ttl_seconds``, ``tags`` and ``metadata``.
+        The whole batch is written with a single storage call (one append,
+        transaction or file write) instead of one per item.
+        
+        Args:
+            context_type: The context to store in
+            items: The values to store
+            
+        Returns:
+            True if every item was stored, False otherwise
+            
+        Raises:
+            RuntimeError: If hub is not initialized
+        """
+        if not self._initialized:
+            raise RuntimeError("Memory Hub not initialized")
+        
+        items = list(items)
+        if not items:
+            return True
+        
+        if self.storage.queryable:
+            try:
+                await self.storage.put_entries(context_type, items)
+                return True
+            except Exception as e:
+                # In production, use proper logging
+                print(f"Error storing batch in {context_type.value}: {e}")
+                return False
+        
+        context = await self._get_context(context_type)
+        success = True
+        written: Dict[str, MemoryEntry] = {}
+        
+        for item in items:
+            try:
+                entry = self._put_entry(
+                    context,
+                    item["key"],
+                    item.get("value"),
+                    item.get("ttl_seconds"),
+                    item.get("tags"),
+                    item.get("metadata")
+                )
+            except Exception as e:
+                # In production, use proper logging
+                print(f"Error storing in {context_type.value}: {e}")
+                success = False
+                break
+            written[entry.key] = entry
+        
+        # Entries evicted later in the same batch are persisted as deletes only
+        evicted = [key for key in context.take_evictions() if key not in context.entries]
+        changed = [
+            entry for key, entry in written.items() if context.entries.get(key) is entry
+        ]
+        
+        if self.write_behind:
+            for entry in changed:
+                self._mark_dirty(context_type, entry.key, entry)
+            for key in evicted:
+                self._mark_dirty(context_type, key, None)
+        elif changed or evicted:
+            if not await self.storage.apply_mutations(context, changed, evicted):
+                success = False
+        
+        return success
+    
+    @timed("get")
     async def get(
         self,
         context_type: ContextType,
@@ -189,13 +645,48 @@ class MemoryHub:
         if not self._initialized:
             raise RuntimeError("Memory Hub not initialized")
         
-        context = self.contexts.get(context_type)
-        if not context:
-            return None
+        if self.storage.queryable:
+            entry = await self.storage.get_entry(context_type, key)
+            return entry.value if entry else None
         
+        context = await self._get_context(context_type)
         entry = context.get_entry(key)
         return entry.value if entry else None
     
+    @timed("get_many")
+    async def get_many(
+        self,
+        context_type: ContextType,
+        keys: Iterable[str]
+    ) -> Dict[str, Any]:
+        """Retrieve several values from one context.
+        
+        Args:
+            context_type: The context to retrieve from
+            keys: The keys to look up
+            
+        Returns:
+            Dictionary of key to value for the keys found (missing and
+            expired keys are left out)
+            
+        Raises:
+            RuntimeError: If hub is not initialized
+        """
+        if not self._initialized:
+            raise RuntimeError("Memory Hub not initialized")
+        
+        if self.storage.queryable:
+            entries = await self.storage.get_entries(context_type, list(keys))
+            return {key: entry.value for key, entry in entries.items()}
+        
+        context = await self._get_context(context_type)
+        values = {}
+        for key in keys:
+            entry = context.get_entry(key)
+            if entry:
+                values[key] = entry.value
+        return values
+    
     # Alias methods for compatibility
     async def write(
         self,
@@ -233,6 +724,7 @@ class MemoryHub:
         """
         return await self.get(context_type, key)
     
+    @timed("search")
     async def search(
         self,
         context_type: ContextType,
@@ -255,33 +747,102 @@ class MemoryHub:
         if not self._initialized:
             raise RuntimeError("Memory Hub not initialized")
         
-        context = self.contexts.get(context_type)
-        if not context:
-            return []
+        if self.storage.queryable:
+            entries = await self.storage.search_entries(context_type, tags, limit)
+            return [self._entry_to_dict(entry) for entry in entries]
         
+        context = await self._get_context(context_type)
         if tags:
             entries = context.search_by_tags(tags)
         else:
             # Return all non-expired entries
-            entries = [
-                entry for entry in context.entries.values()
-                if not entry.is_expired()
-            ]
+            entries = context.live_entries()
         
         # Convert to dictionaries and limit results
-        results = []
-        for entry in entries[:limit]:
-            results.append({
-                "key": entry.key,
-                "value": entry.value,
-                "tags": entry.tags,
-                "metadata": entry.metadata,
-                "created_at": entry.created_at.isoformat(),
-                "updated_at": entry.updated_at.isoformat(),
-            })
-        
-        return results
+        return [self._entry_to_dict(entry) for entry in entries[:limit]]
+    
+    @timed("query")
+    async def query(
+        self,
+        context_type: ContextType,
+        query: Union[MemoryQuery, Dict[str, Any], None] = None,
+        **criteria: Any
+    ) -> Dict[str, Any]:
+        """Query a context with tag logic, predicates, projection and paging.
+        
+        Matching is lazy: entries are checked in insertion order and only
+        the returned page is converted to dictionaries.
+        
+        Args:
+            context_type: The context to query
+            query: A MemoryQuery (or its dictionary form)
+            **criteria: MemoryQuery attributes, e.g. ``all_tags``,
+                ``metadata``, ``updated_after``, ``fields``, ``limit``,
+                ``cursor``
+            
+        Returns:
+            Dictionary with ``items`` (projected entries) and
+            ``next_cursor`` (None on the last page)
+            
+        Raises:
+            RuntimeError: If hub is not initialized
+            ValueError: If the query or its cursor is invalid
+        """
+        if not self._initialized:
+            raise RuntimeError("Memory Hub not initialized")
+        
+        query = MemoryQuery.coerce(query, **criteria)
+        if self.storage.queryable:
+            return await self.storage.query_entries(context_type, query)
+        
+        context = await self._get_context(context_type)
+        return collect_page(iter_matches(context, query), query)
+    
+    async def scan(
+        self,
+        context_type: ContextType,
+        query: Union[MemoryQuery, Dict[str, Any], None] = None,
+        **criteria: Any
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over every match of a query, one page at a time.
+        
+        Args:
+            context_type: The context to query
+            query: A MemoryQuery (or its dictionary form)
+            **criteria: MemoryQuery attributes
+            
+        Yields:
+            Projected entries
+        """
+        query = MemoryQuery.coerce(query, **criteria)
+        while True:
+            page = await self.query(context_type, query)
+            for item in page["items"]:
+                yield item
+            if not page["next_cursor"]:
+                return
+            query = MemoryQuery.coerce(query, cursor=page["next_cursor"])
+    
+    @staticmethod
+    def _entry_to_dict(entry: MemoryEntry) -> Dict[str, Any]:
+        """Convert an entry to the dictionary format returned by search().
+        
+        Args:
+            entry: The entry to convert
+            
+        Returns:
+            Dictionary representation of the entry
+        """
+        return {
+            "key": entry.key,
+            "value": entry.value,
+            "tags": entry.tags,
+            "metadata": entry.metadata,
+            "created_at": entry.created_at.isoformat(),
+            "updated_at": entry.updated_at.isoformat(),
+        }
     
+    @timed("delete")
     async def delete(
         self,
         context_type: ContextType,
@@ -302,18 +863,58 @@ class MemoryHub:
         if not self._initialized:
             raise RuntimeError("Memory Hub not initialized")
         
-        context = self.contexts.get(context_type)
-        if not context:
-            return False
+        if self.storage.queryable:
+            return await self.storage.remove_entry(context_type, key)
         
+        context = await self._get_context(context_type)
         success = context.remove_entry(key)
         
         if success:
             # Save to storage
-            await self.storage.save_context(context)
+            if self.write_behind:
+                self._mark_dirty(context_type, key, None)
+            else:
+                await self.storage.delete_entry(context, key)
         
         return success
     
+    @timed("delete_many")
+    async def delete_many(
+        self,
+        context_type: ContextType,
+        keys: Iterable[str]
+    ) -> int:
+        """Delete several entries from one context and persist once.
+        
+        Args:
+            context_type: The context to delete from
+            keys: The keys to delete
+            
+        Returns:
+            Number of entries deleted
+            
+        Raises:
+            RuntimeError: If hub is not initialized
+        """
+        if not self._initialized:
+            raise RuntimeError("Memory Hub not initialized")
+        
+        keys = list(dict.fromkeys(keys))
+        if self.storage.queryable:
+            return await self.storage.remove_entries(context_type, keys)
+        
+        context = await self._get_context(context_type)
+        removed = [key for key in keys if context.remove_entry(key)]
+        
+        if removed:
+            if self.write_behind:
+                for key in removed:
+                    self._mark_dirty(context_type, key, None)
+            else:
+                await self.storage.apply_mutations(context, [], removed)
+        
+        return len(removed)
+    
     async def clear_context(self, context_type: ContextType) -> bool:
         """Clear all entries in a context.
         
@@ -331,7 +932,11 @@ class MemoryHub:
         
         try:
             # Create new empty context
-            self.contexts[context_type] = MemoryContext(type=context_type)
+            context = MemoryContext(type=context_type)
+            self._configure_context(context)
+            self.contexts[context_type] = context
+            with self._dirty_lock:
+                self._dirty.pop(context_type, None)
             
             # Delete from storage
             await self.storage.delete_context(context_type)
@@ -350,7 +955,8 @@ class MemoryHub:
             context_type: The context to get stats for
             
         Returns:
-            Dictionary containing context statistics
+            Dictionary containing context statistics; ``metrics`` holds
+            latency (ms) and bytes-written summaries for the context
             
         Raises:
             RuntimeError: If hub is not initialized
@@ -358,18 +964,41 @@ class MemoryHub:
         if not self._initialized:
             raise RuntimeError("Memory Hub not initialized")
         
-        context = self.contexts.get(context_type)
-        if not context:
-            return {"exists": False}
+        context = await self._get_context(context_type)
         
         # Cleanup expired entries first
-        context.cleanup_expired()
+        await self._expire_entries(context_type)
+        if self.storage.queryable:
+            total_entries = await self.storage.count_entries(context_type)
+            indexed_tags = await self.storage.count_tags(context_type)
+        else:
+            total_entries = len(context.entries)
+            indexed_tags = len(context.tag_counts())
         
         return {
             "exists": True,
             "type": context_type.value,
-            "total_entries": len(context.entries),
+            "total_entries": total_entries,
+            "indexed_tags": indexed_tags,
             "max_entries": context.max_entries,
             "total_size_bytes": context.total_size_bytes,
             "max_size_bytes": context.max_size_bytes,
-        }
\ No newline at end of file
+            "eviction_policy": context.eviction_policy.name if context.eviction_policy else None,
+            "evictions": context.evictions,
+            "expirations": context.expirations,
+            "metrics": self.metrics.summary(context=context_type.value),
+        }
+    
+    def render_metrics(self) -> str:
+        """Render the memory metrics in the Prometheus text format.
+        
+        Entry, size, eviction and expiry figures of the loaded contexts are
+        refreshed first; latency and bytes-written histograms accumulate
+        as operations run.
+        
+        Returns:
+            Prometheus exposition text
+        """
+        for context in list(self.contexts.values()):
+            self.metrics.record_context(context)
+        return self.metrics.render_prometheus()
\ No newline at end of file
@@ -0,0 +1,341 @@
+"""Metrics for the memory layer.
+
+A small, dependency-free registry of histograms, counters and gauges with
+Prometheus text exposition. MemoryHub records per-operation latency, the
+storage backends record save/load latency and bytes written, and the hub
+refreshes entry/size/eviction/expiry figures when metrics are rendered.
+
+Metrics recorded by the memory package:
+
+- ``memory_operation_seconds{operation,context}``: MemoryHub call latency
+- ``memory_storage_seconds{operation,context,backend}``: storage call latency
+- ``memory_storage_write_bytes{context,backend}``: bytes written per save
+- ``memory_context_entries{context}`` / ``memory_context_size_bytes{context}``
+- ``memory_evictions_total{context}`` / ``memory_expirations_total{context}``
+"""
+
+from __future__ import annotations
+
+import bisect
+import functools
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from .contexts import ContextType, MemoryContext
+
+LATENCY_BUCKETS = (
+    0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01,
+    0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+BYTES_BUCKETS = tuple(256 * 4 ** i for i in range(10))  # 256 B .. 64 MiB
+
+_HELP = {
+    "memory_operation_seconds": "Latency of MemoryHub operations",
+    "memory_storage_seconds": "Latency of memory storage backend calls",
+    "memory_storage_write_bytes": "Bytes written to storage per save",
+    "memory_context_entries": "Entries held by a memory context",
+    "memory_context_size_bytes": "Estimated size of a memory context",
+    "memory_evictions_total": "Entries evicted from a memory context",
+    "memory_expirations_total": "Entries expired from a memory context",
+}
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+class Histogram:
+    """Cumulative-bucket histogram.
+
+    Attributes:
+        buckets: Upper bounds of the buckets (an implicit +Inf follows)
+        counts: Observations per bucket (not cumulative)
+        count: Total number of observations
+        total: Sum of observed values
+    """
+
+    def __init__(self, buckets: Iterable[float] = LATENCY_BUCKETS) -> None:
+        """Initialize an empty histogram.
+
+        Args:
+            buckets: Sorted bucket upper bounds
+        """
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one observation.
+
+        Args:
+            value: The observed value
+        """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile by interpolating inside its bucket.
+
+        Args:
+            q: Quantile between 0 and 1
+
+        Returns:
+            Estimated value (0.0 without observations)
+        """
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if seen + bucket_count >= rank and bucket_count:
+                lower = self.buckets[index - 1] if index else 0.0
+                upper = self.buckets[index] if index < len(self.buckets) else lower
+                return lower + (upper - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+        return self.buckets[-1]
+
+    def summary(self, scale: float = 1.0) -> Dict[str, float]:
+        """Summarize the histogram.
+
+        Args:
+            scale: Factor applied to values (e.g. 1000 for seconds to ms)
+
+        Returns:
+            Dictionary with count, sum, avg, p50, p95 and p99
+        """
+        return {
+            "count": self.count,
+            "sum": self.total * scale,
+            "avg": self.total * scale / self.count if self.count else 0.0,
+            "p50": self.quantile(0.5) * scale,
+            "p95": self.quantile(0.95) * scale,
+            "p99": self.quantile(0.99) * scale,
+        }
+
+
+class MemoryMetrics:
+    """Thread-safe registry of memory layer metrics."""
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, Dict[LabelKey, Histogram]] = {}
+        self._values: Dict[str, Dict[LabelKey, float]] = {}
+        self._kinds: Dict[str, str] = {}
+
+    @staticmethod
+    def _key(labels: Dict[str, Any]) -> LabelKey:
+        """Build the hashable label key."""
+        return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+    def observe(
+        self,
+        name: str,
+        value: float,
+        buckets: Iterable[float] = LATENCY_BUCKETS,
+        **labels: Any
+    ) -> None:
+        """Record a histogram observation.
+
+        Args:
+            name: Metric name
+            value: The observed value
+            buckets: Bucket bounds, used when the series is created
+            **labels: Label values
+        """
+        key = self._key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram(buckets)
+            histogram.observe(value)
+            self._kinds[name] = "histogram"
+
+    def set_gauge(self, name: str, value: float, **labels: Any) -> None:
+        """Set a gauge value.
+
+        Args:
+            name: Metric name
+            value: The current value
+            **labels: Label values
+        """
+        self._set(name, value, "gauge", labels)
+
+    def set_counter(self, name: str, value: float, **labels: Any) -> None:
+        """Set a counter to a total maintained elsewhere.
+
+        Args:
+            name: Metric name (conventionally ending in ``_total``)
+            value: The current total
+            **labels: Label values
+        """
+        self._set(name, value, "counter", labels)
+
+    def _set(self, name: str, value: float, kind: str, labels: Dict[str, Any]) -> None:
+        """Store a gauge or counter value."""
+        with self._lock:
+            self._values.setdefault(name, {})[self._key(labels)] = value
+            self._kinds[name] = kind
+
+    def histogram(self, name: str, **labels: Any) -> Optional[Histogram]:
+        """Get a histogram series.
+
+        Args:
+            name: Metric name
+            **labels: Label values
+
+        Returns:
+            The histogram, or None if nothing was observed
+        """
+        with self._lock:
+            return self._histograms.get(name, {}).get(self._key(labels))
+
+    def summary(self, context: Optional[str] = None) -> Dict[str, Any]:
+        """Summarize the latency and size histograms.
+
+        Args:
+            context: Only include series with this context label
+
+        Returns:
+            Dictionary of metric name to {labels: summary}; latencies are
+            reported in milliseconds
+        """
+        result: Dict[str, Any] = {}
+        with self._lock:
+            for name, series in self._histograms.items():
+                scale = 1000.0 if name.endswith("_seconds") else 1.0
+                for key, histogram in series.items():
+                    labels = dict(key)
+                    if context is not None and labels.get("context") != context:
+                        continue
+                    label = ",".join(
+                        value for field, value in key if field != "context"
+                    ) or "all"
+                    result.setdefault(name, {})[label] = histogram.summary(scale)
+        return result
+
+    def render_prometheus(self) -> str:
+        """Render every metric in the Prometheus text exposition format.
+
+        Returns:
+            Exposition text
+        """
+        lines: List[str] = []
+        with self._lock:
+            for name in sorted(self._kinds):
+                kind = self._kinds[name]
+                if name in _HELP:
+                    lines.append(f"# HELP {name} {_HELP[name]}")
+                lines.append(f"# TYPE {name} {kind}")
+
+                if kind == "histogram":
+                    for key, histogram in self._histograms[name].items():
+                        cumulative = 0
+                        for bound, bucket_count in zip(histogram.buckets, histogram.counts):
+                            cumulative += bucket_count
+                            lines.append(
+                                f"{name}_bucket{_labels(key, le=_number(bound))} {cumulative}"
+                            )
+                        lines.append(f"{name}_bucket{_labels(key, le='+Inf')} {histogram.count}")
+                        lines.append(f"{name}_sum{_labels(key)} {_number(histogram.total)}")
+                        lines.append(f"{name}_count{_labels(key)} {histogram.count}")
+                else:
+                    for key, value in self._values[name].items():
+                        lines.append(f"{name}{_labels(key)} {_number(value)}")
+        return "\n".join(lines) + "\n"
+
+    def record_context(self, context: MemoryContext) -> None:
+        """Refresh the size and eviction figures of a context.
+
+        Args:
+            context: The context to record
+        """
+        label = context.type.value
+        self.set_gauge("memory_context_entries", len(context.entries), context=label)
+        self.set_gauge("memory_context_size_bytes", context.total_size_bytes, context=label)
+        self.set_counter("memory_evictions_total", context.evictions, context=label)
+        self.set_counter("memory_expirations_total", context.expirations, context=label)
+
+    def reset(self) -> None:
+        """Drop every recorded series."""
+        with self._lock:
+            self._histograms.clear()
+            self._values.clear()
+            self._kinds.clear()
+
+
+def _number(value: float) -> str:
+    """Format a sample value."""
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+def _labels(key: LabelKey, **extra: str) -> str:
+    """Format a label set."""
+    pairs = list(key) + list(extra.items())
+    if not pairs:
+        return ""
+    escaped = (
+        '{}="{}"'.format(
+            name, value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        )
+        for name, value in pairs
+    )
+    return "{" + ",".join(escaped) + "}"
+
+
+_metrics: Optional[MemoryMetrics] = None
+
+
+def get_memory_metrics() -> MemoryMetrics:
+    """Get the process-wide memory metrics registry.
+
+    Returns:
+        MemoryMetrics instance
+    """
+    global _metrics
+    if _metrics is None:
+        _metrics = MemoryMetrics()
+    return _metrics
+
+
+def _context_label(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> str:
+    """Find the context of a hub or storage call from its arguments."""
+    target = kwargs.get("context_type", kwargs.get("context"))
+    if target is None and args:
+        target = args[0]
+    if isinstance(target, MemoryContext):
+        return target.type.value
+    if isinstance(target, ContextType):
+        return target.value
+    return "none"
+
+
+def timed(operation: str, metric: str = "memory_operation_seconds") -> Callable:
+    """Decorate an async hub or storage method to record its latency.
+
+    The instance's ``metrics`` attribute is used when set, else the
+    process-wide registry. Storage methods get a ``backend`` label.
+
+    Args:
+        operation: Value of the ``operation`` label
+        metric: Histogram name
+
+    Returns:
+        The decorator
+    """
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        async def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return await func(self, *args, **kwargs)
+            finally:
+                labels = {"operation": operation, "context": _context_label(args, kwargs)}
+                if metric == "memory_storage_seconds":
+                    labels["backend"] = type(self).__name__
+                registry = getattr(self, "metrics", None) or get_memory_metrics()
+                registry.observe(metric, time.perf_counter() - start, **labels)
+        return wrapper
+    return decorator
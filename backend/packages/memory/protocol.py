@@ -0,0 +1,90 @@
+"""Wire protocol shared by MemoryHubServer and MemoryHubClient.
+
+Messages are length-prefixed frames: a 4-byte big-endian payload length
+followed by the payload encoded with a MemoryCodec (compact JSON by
+default). Requests look like ``{"id": 1, "op": "put", "args": {...}}`` and
+responses like ``{"id": 1, "ok": true, "result": ...}`` or
+``{"id": 1, "ok": false, "error": "...", "error_type": "ValueError"}``.
+Responses carry the request id, so a client may pipeline many requests
+over one connection.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import struct
+from typing import Any, Optional, Union
+
+from .codecs import JSONCodec, MemoryCodec, get_codec
+
+DEFAULT_SOCKET_PATH = "/tmp/t-developer/memory.sock"
+# Upper bound for a single frame, guards against corrupt length headers
+MAX_FRAME_BYTES = 64 * 1024 * 1024
+
+_HEADER = struct.Struct(">I")
+
+
+def get_socket_path(socket_path: Optional[str] = None) -> str:
+    """Resolve the memory server socket path.
+
+    Args:
+        socket_path: Explicit path, or None to use MEMORY_SOCKET
+
+    Returns:
+        The socket path
+    """
+    return socket_path or os.getenv("MEMORY_SOCKET", DEFAULT_SOCKET_PATH)
+
+
+def get_wire_codec(codec: Union[str, MemoryCodec, None] = None) -> MemoryCodec:
+    """Get the codec used on the wire (compact JSON by default).
+
+    Args:
+        codec: Codec name or instance, None for compact JSON
+
+    Returns:
+        MemoryCodec instance
+    """
+    if codec is None:
+        return JSONCodec(indent=None, ensure_ascii=False)
+    return get_codec(codec)
+
+
+def encode_frame(codec: MemoryCodec, message: Any) -> bytes:
+    """Encode a message as a length-prefixed frame.
+
+    Args:
+        codec: Codec for the payload
+        message: The message to encode
+
+    Returns:
+        The frame bytes
+    """
+    payload = codec.encode(message)
+    return _HEADER.pack(len(payload)) + payload
+
+
+async def read_frame(reader: asyncio.StreamReader, codec: MemoryCodec) -> Optional[Any]:
+    """Read and decode one frame.
+
+    Args:
+        reader: Stream to read from
+        codec: Codec for the payload
+
+    Returns:
+        The decoded message, or None when the peer closed the connection
+
+    Raises:
+        ValueError: If the frame exceeds MAX_FRAME_BYTES
+    """
+    try:
+        header = await reader.readexactly(_HEADER.size)
+        (length,) = _HEADER.unpack(header)
+        if length > MAX_FRAME_BYTES:
+            raise ValueError(f"Frame too large: {length} bytes")
+        payload = await reader.readexactly(length)
+    except asyncio.IncompleteReadError:
+        return None
+
+    return codec.decode(payload)
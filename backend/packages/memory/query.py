@@ -0,0 +1,231 @@
+"""Query API for MemoryHub.
+
+A MemoryQuery combines AND/OR/NOT tag filters, metadata and key
+predicates, an ``updated_at`` time range, field projection and paging.
+Matches are produced lazily: entries are visited in insertion order and
+only the page being returned is projected into dictionaries, so a query
+never materializes (or decodes) entries it does not return.
+
+Pages are linked by opaque continuation cursors. A cursor records the
+position after the last returned entry, so entries written while a client
+is paging do not shift or duplicate the following pages.
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .contexts import MemoryContext, MemoryEntry
+
+# Fields a projection may select; "value.<path>" selects inside the value
+ENTRY_FIELDS = ("key", "value", "tags", "metadata", "created_at", "updated_at")
+
+
+@dataclass
+class MemoryQuery:
+    """Declarative query over the entries of one context.
+
+    Attributes:
+        all_tags: Tags an entry must all have (AND)
+        any_tags: Tags of which an entry must have at least one (OR)
+        none_tags: Tags an entry must not have (NOT)
+        metadata: Metadata values an entry must have (equality)
+        key_prefix: Prefix the entry key must start with
+        updated_after: Only entries updated at or after this time
+        updated_before: Only entries updated before this time
+        fields: Fields to return (None returns every field)
+        limit: Maximum number of entries per page
+        cursor: Continuation cursor from a previous page
+    """
+
+    all_tags: List[str] = field(default_factory=list)
+    any_tags: List[str] = field(default_factory=list)
+    none_tags: List[str] = field(default_factory=list)
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    key_prefix: Optional[str] = None
+    updated_after: Optional[datetime] = None
+    updated_before: Optional[datetime] = None
+    fields: Optional[List[str]] = None
+    limit: int = 100
+    cursor: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        """Validate the projection and the limit."""
+        for name in self.fields or []:
+            if name.split(".", 1)[0] not in ENTRY_FIELDS:
+                raise ValueError(f"Unknown query field: {name}")
+        if self.limit < 1:
+            raise ValueError("Query limit must be at least 1")
+
+    @classmethod
+    def coerce(
+        cls,
+        query: Union["MemoryQuery", Dict[str, Any], None] = None,
+        **criteria: Any
+    ) -> "MemoryQuery":
+        """Build a query from an instance, a dictionary and/or keywords.
+
+        Args:
+            query: Existing query or its to_dict() form
+            **criteria: Query attributes overriding those of ``query``
+
+        Returns:
+            MemoryQuery instance
+
+        Raises:
+            TypeError: If an unknown query attribute is given
+        """
+        base = query.to_dict() if isinstance(query, MemoryQuery) else dict(query or {})
+        base.update(criteria)
+        return cls(**base)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the query as a dictionary (for the wire protocol).
+
+        Returns:
+            Dictionary of query attributes
+        """
+        return asdict(self)
+
+    def matches(self, entry: MemoryEntry) -> bool:
+        """Check the non-positional predicates against an entry.
+
+        Never decodes the entry value.
+
+        Args:
+            entry: The entry to check
+
+        Returns:
+            True if the entry satisfies every predicate
+        """
+        if self.key_prefix is not None and not entry.key.startswith(self.key_prefix):
+            return False
+        if self.all_tags and not set(self.all_tags).issubset(entry.tags):
+            return False
+        if self.any_tags and not any(tag in entry.tags for tag in self.any_tags):
+            return False
+        if self.none_tags and any(tag in entry.tags for tag in self.none_tags):
+            return False
+        if self.updated_after is not None and entry.updated_at < self.updated_after:
+            return False
+        if self.updated_before is not None and entry.updated_at >= self.updated_before:
+            return False
+        for name, expected in self.metadata.items():
+            if entry.metadata.get(name) != expected:
+                return False
+        return True
+
+    def project(self, entry: MemoryEntry) -> Dict[str, Any]:
+        """Convert an entry to a dictionary holding only the selected fields.
+
+        The value is only touched (and decoded) when it is selected.
+
+        Args:
+            entry: The entry to project
+
+        Returns:
+            Dictionary in the format of MemoryHub.search() results
+        """
+        result: Dict[str, Any] = {}
+        for name in self.fields or ENTRY_FIELDS:
+            top, _, path = name.partition(".")
+            value = getattr(entry, top)
+            if isinstance(value, datetime):
+                value = value.isoformat()
+            if path:
+                value = _pick(value, path)
+            result[name] = value
+        return result
+
+
+def _pick(value: Any, path: str) -> Any:
+    """Follow a dotted path into nested dictionaries (None if missing)."""
+    for part in path.split("."):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(part)
+    return value
+
+
+def encode_cursor(position: int) -> str:
+    """Encode a scan position as an opaque cursor.
+
+    Args:
+        position: Position after which the next page starts
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps({"after": position}, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> int:
+    """Decode a cursor produced by encode_cursor().
+
+    Args:
+        cursor: The cursor, or None for the first page
+
+    Returns:
+        Position after which the page starts (-1 for the first page)
+
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    if not cursor:
+        return -1
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return int(json.loads(base64.urlsafe_b64decode(padded))["after"])
+    except (ValueError, KeyError, TypeError) as e:
+        raise ValueError(f"Invalid query cursor: {cursor}") from e
+
+
+def iter_matches(context: MemoryContext, query: MemoryQuery) -> Iterator[Tuple[int, MemoryEntry]]:
+    """Lazily yield the entries of a context matching a query.
+
+    Args:
+        context: The context to scan
+        query: The query to evaluate
+
+    Yields:
+        (position, entry) pairs in insertion order, after the query cursor
+    """
+    candidates = context.iter_entries(
+        all_tags=query.all_tags,
+        any_tags=query.any_tags,
+        after_sequence=decode_cursor(query.cursor),
+    )
+    for position, entry in candidates:
+        if query.matches(entry):
+            yield position, entry
+
+
+def collect_page(
+    matches: Iterable[Tuple[int, MemoryEntry]],
+    query: MemoryQuery
+) -> Dict[str, Any]:
+    """Take one page from a stream of matches.
+
+    Consumes at most ``limit + 1`` matches: the extra one only tells
+    whether a next page exists.
+
+    Args:
+        matches: (position, entry) pairs in scan order
+        query: The query providing limit and projection
+
+    Returns:
+        Dictionary with ``items`` and ``next_cursor`` (None on the last page)
+    """
+    items: List[Dict[str, Any]] = []
+    last_position: Optional[int] = None
+    for position, entry in matches:
+        if len(items) == query.limit:
+            return {"items": items, "next_cursor": encode_cursor(last_position)}
+        items.append(query.project(entry))
+        last_position = position
+    return {"items": items, "next_cursor": None}
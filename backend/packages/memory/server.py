@@ -0,0 +1,217 @@
+"""Memory Hub server for sharing one hub across threads and processes.
+
+A single process owns the MemoryHub and its contexts and serves it over a
+Unix domain socket. Analyses running in other threads (each with its own
+event loop) or other processes use MemoryHubClient, so they all share one
+cache and one writer instead of reading and rewriting the storage files
+independently.
+
+Requests of one connection are executed in the order they were sent, so a
+client's pipelined put followed by a get sees its own write. Connections
+are served concurrently.
+
+Run standalone with ``scripts/run_memory_server.sh`` (or call main()).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import inspect
+import logging
+import os
+import signal
+from pathlib import Path
+from typing import Any, Dict, Optional, Set, Union
+
+from .codecs import MemoryCodec
+from .contexts import ContextType
+from .hub import MemoryHub
+from .protocol import encode_frame, get_socket_path, get_wire_codec, read_frame
+from .storage import get_memory_storage
+
+logger = logging.getLogger(__name__)
+
+# Hub methods a client may call
+SERVED_OPERATIONS = frozenset({
+    "put",
+    "put_many",
+    "get",
+    "get_many",
+    "search",
+    "query",
+    "delete",
+    "delete_many",
+    "clear_context",
+    "get_context_stats",
+    "flush",
+    "get_write_behind_stats",
+})
+
+
+class MemoryHubServer:
+    """Serves a MemoryHub over a Unix domain socket.
+
+    The server does not own the hub's lifecycle: the caller initializes
+    the hub before start() and shuts it down after stop().
+
+    Attributes:
+        hub: The served MemoryHub
+        socket_path: Path of the Unix domain socket
+        codec: Codec used for frame payloads
+    """
+
+    def __init__(
+        self,
+        hub: MemoryHub,
+        socket_path: Optional[str] = None,
+        codec: Union[str, MemoryCodec, None] = None
+    ) -> None:
+        """Initialize the server.
+
+        Args:
+            hub: An initialized MemoryHub to serve
+            socket_path: Socket path (defaults to MEMORY_SOCKET or
+                /tmp/t-developer/memory.sock)
+            codec: Wire codec, must match the clients (compact JSON default)
+        """
+        self.hub = hub
+        self.socket_path = get_socket_path(socket_path)
+        self.codec = get_wire_codec(codec)
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._connections: Set[asyncio.StreamWriter] = set()
+        self._stats: Dict[str, int] = {"connections": 0, "requests": 0, "errors": 0}
+
+    async def start(self) -> None:
+        """Start listening on the socket.
+
+        A stale socket file left by a crashed server is replaced.
+        """
+        path = Path(self.socket_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.exists():
+            path.unlink()
+
+        self._server = await asyncio.start_unix_server(self._handle_connection, path=str(path))
+        os.chmod(path, 0o600)
+        logger.info(f"Memory hub server listening on {path}")
+
+    async def stop(self) -> None:
+        """Stop listening, close client connections and remove the socket."""
+        if self._server:
+            self._server.close()
+            for writer in list(self._connections):
+                writer.close()
+            await self._server.wait_closed()
+            self._server = None
+
+        Path(self.socket_path).unlink(missing_ok=True)
+
+    async def serve_forever(self) -> None:
+        """Start the server (if needed) and serve until cancelled."""
+        if not self._server:
+            await self.start()
+        await self._server.serve_forever()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get server counters.
+
+        Returns:
+            Dictionary with connection and request counters
+        """
+        stats = dict(self._stats)
+        stats["open_connections"] = len(self._connections)
+        return stats
+
+    async def _handle_connection(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve the requests of one client connection in order."""
+        self._connections.add(writer)
+        self._stats["connections"] += 1
+
+        try:
+            while True:
+                request = await read_frame(reader, self.codec)
+                if request is None:
+                    break
+                response = await self._dispatch(request)
+                writer.write(encode_frame(self.codec, response))
+                await writer.drain()
+        except (ConnectionError, ValueError) as e:
+            logger.warning(f"Memory hub client connection dropped: {e}")
+        finally:
+            self._connections.discard(writer)
+            writer.close()
+
+    async def _dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute one request against the hub.
+
+        Args:
+            request: The decoded request frame
+
+        Returns:
+            The response frame
+        """
+        request_id = request.get("id")
+        self._stats["requests"] += 1
+
+        try:
+            op = request.get("op")
+            if op == "ping":
+                return {"id": request_id, "ok": True, "result": "pong"}
+            if op not in SERVED_OPERATIONS:
+                raise ValueError(f"Unsupported memory hub operation: {op}")
+
+            args = dict(request.get("args") or {})
+            if "context_type" in args:
+                args["context_type"] = ContextType(args["context_type"])
+
+            result = getattr(self.hub, op)(**args)
+            if inspect.isawaitable(result):
+                result = await result
+            return {"id": request_id, "ok": True, "result": result}
+
+        except Exception as e:
+            self._stats["errors"] += 1
+            return {
+                "id": request_id,
+                "ok": False,
+                "error": str(e),
+                "error_type": type(e).__name__,
+            }
+
+
+async def _serve(socket_path: Optional[str]) -> None:
+    """Run a hub on the configured storage and serve it until signalled."""
+    hub = MemoryHub(storage=get_memory_storage(), write_behind=True, lazy_load=True)
+    await hub.initialize()
+    server = MemoryHubServer(hub, socket_path)
+    await server.start()
+
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    try:
+        await stop.wait()
+    finally:
+        await server.stop()
+        await hub.shutdown()
+
+
+def main() -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Serve a MemoryHub over a Unix socket")
+    parser.add_argument("--socket", default=None, help="Socket path (default: MEMORY_SOCKET)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(_serve(args.socket))
+
+
+if __name__ == "__main__":
+    main()
@@ -6,15 +6,26 @@ following the Dependency Inversion Principle (DIP).
 
 from __future__ import annotations
 
+import asyncio
 import json
+import logging
 import os
+import sqlite3
+import threading
+import time
 from abc import ABC, abstractmethod
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Union
 
 import aiofiles
 
-from .contexts import ContextType, MemoryContext, MemoryEntry
+from .codecs import MemoryCodec, get_codec
+from .contexts import ContextType, LazyValue, MemoryContext, MemoryEntry
+from .metrics import BYTES_BUCKETS, MemoryMetrics, get_memory_metrics, timed
+from .query import MemoryQuery, collect_page, decode_cursor
+
+logger = logging.getLogger(__name__)
 
 
 class MemoryStorage(ABC):
@@ -22,8 +33,34 @@ class MemoryStorage(ABC):
     
     This interface allows different storage implementations
     (JSON, DynamoDB, Redis, etc.) following the DIP principle.
+    
+    Backends that set ``queryable`` to True are the source of truth for
+    their entries: MemoryHub then answers get/put/search/delete and expiry
+    cleanup through the entry-level query methods below instead of its
+    in-process cache, so several processes can share one store.
+    
+    Backends record call latency and bytes written per save in
+    ``metrics`` (MemoryHub sets it to its own registry).
     """
     
+    queryable: bool = False
+    metrics: Optional[MemoryMetrics] = None
+    
+    def _record_write(self, context_type: ContextType, nbytes: int) -> None:
+        """Record the number of bytes written by one save.
+        
+        Args:
+            context_type: The context that was saved
+            nbytes: Bytes written
+        """
+        (self.metrics or get_memory_metrics()).observe(
+            "memory_storage_write_bytes",
+            nbytes,
+            buckets=BYTES_BUCKETS,
+            context=context_type.value,
+            backend=type(self).__name__,
+        )
+    
     @abstractmethod
     async def save_context(self, context: MemoryContext) -> bool:
         """Save a memory context to storage.
@@ -36,6 +73,55 @@ class MemoryStorage(ABC):
         """
         pass
     
+    async def save_entry(self, context: MemoryContext, entry: MemoryEntry) -> bool:
+        """Persist a single created or updated entry.
+        
+        Backends that can store entries individually should override this.
+        The default implementation rewrites the whole context.
+        
+        Args:
+            context: The context the entry belongs to (already mutated)
+            entry: The entry that was created or updated
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        return await self.save_context(context)
+    
+    async def delete_entry(self, context: MemoryContext, key: str) -> bool:
+        """Persist the removal of a single entry.
+        
+        The default implementation rewrites the whole context.
+        
+        Args:
+            context: The context the entry was removed from (already mutated)
+            key: Key of the removed entry
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        return await self.save_context(context)
+    
+    async def apply_mutations(
+        self,
+        context: MemoryContext,
+        changed: List[MemoryEntry],
+        deleted: List[str]
+    ) -> bool:
+        """Persist a batch of entry changes with a single storage write.
+        
+        The default implementation rewrites the whole context once.
+        
+        Args:
+            context: The context the changes belong to (already mutated)
+            changed: Entries that were created or updated
+            deleted: Keys of entries that were removed
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        return await self.save_context(context)
+    
     @abstractmethod
     async def load_context(self, context_type: ContextType) -> Optional[MemoryContext]:
         """Load a memory context from storage.
@@ -71,6 +157,168 @@ class MemoryStorage(ABC):
             True if exists, False otherwise
         """
         pass
+    
+    async def get_entry(self, context_type: ContextType, key: str) -> Optional[MemoryEntry]:
+        """Get a single non-expired entry (queryable backends only).
+        
+        Args:
+            context_type: The context to look in
+            key: The key to look up
+            
+        Returns:
+            The MemoryEntry if found and not expired, None otherwise
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support entry queries")
+    
+    async def put_entry(
+        self,
+        context_type: ContextType,
+        key: str,
+        value: Any,
+        ttl_seconds: Optional[int] = None,
+        tags: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> MemoryEntry:
+        """Create or update an entry atomically (queryable backends only).
+        
+        Follows MemoryHub.put semantics: an existing entry keeps its tags
+        and TTL, gets the new value and has its metadata merged.
+        
+        Args:
+            context_type: The context to store in
+            key: Unique key for the entry
+            value: The value to store
+            ttl_seconds: Optional time to live for new entries
+            tags: Optional tags for new entries
+            metadata: Optional metadata to merge
+            
+        Returns:
+            The stored MemoryEntry
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support entry queries")
+    
+    async def remove_entry(self, context_type: ContextType, key: str) -> bool:
+        """Remove a single entry (queryable backends only).
+        
+        Args:
+            context_type: The context to delete from
+            key: The key to delete
+            
+        Returns:
+            True if removed, False if not found
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support entry queries")
+    
+    async def get_entries(
+        self,
+        context_type: ContextType,
+        keys: List[str]
+    ) -> Dict[str, MemoryEntry]:
+        """Get several non-expired entries at once (queryable backends only).
+        
+        Args:
+            context_type: The context to look in
+            keys: The keys to look up
+            
+        Returns:
+            Dictionary of key to MemoryEntry for the keys found
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support entry queries")
+    
+    async def put_entries(
+        self,
+        context_type: ContextType,
+        items: List[Dict[str, Any]]
+    ) -> List[MemoryEntry]:
+        """Create or update several entries atomically (queryable backends only).
+        
+        Args:
+            context_type: The context to store in
+            items: Dictionaries with the arguments of put_entry()
+            
+        Returns:
+            The stored MemoryEntries
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support entry queries")
+    
+    async def remove_entries(self, context_type: ContextType, keys: List[str]) -> int:
+        """Remove several entries at once (queryable backends only).
+        
+        Args:
+            context_type: The context to delete from
+            keys: The keys to delete
+            
+        Returns:
+            Number of entries removed
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support entry queries")
+    
+    async def search_entries(
+        self,
+        context_type: ContextType,
+        tags: Optional[List[str]] = None,
+        limit: int = 100
+    ) -> List[MemoryEntry]:
+        """Search non-expired entries, optionally by tags (queryable backends only).
+        
+        Args:
+            context_type: The context to search in
+            tags: Optional tags to filter by (OR operation)
+            limit: Maximum number of results
+            
+        Returns:
+            Matching entries in insertion order
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support entry queries")
+    
+    async def query_entries(
+        self,
+        context_type: ContextType,
+        query: MemoryQuery
+    ) -> Dict[str, Any]:
+        """Evaluate a MemoryQuery and return one page (queryable backends only).
+        
+        Args:
+            context_type: The context to query
+            query: The query to evaluate
+            
+        Returns:
+            Dictionary with projected ``items`` and ``next_cursor``
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support entry queries")
+    
+    async def cleanup_expired(self, context_type: ContextType) -> int:
+        """Remove expired entries of a context (queryable backends only).
+        
+        Args:
+            context_type: The context to clean up
+            
+        Returns:
+            Number of entries removed
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support entry queries")
+    
+    async def count_entries(self, context_type: ContextType) -> int:
+        """Count non-expired entries of a context (queryable backends only).
+        
+        Args:
+            context_type: The context to count
+            
+        Returns:
+            Number of live entries
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support entry queries")
+    
+    async def count_tags(self, context_type: ContextType) -> int:
+        """Count distinct tags of non-expired entries (queryable backends only).
+        
+        Args:
+            context_type: The context to count
+            
+        Returns:
+            Number of distinct tags
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support entry queries")
 
 
 class JSONMemoryStorage(MemoryStorage):
@@ -79,18 +327,29 @@ class JSONMemoryStorage(MemoryStorage):
     This is the MVP implementation using local JSON files.
     Suitable for development and small-scale deployments.
     
+    The file format is pluggable through a codec: stdlib ``json`` with
+    ``indent=2`` (default, human readable), ``orjson`` (compact, fast) or
+    ``msgpack`` (binary, smallest).
+    
     Attributes:
         base_path: Base directory for storing JSON files
+        codec: Codec used to encode and decode context files
     """
     
-    def __init__(self, base_path: str = "/tmp/t-developer/memory") -> None:
+    def __init__(
+        self,
+        base_path: str = "/tmp/t-developer/memory",
+        codec: Union[str, MemoryCodec, None] = None
+    ) -> None:
         """Initialize JSON memory storage.
         
         Args:
             base_path: Base directory path for storing memory files
+            codec: Codec name ("json", "orjson", "msgpack") or instance
         """
         self.base_path = Path(base_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
+        self.codec = get_codec(codec)
     
     def _get_file_path(self, context_type: ContextType) -> Path:
         """Get the file path for a context type.
@@ -99,15 +358,16 @@ class JSONMemoryStorage(MemoryStorage):
             context_type: The context type
             
         Returns:
-            Path to the JSON file for this context
+            Path to the file for this context (extension depends on the codec)
         """
-        return self.base_path / f"{context_type.value}.json"
+        return self.base_path / f"{context_type.value}{self.codec.extension}"
     
-    def _serialize_entry(self, entry: MemoryEntry) -> Dict[str, Any]:
+    def _serialize_entry(self, entry: MemoryEntry, raw: bool = False) -> Dict[str, Any]:
         """Serialize a memory entry to JSON-compatible format.
         
         Args:
             entry: The MemoryEntry to serialize
+            raw: Keep a pending LazyValue instead of loading the value
             
         Returns:
             Dictionary representation of the entry
@@ -116,7 +376,7 @@ class JSONMemoryStorage(MemoryStorage):
             "id": entry.id,
             "context_type": entry.context_type.value,
             "key": entry.key,
-            "value": entry.value,
+            "value": entry.raw_value() if raw else entry.value,
             "metadata": entry.metadata,
             "created_at": entry.created_at.isoformat(),
             "updated_at": entry.updated_at.isoformat(),
@@ -147,6 +407,7 @@ class JSONMemoryStorage(MemoryStorage):
             tags=data.get("tags", []),
         )
     
+    @timed("save_context", metric="memory_storage_seconds")
     async def save_context(self, context: MemoryContext) -> bool:
         """Save a memory context to a JSON file.
         
@@ -171,9 +432,11 @@ class JSONMemoryStorage(MemoryStorage):
             }
             
             # Write to file asynchronously
-            async with aiofiles.open(file_path, mode='w') as f:
-                await f.write(json.dumps(data, indent=2))
+            payload = self.codec.encode(data)
+            async with aiofiles.open(file_path, mode='wb') as f:
+                await f.write(payload)
             
+            self._record_write(context.type, len(payload))
             return True
             
         except Exception as e:
@@ -181,6 +444,7 @@ class JSONMemoryStorage(MemoryStorage):
             print(f"Error saving context {context.type.value}: {e}")
             return False
     
+    @timed("load_context", metric="memory_storage_seconds")
     async def load_context(self, context_type: ContextType) -> Optional[MemoryContext]:
         """Load a memory context from a JSON file.
         
@@ -197,9 +461,9 @@ class JSONMemoryStorage(MemoryStorage):
                 return None
             
             # Read file asynchronously
-            async with aiofiles.open(file_path, mode='r') as f:
+            async with aiofiles.open(file_path, mode='rb') as f:
                 content = await f.read()
-                data = json.loads(content)
+                data = self.codec.decode(content)
             
             # Reconstruct context
             context = MemoryContext(
@@ -209,9 +473,8 @@ class JSONMemoryStorage(MemoryStorage):
             )
             
             # Reconstruct entries
-            for key, entry_data in data.get("entries", {}).items():
-                entry = self._deserialize_entry(entry_data)
-                context.entries[key] = entry
+            for entry_data in data.get("entries", {}).values():
+                context.restore_entry(self._deserialize_entry(entry_data))
             
             return context
             
@@ -253,4 +516,1199 @@ class JSONMemoryStorage(MemoryStorage):
             True if exists, False otherwise
         """
         file_path = self._get_file_path(context_type)
-        return file_path.exists()
\ No newline at end of file
+        return file_path.exists()
+
+
+class WALMemoryStorage(JSONMemoryStorage):
+    """Append-only write-ahead log storage implementation.
+    
+    Every mutation is appended as one JSON line to the active log segment
+    of its context, so a single write costs the same regardless of how many
+    entries the context holds. On load the latest snapshot is read and the
+    segments written after it are replayed in order.
+    
+    Once a segment holds more records than the context has live entries
+    (and at least ``compact_min_records``), the storage rotates to a new
+    segment and writes a snapshot of the context in the background. Older
+    segments are removed after the snapshot is safely on disk.
+    
+    Values whose record would exceed ``lazy_value_bytes`` are written on a
+    line of their own after the record. Loading a context skips over those
+    lines and leaves a LazyValue pointing at them, so startup cost does not
+    grow with the size of stored payloads; a value is decoded when first
+    read.
+    
+    Layout per context::
+    
+        <context>.snapshot.json      # {"segment": N, "records": M} + M put records
+        <context>.wal.<segment>      # JSON lines, replayed if segment >= N
+    
+    Attributes:
+        base_path: Base directory for storing log segments and snapshots
+        compact_min_records: Minimum records in a segment before compaction
+        fsync: Whether to fsync each append (durability over throughput)
+        lazy_value_bytes: Record size from which values are stored on their
+            own line and loaded lazily (None keeps every value inline)
+    """
+    
+    def __init__(
+        self,
+        base_path: str = "/tmp/t-developer/memory",
+        compact_min_records: int = 1000,
+        fsync: bool = False,
+        lazy_value_bytes: Optional[int] = 4096
+    ) -> None:
+        """Initialize WAL memory storage.
+        
+        Args:
+            base_path: Base directory path for storing memory files
+            compact_min_records: Minimum segment records before compaction
+            fsync: Whether to fsync every appended record
+            lazy_value_bytes: Record size from which values are detached
+        """
+        super().__init__(base_path)
+        self.compact_min_records = compact_min_records
+        self.fsync = fsync
+        self.lazy_value_bytes = lazy_value_bytes
+        self._segments: Dict[ContextType, int] = {}
+        self._segment_records: Dict[ContextType, int] = {}
+        self._locks: Dict[ContextType, asyncio.Lock] = {}
+        self._compact_locks: Dict[ContextType, asyncio.Lock] = {}
+        self._compactions: Dict[ContextType, asyncio.Task] = {}
+        self._background: Set[asyncio.Task] = set()
+    
+    def _get_snapshot_path(self, context_type: ContextType) -> Path:
+        """Get the snapshot file path for a context type."""
+        return self.base_path / f"{context_type.value}.snapshot.json"
+    
+    def _get_segment_path(self, context_type: ContextType, segment: int) -> Path:
+        """Get the log segment file path for a context type."""
+        return self.base_path / f"{context_type.value}.wal.{segment:08d}"
+    
+    def _list_segments(self, context_type: ContextType) -> List[int]:
+        """List existing segment numbers for a context in ascending order."""
+        prefix = f"{context_type.value}.wal."
+        segments = []
+        for path in self.base_path.glob(f"{prefix}*"):
+            suffix = path.name[len(prefix):]
+            if suffix.isdigit():
+                segments.append(int(suffix))
+        return sorted(segments)
+    
+    def _get_lock(self, context_type: ContextType) -> asyncio.Lock:
+        """Get the append lock for a context type."""
+        return self._locks.setdefault(context_type, asyncio.Lock())
+    
+    def _get_compact_lock(self, context_type: ContextType) -> asyncio.Lock:
+        """Get the lock serializing snapshot writes for a context type."""
+        return self._compact_locks.setdefault(context_type, asyncio.Lock())
+    
+    def _active_segment(self, context_type: ContextType) -> int:
+        """Get the segment new records are appended to."""
+        if context_type not in self._segments:
+            existing = self._list_segments(context_type)
+            self._segments[context_type] = existing[-1] if existing else 0
+            self._segment_records.setdefault(context_type, 0)
+        return self._segments[context_type]
+    
+    def _encode_put(self, data: Dict[str, Any]) -> bytes:
+        """Encode a put record, detaching a large value onto its own line.
+        
+        Args:
+            data: Serialized entry (from _serialize_entry with raw=True)
+            
+        Returns:
+            The encoded record, newline terminated
+        """
+        value = data["value"]
+        if type(value) is LazyValue:
+            encoded = value.read_raw()
+        else:
+            line = json.dumps({"op": "put", "entry": data}, ensure_ascii=False).encode("utf-8")
+            if self.lazy_value_bytes is None or len(line) < self.lazy_value_bytes:
+                return line + b"\n"
+            encoded = json.dumps(value, ensure_ascii=False).encode("utf-8")
+        
+        header = {"op": "put", "entry": {**data, "value": None}, "value_bytes": len(encoded)}
+        return json.dumps(header, ensure_ascii=False).encode("utf-8") + b"\n" + encoded + b"\n"
+    
+    def _encode_delete(self, key: str) -> bytes:
+        """Encode a delete record, newline terminated."""
+        return json.dumps({"op": "delete", "key": key}, ensure_ascii=False).encode("utf-8") + b"\n"
+    
+    async def _append(self, context: MemoryContext, *records: bytes) -> bool:
+        """Append encoded mutation records to the active segment in one write.
+        
+        Args:
+            context: The context the records belong to
+            *records: The encoded mutation records
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        if not records:
+            return True
+        
+        payload = b"".join(records)
+        
+        try:
+            async with self._get_lock(context.type):
+                segment = self._active_segment(context.type)
+                path = self._get_segment_path(context.type, segment)
+                async with aiofiles.open(path, mode='ab') as f:
+                    await f.write(payload)
+                    if self.fsync:
+                        await f.flush()
+                        os.fsync(f.fileno())
+                self._segment_records[context.type] = (
+                    self._segment_records.get(context.type, 0) + len(records)
+                )
+            self._record_write(context.type, len(payload))
+        except Exception as e:
+            logger.error(f"Error appending to WAL for {context.type.value}: {e}")
+            return False
+        
+        self._maybe_compact(context)
+        return True
+    
+    def _maybe_compact(self, context: MemoryContext) -> None:
+        """Schedule a background compaction if the active segment is large."""
+        records = self._segment_records.get(context.type, 0)
+        threshold = max(self.compact_min_records, len(context.entries))
+        
+        if records < threshold:
+            return
+        
+        running = self._compactions.get(context.type)
+        if running and not running.done():
+            return
+        
+        task = asyncio.create_task(self._compact(context))
+        self._compactions[context.type] = task
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+    
+    async def _compact(self, context: MemoryContext) -> bool:
+        """Rotate the active segment and snapshot the context.
+        
+        The snapshot is taken right after rotation with no await in between,
+        so it reflects every record in the sealed segments. Records written
+        concurrently land in the new segment and are replayed on top of it.
+        
+        Args:
+            context: The live context to snapshot
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        async with self._get_compact_lock(context.type):
+            return await self._rotate_and_snapshot(context)
+    
+    async def _rotate_and_snapshot(self, context: MemoryContext) -> bool:
+        """Body of _compact, run under the compaction lock."""
+        async with self._get_lock(context.type):
+            sealed = self._active_segment(context.type)
+            new_segment = sealed + 1
+            self._segments[context.type] = new_segment
+            self._segment_records[context.type] = 0
+            header = {
+                "type": context.type.value,
+                "segment": new_segment,
+                "max_entries": context.max_entries,
+                "max_size_bytes": context.max_size_bytes,
+                "records": len(context.entries),
+            }
+            entries = [
+                self._serialize_entry(entry, raw=True) for entry in context.entries.values()
+            ]
+        
+        try:
+            content, placements = await asyncio.to_thread(
+                self._encode_snapshot, header, entries
+            )
+            snapshot_path = self._get_snapshot_path(context.type)
+            tmp_path = snapshot_path.with_suffix(".tmp")
+            async with aiofiles.open(tmp_path, mode='wb') as f:
+                await f.write(content)
+            os.replace(tmp_path, snapshot_path)
+            self._record_write(context.type, len(content))
+            
+            # Re-point values that are still on disk before their old files go
+            for lazy, offset in placements:
+                lazy.path = str(snapshot_path)
+                lazy.offset = offset
+            
+            for segment in self._list_segments(context.type):
+                if segment < new_segment:
+                    self._get_segment_path(context.type, segment).unlink(missing_ok=True)
+            
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error compacting WAL for {context.type.value}: {e}")
+            return False
+    
+    def _encode_snapshot(
+        self,
+        header: Dict[str, Any],
+        entries: List[Dict[str, Any]]
+    ) -> Tuple[bytes, List[Tuple[LazyValue, int]]]:
+        """Encode a snapshot as a header line followed by put records.
+        
+        Runs in a worker thread. Values that are still LazyValues are copied
+        without decoding.
+        
+        Args:
+            header: Snapshot header (segment number, limits, record count)
+            entries: Serialized entries (from _serialize_entry with raw=True)
+            
+        Returns:
+            The snapshot content and, for every copied LazyValue, the offset
+            of its value in the content
+        """
+        chunks = [json.dumps(header, ensure_ascii=False).encode("utf-8") + b"\n"]
+        position = len(chunks[0])
+        placements = []
+        
+        for data in entries:
+            chunk = self._encode_put(data)
+            if type(data["value"]) is LazyValue:
+                placements.append((data["value"], position + chunk.index(b"\n") + 1))
+            chunks.append(chunk)
+            position += len(chunk)
+        
+        return b"".join(chunks), placements
+    
+    async def _wait_for_compaction(self, context_type: ContextType) -> None:
+        """Wait for a running background compaction of a context."""
+        running = self._compactions.get(context_type)
+        if running and not running.done():
+            await asyncio.gather(running, return_exceptions=True)
+    
+    @timed("save_entry", metric="memory_storage_seconds")
+    async def save_entry(self, context: MemoryContext, entry: MemoryEntry) -> bool:
+        """Append a put record for a created or updated entry.
+        
+        Args:
+            context: The context the entry belongs to
+            entry: The entry that was created or updated
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        return await self._append(context, self._encode_put(self._serialize_entry(entry, raw=True)))
+    
+    @timed("delete_entry", metric="memory_storage_seconds")
+    async def delete_entry(self, context: MemoryContext, key: str) -> bool:
+        """Append a delete record for a removed entry.
+        
+        Args:
+            context: The context the entry was removed from
+            key: Key of the removed entry
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        return await self._append(context, self._encode_delete(key))
+    
+    @timed("apply_mutations", metric="memory_storage_seconds")
+    async def apply_mutations(
+        self,
+        context: MemoryContext,
+        changed: List[MemoryEntry],
+        deleted: List[str]
+    ) -> bool:
+        """Append put/delete records for a batch of changes in one write.
+        
+        Args:
+            context: The context the changes belong to
+            changed: Entries that were created or updated
+            deleted: Keys of entries that were removed
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        records = [self._encode_put(self._serialize_entry(entry, raw=True)) for entry in changed]
+        records.extend(self._encode_delete(key) for key in deleted)
+        return await self._append(context, *records)
+    
+    @timed("save_context", metric="memory_storage_seconds")
+    async def save_context(self, context: MemoryContext) -> bool:
+        """Persist the whole context as a new snapshot.
+        
+        Used for bulk changes (expiry cleanup, shutdown); regular writes go
+        through save_entry/delete_entry.
+        
+        Args:
+            context: The MemoryContext to save
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        await self._wait_for_compaction(context.type)
+        return await self._compact(context)
+    
+    @timed("load_context", metric="memory_storage_seconds")
+    async def load_context(self, context_type: ContextType) -> Optional[MemoryContext]:
+        """Load a context by reading its snapshot and replaying the log.
+        
+        Detached values are not decoded; entries get LazyValue placeholders.
+        
+        Args:
+            context_type: The type of context to load
+            
+        Returns:
+            The loaded MemoryContext or None if not found
+        """
+        try:
+            snapshot_path = self._get_snapshot_path(context_type)
+            segments = self._list_segments(context_type)
+            
+            if not snapshot_path.exists() and not segments:
+                return None
+            
+            context = MemoryContext(type=context_type)
+            first_segment = 0
+            
+            if snapshot_path.exists():
+                header, records = await asyncio.to_thread(
+                    self._scan_records, snapshot_path, True
+                )
+                context.max_entries = header.get("max_entries")
+                context.max_size_bytes = header.get("max_size_bytes")
+                first_segment = header.get("segment", 0)
+                # Snapshots written before records were used hold an entries map
+                for entry_data in header.get("entries", {}).values():
+                    context.restore_entry(self._deserialize_entry(entry_data))
+                self._apply_records(context, records)
+            
+            records = 0
+            for segment in segments:
+                if segment < first_segment:
+                    continue
+                records = await self._replay_segment(context, segment)
+            
+            self._segments[context_type] = max(segments[-1] if segments else 0, first_segment)
+            self._segment_records[context_type] = records
+            
+            return context
+            
+        except Exception as e:
+            logger.error(f"Error loading WAL context {context_type.value}: {e}")
+            return None
+    
+    async def _replay_segment(self, context: MemoryContext, segment: int) -> int:
+        """Apply every record of a segment to a context.
+        
+        A truncated trailing line (crash during append) is ignored.
+        
+        Args:
+            context: The context to apply records to
+            segment: Segment number to replay
+            
+        Returns:
+            Number of records applied
+        """
+        path = self._get_segment_path(context.type, segment)
+        _, records = await asyncio.to_thread(self._scan_records, path)
+        self._apply_records(context, records)
+        return len(records)
+    
+    def _scan_records(
+        self,
+        path: Path,
+        has_header: bool = False
+    ) -> Tuple[Optional[Dict[str, Any]], List[Tuple[Dict[str, Any], Optional[LazyValue]]]]:
+        """Read the records of a segment or snapshot file.
+        
+        Runs in a worker thread. Detached value lines are skipped with a
+        seek and returned as LazyValues pointing into the file.
+        
+        Args:
+            path: The file to read
+            has_header: Whether the first line is a snapshot header
+            
+        Returns:
+            The header (or None) and the (record, lazy value) pairs
+        """
+        size = path.stat().st_size
+        header = None
+        records = []
+        
+        with open(path, "rb") as f:
+            if has_header:
+                header = json.loads(f.readline())
+            for line in iter(f.readline, b""):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping corrupt WAL record in {path.name}")
+                    continue
+                
+                lazy = None
+                length = record.pop("value_bytes", None)
+                if length is not None:
+                    offset = f.tell()
+                    if offset + length >= size:
+                        logger.warning(f"Skipping truncated WAL value in {path.name}")
+                        break
+                    lazy = LazyValue(str(path), offset, length)
+                    f.seek(offset + length + 1)
+                records.append((record, lazy))
+        
+        return header, records
+    
+    def _apply_records(
+        self,
+        context: MemoryContext,
+        records: List[Tuple[Dict[str, Any], Optional[LazyValue]]]
+    ) -> None:
+        """Apply scanned put/delete records to a context.
+        
+        Args:
+            context: The context to apply records to
+            records: (record, lazy value) pairs from _scan_records
+        """
+        for record, lazy in records:
+            if record.get("op") == "put":
+                data = record["entry"]
+                if lazy is not None:
+                    data["value"] = lazy
+                context.restore_entry(self._deserialize_entry(data))
+            elif record.get("op") == "delete":
+                context.remove_entry(record["key"])
+    
+    async def delete_context(self, context_type: ContextType) -> bool:
+        """Delete the snapshot and all log segments of a context.
+        
+        Args:
+            context_type: The type of context to delete
+            
+        Returns:
+            True if deleted, False if not found
+        """
+        await self._wait_for_compaction(context_type)
+        
+        async with self._get_lock(context_type):
+            found = False
+            snapshot_path = self._get_snapshot_path(context_type)
+            if snapshot_path.exists():
+                snapshot_path.unlink()
+                found = True
+            for segment in self._list_segments(context_type):
+                self._get_segment_path(context_type, segment).unlink(missing_ok=True)
+                found = True
+            self._segments[context_type] = 0
+            self._segment_records[context_type] = 0
+        
+        return found
+    
+    async def exists(self, context_type: ContextType) -> bool:
+        """Check if a snapshot or log segment exists for a context.
+        
+        Args:
+            context_type: The type of context to check
+            
+        Returns:
+            True if exists, False otherwise
+        """
+        return (
+            self._get_snapshot_path(context_type).exists()
+            or bool(self._list_segments(context_type))
+        )
+
+
+
+class SQLiteMemoryStorage(MemoryStorage):
+    """SQLite-based memory storage implementation.
+    
+    Keeps one row per MemoryEntry keyed by ``(context_type, key)``, a tag
+    join table and an indexed ``expires_at`` column, so lookups, tag
+    searches and expiry cleanup are indexed queries rather than scans.
+    
+    The database runs in WAL journal mode and every read-modify-write
+    happens inside a ``BEGIN IMMEDIATE`` transaction, which lets several
+    processes (API workers, Streamlit apps) share one file without losing
+    each other's writes. Blocking sqlite calls run in worker threads.
+    
+    Attributes:
+        db_path: Path to the SQLite database file
+        busy_timeout_ms: How long to wait for another process' write lock
+    """
+    
+    queryable = True
+    
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS contexts (
+            context_type TEXT PRIMARY KEY,
+            max_entries INTEGER,
+            max_size_bytes INTEGER
+        );
+        CREATE TABLE IF NOT EXISTS entries (
+            context_type TEXT NOT NULL,
+            key TEXT NOT NULL,
+            id TEXT NOT NULL,
+            value TEXT NOT NULL,
+            metadata TEXT NOT NULL,
+            created_at TEXT NOT NULL,
+            updated_at TEXT NOT NULL,
+            ttl_seconds INTEGER,
+            expires_at REAL,
+            PRIMARY KEY (context_type, key)
+        );
+        CREATE INDEX IF NOT EXISTS idx_entries_expires_at
+            ON entries (context_type, expires_at) WHERE expires_at IS NOT NULL;
+        CREATE TABLE IF NOT EXISTS entry_tags (
+            context_type TEXT NOT NULL,
+            tag TEXT NOT NULL,
+            key TEXT NOT NULL,
+            PRIMARY KEY (context_type, tag, key)
+        );
+        CREATE INDEX IF NOT EXISTS idx_entry_tags_key
+            ON entry_tags (context_type, key);
+    """
+    
+    _ENTRY_COLUMNS = (
+        "e.id, e.key, e.value, e.metadata, e.created_at, e.updated_at, e.ttl_seconds"
+    )
+    
+    def __init__(
+        self,
+        db_path: str = "/tmp/t-developer/memory/memory.db",
+        busy_timeout_ms: int = 5000
+    ) -> None:
+        """Initialize SQLite memory storage.
+        
+        Args:
+            db_path: Path to the SQLite database file
+            busy_timeout_ms: Lock wait timeout for concurrent writers
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.busy_timeout_ms = busy_timeout_ms
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.db_path),
+            timeout=busy_timeout_ms / 1000,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(f"PRAGMA busy_timeout={int(busy_timeout_ms)}")
+        self._conn.executescript(self._SCHEMA)
+    
+    async def _run(self, func: Any, *args: Any) -> Any:
+        """Run a blocking database function in a worker thread."""
+        return await asyncio.to_thread(self._locked, func, *args)
+    
+    def _locked(self, func: Any, *args: Any) -> Any:
+        """Run a database function while holding the connection lock."""
+        with self._lock:
+            return func(*args)
+    
+    def _transaction(self, func: Any, *args: Any) -> Any:
+        """Run a function inside a BEGIN IMMEDIATE transaction."""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            result = func(*args)
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._conn.execute("COMMIT")
+        return result
+    
+    @staticmethod
+    def _epoch(moment: datetime) -> float:
+        """Convert a naive UTC datetime to a unix timestamp."""
+        return (moment - datetime(1970, 1, 1)).total_seconds()
+    
+    def _expires_at(self, entry: MemoryEntry) -> Optional[float]:
+        """Compute the expiry timestamp of an entry (None = permanent)."""
+        if entry.ttl_seconds is None:
+            return None
+        return self._epoch(entry.created_at) + entry.ttl_seconds
+    
+    def _row_to_entry(self, context_type: ContextType, row: Tuple[Any, ...]) -> MemoryEntry:
+        """Build a MemoryEntry from an entries row (without tags)."""
+        entry_id, key, value, metadata, created_at, updated_at, ttl_seconds = row
+        return MemoryEntry(
+            id=entry_id,
+            context_type=context_type,
+            key=key,
+            value=json.loads(value),
+            metadata=json.loads(metadata),
+            created_at=datetime.fromisoformat(created_at),
+            updated_at=datetime.fromisoformat(updated_at),
+            ttl_seconds=ttl_seconds,
+        )
+    
+    def _attach_tags(self, context_type: ContextType, entries: List[MemoryEntry]) -> None:
+        """Load tags for a batch of entries with one query."""
+        if not entries:
+            return
+        
+        by_key = {entry.key: entry for entry in entries}
+        keys = list(by_key)
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                f"SELECT key, tag FROM entry_tags "
+                f"WHERE context_type = ? AND key IN ({placeholders})",
+                [context_type.value, *chunk],
+            )
+            for key, tag in rows:
+                by_key[key].tags.append(tag)
+    
+    def _write_entry(self, entry: MemoryEntry) -> int:
+        """Insert or update an entry row and its tags.
+        
+        Updates keep the row's rowid, which query cursors page over, so
+        rewriting an entry does not move it behind later entries.
+        
+        Returns:
+            Approximate bytes written (encoded value and metadata)
+        """
+        ctx = entry.context_type.value
+        value = json.dumps(entry.value, ensure_ascii=False)
+        metadata = json.dumps(entry.metadata, ensure_ascii=False)
+        self._conn.execute(
+            "INSERT INTO entries "
+            "(context_type, key, id, value, metadata, created_at, updated_at, ttl_seconds, expires_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (context_type, key) DO UPDATE SET "
+            "id = excluded.id, value = excluded.value, metadata = excluded.metadata, "
+            "created_at = excluded.created_at, updated_at = excluded.updated_at, "
+            "ttl_seconds = excluded.ttl_seconds, expires_at = excluded.expires_at",
+            (
+                ctx,
+                entry.key,
+                entry.id,
+                value,
+                metadata,
+                entry.created_at.isoformat(),
+                entry.updated_at.isoformat(),
+                entry.ttl_seconds,
+                self._expires_at(entry),
+            ),
+        )
+        self._conn.execute(
+            "DELETE FROM entry_tags WHERE context_type = ? AND key = ?", (ctx, entry.key)
+        )
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO entry_tags (context_type, tag, key) VALUES (?, ?, ?)",
+            [(ctx, tag, entry.key) for tag in entry.tags],
+        )
+        return len(value) + len(metadata)
+    
+    def _delete_keys(self, context_type: ContextType, keys: Iterable[str]) -> int:
+        """Delete entry rows and their tags."""
+        params = [(context_type.value, key) for key in keys]
+        if not params:
+            return 0
+        self._conn.executemany(
+            "DELETE FROM entry_tags WHERE context_type = ? AND key = ?", params
+        )
+        before = self._conn.total_changes
+        self._conn.executemany(
+            "DELETE FROM entries WHERE context_type = ? AND key = ?", params
+        )
+        return self._conn.total_changes - before
+    
+    def _select_entry(self, context_type: ContextType, key: str, now: float) -> Optional[MemoryEntry]:
+        """Select one non-expired entry with its tags."""
+        row = self._conn.execute(
+            f"SELECT {self._ENTRY_COLUMNS} FROM entries e "
+            f"WHERE e.context_type = ? AND e.key = ? "
+            f"AND (e.expires_at IS NULL OR e.expires_at > ?)",
+            (context_type.value, key, now),
+        ).fetchone()
+        
+        if row is None:
+            return None
+        
+        entry = self._row_to_entry(context_type, row)
+        self._attach_tags(context_type, [entry])
+        return entry
+    
+    def _upsert(
+        self,
+        context_type: ContextType,
+        key: str,
+        value: Any,
+        ttl_seconds: Optional[int],
+        tags: Optional[List[str]],
+        metadata: Optional[Dict[str, Any]]
+    ) -> MemoryEntry:
+        """Read-modify-write one entry; must run inside a transaction."""
+        now = time.time()
+        entry = self._select_entry(context_type, key, now)
+        
+        if entry:
+            entry.update(value, metadata)
+        else:
+            self._delete_keys(context_type, [key])
+            entry = MemoryEntry(
+                context_type=context_type,
+                key=key,
+                value=value,
+                ttl_seconds=ttl_seconds,
+                tags=tags or [],
+                metadata=metadata or {},
+            )
+        
+        self._write_entry(entry)
+        return entry
+    
+    def _upsert_many(
+        self,
+        context_type: ContextType,
+        items: List[Dict[str, Any]]
+    ) -> List[MemoryEntry]:
+        """Upsert a batch of entries; must run inside a transaction."""
+        return [
+            self._upsert(
+                context_type,
+                item["key"],
+                item.get("value"),
+                item.get("ttl_seconds"),
+                item.get("tags"),
+                item.get("metadata"),
+            )
+            for item in items
+        ]
+    
+    def _select_entries(
+        self,
+        context_type: ContextType,
+        keys: List[str],
+        now: float
+    ) -> Dict[str, MemoryEntry]:
+        """Select non-expired entries by key, 500 keys per query."""
+        entries = {}
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                f"SELECT {self._ENTRY_COLUMNS} FROM entries e "
+                f"WHERE e.context_type = ? AND e.key IN ({placeholders}) "
+                f"AND (e.expires_at IS NULL OR e.expires_at > ?)",
+                [context_type.value, *chunk, now],
+            )
+            for row in rows:
+                entry = self._row_to_entry(context_type, row)
+                entries[entry.key] = entry
+        
+        self._attach_tags(context_type, list(entries.values()))
+        return entries
+    
+    def _replace_context(self, context: MemoryContext) -> int:
+        """Replace every row of a context; must run inside a transaction."""
+        ctx = context.type.value
+        self._conn.execute("DELETE FROM entry_tags WHERE context_type = ?", (ctx,))
+        self._conn.execute("DELETE FROM entries WHERE context_type = ?", (ctx,))
+        self._conn.execute(
+            "INSERT OR REPLACE INTO contexts (context_type, max_entries, max_size_bytes) "
+            "VALUES (?, ?, ?)",
+            (ctx, context.max_entries, context.max_size_bytes),
+        )
+        return sum(self._write_entry(entry) for entry in context.entries.values())
+    
+    def _cleanup(self, context_type: ContextType) -> int:
+        """Delete expired rows using the expires_at index."""
+        rows = self._conn.execute(
+            "SELECT key FROM entries WHERE context_type = ? "
+            "AND expires_at IS NOT NULL AND expires_at <= ?",
+            (context_type.value, time.time()),
+        ).fetchall()
+        return self._delete_keys(context_type, [row[0] for row in rows])
+    
+    def _search(
+        self,
+        context_type: ContextType,
+        tags: Optional[List[str]],
+        limit: int
+    ) -> List[MemoryEntry]:
+        """Select non-expired entries, using the tag table when filtering."""
+        ctx = context_type.value
+        now = time.time()
+        
+        if tags:
+            placeholders = ",".join("?" * len(tags))
+            rows = self._conn.execute(
+                f"SELECT {self._ENTRY_COLUMNS} FROM entries e "
+                f"WHERE e.context_type = ? "
+                f"AND (e.expires_at IS NULL OR e.expires_at > ?) "
+                f"AND e.key IN (SELECT key FROM entry_tags "
+                f"WHERE context_type = ? AND tag IN ({placeholders})) "
+                f"ORDER BY e.rowid LIMIT ?",
+                [ctx, now, ctx, *tags, limit],
+            ).fetchall()
+        else:
+            rows = self._conn.execute(
+                f"SELECT {self._ENTRY_COLUMNS} FROM entries e "
+                f"WHERE e.context_type = ? "
+                f"AND (e.expires_at IS NULL OR e.expires_at > ?) "
+                f"ORDER BY e.rowid LIMIT ?",
+                (ctx, now, limit),
+            ).fetchall()
+        
+        entries = [self._row_to_entry(context_type, row) for row in rows]
+        self._attach_tags(context_type, entries)
+        return entries
+    
+    def _query(
+        self,
+        context_type: ContextType,
+        query: MemoryQuery,
+        now: float
+    ) -> Dict[str, Any]:
+        """Scan matching rows in rowid order and take one page.
+        
+        Tag, key and time predicates are evaluated in SQL; rows are then
+        fetched lazily and checked against the metadata predicates, so only
+        about one page of rows is decoded.
+        """
+        ctx = context_type.value
+        clauses = [
+            "e.context_type = ?",
+            "(e.expires_at IS NULL OR e.expires_at > ?)",
+            "e.rowid > ?",
+        ]
+        params: List[Any] = [ctx, now, decode_cursor(query.cursor)]
+        tagged = "SELECT key FROM entry_tags WHERE context_type = ? AND tag IN ({})"
+        
+        for tag in query.all_tags:
+            clauses.append(f"e.key IN ({tagged.format('?')})")
+            params += [ctx, tag]
+        if query.any_tags:
+            clauses.append(f"e.key IN ({tagged.format(','.join('?' * len(query.any_tags)))})")
+            params += [ctx, *query.any_tags]
+        if query.none_tags:
+            clauses.append(f"e.key NOT IN ({tagged.format(','.join('?' * len(query.none_tags)))})")
+            params += [ctx, *query.none_tags]
+        if query.key_prefix:
+            clauses.append("substr(e.key, 1, ?) = ?")
+            params += [len(query.key_prefix), query.key_prefix]
+        if query.updated_after is not None:
+            clauses.append("e.updated_at >= ?")
+            params.append(query.updated_after.isoformat())
+        if query.updated_before is not None:
+            clauses.append("e.updated_at < ?")
+            params.append(query.updated_before.isoformat())
+        
+        rows = self._conn.execute(
+            f"SELECT e.rowid, {self._ENTRY_COLUMNS} FROM entries e "
+            f"WHERE {' AND '.join(clauses)} ORDER BY e.rowid",
+            params,
+        )
+        
+        def matches() -> Iterable[Tuple[int, MemoryEntry]]:
+            for row in rows:
+                entry = self._row_to_entry(context_type, row[1:])
+                self._attach_tags(context_type, [entry])
+                if query.matches(entry):
+                    yield row[0], entry
+        
+        try:
+            return collect_page(matches(), query)
+        finally:
+            rows.close()
+    
+    def _load(self, context_type: ContextType) -> Optional[MemoryContext]:
+        """Load every non-expired entry of a context."""
+        limits = self._conn.execute(
+            "SELECT max_entries, max_size_bytes FROM contexts WHERE context_type = ?",
+            (context_type.value,),
+        ).fetchone()
+        entries = self._search(context_type, None, -1)
+        
+        if limits is None and not entries:
+            return None
+        
+        context = MemoryContext(
+            type=context_type,
+            max_entries=limits[0] if limits else None,
+            max_size_bytes=limits[1] if limits else None,
+        )
+        for entry in entries:
+            context.restore_entry(entry)
+        return context
+    
+    def _delete_context(self, context_type: ContextType) -> bool:
+        """Delete every row of a context; must run inside a transaction."""
+        ctx = context_type.value
+        before = self._conn.total_changes
+        self._conn.execute("DELETE FROM entry_tags WHERE context_type = ?", (ctx,))
+        self._conn.execute("DELETE FROM entries WHERE context_type = ?", (ctx,))
+        self._conn.execute("DELETE FROM contexts WHERE context_type = ?", (ctx,))
+        return self._conn.total_changes > before
+    
+    @timed("save_context", metric="memory_storage_seconds")
+    async def save_context(self, context: MemoryContext) -> bool:
+        """Replace all rows of a context with the given in-memory context.
+        
+        Args:
+            context: The MemoryContext to save
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            written = await self._run(self._transaction, self._replace_context, context)
+            self._record_write(context.type, written)
+            return True
+        except Exception as e:
+            logger.error(f"Error saving context {context.type.value} to SQLite: {e}")
+            return False
+    
+    @timed("save_entry", metric="memory_storage_seconds")
+    async def save_entry(self, context: MemoryContext, entry: MemoryEntry) -> bool:
+        """Write a single entry row.
+        
+        Args:
+            context: The context the entry belongs to
+            entry: The entry that was created or updated
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            written = await self._run(self._transaction, self._write_entry, entry)
+            self._record_write(context.type, written)
+            return True
+        except Exception as e:
+            logger.error(f"Error saving entry {entry.key} to SQLite: {e}")
+            return False
+    
+    def _apply(
+        self,
+        context_type: ContextType,
+        changed: List[MemoryEntry],
+        deleted: List[str]
+    ) -> int:
+        """Write and delete a batch of rows; must run inside a transaction."""
+        written = sum(self._write_entry(entry) for entry in changed)
+        self._delete_keys(context_type, deleted)
+        return written
+    
+    @timed("apply_mutations", metric="memory_storage_seconds")
+    async def apply_mutations(
+        self,
+        context: MemoryContext,
+        changed: List[MemoryEntry],
+        deleted: List[str]
+    ) -> bool:
+        """Write a batch of changes in one transaction.
+        
+        Args:
+            context: The context the changes belong to
+            changed: Entries that were created or updated
+            deleted: Keys of entries that were removed
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            written = await self._run(self._transaction, self._apply, context.type, changed, deleted)
+            self._record_write(context.type, written)
+            return True
+        except Exception as e:
+            logger.error(f"Error applying batch to {context.type.value} in SQLite: {e}")
+            return False
+    
+    @timed("delete_entry", metric="memory_storage_seconds")
+    async def delete_entry(self, context: MemoryContext, key: str) -> bool:
+        """Delete a single entry row.
+        
+        Args:
+            context: The context the entry was removed from
+            key: Key of the removed entry
+            
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            await self.remove_entry(context.type, key)
+            return True
+        except Exception as e:
+            logger.error(f"Error deleting entry {key} from SQLite: {e}")
+            return False
+    
+    @timed("load_context", metric="memory_storage_seconds")
+    async def load_context(self, context_type: ContextType) -> Optional[MemoryContext]:
+        """Load a memory context from the database.
+        
+        Args:
+            context_type: The type of context to load
+            
+        Returns:
+            The loaded MemoryContext or None if not found
+        """
+        try:
+            return await self._run(self._load, context_type)
+        except Exception as e:
+            logger.error(f"Error loading context {context_type.value} from SQLite: {e}")
+            return None
+    
+    async def delete_context(self, context_type: ContextType) -> bool:
+        """Delete all rows of a context.
+        
+        Args:
+            context_type: The type of context to delete
+            
+        Returns:
+            True if deleted, False if not found
+        """
+        try:
+            return await self._run(self._transaction, self._delete_context, context_type)
+        except Exception as e:
+            logger.error(f"Error deleting context {context_type.value} from SQLite: {e}")
+            return False
+    
+    async def exists(self, context_type: ContextType) -> bool:
+        """Check if a context has any rows.
+        
+        Args:
+            context_type: The type of context to check
+            
+        Returns:
+            True if exists, False otherwise
+        """
+        def _exists() -> bool:
+            ctx = context_type.value
+            return bool(
+                self._conn.execute(
+                    "SELECT 1 FROM contexts WHERE context_type = ? "
+                    "UNION ALL SELECT 1 FROM entries WHERE context_type = ? LIMIT 1",
+                    (ctx, ctx),
+                ).fetchone()
+            )
+        
+        return await self._run(_exists)
+    
+    async def get_entry(self, context_type: ContextType, key: str) -> Optional[MemoryEntry]:
+        """Get a single non-expired entry by primary key."""
+        return await self._run(self._select_entry, context_type, key, time.time())
+    
+    async def put_entry(
+        self,
+        context_type: ContextType,
+        key: str,
+        value: Any,
+        ttl_seconds: Optional[int] = None,
+        tags: Optional[List[str]] = None,
+        metadata: Optional[Dict[str, Any]] = None
+    ) -> MemoryEntry:
+        """Create or update an entry in one IMMEDIATE transaction."""
+        return await self._run(
+            self._transaction, self._upsert, context_type, key, value, ttl_seconds, tags, metadata
+        )
+    
+    async def remove_entry(self, context_type: ContextType, key: str) -> bool:
+        """Remove a single entry and its tags."""
+        removed = await self._run(self._transaction, self._delete_keys, context_type, [key])
+        return removed > 0
+    
+    async def get_entries(
+        self,
+        context_type: ContextType,
+        keys: List[str]
+    ) -> Dict[str, MemoryEntry]:
+        """Get several non-expired entries with one query per 500 keys."""
+        return await self._run(self._select_entries, context_type, keys, time.time())
+    
+    async def put_entries(
+        self,
+        context_type: ContextType,
+        items: List[Dict[str, Any]]
+    ) -> List[MemoryEntry]:
+        """Create or update several entries in one IMMEDIATE transaction."""
+        return await self._run(self._transaction, self._upsert_many, context_type, items)
+    
+    async def remove_entries(self, context_type: ContextType, keys: List[str]) -> int:
+        """Remove several entries and their tags in one transaction."""
+        return await self._run(self._transaction, self._delete_keys, context_type, keys)
+    
+    async def search_entries(
+        self,
+        context_type: ContextType,
+        tags: Optional[List[str]] = None,
+        limit: int = 100
+    ) -> List[MemoryEntry]:
+        """Search non-expired entries through the tag index."""
+        return await self._run(self._search, context_type, tags, limit)
+    
+    async def query_entries(
+        self,
+        context_type: ContextType,
+        query: MemoryQuery
+    ) -> Dict[str, Any]:
+        """Evaluate a query with SQL tag/time filters and lazy row fetching."""
+        return await self._run(self._query, context_type, query, time.time())
+    
+    async def cleanup_expired(self, context_type: ContextType) -> int:
+        """Remove expired entries through the expires_at index."""
+        return await self._run(self._transaction, self._cleanup, context_type)
+    
+    async def count_entries(self, context_type: ContextType) -> int:
+        """Count non-expired entries of a context."""
+        def _count() -> int:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM entries WHERE context_type = ? "
+                "AND (expires_at IS NULL OR expires_at > ?)",
+                (context_type.value, time.time()),
+            ).fetchone()[0]
+        
+        return await self._run(_count)
+    
+    async def count_tags(self, context_type: ContextType) -> int:
+        """Count distinct tags of non-expired entries."""
+        def _count() -> int:
+            return self._conn.execute(
+                "SELECT COUNT(DISTINCT t.tag) FROM entry_tags t "
+                "JOIN entries e ON e.context_type = t.context_type AND e.key = t.key "
+                "WHERE t.context_type = ? AND (e.expires_at IS NULL OR e.expires_at > ?)",
+                (context_type.value, time.time()),
+            ).fetchone()[0]
+        
+        return await self._run(_count)
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def get_memory_storage(
+    storage_type: Optional[str] = None,
+    config: Optional[Dict[str, Any]] = None
+) -> MemoryStorage:
+    """Memory storage 인스턴스를 가져옵니다.
+    
+    Args:
+        storage_type: Storage 타입 ("json", "wal", "sqlite").
+            None이면 MEMORY_STORAGE 환경변수를 사용 (기본 "json")
+        config: Storage 설정 (base_path, codec 등).
+            json storage의 codec은 MEMORY_CODEC 환경변수로도 지정 가능
+        
+    Returns:
+        MemoryStorage 인스턴스
+    """
+    storage_type = (storage_type or os.getenv("MEMORY_STORAGE", "json")).lower()
+    config = dict(config or {})
+    base_path = config.pop("base_path", os.getenv("MEMORY_PATH", "/tmp/t-developer/memory"))
+    
+    if storage_type == "json":
+        codec = config.pop("codec", os.getenv("MEMORY_CODEC"))
+        return JSONMemoryStorage(base_path=base_path, codec=codec, **config)
+    if storage_type == "wal":
+        return WALMemoryStorage(base_path=base_path, **config)
+    if storage_type == "sqlite":
+        db_path = config.pop("db_path", str(Path(base_path) / "memory.db"))
+        return SQLiteMemoryStorage(db_path=db_path, **config)
+    
+    raise ValueError(f"Unknown memory storage type: {storage_type}")
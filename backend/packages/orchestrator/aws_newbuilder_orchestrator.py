@@ -223,6 +223,8 @@ class AWSNewBuilderOrchestrator:
                     memory_hub=None,  # AWS Runtime이 메모리 관리
                     document_context=self.document_context
                 )
+                # 에이전트 내부의 스트리밍 AI 출력도 런타임 콜백으로 전달
+                agent_instance.stream_callback = self.runtime.publish_stream
                 
                 # 에이전트 실행 함수 생성
                 async def agent_execute(task, context, agent=agent_instance):
@@ -144,6 +144,10 @@ class AWSUpgradeOrchestrator:
         
         # 문서 컨텍스트
         self.document_context = SharedDocumentContext()
+        # 에이전트별 마지막으로 저장한 문서 fingerprint
+        self._saved_fingerprints: Dict[str, str] = {}
+        if config.save_documents:
+            self.squad.add_iteration_callback(self._on_iteration_complete)
         
         # 에이전트 초기화는 나중에
         self.agents_initialized = False
@@ -186,6 +190,8 @@ class AWSUpgradeOrchestrator:
                     memory_hub=None,  # AWS Runtime이 메모리 관리
                     document_context=self.document_context
                 )
+                # 에이전트 내부의 스트리밍 AI 출력도 런타임 콜백으로 전달
+                agent_instance.stream_callback = self.runtime.publish_stream
                 
                 # 에이전트 실행 함수 생성
                 async def agent_execute(task, context, agent=agent_instance):
@@ -394,16 +400,50 @@ class AWSUpgradeOrchestrator:
         
         logger.info(f"📄 보고서 저장: {report_path}")
         
-        # 개별 문서 저장
-        docs_path = output_path / "documents"
-        docs_path.mkdir(exist_ok=True)
+        # 개별 문서 저장 (변경된 문서만)
+        docs_path = self._persist_document_changes(result.get('final_documents', {}))
         
-        for agent_name, doc in result.get('final_documents', {}).items():
+        logger.info(f"📂 문서 저장: {docs_path}")
+    
+    def _persist_document_changes(self, documents: Dict[str, Any]) -> Path:
+        """마지막 저장 이후 변경된 문서만 저장.
+        
+        내용이 바뀐 에이전트 문서 파일만 다시 쓰고, 문서 컨텍스트의
+        델타 스냅샷을 추가합니다. 저장량은 반복 횟수가 아니라 변경량에 비례합니다.
+        
+        Args:
+            documents: 에이전트 이름별 현재 문서
+            
+        Returns:
+            문서 디렉터리 경로
+        """
+        import json
+        
+        docs_path = Path(self.config.output_dir) / "documents"
+        docs_path.mkdir(parents=True, exist_ok=True)
+        
+        for agent_name, doc in documents.items():
+            fingerprint = self.document_context.get_fingerprint(agent_name)
+            if fingerprint is not None and self._saved_fingerprints.get(agent_name) == fingerprint:
+                continue
             doc_path = docs_path / f"{agent_name}.json"
             with open(doc_path, 'w', encoding='utf-8') as f:
                 json.dump(doc, f, indent=2, ensure_ascii=False, default=str)
+            if fingerprint is not None:
+                self._saved_fingerprints[agent_name] = fingerprint
         
-        logger.info(f"📂 문서 저장: {docs_path}")
+        self.document_context.save_incremental(docs_path / "history")
+        return docs_path
+    
+    async def _on_iteration_complete(self, iteration: int, iteration_result: Dict[str, Any]):
+        """반복이 끝날 때마다 변경된 문서를 증분 저장.
+        
+        Args:
+            iteration: 완료된 반복 번호
+            iteration_result: 반복 결과
+        """
+        self._persist_document_changes(self.document_context.get_all_documents())
+        logger.debug(f"📂 반복 {iteration} 문서 변경분 저장")
     
     def get_gap_score(self) -> float:
         """현재 갭 스코어 반환.
@@ -125,4 +125,8 @@ class NewBuildOrchestrator:
     
     def get_shared_documents(self) -> Dict[str, Any]:
         """공유 문서 반환."""
-        return self.aws_orchestrator.get_shared_documents()
\ No newline at end of file
+        return self.aws_orchestrator.get_shared_documents()
+    
+    def add_stream_callback(self, callback) -> None:
+        """스트리밍 AI 출력 콜백 등록 (agent_name, chunk)."""
+        self.aws_orchestrator.runtime.add_stream_callback(callback)
\ No newline at end of file
@@ -0,0 +1,185 @@
+"""에이전트 의존성 DAG 스케줄링 테스트.
+
+문서 참조 원칙 기반 의존성, 빠진 에이전트를 건너뛰는 부분 그래프, 순환 검출,
+최대 동시 실행 수를 지키는 ready-queue 실행, 임계 경로 계산과
+SquadOrchestrator Evolution Loop 연동을 검증합니다.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from backend.packages.aws_agent_squad.core.agent_dag import AgentDAG
+from backend.packages.aws_agent_squad.core.agent_runtime import AgentRuntime, RuntimeConfig
+from backend.packages.aws_agent_squad.core.squad_orchestrator import (
+    ExecutionStrategy,
+    SquadConfig,
+    SquadOrchestrator,
+)
+
+
+class Timeline:
+    """에이전트 시작/종료 시각을 기록하는 테스트용 실행기."""
+
+    def __init__(self, delays=None, default_delay=0.02):
+        self.delays = delays or {}
+        self.default_delay = default_delay
+        self.spans = {}
+
+    async def execute(self, name):
+        started = time.perf_counter()
+        await asyncio.sleep(self.delays.get(name, self.default_delay))
+        self.spans[name] = (started, time.perf_counter())
+        return {'agent': name}
+
+    def overlaps(self, a, b):
+        return self.spans[a][0] < self.spans[b][1] and self.spans[b][0] < self.spans[a][1]
+
+    def before(self, a, b):
+        return self.spans[a][1] <= self.spans[b][0]
+
+
+class TestAgentDAG:
+    """그래프 구성 테스트."""
+
+    def test_default_graph_follows_document_rules(self):
+        """기본 그래프는 보고서를 읽는 순서를 지키고 독립 에이전트는 선행 관계가 없어야 함."""
+        dag = AgentDAG.default()
+        order = dag.topological_order()
+
+        assert order.index('GapAnalyzer') > order.index('ExternalResearcher') > order.index('QualityGate')
+        assert order.index('CodeGenerator') > max(order.index('PlannerAgent'), order.index('TaskCreatorAgent'))
+        assert dag.inputs['StaticAnalyzer'] == ()
+        assert 'PlannerAgent' not in dag.ancestors('TaskCreatorAgent')
+        assert set(dag.descendants('GapAnalyzer')) == {
+            'SystemArchitect', 'OrchestratorDesigner', 'PlannerAgent', 'TaskCreatorAgent', 'CodeGenerator', 'TestAgent'
+        }
+
+    def test_subgraph_bridges_missing_agents(self):
+        """빠진 에이전트를 거치는 의존성은 그 선행 에이전트로 이어져야 함."""
+        dag = AgentDAG.default().subgraph(['RequirementAnalyzer', 'StaticAnalyzer', 'PlannerAgent', 'CodeGenerator'])
+
+        assert set(dag.inputs['PlannerAgent']) == {'RequirementAnalyzer', 'StaticAnalyzer'}
+        assert set(dag.inputs['CodeGenerator']) == {'PlannerAgent', 'RequirementAnalyzer', 'StaticAnalyzer'}
+
+    def test_cycles_are_rejected(self):
+        """순환 의존성은 생성 시점에 거부되어야 함."""
+        with pytest.raises(ValueError, match='cycle'):
+            AgentDAG({'A': ['B'], 'B': ['C'], 'C': ['A']})
+
+    def test_critical_path_uses_durations(self):
+        """임계 경로는 실행 시간 합이 가장 긴 의존성 경로여야 함."""
+        dag = AgentDAG({'A': [], 'B': ['A'], 'C': ['A'], 'D': ['B', 'C']})
+
+        path, length = dag.critical_path({'A': 1.0, 'B': 5.0, 'C': 2.0, 'D': 1.0})
+
+        assert path == ['A', 'B', 'D']
+        assert length == pytest.approx(7.0)
+
+
+class TestScheduler:
+    """ready-queue 실행 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_ready_agents_run_concurrently_within_the_limit(self):
+        """입력이 준비된 에이전트는 바로 시작하되 동시 실행 수를 넘지 않아야 함."""
+        dag = AgentDAG({'A': [], 'B': [], 'C': [], 'D': ['A']})
+        timeline = Timeline()
+
+        run = await dag.run(timeline.execute, max_parallel=2)
+
+        assert run.max_concurrency == 2
+        assert timeline.overlaps('A', 'B')
+        assert timeline.before('A', 'D')
+        assert set(run.results) == {'A', 'B', 'C', 'D'}
+        assert run.critical_path == ['A', 'D']
+
+    @pytest.mark.asyncio
+    async def test_failures_are_recorded_without_stopping_dependents(self):
+        """실패한 에이전트는 에러로 기록되고 후속 에이전트는 계속 실행되어야 함."""
+        dag = AgentDAG({'A': [], 'B': ['A']})
+
+        async def execute(name):
+            if name == 'A':
+                raise RuntimeError('boom')
+            return {'agent': name}
+
+        run = await dag.run(execute, max_parallel=4)
+
+        assert run.results == {'A': {'error': 'boom'}, 'B': {'agent': 'B'}}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_agent_is_recorded_as_error(self):
+        """취소된 에이전트도 에러로 기록되고 나머지 실행은 계속되어야 함."""
+        dag = AgentDAG({'A': [], 'B': ['A'], 'C': []})
+
+        async def execute(name):
+            if name == 'A':
+                raise asyncio.CancelledError()
+            return {'agent': name}
+
+        run = await dag.run(execute, max_parallel=4)
+
+        assert run.results == {'A': {'error': 'cancelled'}, 'B': {'agent': 'B'}, 'C': {'agent': 'C'}}
+
+    @pytest.mark.asyncio
+    async def test_cancelling_run_cancels_running_agents(self):
+        """run()이 취소되면 실행 중인 에이전트도 취소되어야 함."""
+        dag = AgentDAG({'A': [], 'B': []})
+        started, finished = [], []
+
+        async def execute(name):
+            started.append(name)
+            await asyncio.sleep(0.2)
+            finished.append(name)
+
+        outer = asyncio.ensure_future(dag.run(execute, max_parallel=2))
+        while len(started) < 2:
+            await asyncio.sleep(0)
+        outer.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await outer
+        await asyncio.sleep(0.3)
+
+        assert finished == []
+
+
+class TestOrchestratorIntegration:
+    """SquadOrchestrator 연동 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_evolution_iteration_is_scheduled_from_the_dag(self):
+        """상태 분석은 요구사항 분석과, 계획/작업 생성은 서로 병렬로 실행되어야 함."""
+        runtime = AgentRuntime(RuntimeConfig(max_parallel_agents=8))
+        orchestrator = SquadOrchestrator(
+            runtime, SquadConfig(name='test', strategy=ExecutionStrategy.EVOLUTION_LOOP, max_iterations=1)
+        )
+        timeline = Timeline(delays={'RequirementAnalyzer': 0.05})
+
+        def make_agent(name):
+            async def agent(task):
+                result = await timeline.execute(name)
+                return {**result, 'gap_score': 0.5} if name == 'GapAnalyzer' else result
+            return agent
+
+        names = [
+            'RequirementAnalyzer', 'StaticAnalyzer', 'QualityGate', 'ExternalResearcher', 'GapAnalyzer',
+            'PlannerAgent', 'TaskCreatorAgent', 'CodeGenerator'
+        ]
+        for name in names:
+            orchestrator.register_agent(name, make_agent(name))
+
+        results = await orchestrator.execute_squad({'type': 'evolve'})
+
+        iteration = results['iterations'][0]
+        assert timeline.overlaps('RequirementAnalyzer', 'StaticAnalyzer')
+        assert timeline.overlaps('PlannerAgent', 'TaskCreatorAgent')
+        assert timeline.before('GapAnalyzer', 'PlannerAgent')
+        assert timeline.before('TaskCreatorAgent', 'CodeGenerator')
+        assert len(iteration['current_state']) == 2
+        assert iteration['gap_analysis']['gap_score'] == 0.5
+        assert iteration['codegenerator'] == {'agent': 'CodeGenerator'}
+        assert iteration['schedule']['critical_path'][:3] == ['RequirementAnalyzer', 'ExternalResearcher', 'GapAnalyzer']
+        assert iteration['schedule']['critical_path'][-1] == 'CodeGenerator'
+        assert iteration['schedule']['critical_path_seconds'] <= iteration['schedule']['wall_seconds'] + 0.01
@@ -0,0 +1,241 @@
+"""AgentRuntime 프롬프트 구성 테스트.
+
+안정적인 prefix(공유 문서 요약, 페르소나)와 suffix 분리, prefix 재사용,
+Bedrock 프롬프트 캐싱 마커와 미지원 모델 폴백을 검증합니다.
+"""
+
+import asyncio
+import json
+
+import pytest
+from botocore.exceptions import ClientError
+
+from backend.packages.agents.ai_cache import AIResponseCache
+from backend.packages.agents.single_flight import SingleFlight
+from backend.packages.aws_agent_squad.core.agent_runtime import AgentRuntime, RuntimeConfig
+
+PERSONA = {"name": "분석가", "role": "갭 분석", "expertise": ["아키텍처"]}
+
+
+class RecordingTransport:
+    """요청 본문을 기록하는 전송 계층."""
+
+    def __init__(self, reject_cache_markers=False, reject_message=None):
+        self.bodies = []
+        self.reject_cache_markers = reject_cache_markers
+        self.reject_message = reject_message
+
+    async def invoke_model(self, model_id, body):
+        body = json.loads(body)
+        self.bodies.append(body)
+        if self.reject_cache_markers and "cache_control" in json.dumps(body):
+            raise ClientError(
+                {"Error": {"Code": "ValidationException", "Message": "cache_control not supported"}},
+                "InvokeModel",
+            )
+        if self.reject_message:
+            raise ClientError(
+                {"Error": {"Code": "ValidationException", "Message": self.reject_message}},
+                "InvokeModel",
+            )
+        return {
+            "content": [{"type": "text", "text": "ok"}],
+            "usage": {"input_tokens": 20, "cache_read_input_tokens": 1500, "cache_creation_input_tokens": 0},
+        }
+
+
+class SlowStreamingTransport(RecordingTransport):
+    """응답을 늦게 한 조각으로 스트리밍하는 기록용 전송 계층."""
+
+    async def invoke_model_stream(self, model_id, body):
+        self.bodies.append(json.loads(body))
+        await asyncio.sleep(0.05)
+        yield {"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": "ok"}}
+
+
+@pytest.fixture
+def runtime():
+    """작은 캐싱 임계값과 기록용 전송 계층을 쓰는 런타임."""
+    runtime = AgentRuntime(RuntimeConfig(prompt_cache_min_tokens=10))
+    runtime.response_cache = None
+    runtime.bedrock_transport = RecordingTransport()
+    runtime.register_persona("GapAnalyzer", PERSONA)
+    runtime.shared_document_context["StaticAnalyzer"] = {"result": {"files": 3, "issues": ["a", "b"]}}
+    runtime.shared_document_context["BehaviorAnalyzer"] = {"result": {"patterns": []}}
+    return runtime
+
+
+def shared_context(runtime, **extra):
+    """execute_agent와 같은 방식의 컨텍스트."""
+    return {"shared_documents": runtime.shared_document_context, **extra}
+
+
+class TestPromptSegments:
+    """prefix/suffix 구성 테스트."""
+
+    def test_stable_parts_go_to_the_prefix(self, runtime):
+        """공유 문서 요약과 페르소나는 prefix, 기타 컨텍스트와 작업은 suffix여야 함."""
+        segments = runtime._build_prompt_segments(
+            "갭을 분석하세요", shared_context(runtime, iteration=2), "GapAnalyzer"
+        )
+
+        digest, persona = segments.prefix_blocks
+        assert digest.index("BehaviorAnalyzer") < digest.index("StaticAnalyzer")
+        assert '{"files":3,"issues":["a","b"]}' in digest
+        assert persona.startswith("당신은 분석가입니다.")
+        assert "### iteration:\n2" in segments.suffix
+        assert segments.suffix.endswith("### 작업:\n갭을 분석하세요")
+        assert "분석가" not in segments.suffix
+
+    def test_prefix_is_memoized_per_agent_and_context_version(self, runtime, monkeypatch):
+        """같은 (에이전트, 컨텍스트 버전)은 prefix를 재사용하고 문서 요약은 에이전트 간 공유해야 함."""
+        digests = []
+        render = runtime._render_document_digest
+        monkeypatch.setattr(runtime, "_render_document_digest", lambda docs: digests.append(1) or render(docs))
+
+        for agent in ("GapAnalyzer", "GapAnalyzer", "PlannerAgent"):
+            runtime._build_prompt_segments("작업", shared_context(runtime), agent)
+        assert runtime.prompt_cache_stats["prefix_renders"] == 2
+        assert runtime.prompt_cache_stats["prefix_reuses"] == 1
+        assert len(digests) == 1
+
+        runtime.update_shared_context("PlannerAgent", {"plan": []})
+        runtime._build_prompt_segments("작업", shared_context(runtime), "GapAnalyzer")
+        assert runtime.prompt_cache_stats["prefix_renders"] == 3
+        assert len(digests) == 2
+
+
+class TestPromptCaching:
+    """Bedrock 프롬프트 캐싱 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_prefix_is_sent_as_cached_system_blocks(self, runtime):
+        """prefix는 cache_control 마커가 붙은 system 블록으로 보내야 함."""
+        await runtime._invoke_bedrock("작업", shared_context(runtime), agent_name="GapAnalyzer")
+
+        body = runtime.bedrock_transport.bodies[0]
+        assert [block["cache_control"] for block in body["system"]] == [{"type": "ephemeral"}] * 2
+        assert body["messages"][0]["content"].endswith("### 작업:\n작업")
+        stats = runtime.get_execution_metrics()["prompt_cache"]
+        assert stats["cache_read_input_tokens"] == 1500
+
+    @pytest.mark.asyncio
+    async def test_short_prefixes_and_disabled_caching_send_no_markers(self, runtime):
+        """임계값보다 짧은 prefix나 캐싱을 끈 설정은 마커를 붙이지 않아야 함."""
+        runtime.config.prompt_cache_min_tokens = 100000
+        await runtime._invoke_bedrock("작업", shared_context(runtime), agent_name="GapAnalyzer")
+        runtime.config.prompt_cache_min_tokens = 10
+        runtime.config.prompt_caching = False
+        await runtime._invoke_bedrock("작업", shared_context(runtime), agent_name="GapAnalyzer")
+
+        for body in runtime.bedrock_transport.bodies:
+            assert len(body["system"]) == 2
+            assert all("cache_control" not in block for block in body["system"])
+
+    @pytest.mark.asyncio
+    async def test_unsupported_models_fall_back_without_markers(self, runtime):
+        """마커가 거부되면 마커 없이 재시도하고 이후 호출에서도 생략해야 함."""
+        runtime.bedrock_transport = RecordingTransport(reject_cache_markers=True)
+
+        assert await runtime._invoke_bedrock("작업", shared_context(runtime), agent_name="GapAnalyzer") == "ok"
+        assert await runtime._invoke_bedrock("작업", shared_context(runtime), agent_name="GapAnalyzer") == "ok"
+        assert runtime.prompt_caching_supported is False
+        assert len(runtime.bedrock_transport.bodies) == 3
+
+    @pytest.mark.asyncio
+    async def test_other_validation_errors_keep_prompt_caching(self, runtime):
+        """cache_control과 무관한 ValidationException은 그대로 올리고 캐싱을 유지해야 함."""
+        runtime.bedrock_transport = RecordingTransport(reject_message="Input is too long for requested model.")
+
+        with pytest.raises(ClientError):
+            await runtime._invoke_bedrock("작업", shared_context(runtime), agent_name="GapAnalyzer")
+        assert runtime.prompt_caching_supported is True
+        assert len(runtime.bedrock_transport.bodies) == 1
+
+    @pytest.mark.asyncio
+    async def test_persona_is_not_stacked_into_task_inputs(self, runtime):
+        """페르소나는 작업 입력을 바꾸지 않고 prefix로만 전달되어야 함."""
+        async def agent(task):
+            return {"echo": task.inputs["prompt"]}
+
+        result = await runtime.execute_agent("GapAnalyzer", agent, {"prompt": "분석", "requires_ai": True})
+
+        assert result == {"echo": "분석"}
+        system = runtime.bedrock_transport.bodies[0]["system"]
+        assert sum(block["text"].count("당신은 분석가입니다") for block in system) == 1
+
+
+class TestSharedCompletion:
+    """공유 캐시/합치기 데코레이터 적용 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_identical_calls_are_coalesced_and_cached(self, runtime):
+        """동시 동일 호출은 한 번만 보내고, 이후 호출은 캐시에서 응답해야 함."""
+        runtime.config.temperature = 0.0
+        runtime.response_cache = AIResponseCache(db_path=None)
+        runtime.single_flight = SingleFlight()
+        runtime.bedrock_transport = SlowStreamingTransport()
+        published = []
+        runtime.add_stream_callback(lambda agent, chunk: published.append((agent, chunk)))
+
+        responses = await asyncio.gather(*(
+            runtime._invoke_bedrock("작업", shared_context(runtime), agent_name="GapAnalyzer")
+            for _ in range(3)
+        ))
+        assert responses == ["ok"] * 3
+        assert len(runtime.bedrock_transport.bodies) == 1
+        assert runtime.single_flight.get_stats()["coalesced"] == 2
+
+        assert await runtime._invoke_bedrock("작업", shared_context(runtime), agent_name="GapAnalyzer") == "ok"
+        assert len(runtime.bedrock_transport.bodies) == 1
+        assert published == [("GapAnalyzer", "ok")] * 4
+
+
+class FlakyTransport(RecordingTransport):
+    """처음 몇 번은 지정한 오류로 실패하는 기록용 전송 계층."""
+
+    def __init__(self, failures, code="ThrottlingException", status=400):
+        super().__init__()
+        self.failures = failures
+        self.error = {"Error": {"Code": code, "Message": "try again"},
+                      "ResponseMetadata": {"HTTPStatusCode": status}}
+
+    async def invoke_model(self, model_id, body):
+        if self.failures:
+            self.failures -= 1
+            self.bodies.append(json.loads(body))
+            raise ClientError(self.error, "InvokeModel")
+        return await super().invoke_model(model_id, body)
+
+
+class TestRetries:
+    """Bedrock 호출 재시도 테스트."""
+
+    @pytest.fixture(autouse=True)
+    def fast_backoff(self, monkeypatch):
+        """재시도 대기 시간을 줄임."""
+        monkeypatch.setattr(AgentRuntime, "RETRY_BASE_DELAY_SECONDS", 0.001)
+
+    @pytest.mark.asyncio
+    async def test_throttling_and_server_errors_are_retried(self, runtime):
+        """스로틀링과 5xx는 retry_count 안에서 재시도해야 함."""
+        runtime.bedrock_transport = FlakyTransport(failures=2)
+        assert await runtime._invoke_bedrock("작업", shared_context(runtime)) == "ok"
+        assert len(runtime.bedrock_transport.bodies) == 3
+
+        runtime.bedrock_transport = FlakyTransport(failures=1, code="HTTP503", status=503)
+        assert await runtime._invoke_bedrock("작업", shared_context(runtime)) == "ok"
+
+    @pytest.mark.asyncio
+    async def test_retries_are_bounded_by_retry_count(self, runtime):
+        """retry_count번 시도한 뒤에는 오류를 올리고, 재시도 불가 오류는 바로 올려야 함."""
+        runtime.config.retry_count = 2
+        runtime.bedrock_transport = FlakyTransport(failures=5)
+        with pytest.raises(ClientError):
+            await runtime._invoke_bedrock("작업", shared_context(runtime))
+        assert len(runtime.bedrock_transport.bodies) == 2
+
+        runtime.bedrock_transport = FlakyTransport(failures=5, code="AccessDeniedException", status=403)
+        with pytest.raises(ClientError):
+            await runtime._invoke_bedrock("작업", shared_context(runtime))
+        assert len(runtime.bedrock_transport.bodies) == 1
@@ -0,0 +1,115 @@
+"""LLM 응답 캐시 테스트.
+
+LRU/디스크 두 계층, TTL, 결정적 모드, 호출별 해제, 스트리밍 캐시를 검증합니다.
+"""
+
+import time
+
+import pytest
+
+from backend.packages.agents.ai_cache import AIResponseCache, cached_completion, make_cache_key
+
+
+class CountingProvider:
+    """호출 횟수를 세는 테스트용 Provider."""
+
+    default_model_id = "test-model"
+
+    def __init__(self, cache):
+        self.response_cache = cache
+        self.calls = 0
+
+    @cached_completion
+    async def complete(self, prompt, system=None, max_tokens=4096, temperature=0.7, model_id=None):
+        self.calls += 1
+        return f"answer {self.calls}: {prompt}"
+
+    @cached_completion
+    async def stream_complete(self, prompt, system=None, max_tokens=4096, temperature=0.7, model_id=None):
+        self.calls += 1
+        for part in ["a", "b", "c"]:
+            yield part
+
+
+class TestAIResponseCache:
+    """캐시 계층 테스트."""
+
+    def test_key_covers_every_parameter(self):
+        """키는 다섯 매개변수 중 하나만 달라도 달라져야 함."""
+        base = ("m", "sys", "prompt", 100, 0.2)
+        keys = {make_cache_key(*base)}
+        for index, changed in enumerate(["m2", None, "prompt2", 101, 0.3]):
+            params = list(base)
+            params[index] = changed
+            keys.add(make_cache_key(*params))
+        assert len(keys) == 6
+        assert make_cache_key(*base) == make_cache_key(*base)
+
+    @pytest.mark.asyncio
+    async def test_disk_tier_survives_new_instances(self, tmp_path):
+        """디스크 계층은 다른 인스턴스(다른 실행)에서도 적중해야 함."""
+        db_path = str(tmp_path / "cache.db")
+        first = AIResponseCache(db_path=db_path)
+        await first.put("k", "cached answer")
+        first.close()
+
+        second = AIResponseCache(db_path=db_path)
+        assert await second.get("k") == "cached answer"
+        assert await second.get("k") == "cached answer"
+        stats = second.get_stats()
+        assert (stats["disk_hits"], stats["memory_hits"]) == (1, 1)
+        second.close()
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction_and_ttl(self, tmp_path):
+        """LRU 용량을 넘으면 오래된 항목을 버리고, TTL이 지나면 만료되어야 함."""
+        cache = AIResponseCache(max_entries=2, db_path=None)
+        for key in ("a", "b", "c"):
+            await cache.put(key, key.upper())
+        assert await cache.get("a") is None
+        assert await cache.get("c") == "C"
+
+        expiring = AIResponseCache(ttl_seconds=0.05, db_path=str(tmp_path / "ttl.db"))
+        await expiring.put("k", "v")
+        time.sleep(0.1)
+        assert await expiring.get("k") is None
+        expiring.close()
+
+
+class TestCachedCompletion:
+    """cached_completion 데코레이터 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_identical_deterministic_calls_hit_the_cache(self):
+        """temperature <= 0.3인 동일 호출은 한 번만 실행되어야 함."""
+        provider = CountingProvider(AIResponseCache(db_path=None))
+
+        first = await provider.complete("p", system="s", temperature=0.3)
+        assert await provider.complete("p", system="s", temperature=0.3) == first
+        assert await provider.complete("p", system="other", temperature=0.3) != first
+        assert provider.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_opt_out_and_deterministic_mode(self):
+        """use_cache=False와 높은 temperature는 캐시를 건너뛰어야 함."""
+        provider = CountingProvider(AIResponseCache(db_path=None))
+        await provider.complete("p", temperature=0.0)
+        await provider.complete("p", temperature=0.0, use_cache=False)
+        await provider.complete("p", temperature=0.7)
+        await provider.complete("p", temperature=0.7)
+        assert provider.calls == 4
+        assert provider.response_cache.get_stats()["bypassed"] == 3
+
+        provider = CountingProvider(AIResponseCache(db_path=None, deterministic_only=False))
+        await provider.complete("p", temperature=0.7)
+        await provider.complete("p", temperature=0.7)
+        assert provider.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_streams_are_cached_as_one_chunk(self):
+        """스트림 결과도 캐시되어 적중 시 한 조각으로 반환되어야 함."""
+        provider = CountingProvider(AIResponseCache(db_path=None))
+
+        assert [c async for c in provider.stream_complete("p", temperature=0.1)] == ["a", "b", "c"]
+        assert [c async for c in provider.stream_complete("p", temperature=0.1)] == ["abc"]
+        assert provider.calls == 1
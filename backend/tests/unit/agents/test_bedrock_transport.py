@@ -0,0 +1,294 @@
+"""Bedrock 비동기 전송 계층 테스트.
+
+로컬 HTTP 서버를 Bedrock 런타임 엔드포인트 대용으로 띄워
+병렬 호출 중첩, 에러 변환, 서명, 응답 스트리밍, Provider/Runtime 연동을 검증합니다.
+"""
+
+import asyncio
+import base64
+import binascii
+import json
+import struct
+import time
+
+import pytest
+from aiohttp import web
+from botocore.exceptions import ClientError
+
+from backend.packages.agents.ai_providers import BedrockAIProvider
+from backend.packages.agents.base import AgentResult, AgentTask, BaseAgent
+from backend.packages.agents.bedrock_transport import BedrockTransport
+from backend.packages.aws_agent_squad.core.agent_runtime import AgentRuntime, RuntimeConfig
+
+DELAY = 0.2
+STREAM_DELAY = 0.1
+
+
+def encode_event(headers, payload):
+    """AWS event-stream 메시지 인코딩 (문자열 헤더만)."""
+    header_bytes = b"".join(
+        struct.pack("B", len(name)) + name.encode() + b"\x07"
+        + struct.pack(">H", len(value)) + value.encode()
+        for name, value in headers.items()
+    )
+    prelude = struct.pack(">II", 12 + len(header_bytes) + len(payload) + 4, len(header_bytes))
+    prelude += struct.pack(">I", binascii.crc32(prelude))
+    message = prelude + header_bytes + payload
+    return message + struct.pack(">I", binascii.crc32(message))
+
+
+def chunk_event(chunk):
+    """모델 청크를 담은 event-stream 메시지."""
+    payload = json.dumps({"bytes": base64.b64encode(json.dumps(chunk).encode()).decode()})
+    return encode_event(
+        {":message-type": "event", ":event-type": "chunk", ":content-type": "application/json"},
+        payload.encode(),
+    )
+
+
+@pytest.fixture
+async def bedrock_stub():
+    """Bedrock InvokeModel을 흉내 내는 로컬 HTTP 서버."""
+    state = {"requests": [], "throttle": False, "fail_stream": False}
+
+    async def invoke(request):
+        body = json.loads(await request.read())
+        state["requests"].append({
+            "model_id": request.match_info["model_id"],
+            "headers": dict(request.headers),
+            "body": body,
+        })
+        if state["throttle"]:
+            return web.json_response(
+                {"message": "Too many requests"},
+                status=429,
+                headers={"x-amzn-ErrorType": "ThrottlingException:http://internal.amazon.com/"},
+            )
+        await asyncio.sleep(DELAY)
+        text = body["messages"][0]["content"]
+        return web.json_response({"content": [{"type": "text", "text": f"echo: {text}"}]})
+
+    async def invoke_stream(request):
+        body = json.loads(await request.read())
+        state["requests"].append({"model_id": request.match_info["model_id"], "body": body})
+        response = web.StreamResponse(headers={"Content-Type": "application/vnd.amazon.eventstream"})
+        await response.prepare(request)
+        await response.write(chunk_event({"type": "message_start", "message": {}}))
+        for word in ["Hello", ", ", "stream"]:
+            await response.write(chunk_event(
+                {"type": "content_block_delta", "index": 0, "delta": {"type": "text_delta", "text": word}}
+            ))
+            if state["fail_stream"]:
+                await response.write(encode_event(
+                    {":message-type": "exception", ":exception-type": "modelStreamErrorException"},
+                    b'{"message": "model failed"}',
+                ))
+                break
+            await asyncio.sleep(STREAM_DELAY)
+        await response.write(chunk_event({"type": "message_stop"}))
+        await response.write_eof()
+        return response
+
+    app = web.Application()
+    app.router.add_post("/model/{model_id}/invoke", invoke)
+    app.router.add_post("/model/{model_id}/invoke-with-response-stream", invoke_stream)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    state["url"] = f"http://127.0.0.1:{port}"
+    yield state
+    await runner.cleanup()
+
+
+def claude_body(text):
+    """Claude 요청 본문."""
+    return {
+        "anthropic_version": "bedrock-2023-05-31",
+        "max_tokens": 10,
+        "messages": [{"role": "user", "content": text}],
+    }
+
+
+class TestBedrockTransport:
+    """전송 계층 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_parallel_calls_overlap(self, bedrock_stub):
+        """병렬 호출이 이벤트 루프를 막지 않고 겹쳐서 실행되어야 함."""
+        transport = BedrockTransport(endpoint_url=bedrock_stub["url"], max_connections=8)
+        assert transport.mode == "http"
+
+        start = time.perf_counter()
+        results = await asyncio.gather(*(
+            transport.invoke_model("anthropic.claude-v2:1", claude_body(f"q{i}")) for i in range(5)
+        ))
+        elapsed = time.perf_counter() - start
+
+        assert [r["content"][0]["text"] for r in results] == [f"echo: q{i}" for i in range(5)]
+        assert elapsed < DELAY * 3
+        assert bedrock_stub["requests"][0]["model_id"] == "anthropic.claude-v2:1"
+        stats = transport.get_stats()
+        assert stats["requests"] == 5 and stats["max_in_flight"] == 5
+        await transport.close()
+
+    @pytest.mark.asyncio
+    async def test_each_event_loop_keeps_its_own_session(self, bedrock_stub):
+        """루프마다 세션을 유지하고, 루프가 종료되면 그 세션을 닫아야 함."""
+        transport = BedrockTransport(endpoint_url=bedrock_stub["url"])
+        await transport.invoke_model("anthropic.claude-v2", claude_body("a"))
+        session = await transport._get_session()
+
+        async def call_twice():
+            await transport.invoke_model("anthropic.claude-v2", claude_body("b"))
+            await transport.invoke_model("anthropic.claude-v2", claude_body("c"))
+            return await transport._get_session()
+
+        loop = asyncio.get_running_loop()
+        thread_sessions = await asyncio.gather(*(
+            loop.run_in_executor(None, lambda: asyncio.run(call_twice())) for _ in range(2)
+        ))
+
+        assert session not in thread_sessions
+        assert thread_sessions[0] is not thread_sessions[1]
+        assert all(s.closed for s in thread_sessions)
+        assert await transport._get_session() is session and not session.closed
+        await transport.close()
+        assert session.closed
+
+    @pytest.mark.asyncio
+    async def test_errors_become_client_errors(self, bedrock_stub):
+        """HTTP 에러는 botocore ClientError로 변환되어야 함."""
+        bedrock_stub["throttle"] = True
+        transport = BedrockTransport(endpoint_url=bedrock_stub["url"])
+
+        with pytest.raises(ClientError) as exc_info:
+            await transport.invoke_model("anthropic.claude-v2", claude_body("x"))
+
+        error = exc_info.value.response["Error"]
+        assert error["Code"] == "ThrottlingException"
+        assert error["Message"] == "Too many requests"
+        assert transport.get_stats()["errors"] == 1
+        await transport.close()
+
+    @pytest.mark.asyncio
+    async def test_requests_are_signed_with_credentials(self, bedrock_stub, monkeypatch):
+        """자격 증명이 있으면 SigV4 서명 헤더를 붙여야 함."""
+        monkeypatch.setenv("AWS_ACCESS_KEY_ID", "AKIDEXAMPLE")
+        monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "secret")
+        transport = BedrockTransport(region="us-west-2", endpoint_url=bedrock_stub["url"])
+
+        await transport.invoke_model("anthropic.claude-v2", claude_body("x"))
+
+        authorization = bedrock_stub["requests"][0]["headers"]["Authorization"]
+        assert authorization.startswith("AWS4-HMAC-SHA256 Credential=AKIDEXAMPLE/")
+        assert "/us-west-2/bedrock/aws4_request" in authorization
+        await transport.close()
+
+
+class TestResponseStreaming:
+    """응답 스트리밍 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_chunks_arrive_before_the_response_completes(self, bedrock_stub):
+        """첫 청크는 전체 응답이 끝나기 전에 도착해야 함."""
+        transport = BedrockTransport(endpoint_url=bedrock_stub["url"])
+
+        start = time.perf_counter()
+        first_chunk_at = None
+        texts = []
+        async for chunk in transport.invoke_model_stream("anthropic.claude-v2", claude_body("x")):
+            if chunk.get("type") == "content_block_delta":
+                first_chunk_at = first_chunk_at or time.perf_counter() - start
+                texts.append(chunk["delta"]["text"])
+        total = time.perf_counter() - start
+
+        assert texts == ["Hello", ", ", "stream"]
+        assert first_chunk_at < STREAM_DELAY < total
+        assert transport.get_stats()["streams"] == 1
+        await transport.close()
+
+    @pytest.mark.asyncio
+    async def test_stream_exceptions_become_client_errors(self, bedrock_stub):
+        """스트림 중간의 예외 메시지는 ClientError로 변환되어야 함."""
+        bedrock_stub["fail_stream"] = True
+        transport = BedrockTransport(endpoint_url=bedrock_stub["url"])
+
+        received = []
+        with pytest.raises(ClientError) as exc_info:
+            async for chunk in transport.invoke_model_stream("anthropic.claude-v2", claude_body("x")):
+                received.append(chunk)
+
+        assert exc_info.value.response["Error"]["Code"] == "ModelStreamErrorException"
+        assert received[-1]["delta"]["text"] == "Hello"
+        await transport.close()
+
+
+class EchoAgent(BaseAgent):
+    """스트리밍 테스트용 에이전트."""
+
+    async def execute(self, task: AgentTask) -> AgentResult:
+        """사용하지 않음."""
+        return self.format_result(True)
+
+
+class TestTransportIntegration:
+    """Provider/Runtime 연동 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_provider_completes_through_transport(self, bedrock_stub):
+        """BedrockAIProvider.complete가 전송 계층을 사용해야 함."""
+        provider = BedrockAIProvider(model="claude-2", endpoint_url=bedrock_stub["url"])
+
+        assert await provider.complete("hello", max_retries=1) == "echo: hello"
+        assert bedrock_stub["requests"][0]["body"]["messages"][0]["content"] == "hello"
+        await provider.transport.close()
+
+    @pytest.mark.asyncio
+    async def test_runtime_invocations_overlap(self, bedrock_stub):
+        """AgentRuntime의 Bedrock 호출도 병렬로 겹쳐야 함."""
+        runtime = AgentRuntime(RuntimeConfig(endpoint_url=bedrock_stub["url"]))
+
+        start = time.perf_counter()
+        responses = await asyncio.gather(*(
+            runtime._invoke_bedrock(f"task {i}", {}) for i in range(4)
+        ))
+        elapsed = time.perf_counter() - start
+
+        assert all(response.startswith("echo: ") for response in responses)
+        assert elapsed < DELAY * 3
+        await runtime.bedrock_transport.close()
+
+    @pytest.mark.asyncio
+    async def test_provider_and_agent_stream_tokens(self, bedrock_stub):
+        """Provider와 BaseAgent.use_ai_stream이 토큰 단위로 전달해야 함."""
+        provider = BedrockAIProvider(model="claude-2", endpoint_url=bedrock_stub["url"])
+        assert [c async for c in provider.stream_generate("hi")] == ["Hello", ", ", "stream"]
+
+        forwarded = []
+        agent = EchoAgent(name="EchoAgent", ai_provider=provider)
+        agent.stream_callback = lambda name, chunk: forwarded.append((name, chunk))
+
+        chunks = [chunk async for chunk in agent.use_ai_stream("hi")]
+        assert "".join(chunks) == "Hello, stream"
+        assert forwarded == [("EchoAgent", "Hello"), ("EchoAgent", ", "), ("EchoAgent", "stream")]
+        await provider.transport.close()
+
+    @pytest.mark.asyncio
+    async def test_runtime_forwards_stream_to_callbacks(self, bedrock_stub):
+        """스트림 콜백이 있으면 AgentRuntime이 출력 조각을 전달해야 함."""
+        runtime = AgentRuntime(RuntimeConfig(endpoint_url=bedrock_stub["url"]))
+        received = []
+
+        async def on_chunk(agent_name, chunk):
+            received.append((agent_name, chunk))
+
+        runtime.add_stream_callback(on_chunk)
+        response = await runtime._invoke_bedrock("task", {}, agent_name="GapAnalyzer")
+
+        assert response == "Hello, stream"
+        assert [chunk for _, chunk in received] == ["Hello", ", ", "stream"]
+        assert {agent for agent, _ in received} == {"GapAnalyzer"}
+        await runtime.bedrock_transport.close()
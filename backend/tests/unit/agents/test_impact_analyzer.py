@@ -0,0 +1,116 @@
+"""ImpactAnalyzer 배치 리스크 점수 테스트.
+
+여러 변경을 한 프롬프트로 묶는 배치 점수 계산, 동시 실행 제한,
+항목별/배치 단위 규칙 기반 폴백을 검증합니다.
+"""
+
+import asyncio
+import json
+import re
+
+import pytest
+
+from backend.packages.agents.ai_providers import AIResponse
+from backend.packages.agents.impact_analyzer import ChangeImpact, ImpactAnalyzer
+
+
+class ScoringProvider:
+    """프롬프트의 변경 목록에 점수를 매기는 테스트용 Provider."""
+
+    def __init__(self, skip_ids=(), fail=False):
+        self.prompts = []
+        self.skip_ids = set(skip_ids)
+        self.fail = fail
+        self.running = 0
+        self.peak = 0
+
+    async def generate(self, prompt, system_prompt=None, **kwargs):
+        self.prompts.append(prompt)
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        await asyncio.sleep(0.01)
+        self.running -= 1
+        if self.fail:
+            return AIResponse(content="", success=False, error="throttled")
+
+        summaries = json.loads(re.search(r"\[.*?\n\]", prompt, re.DOTALL).group(0))
+        scores = [
+            {"id": item["id"], "risk_score": 10 + item["id"]}
+            for item in summaries if item["id"] not in self.skip_ids
+        ]
+        return AIResponse(content=f"```json\n{json.dumps(scores)}\n```", success=True)
+
+
+def make_impacts(count):
+    """테스트용 변경 영향 목록."""
+    return [
+        ChangeImpact(changed_file=f"src/module_{i}.py", changed_component="run", change_type="modify",
+                     blast_radius=i)
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def analyzer():
+    """AI Provider가 주입될 ImpactAnalyzer."""
+    return ImpactAnalyzer()
+
+
+class TestBatchRiskScoring:
+    """배치 리스크 점수 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_changes_are_scored_in_batches(self, analyzer):
+        """변경들은 RISK_BATCH_SIZE 단위 프롬프트로 묶여 점수가 매겨져야 함."""
+        provider = ScoringProvider()
+        analyzer.ai_provider = provider
+        analyzer.RISK_BATCH_SIZE = 10
+        analyzer.RISK_BATCH_CONCURRENCY = 2
+        impacts = make_impacts(45)
+
+        await analyzer._score_impacts(impacts)
+
+        assert len(provider.prompts) == 5
+        assert provider.peak == 2
+        assert [impact.risk_score for impact in impacts[:10]] == [10.0 + i for i in range(10)]
+        assert impacts[44].risk_score == 14.0
+
+    @pytest.mark.asyncio
+    async def test_unscored_items_fall_back_individually(self, analyzer):
+        """응답에서 빠진 항목만 규칙 기반 점수로 대체되어야 함."""
+        analyzer.ai_provider = ScoringProvider(skip_ids={1})
+        impacts = make_impacts(3)
+
+        await analyzer._score_impacts(impacts)
+
+        assert impacts[0].risk_score == 10.0
+        assert impacts[1].risk_score == analyzer._calculate_risk_score_fallback(impacts[1])
+        assert impacts[2].risk_score == 12.0
+
+    @pytest.mark.asyncio
+    async def test_failed_call_falls_back_for_the_whole_batch(self, analyzer):
+        """AI 호출이 실패하면 배치 전체가 규칙 기반 점수를 사용해야 함."""
+        analyzer.ai_provider = ScoringProvider(fail=True)
+        impacts = make_impacts(3)
+
+        await analyzer._score_impacts(impacts)
+
+        assert [impact.risk_score for impact in impacts] == [
+            analyzer._calculate_risk_score_fallback(impact) for impact in impacts
+        ]
+
+    def test_invalid_scores_are_rejected(self, analyzer):
+        """범위를 벗어나거나 형식이 틀린 점수는 버려야 함."""
+        content = json.dumps([
+            {"id": 0, "risk_score": 55},
+            {"id": 1, "risk_score": 150},
+            {"id": 2, "risk_score": "high"},
+            {"id": 7, "risk_score": 30},
+        ])
+        assert analyzer._parse_batch_scores(content, 3) == {0: 55.0}
+        assert analyzer._parse_batch_scores("no json here", 3) == {}
+
+    def test_cut_off_score_is_not_accepted(self, analyzer):
+        """응답이 숫자 중간에서 잘리면 그 항목은 점수 없이 폴백되어야 함."""
+        content = '[{"id": 0, "risk_score": 45}, {"id": 1, "risk_score": 7'
+        assert analyzer._parse_batch_scores(content, 2) == {0: 45.0}
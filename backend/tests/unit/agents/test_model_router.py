@@ -0,0 +1,196 @@
+"""작업 종류별 모델 라우팅 테스트.
+
+task_class 라우트의 모델/토큰/타임아웃 적용, 명시적 인자 우선,
+환경변수 재정의, 라우트별 비용 집계와 BedrockAIProvider/AgentRuntime 연동을 검증합니다.
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from backend.packages.agents.ai_cache import AIResponseCache
+from backend.packages.agents.ai_providers import BedrockAIProvider
+from backend.packages.agents.base import AgentResult, AgentTask, BaseAgent
+from backend.packages.agents.model_router import (
+    ModelRoute,
+    ModelRouter,
+    RoutingPolicy,
+    TaskClass,
+    estimate_cost,
+    routed_completion,
+)
+from backend.packages.agents.single_flight import SingleFlight
+from backend.packages.aws_agent_squad.core.agent_runtime import AgentRuntime, RuntimeConfig
+
+
+class EchoProvider:
+    """받은 인자를 기록하는 테스트용 Provider."""
+
+    MODELS = {"claude-3-haiku": "haiku-id", "claude-3-5-sonnet": "sonnet-id"}
+
+    def __init__(self, router=None, delay=0.0):
+        self.model_router = router or ModelRouter()
+        self.delay = delay
+        self.calls = []
+
+    @routed_completion
+    async def complete(self, prompt, system=None, max_tokens=4096, temperature=0.7, model_id=None):
+        self.calls.append({"model_id": model_id, "max_tokens": max_tokens})
+        await asyncio.sleep(self.delay)
+        return "x" * 40
+
+
+class ModelTransport:
+    """호출된 모델 ID와 요청 본문을 기록하는 전송 계층."""
+
+    def __init__(self):
+        self.requests = []
+
+    async def invoke_model(self, model_id, body):
+        self.requests.append((model_id, json.loads(body) if isinstance(body, str) else body))
+        return {"content": [{"type": "text", "text": "ok"}], "usage": {}}
+
+
+class StreamingEchoProvider(EchoProvider):
+    """스트리밍 호출도 기록하는 테스트용 Provider."""
+
+    @routed_completion
+    async def stream_complete(self, prompt, system=None, max_tokens=4096, temperature=0.7, model_id=None):
+        self.calls.append({"model_id": model_id, "max_tokens": max_tokens})
+        yield "report"
+
+
+class ReportAgent(BaseAgent):
+    """보고서 생성 테스트용 에이전트."""
+
+    async def execute(self, task: AgentTask) -> AgentResult:
+        """사용하지 않음."""
+        return self.format_result(True)
+
+
+class TestRouting:
+    """라우트 적용 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_task_class_selects_model_and_max_tokens(self):
+        """분류는 경량 모델, 코드 생성은 대형 모델로 라우팅되어야 함."""
+        provider = EchoProvider()
+
+        await provider.complete("분류", task_class="classify")
+        await provider.complete("생성", task_class=TaskClass.GENERATE_CODE)
+        await provider.complete("기본")
+
+        assert provider.calls == [
+            {"model_id": "haiku-id", "max_tokens": 512},
+            {"model_id": "sonnet-id", "max_tokens": 8192},
+            {"model_id": None, "max_tokens": 4096},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_explicit_arguments_win_over_the_route(self):
+        """호출자가 지정한 model_id/max_tokens는 라우트보다 우선해야 함."""
+        provider = EchoProvider()
+
+        await provider.complete("p", None, 100, task_class="classify")
+        await provider.complete("p", model_id="custom", task_class="classify")
+
+        assert provider.calls == [
+            {"model_id": "haiku-id", "max_tokens": 100},
+            {"model_id": "custom", "max_tokens": 512},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_route_timeout_is_enforced_and_counted(self):
+        """라우트 타임아웃을 넘긴 호출은 실패하고 통계에 기록되어야 함."""
+        router = ModelRouter(RoutingPolicy({TaskClass.CLASSIFY: ModelRoute("claude-3-haiku", 512, 0.01)}))
+        provider = EchoProvider(router, delay=0.2)
+
+        with pytest.raises(asyncio.TimeoutError):
+            await provider.complete("p", task_class="classify")
+
+        stats = router.get_stats()["classify"]
+        assert (stats["calls"], stats["errors"], stats["timeouts"]) == (1, 1, 1)
+
+    def test_env_overrides_routes(self, monkeypatch):
+        """MODEL_ROUTE_<CLASS> 환경변수로 라우트를 부분 재정의할 수 있어야 함."""
+        monkeypatch.setenv("MODEL_ROUTE_CLASSIFY", "claude-3-5-sonnet:1024")
+        policy = RoutingPolicy.from_env()
+
+        assert policy.route("classify") == ModelRoute("claude-3-5-sonnet", 1024, 30)
+        assert policy.route("extract").model == "claude-3-haiku"
+        with pytest.raises(ValueError):
+            policy.route("translate")
+
+
+class TestAccounting:
+    """라우트별 비용 집계 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_routes_track_latency_tokens_and_cost(self):
+        """라우트별로 호출 수, 토큰, 모델 단가 기반 비용이 집계되어야 함."""
+        provider = EchoProvider()
+
+        for _ in range(3):
+            await provider.complete("a" * 400, task_class="classify")
+        await provider.complete("a" * 400, task_class="generate_code")
+
+        stats = provider.model_router.get_stats()
+        assert stats["classify"]["calls"] == 3
+        assert stats["classify"]["models"] == {"haiku-id": 3}
+        assert stats["classify"]["input_tokens"] == 300
+        assert stats["classify"]["mean_latency_seconds"] >= 0
+        assert stats["classify"]["cost_usd"] < stats["generate_code"]["cost_usd"]
+        assert estimate_cost("us.anthropic.claude-3-5-haiku-20241022-v1:0", 1000, 1000) == pytest.approx(0.0048)
+        assert estimate_cost("unknown-model", 1000, 1000) == 0.0
+
+
+class TestIntegration:
+    """BedrockAIProvider/AgentRuntime 연동 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_bedrock_provider_routes_generate_calls(self):
+        """generate(task_class=...)는 라우트의 Bedrock 모델 ID로 호출되어야 함."""
+        provider = BedrockAIProvider(
+            model="claude-3-sonnet", response_cache=AIResponseCache(db_path=None), model_router=ModelRouter()
+        )
+        provider.single_flight = SingleFlight()
+        provider.transport = ModelTransport()
+
+        response = await provider.generate("Classify this change", task_class="classify")
+
+        model_id, body = provider.transport.requests[0]
+        assert response.success
+        assert model_id == BedrockAIProvider.MODELS["claude-3-haiku"]
+        assert body["max_tokens"] == 512
+
+    @pytest.mark.asyncio
+    async def test_reports_are_routed_with_and_without_streaming(self):
+        """보고서 생성은 stream_callback 유무와 관계없이 report 라우트를 써야 함."""
+        provider = StreamingEchoProvider()
+        agent = ReportAgent(name="ReportAgent", ai_provider=provider)
+        result = agent.format_result(True, data={"issues": 3})
+
+        await agent._generate_ai_report(result, "markdown")
+        agent.stream_callback = lambda name, chunk: None
+        await agent._generate_ai_report(result, "markdown")
+
+        report_model = provider.MODELS["claude-3-5-sonnet"]
+        assert [call["model_id"] for call in provider.calls] == [report_model, report_model]
+        assert provider.model_router.get_stats()["report"]["calls"] == 2
+
+    @pytest.mark.asyncio
+    async def test_runtime_routes_invocations(self):
+        """AgentRuntime도 task_class에 따라 모델과 max_tokens를 바꿔야 함."""
+        runtime = AgentRuntime(RuntimeConfig())
+        runtime.response_cache = None
+        runtime.model_router = ModelRouter()
+        runtime.bedrock_transport = ModelTransport()
+
+        await runtime._invoke_bedrock("다음 에이전트 선택", {}, task_class="classify")
+        await runtime._invoke_bedrock("보고서 작성", {})
+
+        (routed_model, routed_body), (default_model, default_body) = runtime.bedrock_transport.requests
+        assert (routed_model, routed_body["max_tokens"]) == (BedrockAIProvider.MODELS["claude-3-haiku"], 512)
+        assert (default_model, default_body["max_tokens"]) == (runtime.config.model_id, runtime.config.max_tokens)
+        assert runtime.get_execution_metrics()["model_routes"]["classify"]["calls"] == 1
@@ -0,0 +1,178 @@
+"""오프라인 AI Provider 테스트.
+
+카세트 녹화/재생, 스키마에 맞는 합성 응답, 지연 분포,
+get_ai_provider/AgentRuntime 연동(고동시성 부하)을 검증합니다.
+"""
+
+import asyncio
+import json
+import time
+
+import jsonschema
+import pytest
+
+from backend.packages.agents.ai_providers import get_ai_provider
+from backend.packages.agents.model_router import (
+    ModelRoute,
+    ModelRouter,
+    RoutingPolicy,
+    TaskClass,
+    routed_completion,
+)
+from backend.packages.agents.offline_providers import (
+    DEFAULT_SCHEMA,
+    CassetteMissError,
+    LatencyModel,
+    ReplayAIProvider,
+    SyntheticAIProvider,
+)
+from backend.packages.aws_agent_squad.core.agent_runtime import AgentRuntime, RuntimeConfig
+
+RISK_SCHEMA = {
+    "type": "array",
+    "minItems": 1,
+    "maxItems": 5,
+    "items": {
+        "type": "object",
+        "properties": {
+            "id": {"type": "integer", "minimum": 0, "maximum": 9},
+            "risk_score": {"type": "number", "minimum": 0, "maximum": 100},
+            "level": {"enum": ["low", "medium", "high"]},
+        },
+        "required": ["id", "risk_score", "level"],
+    },
+}
+
+
+def instant_provider(seed=1):
+    """지연 없는 합성 Provider."""
+    return SyntheticAIProvider(latency=LatencyModel("constant", mean_ms=0), seed=seed)
+
+
+class RoutedSyntheticProvider(SyntheticAIProvider):
+    """task_class로 라우팅하고 받은 model_id를 기록하는 합성 Provider."""
+
+    def __init__(self):
+        super().__init__(latency=LatencyModel("constant", mean_ms=0), seed=1)
+        self.model_router = ModelRouter(RoutingPolicy({TaskClass.CLASSIFY: ModelRoute("haiku-model", 512, 5)}))
+        self.models = []
+
+    @routed_completion
+    async def complete(self, prompt, system=None, max_tokens=None, temperature=0.7, model_id=None, **kwargs):
+        self.models.append((model_id, max_tokens))
+        return await super().complete(prompt, system, max_tokens, temperature, model_id)
+
+
+class TestReplayAIProvider:
+    """카세트 녹화/재생 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_recorded_pairs_replay_offline(self, tmp_path):
+        """녹화한 요청은 upstream 없이 같은 응답으로 재생되어야 함."""
+        cassette = tmp_path / "cassette.jsonl"
+        recorder = ReplayAIProvider(str(cassette), mode="record", upstream=instant_provider())
+        recorded = await recorder.complete("analyze", system="sys", temperature=0.2)
+
+        entry = json.loads(cassette.read_text().splitlines()[0])
+        assert entry["request"]["prompt"] == "analyze"
+        assert entry["response"] == recorded
+
+        player = ReplayAIProvider(str(cassette))
+        assert player.default_model_id == "synthetic"
+        assert await player.complete("analyze", system="sys", temperature=0.2) == recorded
+        with pytest.raises(CassetteMissError):
+            await player.complete("analyze", system="sys", temperature=0.3)
+        assert player.get_stats()["replayed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_repeated_recordings_replay_round_robin(self, tmp_path):
+        """같은 요청을 여러 번 녹화하면 재생도 순서대로 돌아가야 함."""
+        cassette = str(tmp_path / "cassette.jsonl")
+        recorder = ReplayAIProvider(cassette, mode="record", upstream=instant_provider())
+        answers = [await recorder.complete("p") for _ in range(2)]
+
+        player = ReplayAIProvider(cassette)
+        assert [await player.complete("p") for _ in range(3)] == answers + answers[:1]
+
+    @pytest.mark.asyncio
+    async def test_auto_mode_records_only_misses(self, tmp_path):
+        """auto 모드는 녹화된 요청은 재생하고 없는 요청만 upstream으로 녹화해야 함."""
+        upstream = instant_provider()
+        provider = ReplayAIProvider(str(tmp_path / "c.jsonl"), mode="auto", upstream=upstream)
+
+        first = await provider.complete("p")
+        assert await provider.complete("p") == first
+        assert upstream.get_stats()["calls"] == 1
+        assert provider.get_stats()["recorded"] == 1
+
+    @pytest.mark.asyncio
+    async def test_recording_keeps_task_class_routing(self, tmp_path):
+        """녹화 중에도 upstream이 task_class로 라우팅하고, 카세트 키는 라우팅된 모델이어야 함."""
+        cassette = str(tmp_path / "cassette.jsonl")
+        upstream = RoutedSyntheticProvider()
+        recorder = ReplayAIProvider(cassette, mode="record", upstream=upstream)
+        recorded = await recorder.generate("classify", task_class=TaskClass.CLASSIFY)
+        assert upstream.models == [("haiku-model", 512)]
+
+        entry = json.loads(open(cassette).read().splitlines()[0])
+        assert (entry["request"]["model_id"], entry["request"]["max_tokens"]) == ("haiku-model", 512)
+
+        player = ReplayAIProvider(cassette, model_router=upstream.model_router)
+        assert await player.complete("classify", task_class=TaskClass.CLASSIFY) == recorded.content
+        with pytest.raises(CassetteMissError):
+            await player.complete("classify")
+
+
+class TestSyntheticAIProvider:
+    """합성 응답 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_answers_are_valid_against_the_selected_schema(self):
+        """프롬프트 규칙에 맞는 스키마로 유효한 JSON을 반환해야 함."""
+        provider = SyntheticAIProvider(
+            latency=LatencyModel("constant", mean_ms=0), rules=[(r"risk score", RISK_SCHEMA)], seed=7
+        )
+        for _ in range(20):
+            jsonschema.validate(json.loads(await provider.complete("Give a risk score")), RISK_SCHEMA)
+            jsonschema.validate(json.loads(await provider.complete("Summarize")), DEFAULT_SCHEMA)
+
+        response = await provider.generate("Summarize")
+        assert response.success and json.loads(response.content)["items"]
+
+    def test_latency_distributions(self):
+        """지연 분포의 평균은 설정한 값에 가까워야 함."""
+        assert LatencyModel("constant", mean_ms=250).sample() == 0.25
+        for distribution in ("uniform", "normal", "lognormal", "exponential"):
+            model = LatencyModel(distribution, mean_ms=100, spread=0.3, seed=3)
+            samples = [model.sample() for _ in range(4000)]
+            assert min(samples) >= 0
+            assert sum(samples) / len(samples) == pytest.approx(0.1, rel=0.1)
+        with pytest.raises(ValueError):
+            LatencyModel("pareto")
+
+
+class TestOfflineIntegration:
+    """get_ai_provider/AgentRuntime 연동 테스트."""
+
+    def test_ai_provider_env_switches_the_pipeline_offline(self, monkeypatch):
+        """AI_PROVIDER 환경변수는 bedrock 요청을 오프라인 Provider로 바꿔야 함."""
+        monkeypatch.setenv("AI_PROVIDER", "synthetic")
+        assert isinstance(get_ai_provider("bedrock"), SyntheticAIProvider)
+        assert isinstance(get_ai_provider(), SyntheticAIProvider)
+
+    @pytest.mark.asyncio
+    async def test_runtime_load_test_at_high_concurrency(self, monkeypatch):
+        """합성 Provider로 AgentRuntime을 네트워크 없이 고동시성으로 실행할 수 있어야 함."""
+        monkeypatch.setenv("AI_SYNTHETIC_LATENCY", "constant")
+        monkeypatch.setenv("AI_SYNTHETIC_LATENCY_MS", "50")
+        runtime = AgentRuntime(RuntimeConfig(ai_provider="synthetic"))
+
+        start = time.perf_counter()
+        responses = await asyncio.gather(*(
+            runtime._invoke_bedrock(f"task {i}", {}, use_cache=False) for i in range(200)
+        ))
+        elapsed = time.perf_counter() - start
+
+        assert all(json.loads(response)["summary"] for response in responses)
+        assert elapsed < 1.0
+        assert runtime.ai_provider.get_stats()["max_in_flight"] == 200
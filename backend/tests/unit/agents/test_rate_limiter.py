@@ -0,0 +1,154 @@
+"""Bedrock rate limiter 테스트.
+
+요청/토큰 버킷, AIMD 동시성 조절, 이벤트 루프 간 공유, Provider 연동을 검증합니다.
+"""
+
+import asyncio
+import threading
+import time
+
+import pytest
+from botocore.exceptions import ClientError
+
+from backend.packages.agents.ai_providers import BedrockAIProvider
+from backend.packages.agents.rate_limiter import (
+    AdaptiveConcurrency,
+    BedrockRateLimiter,
+    TokenBucket,
+)
+
+
+def throttling_error():
+    """Bedrock ThrottlingException."""
+    return ClientError({"Error": {"Code": "ThrottlingException", "Message": "slow down"}}, "InvokeModel")
+
+
+class TestBuckets:
+    """토큰 버킷 테스트."""
+
+    def test_reservations_wait_for_refill(self):
+        """용량을 넘는 예약은 부족분만큼 기다려야 하고, 환불은 대기를 줄여야 함."""
+        bucket = TokenBucket(rate=10, capacity=10)
+        assert bucket.reserve(10) == 0
+        assert bucket.reserve(5) == pytest.approx(0.5, abs=0.05)
+
+        bucket.refund(5)
+        assert bucket.reserve(1) == pytest.approx(0.1, abs=0.05)
+
+    @pytest.mark.asyncio
+    async def test_request_rate_is_enforced(self):
+        """초당 요청 수를 넘는 호출은 버킷이 채워질 때까지 지연되어야 함."""
+        limiter = BedrockRateLimiter(requests_per_second=20, initial_concurrency=32)
+
+        async def call():
+            async with limiter.limit():
+                pass
+
+        start = time.perf_counter()
+        await asyncio.gather(*(call() for _ in range(30)))
+        assert time.perf_counter() - start >= 0.45
+        assert limiter.get_stats()["admitted"] == 30
+
+    @pytest.mark.asyncio
+    async def test_token_budget_is_settled(self):
+        """예약한 토큰 중 쓰지 않은 만큼은 반환되어야 함."""
+        limiter = BedrockRateLimiter(tokens_per_minute=6000)
+        async with limiter.limit(5000) as permit:
+            permit.settle(1000)
+        assert limiter.get_stats()["available_tokens"] >= 5000
+
+
+class TestAdaptiveConcurrency:
+    """AIMD 동시성 테스트."""
+
+    def test_throttling_halves_and_success_grows(self):
+        """스로틀링은 한도를 절반으로, 성공은 한도를 조금씩 늘려야 함."""
+        concurrency = AdaptiveConcurrency(initial=8, cooldown_seconds=10)
+        assert concurrency.on_throttle() is True
+        assert concurrency.limit == 4
+        # 쿨다운 동안의 연속 스로틀링은 한 번만 반영
+        assert concurrency.on_throttle() is False
+        # 한도만큼 성공할 때마다 약 1씩 증가
+        for _ in range(5):
+            concurrency.on_success()
+        assert int(concurrency.limit) == 5
+
+    @pytest.mark.asyncio
+    async def test_in_flight_calls_never_exceed_limit(self):
+        """동시에 실행되는 호출 수가 한도를 넘지 않아야 함."""
+        limiter = BedrockRateLimiter(requests_per_second=1000, initial_concurrency=3, max_concurrency=3)
+        running = []
+        peak = 0
+
+        async def call():
+            nonlocal peak
+            async with limiter.limit():
+                running.append(1)
+                peak = max(peak, len(running))
+                await asyncio.sleep(0.02)
+                running.pop()
+
+        await asyncio.gather(*(call() for _ in range(12)))
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_throttled_calls_lower_the_limit(self):
+        """블록 안의 ThrottlingException은 한도를 낮추고 그대로 전파되어야 함."""
+        limiter = BedrockRateLimiter(initial_concurrency=8)
+        with pytest.raises(ClientError):
+            async with limiter.limit():
+                raise throttling_error()
+
+        stats = limiter.get_stats()
+        assert stats["concurrency_limit"] == 4
+        assert stats["throttle_rate"] == 1.0
+        assert stats["in_flight"] == 0
+
+    def test_slots_are_shared_across_event_loops(self):
+        """다른 스레드의 이벤트 루프에서 기다리던 호출도 슬롯 반환 시 깨어나야 함."""
+        concurrency = AdaptiveConcurrency(initial=1)
+        acquired = threading.Event()
+
+        async def hold():
+            await concurrency.acquire()
+            await asyncio.sleep(0.1)
+            concurrency.release()
+
+        async def wait():
+            await concurrency.acquire()
+            acquired.set()
+            concurrency.release()
+
+        holder = threading.Thread(target=asyncio.run, args=(hold(),))
+        holder.start()
+        time.sleep(0.02)
+        asyncio.run(wait())
+        holder.join()
+        assert acquired.is_set()
+        assert concurrency.in_flight == 0
+
+
+class ThrottlingTransport:
+    """항상 스로틀링하는 전송 계층."""
+
+    async def invoke_model(self, model_id, body):
+        raise throttling_error()
+
+
+class TestProviderIntegration:
+    """Provider 연동 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_provider_reports_throttling_to_limiter(self):
+        """BedrockAIProvider의 스로틀링이 공유 limiter에 반영되어야 함."""
+        limiter = BedrockRateLimiter(initial_concurrency=8)
+        provider = BedrockAIProvider(model="claude-2", rate_limiter=limiter)
+        provider.response_cache = None
+        provider.transport = ThrottlingTransport()
+
+        with pytest.raises(Exception, match="ThrottlingException"):
+            await provider.complete("hello", max_retries=1)
+
+        stats = limiter.get_stats()
+        assert stats["throttled"] == 1
+        assert stats["concurrency_limit"] == 4
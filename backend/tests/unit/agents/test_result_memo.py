@@ -0,0 +1,145 @@
+"""증분 Evolution Loop 테스트.
+
+프로젝트 파일 digest의 변경 감지와 재해시 최소화, 입력 fingerprint 기반
+결과 재사용, 변경된 에이전트와 그 후속 에이전트만 다시 실행하는지 검증합니다.
+"""
+
+import pytest
+
+from backend.packages.aws_agent_squad.core.agent_runtime import AgentRuntime, RuntimeConfig
+from backend.packages.aws_agent_squad.core.result_memo import ProjectDigest, ResultMemo
+from backend.packages.aws_agent_squad.core.squad_orchestrator import (
+    ExecutionStrategy,
+    SquadConfig,
+    SquadOrchestrator,
+)
+
+
+class TestProjectDigest:
+    """프로젝트 digest 테스트."""
+
+    def test_digest_tracks_content_and_skips_ignored_paths(self, tmp_path):
+        """내용이 바뀌면 digest가 바뀌고 캐시/출력 디렉토리는 무시해야 함."""
+        (tmp_path / 'main.py').write_text("print('a')")
+        (tmp_path / '__pycache__').mkdir()
+        (tmp_path / 'reports').mkdir()
+        digest = ProjectDigest()
+
+        before = digest.snapshot(str(tmp_path), [str(tmp_path / 'reports')])
+        (tmp_path / '__pycache__' / 'main.pyc').write_bytes(b'x')
+        (tmp_path / 'reports' / 'loop_1.json').write_text('{}')
+        unchanged = digest.snapshot(str(tmp_path), [str(tmp_path / 'reports')])
+        (tmp_path / 'main.py').write_text("print('b')")
+        changed = digest.snapshot(str(tmp_path), [str(tmp_path / 'reports')])
+
+        assert before == unchanged != changed
+        assert list(digest.files) == ['main.py']
+        assert digest.snapshot(None) == ProjectDigest().snapshot('/nonexistent')
+
+    def test_unchanged_files_are_not_rehashed(self, tmp_path, monkeypatch):
+        """(mtime, 크기)가 같은 파일은 다시 읽지 않아야 함."""
+        for name in ('a.py', 'b.py'):
+            (tmp_path / name).write_text(name)
+        digest = ProjectDigest()
+        digest.snapshot(str(tmp_path))
+
+        opened = []
+        real_open = open
+        monkeypatch.setattr('builtins.open', lambda path, *args, **kwargs: opened.append(path) or real_open(path, *args, **kwargs))
+        (tmp_path / 'b.py').write_text('changed b')
+        digest.snapshot(str(tmp_path))
+
+        assert opened == [str(tmp_path / 'b.py')]
+
+
+class TestResultMemo:
+    """결과 저장소 테스트."""
+
+    def test_volatile_fields_do_not_change_the_fingerprint(self):
+        """반복 번호/이전 결과/공유 컨텍스트는 fingerprint에 영향이 없어야 함."""
+        memo = ResultMemo()
+        task = {'type': 'upgrade', 'description': 'add cache'}
+
+        first = memo.input_fingerprint('GapAnalyzer', task, {'StaticAnalyzer': 'd1'})
+        again = memo.input_fingerprint(
+            'GapAnalyzer', {**task, 'iteration': 2, 'previous_results': {}, 'shared_context': {'x': 1}},
+            {'StaticAnalyzer': 'd1'}
+        )
+
+        assert first == again
+        assert first != memo.input_fingerprint('GapAnalyzer', task, {'StaticAnalyzer': 'd2'})
+        assert memo.input_fingerprint('GapAnalyzer', task, {}, 'p1') == memo.input_fingerprint('GapAnalyzer', task, {}, 'p2')
+        assert memo.input_fingerprint('StaticAnalyzer', task, {}, 'p1') != memo.input_fingerprint('StaticAnalyzer', task, {}, 'p2')
+
+    def test_errors_are_not_memoized(self):
+        """에러 결과는 저장하지 않아 다음에 다시 실행되어야 함."""
+        memo = ResultMemo()
+        memo.store('A', 'k', {'error': 'boom'})
+
+        assert memo.lookup('A', 'k') == (False, None)
+
+
+class TestIncrementalEvolutionLoop:
+    """SquadOrchestrator 증분 실행 테스트."""
+
+    def make_orchestrator(self, project, incremental=True):
+        orchestrator = SquadOrchestrator(
+            AgentRuntime(RuntimeConfig()),
+            SquadConfig(
+                name='test', strategy=ExecutionStrategy.EVOLUTION_LOOP, max_iterations=3,
+                enable_incremental=incremental
+            )
+        )
+        calls = []
+
+        def make_agent(name):
+            async def agent(task):
+                calls.append(name)
+                if name == 'StaticAnalyzer':
+                    return {'lines': len((project / 'main.py').read_text().splitlines())}
+                if name == 'GapAnalyzer':
+                    return {'gap_score': 0.5}
+                if name == 'CodeGenerator' and 'iteration' not in task.inputs:
+                    # 첫 번째 반복에서만 프로젝트 파일 수정
+                    with open(project / 'main.py', 'a') as f:
+                        f.write("print('more')\n")
+                return {'agent': name}
+            return agent
+
+        for name in ('RequirementAnalyzer', 'StaticAnalyzer', 'QualityGate', 'ExternalResearcher',
+                     'GapAnalyzer', 'PlannerAgent', 'CodeGenerator'):
+            orchestrator.register_agent(name, make_agent(name))
+        return orchestrator, calls
+
+    @pytest.mark.asyncio
+    async def test_only_changed_inputs_are_rerun(self, tmp_path):
+        """파일이 바뀐 반복은 프로젝트를 읽는 에이전트와 보고서가 바뀐 후속만, 그 다음 반복은 분석을 모두 재사용해야 함."""
+        project = tmp_path / 'project'
+        project.mkdir()
+        (project / 'main.py').write_text("print('a')\n")
+        orchestrator, calls = self.make_orchestrator(project)
+
+        results = await orchestrator.execute_squad({'type': 'evolve', 'project_path': str(project)})
+
+        schedules = [iteration['schedule'] for iteration in results['iterations']]
+        analysis = {'RequirementAnalyzer', 'StaticAnalyzer', 'QualityGate', 'ExternalResearcher', 'GapAnalyzer'}
+        assert schedules[0]['reused'] == []
+        # 2번째 반복: 요구사항은 재사용, 파일을 읽는 상태 분석은 재실행 → 보고서가 바뀌어 후속도 재실행
+        assert set(schedules[1]['reused']) == {'RequirementAnalyzer'}
+        # 3번째 반복: 파일 변경 없음 → 분석 단계 전체 재사용
+        assert set(schedules[2]['reused']) == analysis
+        assert calls.count('StaticAnalyzer') == 2
+        assert calls.count('CodeGenerator') == 3
+        assert results['iterations'][2]['current_state'][0] == {'lines': 2}
+        assert results['incremental']['agents']['RequirementAnalyzer'] == {'hits': 2, 'misses': 1}
+
+    @pytest.mark.asyncio
+    async def test_incremental_can_be_disabled(self, tmp_path):
+        """enable_incremental=False면 매 반복 모든 에이전트를 실행해야 함."""
+        (tmp_path / 'main.py').write_text("print('a')\n")
+        orchestrator, calls = self.make_orchestrator(tmp_path, incremental=False)
+
+        results = await orchestrator.execute_squad({'type': 'evolve', 'project_path': str(tmp_path)})
+
+        assert calls.count('RequirementAnalyzer') == 3
+        assert all(iteration['schedule']['reused'] == [] for iteration in results['iterations'])
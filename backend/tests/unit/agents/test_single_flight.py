@@ -0,0 +1,120 @@
+"""Single-flight 요청 합치기 테스트.
+
+동시에 들어온 동일 요청의 공유, 에러/취소 전파, 통계, BedrockAIProvider 연동을 검증합니다.
+"""
+
+import asyncio
+
+import pytest
+
+from backend.packages.agents.ai_cache import AIResponseCache
+from backend.packages.agents.ai_providers import BedrockAIProvider
+from backend.packages.agents.single_flight import SingleFlight, coalesced_completion
+
+
+class SlowProvider:
+    """호출 횟수를 세는 느린 테스트용 Provider."""
+
+    default_model_id = "test-model"
+
+    def __init__(self):
+        self.single_flight = SingleFlight()
+        self.calls = 0
+
+    @coalesced_completion
+    async def complete(self, prompt, system=None, max_tokens=4096, temperature=0.7, model_id=None):
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        if prompt == "fail":
+            raise RuntimeError("bedrock failed")
+        return f"answer {self.calls}: {prompt}"
+
+
+class CountingTransport:
+    """호출 횟수를 세는 전송 계층."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def invoke_model(self, model_id, body):
+        self.calls += 1
+        await asyncio.sleep(0.05)
+        return {"content": [{"type": "text", "text": "shared"}]}
+
+
+class TestSingleFlight:
+    """요청 합치기 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_calls_share_one_invocation(self):
+        """동시에 들어온 동일 요청은 한 번만 실행되고 결과를 공유해야 함."""
+        provider = SlowProvider()
+
+        results = await asyncio.gather(*(provider.complete("p", system="s") for _ in range(5)))
+        assert results == ["answer 1: p"] * 5
+        assert provider.calls == 1
+
+        stats = provider.single_flight.get_stats()
+        assert (stats["calls"], stats["executed"], stats["coalesced"]) == (5, 1, 4)
+        assert stats["coalesce_rate"] == 0.8
+        assert stats["in_flight"] == 0
+
+    @pytest.mark.asyncio
+    async def test_different_or_sequential_calls_are_not_shared(self):
+        """매개변수가 다르거나 앞 호출이 끝난 뒤의 요청은 따로 실행되어야 함."""
+        provider = SlowProvider()
+
+        await asyncio.gather(
+            provider.complete("p"),
+            provider.complete("p", temperature=0.0),
+            provider.complete("q"),
+        )
+        await provider.complete("p")
+        assert provider.calls == 4
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_every_waiter(self):
+        """공유 호출의 에러는 모든 대기자에게 전달되어야 함."""
+        provider = SlowProvider()
+
+        results = await asyncio.gather(
+            *(provider.complete("fail") for _ in range(3)), return_exceptions=True
+        )
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert provider.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_the_others(self):
+        """먼저 호출한 쪽이 취소되어도 나머지 대기자는 결과를 받아야 함."""
+        provider = SlowProvider()
+
+        first = asyncio.ensure_future(provider.complete("p"))
+        second = asyncio.ensure_future(provider.complete("p"))
+        await asyncio.sleep(0.01)
+        first.cancel()
+
+        assert await second == "answer 1: p"
+        assert first.cancelled()
+
+
+class TestProviderIntegration:
+    """BedrockAIProvider 연동 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_bedrock_provider_coalesces_calls(self):
+        """BedrockAIProvider.complete의 동일 동시 요청은 Bedrock을 한 번만 호출해야 함."""
+        provider = BedrockAIProvider(model="claude-2", response_cache=AIResponseCache(db_path=None))
+        provider.single_flight = SingleFlight()
+        provider.transport = CountingTransport()
+
+        results = await asyncio.gather(*(provider.complete("hello", temperature=0.7) for _ in range(4)))
+        assert results == ["shared"] * 4
+        assert provider.transport.calls == 1
+        assert provider.get_coalescing_stats()["coalesced"] == 3
+
+        # 캐시를 끈 요청은 캐시를 쓴 요청과 합쳐지지 않음
+        await asyncio.gather(
+            provider.complete("hello", temperature=0.0),
+            provider.complete("hello", temperature=0.0, use_cache=False),
+        )
+        assert provider.transport.calls == 3
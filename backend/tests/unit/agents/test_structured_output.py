@@ -0,0 +1,158 @@
+"""구조화 출력 파싱 테스트.
+
+코드 펜스/산문 속 JSON 추출, 잘린 응답의 기계적 복구, 스트리밍 복구,
+pydantic 스키마 검증과 깨진 부분만 다시 묻는 재요청, 에이전트별 실패율 집계를 검증합니다.
+"""
+
+import json
+import re
+from typing import Any, Dict, List
+
+import pytest
+from pydantic import BaseModel
+
+from backend.packages.agents.structured_output import (
+    IncrementalJSONParser,
+    ParseMetrics,
+    StructuredOutputError,
+    StructuredOutputParser,
+    extract_json,
+    loads_lenient,
+    repair_json,
+    set_pointer,
+)
+
+
+class Plan(BaseModel):
+    goals: List[str]
+    tasks: List[Dict[str, Any]]
+
+
+class FixingProvider:
+    """재요청 프롬프트를 기록하고 정해진 답(또는 프롬프트로 만든 답)을 돌려주는 테스트용 Provider."""
+
+    def __init__(self, answer):
+        self.answer = answer
+        self.prompts = []
+
+    async def complete(self, prompt, **kwargs):
+        self.prompts.append(prompt)
+        return self.answer(prompt) if callable(self.answer) else self.answer
+
+
+def make_parser(schema=Plan):
+    """독립된 메트릭을 쓰는 파서."""
+    return StructuredOutputParser("PlannerAgent", schema, metrics=ParseMetrics())
+
+
+class TestRepair:
+    """추출과 기계적 복구 테스트."""
+
+    def test_json_is_extracted_from_fences_and_prose(self):
+        """코드 펜스와 산문 속 JSON을 꺼내야 하며 산문의 짧은 괄호에 가려지면 안 됨."""
+        assert extract_json('Here you go:\n```json\n{"a": 1}\n```\nDone.') == '{"a": 1}'
+        assert extract_json('See [1] below: {"a": [2]} thanks') == '{"a": [2]}'
+        assert extract_json("no json here") == ""
+
+    @pytest.mark.parametrize("broken, expected", [
+        ('{"a": 1, "b": [1, 2,],}', {"a": 1, "b": [1, 2]}),
+        ('{"tasks": [{"id": "t1"}, {"id": "t2", "na', {"tasks": [{"id": "t1"}, {"id": "t2"}]}),
+        ('{"summary": "cut off mid', {"summary": "cut off mid"}),
+        ('{"a": 1, "b":', {"a": 1}),
+        ('{"ok": True, "value": None, "flag": fal', {"ok": True, "value": None}),
+        ('[{"id": 0, "risk_score": 45}, {"id": 1, "risk_score": 7', [{"id": 0, "risk_score": 45}, {"id": 1}]),
+        ('{"scores": [10, 2', {"scores": [10]}),
+        ('{"text": "line one\nline two"}', {"text": "line one\nline two"}),
+    ])
+    def test_truncated_and_sloppy_json_is_repaired(self, broken, expected):
+        """잘린 문자열/배열/객체, 끝 쉼표, Python 리터럴, 줄바꿈을 복구하고 잘린 숫자/리터럴은 버려야 함."""
+        assert json.loads(repair_json(broken)) == expected
+        assert loads_lenient(broken) == (expected, True)
+
+    def test_streamed_json_is_available_before_the_end(self):
+        """스트리밍 중에도 지금까지 받은 부분의 값을 얻을 수 있어야 함."""
+        parser = IncrementalJSONParser()
+
+        assert parser.feed("Plan:\n```json\n") is None
+        assert parser.feed('{"tasks": [{"id": "t1"}, {"id"') == {"tasks": [{"id": "t1"}, {}]}
+        assert parser.feed(': "t2"}]}\n```') == {"tasks": [{"id": "t1"}, {"id": "t2"}]}
+        assert parser.complete
+        assert parser.close() == {"tasks": [{"id": "t1"}, {"id": "t2"}]}
+
+    def test_set_pointer_creates_missing_containers(self):
+        """JSON Pointer로 중간 객체를 만들며 값을 설정해야 함."""
+        document = {"tasks": [{"id": "t1"}]}
+        set_pointer(document, "/tasks/0/name", "build")
+        set_pointer(document, "/tasks/1", {"id": "t2"})
+        set_pointer(document, "/meta/owner", "planner")
+
+        assert document == {
+            "tasks": [{"id": "t1", "name": "build"}, {"id": "t2"}],
+            "meta": {"owner": "planner"},
+        }
+
+
+class TestStructuredOutputParser:
+    """스키마 검증과 재요청 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_valid_and_repaired_answers_need_no_reask(self):
+        """복구 가능한 응답은 재요청 없이 스키마 객체로 반환되어야 함."""
+        parser = make_parser()
+        provider = FixingProvider("unused")
+
+        plan = await parser.parse_with_reask('{"goals": ["a"], "tasks": []}', provider)
+        repaired = await parser.parse_with_reask('```json\n{"goals": ["a"], "tasks": [{"id": 1},', provider)
+
+        assert plan.goals == ["a"]
+        assert repaired.tasks == [{"id": 1}]
+        assert provider.prompts == []
+        stats = parser.metrics.get_stats()["PlannerAgent"]
+        assert (stats["parsed"], stats["repaired"], stats["failure_rate"]) == (1, 1, 0.0)
+
+    @pytest.mark.asyncio
+    async def test_invalid_fields_are_reasked_by_pointer(self):
+        """스키마 오류는 깨진 필드만 JSON Pointer로 다시 묻고 답을 끼워 넣어야 함."""
+        parser = make_parser()
+        provider = FixingProvider('{"/goals/1": "ship v2", "/tasks": []}')
+        answer = json.dumps({"goals": ["ship v1", {"title": "ship v2"}], "notes": "x" * 500})
+
+        plan = await parser.parse_with_reask(answer, provider)
+
+        assert plan.goals == ["ship v1", "ship v2"]
+        assert plan.tasks == []
+        prompt = provider.prompts[0]
+        assert "/goals/1" in prompt and "/tasks" in prompt
+        assert "x" * 500 not in prompt
+        assert parser.metrics.get_stats()["PlannerAgent"]["reasked"] == 1
+
+    @pytest.mark.asyncio
+    async def test_syntax_errors_reask_only_the_broken_excerpt(self):
+        """복구 불가능한 문법 오류는 주변 발췌만 보내고 고친 발췌를 다시 끼워야 함."""
+        parser = make_parser(Dict[str, Any])
+        head = '{"padding": "' + "p" * 400 + '", '
+        provider = FixingProvider(lambda prompt: "```\n{}\n```".format(
+            re.search(r"<excerpt>\n(.*)\n</excerpt>", prompt, re.DOTALL).group(1).replace('"goals" [', '"goals": [')
+        ))
+
+        value = await parser.parse_with_reask(head + '"goals" ["a"], "tasks": []}', provider)
+
+        assert value["goals"] == ["a"]
+        assert "p" * 400 not in provider.prompts[0]
+
+    @pytest.mark.asyncio
+    async def test_unrecoverable_answers_are_counted_as_failures(self):
+        """JSON이 없거나 재요청도 실패하면 예외를 던지고 실패로 집계해야 함."""
+        parser = make_parser()
+        provider = FixingProvider("still not json")
+
+        with pytest.raises(StructuredOutputError):
+            await parser.parse_with_reask("I cannot answer in JSON.", provider)
+        with pytest.raises(StructuredOutputError):
+            await parser.parse_with_reask('{"goals": "a"}', provider)
+        with pytest.raises(StructuredOutputError):
+            parser.parse('{"goals": []}')
+
+        assert len(provider.prompts) == 1  # 답에 JSON이 없으면 재요청하지 않음
+        stats = parser.metrics.get_stats()["PlannerAgent"]
+        assert (stats["calls"], stats["failed"], stats["unrecovered_rate"]) == (3, 3, 1.0)
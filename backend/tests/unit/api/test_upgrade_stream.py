@@ -0,0 +1,62 @@
+"""업그레이드 API 스트리밍 엔드포인트 테스트.
+
+분석 스레드에서 발행한 AI 출력 조각이 SSE로 전달되는지 검증합니다.
+"""
+
+import json
+import threading
+
+import httpx
+import pytest
+
+from backend.api import upgrade_api
+
+
+def parse_events(body):
+    """SSE 본문을 (event, data) 목록으로 변환."""
+    events = []
+    for block in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines() if not line.startswith(":"))
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+@pytest.fixture
+async def client():
+    """API 앱에 연결된 HTTP 클라이언트 (startup 이벤트 없이)."""
+    transport = httpx.ASGITransport(app=upgrade_api.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+class TestTaskStream:
+    """작업 출력 스트림 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_chunks_from_worker_thread_are_streamed(self, client):
+        """다른 스레드에서 발행한 조각과 종료 이벤트가 SSE로 전달되어야 함."""
+        stream = upgrade_api.open_task_stream("task_stream_test")
+
+        def worker():
+            stream.publish_chunk("GapAnalyzer", "Hello")
+            stream.publish_chunk("GapAnalyzer", " world")
+            stream.close("completed")
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        response = await client.get("/api/upgrade/stream/task_stream_test")
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert parse_events(response.text) == [
+            ("token", {"event": "token", "agent": "GapAnalyzer", "text": "Hello"}),
+            ("token", {"event": "token", "agent": "GapAnalyzer", "text": " world"}),
+            ("end", {"event": "end", "status": "completed"}),
+        ]
+        upgrade_api.task_streams.pop("task_stream_test")
+
+    @pytest.mark.asyncio
+    async def test_unknown_task(self, client):
+        """없는 작업은 404."""
+        response = await client.get("/api/upgrade/stream/missing")
+        assert response.status_code == 404
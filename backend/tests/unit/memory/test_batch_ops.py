@@ -0,0 +1,162 @@
+"""MemoryHub 일괄 처리 API 테스트.
+
+put_many/get_many/delete_many가 컨텍스트당 한 번만 저장하는지와
+BaseAgent.write_memory_batch의 컨텍스트별 묶음 저장을 검증합니다.
+"""
+
+import asyncio
+
+import pytest
+
+from backend.packages.agents.base import AgentResult, AgentTask, BaseAgent, TaskStatus
+from backend.packages.agents.code_generator import CodeGenerator, GeneratedCode
+from backend.packages.memory.contexts import ContextType
+from backend.packages.memory.hub import MemoryHub
+from backend.packages.memory.storage import JSONMemoryStorage, SQLiteMemoryStorage
+
+
+class CountingStorage(JSONMemoryStorage):
+    """저장 호출을 기록하는 JSON 저장소."""
+
+    def __init__(self, base_path: str) -> None:
+        super().__init__(base_path)
+        self.calls = []
+
+    async def save_entry(self, context, entry):
+        self.calls.append(("save_entry", context.type, [entry.key], []))
+        return await super().save_entry(context, entry)
+
+    async def apply_mutations(self, context, changed, deleted):
+        self.calls.append(("apply_mutations", context.type, [e.key for e in changed], list(deleted)))
+        return await super().apply_mutations(context, changed, deleted)
+
+
+class EchoAgent(BaseAgent):
+    """테스트용 에이전트."""
+
+    async def execute(self, task: AgentTask) -> AgentResult:
+        return self.format_result(True, data=task.inputs)
+
+
+class TestBatchOperations:
+    """일괄 처리 API 테스트."""
+
+    @pytest.fixture
+    async def hub(self, tmp_path):
+        """호출을 기록하는 저장소를 사용하는 메모리 허브."""
+        hub = MemoryHub(storage=CountingStorage(str(tmp_path)), auto_cleanup_interval=0)
+        await hub.initialize()
+        yield hub
+        await hub.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_put_many_persists_once(self, hub):
+        """put_many는 여러 값을 저장소 호출 한 번으로 저장해야 함."""
+        assert await hub.put_many(ContextType.S_CTX, [
+            {"key": "a", "value": 1, "tags": ["x"]},
+            {"key": "b", "value": 2, "ttl_seconds": 60},
+            {"key": "a", "value": 3},
+        ])
+
+        assert hub.storage.calls == [("apply_mutations", ContextType.S_CTX, ["a", "b"], [])]
+        assert await hub.get_many(ContextType.S_CTX, ["a", "b", "missing"]) == {"a": 3, "b": 2}
+        assert [r["key"] for r in await hub.search(ContextType.S_CTX, tags=["x"])] == ["a"]
+
+    @pytest.mark.asyncio
+    async def test_put_many_with_eviction_persists_deletes(self, tmp_path):
+        """배치 중 축출된 엔트리는 삭제로만 저장되어야 함."""
+        hub = MemoryHub(storage=CountingStorage(str(tmp_path)), auto_cleanup_interval=0,
+                        eviction_policy="lru", context_limits={ContextType.A_CTX: {"max_entries": 2}})
+        await hub.initialize()
+        await hub.put(ContextType.A_CTX, "old", 0)
+        hub.storage.calls.clear()
+
+        await hub.put_many(ContextType.A_CTX, [{"key": f"k{i}", "value": i} for i in range(3)])
+
+        assert hub.storage.calls == [
+            ("apply_mutations", ContextType.A_CTX, ["k1", "k2"], ["old", "k0"])
+        ]
+        await hub.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_delete_many(self, hub):
+        """delete_many는 삭제된 수를 반환하고 한 번만 저장해야 함."""
+        await hub.put_many(ContextType.U_CTX, [{"key": k, "value": k} for k in "abc"])
+        hub.storage.calls.clear()
+
+        assert await hub.delete_many(ContextType.U_CTX, ["a", "c", "missing", "a"]) == 2
+        assert hub.storage.calls == [("apply_mutations", ContextType.U_CTX, [], ["a", "c"])]
+        assert await hub.get_many(ContextType.U_CTX, ["a", "b", "c"]) == {"b": "b"}
+
+    @pytest.mark.asyncio
+    async def test_sqlite_batch_operations(self, tmp_path):
+        """SQLite 저장소에서도 일괄 처리가 동작해야 함."""
+        hub = MemoryHub(storage=SQLiteMemoryStorage(str(tmp_path / "memory.db")),
+                        auto_cleanup_interval=0)
+        await hub.initialize()
+        await hub.put(ContextType.O_CTX, "a", 0, metadata={"first": True})
+
+        assert await hub.put_many(ContextType.O_CTX, [
+            {"key": "a", "value": 1, "metadata": {"second": True}},
+            {"key": "b", "value": 2, "tags": ["t"]},
+        ])
+        assert await hub.get_many(ContextType.O_CTX, ["a", "b", "c"]) == {"a": 1, "b": 2}
+        results = await hub.search(ContextType.O_CTX, tags=["t"])
+        assert [r["key"] for r in results] == ["b"]
+
+        assert await hub.delete_many(ContextType.O_CTX, ["a", "b", "c"]) == 2
+        assert await hub.get_many(ContextType.O_CTX, ["a", "b"]) == {}
+        await hub.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_log_execution_uses_one_write_per_context(self, hub):
+        """log_execution은 컨텍스트별로 한 번씩만 저장해야 함."""
+        agent = EchoAgent(name="EchoAgent", memory_hub=hub)
+        task = AgentTask(intent="echo", inputs={"x": 1})
+        await agent.log_execution(task, AgentResult(success=True, status=TaskStatus.COMPLETED))
+
+        assert sorted((call[0], call[1].value) for call in hub.storage.calls) == [
+            ("apply_mutations", ContextType.A_CTX.value),
+            ("apply_mutations", ContextType.S_CTX.value),
+        ]
+        latest = await hub.get(ContextType.S_CTX, f"latest_execution_{agent.agent_id}")
+        assert latest["task_intent"] == "echo"
+
+    @pytest.mark.asyncio
+    async def test_generated_codes_are_stored_in_one_write(self, hub):
+        """생성된 코드는 성공한 것만 한 번에 저장되어야 함."""
+        generator = CodeGenerator(memory_hub=hub)
+        await generator._store_generated_codes([
+            GeneratedCode(success=True, component_name="a", code="A"),
+            GeneratedCode(success=False, component_name="b", error="boom"),
+            GeneratedCode(success=True, component_name="c", code="C"),
+        ])
+
+        assert hub.storage.calls == [
+            ("apply_mutations", ContextType.A_CTX, ["generated:a", "generated:c"], [])
+        ]
+        assert await hub.get_many(ContextType.A_CTX, ["generated:a", "generated:b", "generated:c"]) == {
+            "generated:a": "A",
+            "generated:c": "C",
+        }
+
+    @pytest.mark.asyncio
+    async def test_write_memory_batch_writes_contexts_concurrently(self, hub):
+        """컨텍스트별 저장은 순차가 아니라 동시에 실행되어야 함."""
+        in_flight = []
+        save = hub.storage.apply_mutations
+
+        async def slow_apply(context, changed, deleted):
+            in_flight.append(context.type)
+            await asyncio.sleep(0.01)
+            result = await save(context, changed, deleted)
+            in_flight.append(None)
+            return result
+
+        hub.storage.apply_mutations = slow_apply
+        agent = EchoAgent(name="EchoAgent", memory_hub=hub)
+        assert await agent.write_memory_batch([
+            {"context_type": ContextType.A_CTX, "key": "a", "value": 1},
+            {"context_type": ContextType.S_CTX, "key": "s", "value": 2},
+        ])
+        assert in_flight[:2] == [ContextType.A_CTX, ContextType.S_CTX]
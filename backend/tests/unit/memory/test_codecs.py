@@ -0,0 +1,86 @@
+"""메모리 codec 테스트.
+
+codec별 datetime 왕복, JSONMemoryStorage의 codec 선택, 문서 컨텍스트 내보내기를 검증합니다.
+"""
+
+from datetime import datetime
+
+import pytest
+
+from backend.packages.memory.codecs import JSONCodec, get_codec
+from backend.packages.memory.contexts import ContextType, MemoryContext
+from backend.packages.memory.document_context import SharedDocumentContext
+from backend.packages.memory.storage import JSONMemoryStorage, get_memory_storage
+
+
+SAMPLE = {
+    "created_at": datetime(2025, 1, 2, 3, 4, 5, 678901),
+    "nested": [{"when": datetime(2024, 12, 31)}, "텍스트", 1.5, None, True],
+    "count": 3,
+}
+
+
+class TestCodecs:
+    """Codec 테스트."""
+
+    @pytest.mark.parametrize("name", ["json", "orjson"])
+    def test_roundtrip_restores_datetimes(self, name):
+        """인코딩 후 디코딩하면 datetime이 복원되어야 함."""
+        pytest.importorskip(name)
+        codec = get_codec(name)
+        assert codec.decode(codec.encode(SAMPLE)) == SAMPLE
+
+    def test_msgpack_roundtrip(self):
+        """msgpack codec도 datetime을 복원해야 함."""
+        pytest.importorskip("msgpack")
+        codec = get_codec("msgpack")
+        payload = codec.encode(SAMPLE)
+        assert codec.decode(payload) == SAMPLE
+        assert len(payload) < len(JSONCodec().encode(SAMPLE))
+
+    def test_json_codec_matches_legacy_format(self):
+        """기본 json codec은 기존 indent=2 형식과 동일해야 함."""
+        import json
+
+        data = {"type": "o_ctx", "entries": [{"key": "k", "value": "값"}]}
+        assert get_codec().encode(data) == json.dumps(data, indent=2).encode()
+
+    def test_unknown_codec(self):
+        """알 수 없는 codec 이름은 ValueError."""
+        with pytest.raises(ValueError):
+            get_codec("yaml")
+
+
+class TestCodecStorage:
+    """Codec을 사용하는 저장소 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_orjson_storage_roundtrip(self, tmp_path):
+        """orjson codec으로 저장한 컨텍스트를 다시 읽을 수 있어야 함."""
+        pytest.importorskip("orjson")
+        storage = JSONMemoryStorage(str(tmp_path), codec="orjson")
+        context = MemoryContext(type=ContextType.O_CTX)
+        context.add_entry("report", {"score": 0.9}, tags=["r"], ttl_seconds=60)
+        assert await storage.save_context(context) is True
+
+        loaded = await storage.load_context(ContextType.O_CTX)
+        entry = loaded.entries["report"]
+        assert entry.value == {"score": 0.9}
+        assert entry.created_at == context.entries["report"].created_at
+        assert b"\n" not in (tmp_path / f"{ContextType.O_CTX.value}.json").read_bytes()
+
+    def test_factory_reads_codec_from_env(self, tmp_path, monkeypatch):
+        """MEMORY_CODEC 환경변수로 json 저장소의 codec을 지정할 수 있어야 함."""
+        pytest.importorskip("orjson")
+        monkeypatch.setenv("MEMORY_CODEC", "orjson")
+        storage = get_memory_storage("json", {"base_path": str(tmp_path)})
+        assert storage.codec.name == "orjson"
+
+    def test_document_context_export_bytes(self):
+        """문서 컨텍스트는 codec으로 내보내고 가져올 수 있어야 함."""
+        source = SharedDocumentContext()
+        source.add_document("StaticAnalyzer", {"issues": 3}, "analysis")
+
+        target = SharedDocumentContext()
+        target.import_bytes(source.export_bytes("json"), "json")
+        assert target.get_document("StaticAnalyzer")["content"] == {"issues": 3}
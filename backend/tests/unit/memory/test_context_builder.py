@@ -0,0 +1,72 @@
+"""ContextBuilder 테스트.
+
+토큰 예산, 관련도 정렬, 렌더링 조각 캐시를 검증합니다.
+"""
+
+import json
+
+from backend.packages.memory.context_builder import ContextBuilder, estimate_tokens
+from backend.packages.memory.document_context import SharedDocumentContext
+
+
+def make_context() -> SharedDocumentContext:
+    """문서 몇 개가 들어 있는 컨텍스트 생성."""
+    context = SharedDocumentContext()
+    context.add_document("StaticAnalyzer", {"issues": list(range(400))})
+    context.add_document("RequirementAnalyzer", {"requirements": ["로그인", "검색"]})
+    context.add_document("ExternalResearcher", {"notes": "x" * 4000})
+    return context
+
+
+class TestContextBuilder:
+    """ContextBuilder 테스트."""
+
+    def test_unbounded_output_keeps_legacy_shape(self):
+        """예산이 없으면 기존 get_context_for_ai와 같은 구조여야 함."""
+        context = make_context()
+        context.start_new_loop()
+        context.add_document("GapAnalyzer", {"gap": 0.4})
+
+        data = json.loads(context.get_context_for_ai(include_history=True))
+        assert data["current_loop"] == 1
+        assert data["current_documents"]["GapAnalyzer"]["content"] == {"gap": 0.4}
+        assert set(data["previous_loops"][0]["documents"]) == {
+            "StaticAnalyzer", "RequirementAnalyzer", "ExternalResearcher"
+        }
+        assert "omitted_documents" not in data
+
+    def test_relevant_documents_come_first(self):
+        """요청한 에이전트가 참조하는 문서가 먼저 배치되어야 함."""
+        context = make_context()
+        builder = ContextBuilder(context, relevance={"GapAnalyzer": ["RequirementAnalyzer"]})
+
+        order = list(json.loads(builder.build(agent_name="GapAnalyzer"))["current_documents"])
+        assert order[0] == "RequirementAnalyzer"
+
+    def test_overflow_is_summarized_within_budget(self):
+        """예산을 넘는 문서는 요약되거나 생략되고 결과는 예산 안이어야 함."""
+        context = make_context()
+        builder = ContextBuilder(context, relevance={"GapAnalyzer": ["RequirementAnalyzer"]})
+
+        output = builder.build(agent_name="GapAnalyzer", token_budget=300)
+        data = json.loads(output)
+        documents = data["current_documents"]
+        assert "content" in documents["RequirementAnalyzer"]
+        # 나머지는 최신 문서부터 채우므로 ExternalResearcher가 요약으로 들어감
+        assert "content_summary" in documents["ExternalResearcher"]
+        assert data["omitted_documents"] == ["StaticAnalyzer"]
+        assert estimate_tokens(output) < 400
+
+    def test_unchanged_documents_are_not_reserialized(self):
+        """바뀌지 않은 문서는 캐시된 조각을 재사용해야 함."""
+        context = make_context()
+        builder = context.context_builder
+
+        context.get_context_for_ai()
+        misses = builder.get_stats()["misses"]
+        context.get_context_for_ai()
+        assert builder.get_stats()["misses"] == misses
+
+        context.add_document("StaticAnalyzer", {"issues": []})
+        context.get_context_for_ai()
+        assert builder.get_stats()["misses"] == misses + 1
@@ -0,0 +1,71 @@
+"""MemoryContext 인덱스 테스트.
+
+태그 역색인과 만료 힙이 엔트리 추가/삭제/교체에 맞춰 유지되는지 검증합니다.
+"""
+
+from datetime import datetime, timedelta
+
+from backend.packages.memory.contexts import ContextType, MemoryContext, MemoryEntry
+
+
+class TestMemoryContextIndexes:
+    """MemoryContext 인덱스 테스트."""
+
+    def test_search_by_tags_preserves_insertion_order(self):
+        """태그 검색은 OR 조건으로 삽입 순서대로 반환해야 함."""
+        context = MemoryContext(type=ContextType.A_CTX)
+        context.add_entry("a", 1, tags=["x"])
+        context.add_entry("b", 2, tags=["y"])
+        context.add_entry("c", 3, tags=["x", "y"])
+
+        assert [e.key for e in context.search_by_tags(["y", "x"])] == ["a", "b", "c"]
+        assert [e.key for e in context.search_by_tags(["missing"])] == []
+        assert context.tag_counts() == {"x": 2, "y": 2}
+
+    def test_tag_index_follows_remove_and_replace(self):
+        """삭제/교체 시 역색인이 갱신되어야 함."""
+        context = MemoryContext(type=ContextType.A_CTX)
+        context.add_entry("a", 1, tags=["x"])
+        context.add_entry("b", 2, tags=["x"])
+        context.remove_entry("a")
+        context.restore_entry(MemoryEntry(context_type=ContextType.A_CTX, key="b", value=3, tags=["z"]))
+
+        assert context.search_by_tags(["x"]) == []
+        assert [e.value for e in context.search_by_tags(["z"])] == [3]
+        assert context.tag_counts() == {"z": 1}
+
+    def test_pop_expired_only_removes_expired(self):
+        """만료 힙은 만료된 엔트리만 제거해야 함."""
+        context = MemoryContext(type=ContextType.S_CTX)
+        old = MemoryEntry(key="old", ttl_seconds=10,
+                          created_at=datetime.utcnow() - timedelta(seconds=60))
+        context.restore_entry(old)
+        context.add_entry("fresh", 1, ttl_seconds=3600)
+        context.add_entry("permanent", 2)
+
+        assert context.pop_expired() == ["old"]
+        assert set(context.entries) == {"fresh", "permanent"}
+        assert context.pop_expired() == []
+
+    def test_pop_expired_skips_stale_heap_items(self):
+        """제거되거나 교체된 엔트리의 힙 항목은 무시되어야 함."""
+        context = MemoryContext(type=ContextType.S_CTX)
+        past = datetime.utcnow() - timedelta(seconds=60)
+        context.restore_entry(MemoryEntry(key="k", ttl_seconds=10, created_at=past))
+        context.restore_entry(MemoryEntry(key="k", ttl_seconds=3600))
+        context.restore_entry(MemoryEntry(key="gone", ttl_seconds=10, created_at=past))
+        context.remove_entry("gone")
+
+        assert context.pop_expired() == []
+        assert "k" in context.entries
+
+    def test_expired_entries_hidden_from_search(self):
+        """만료된 엔트리는 태그 검색 결과에서 제외되어야 함."""
+        context = MemoryContext(type=ContextType.OBS_CTX)
+        context.restore_entry(MemoryEntry(key="old", ttl_seconds=1, tags=["m"],
+                                          created_at=datetime.utcnow() - timedelta(seconds=5)))
+        context.add_entry("new", 1, tags=["m"])
+
+        assert [e.key for e in context.search_by_tags(["m"])] == ["new"]
+        assert [e.key for e in context.live_entries()] == ["new"]
+        assert context.cleanup_expired() == 1
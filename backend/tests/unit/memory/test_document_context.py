@@ -0,0 +1,107 @@
+"""SharedDocumentContext 버전/증분 스냅샷 테스트.
+
+루프 간 content 공유, 변경분만 담는 델타, 델타 파일 복원을 검증합니다.
+"""
+
+import pytest
+
+from backend.packages.memory.document_context import SharedDocumentContext
+
+
+LARGE_REPORT = {"findings": [{"file": f"module_{i}.py", "line": i} for i in range(200)]}
+
+
+class TestStructuralSharing:
+    """루프 간 구조 공유 테스트."""
+
+    def test_unchanged_content_is_shared_across_loops(self):
+        """내용이 같은 문서는 루프가 바뀌어도 같은 content 객체를 공유해야 함."""
+        context = SharedDocumentContext()
+        for _ in range(12):
+            context.add_document("StaticAnalyzer", dict(LARGE_REPORT), "analysis")
+            context.start_new_loop()
+
+        contents = [loop["StaticAnalyzer"]["content"] for loop in context.get_history()]
+        assert len(contents) == 12
+        assert all(content is contents[0] for content in contents)
+
+    def test_changed_content_is_not_shared(self):
+        """내용이 바뀐 문서는 새 content를 가져야 함."""
+        context = SharedDocumentContext()
+        context.add_document("GapAnalyzer", {"gap": 0.5})
+        context.start_new_loop()
+        context.add_document("GapAnalyzer", {"gap": 0.2})
+
+        assert context.get_history(0)["GapAnalyzer"]["content"] == {"gap": 0.5}
+        assert context.get_document("GapAnalyzer")["content"] == {"gap": 0.2}
+
+
+class TestDeltaSnapshots:
+    """델타 스냅샷 테스트."""
+
+    def test_delta_contains_only_changes(self):
+        """델타에는 마지막 델타 이후 추가된 문서만 있어야 함."""
+        context = SharedDocumentContext()
+        context.add_document("StaticAnalyzer", {"issues": 3})
+        context.add_document("GapAnalyzer", {"gap": 0.5})
+        first = context.export_delta()
+        assert {record["agent"] for record in first["documents"]} == {"StaticAnalyzer", "GapAnalyzer"}
+
+        context.add_document("GapAnalyzer", {"gap": 0.3})
+        second = context.export_delta()
+        assert [record["agent"] for record in second["documents"]] == ["GapAnalyzer"]
+        assert second["base_version"] == first["version"]
+        assert context.has_changes() is False
+
+    def test_unchanged_document_is_recorded_as_reference(self):
+        """이전 루프와 내용이 같은 문서는 content 없이 참조로 기록되어야 함."""
+        context = SharedDocumentContext()
+        context.add_document("StaticAnalyzer", LARGE_REPORT)
+        context.export_delta()
+        context.start_new_loop()
+        context.add_document("StaticAnalyzer", dict(LARGE_REPORT))
+
+        record = context.export_delta()["documents"][0]
+        assert record["same_as_loop"] == 0
+        assert "content" not in record["document"]
+
+    def test_apply_delta_rejects_gaps(self):
+        """이어지지 않는 델타는 ValueError."""
+        source = SharedDocumentContext()
+        source.add_document("StaticAnalyzer", {"issues": 3})
+        source.export_delta()
+        source.add_document("GapAnalyzer", {"gap": 0.5})
+
+        with pytest.raises(ValueError):
+            SharedDocumentContext().apply_delta(source.export_delta())
+
+    def test_incremental_files_restore_context(self, tmp_path):
+        """델타 파일들로 히스토리와 현재 루프를 복원할 수 있어야 함."""
+        source = SharedDocumentContext()
+        for loop in range(3):
+            source.add_document("StaticAnalyzer", LARGE_REPORT)
+            source.add_document("GapAnalyzer", {"gap": 0.5 - loop * 0.1})
+            assert source.save_incremental(tmp_path) is not None
+            source.start_new_loop()
+        source.add_document("GapAnalyzer", {"gap": 0.0})
+        source.save_incremental(tmp_path)
+        assert source.save_incremental(tmp_path) is None
+
+        restored = SharedDocumentContext.load_incremental(tmp_path)
+        assert restored.current_loop_number == 3
+        assert restored.get_history() == source.get_history()
+        assert restored.get_all_documents() == source.get_all_documents()
+        history = restored.get_history()
+        assert history[2]["StaticAnalyzer"]["content"] is history[0]["StaticAnalyzer"]["content"]
+
+    def test_import_data_keeps_version(self):
+        """export_all/import_data 후 이어서 델타를 적용할 수 있어야 함."""
+        source = SharedDocumentContext()
+        source.add_document("StaticAnalyzer", {"issues": 3})
+        target = SharedDocumentContext()
+        target.import_data(source.export_all())
+        source.export_delta()
+
+        source.add_document("GapAnalyzer", {"gap": 0.5})
+        target.apply_delta(source.export_delta())
+        assert target.get_document("GapAnalyzer")["content"] == {"gap": 0.5}
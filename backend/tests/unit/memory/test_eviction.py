@@ -0,0 +1,151 @@
+"""메모리 컨텍스트 크기 계산 및 Eviction 정책 테스트.
+
+용량 초과 시 쓰기를 실패시키는 대신 가장 차가운 엔트리를 제거하는지 검증합니다.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from backend.packages.memory.contexts import ContextType, MemoryContext, MemoryEntry, estimate_size
+from backend.packages.memory.eviction import (
+    LFUEvictionPolicy,
+    LRUEvictionPolicy,
+    TTLFirstEvictionPolicy,
+    get_eviction_policy,
+)
+from backend.packages.memory.hub import MemoryHub
+from backend.packages.memory.storage import JSONMemoryStorage
+
+
+class TestSizeAccounting:
+    """크기 계산 테스트."""
+
+    def test_estimate_matches_compact_json(self):
+        """추정 크기는 compact JSON 직렬화 크기와 같아야 함."""
+        import json
+
+        value = {"a": [1, 2.5, "x"], "b": {"c": None, "d": True}, "e": "한글"}
+        assert estimate_size(value) == len(json.dumps(value, separators=(",", ":"),
+                                                      ensure_ascii=False).encode())
+
+    def test_total_size_tracks_add_update_remove(self):
+        """추가/갱신/삭제 시 total_size_bytes가 증분 갱신되어야 함."""
+        context = MemoryContext(type=ContextType.A_CTX)
+        context.add_entry("a", "x" * 100)
+        context.add_entry("b", "y" * 10)
+        expected = sum(entry.estimate_size() for entry in context.entries.values())
+        assert context.total_size_bytes == expected
+
+        context.update_entry("a", "x" * 1000)
+        assert context.total_size_bytes == expected + 900
+
+        context.remove_entry("a")
+        context.remove_entry("b")
+        assert context.total_size_bytes == 0
+
+
+class TestEvictionPolicies:
+    """Eviction 정책 테스트."""
+
+    def test_without_policy_limit_still_raises(self):
+        """정책이 없으면 기존처럼 ValueError를 발생시켜야 함."""
+        context = MemoryContext(type=ContextType.A_CTX, max_entries=1)
+        context.add_entry("a", 1)
+        with pytest.raises(ValueError):
+            context.add_entry("b", 2)
+
+    def test_lru_evicts_least_recently_used(self):
+        """LRU는 가장 오래 접근되지 않은 엔트리를 제거해야 함."""
+        context = MemoryContext(type=ContextType.A_CTX, max_entries=3,
+                                eviction_policy=LRUEvictionPolicy())
+        for key in "abc":
+            context.add_entry(key, key)
+        context.get_entry("a")
+        context.add_entry("d", "d")
+
+        assert set(context.entries) == {"a", "c", "d"}
+        assert context.take_evictions() == ["b"]
+        assert context.evictions == 1
+
+    def test_lfu_evicts_least_frequently_used(self):
+        """LFU는 가장 적게 사용된 엔트리를 제거해야 함."""
+        context = MemoryContext(type=ContextType.A_CTX, max_entries=3,
+                                eviction_policy=LFUEvictionPolicy())
+        for key in "abc":
+            context.add_entry(key, key)
+        for _ in range(3):
+            context.get_entry("a")
+            context.get_entry("b")
+        context.get_entry("c")
+        context.add_entry("d", "d")
+
+        assert set(context.entries) == {"a", "b", "d"}
+
+    def test_ttl_first_prefers_expiring_entries(self):
+        """TTL-first는 곧 만료될 엔트리부터 제거해야 함."""
+        context = MemoryContext(type=ContextType.A_CTX, max_entries=3,
+                                eviction_policy=TTLFirstEvictionPolicy())
+        context.add_entry("permanent", 1)
+        context.add_entry("long", 2, ttl_seconds=3600)
+        context.add_entry("short", 3, ttl_seconds=60)
+        context.add_entry("new", 4)
+
+        assert set(context.entries) == {"permanent", "long", "new"}
+
+    def test_size_limit_evicts_until_within_budget(self):
+        """max_size_bytes 초과 시 예산 안으로 들어올 때까지 제거해야 함."""
+        context = MemoryContext(type=ContextType.A_CTX, max_size_bytes=2000,
+                                eviction_policy=get_eviction_policy("lru"))
+        for i in range(10):
+            context.add_entry(f"k{i}", "x" * 300)
+
+        assert context.total_size_bytes <= 2000
+        assert "k9" in context.entries
+        assert "k0" not in context.entries
+
+    def test_expired_entries_are_shed_before_eviction(self):
+        """정책 적용 전에 만료된 엔트리가 먼저 제거되어야 함."""
+        context = MemoryContext(type=ContextType.A_CTX, max_entries=2,
+                                eviction_policy=LRUEvictionPolicy())
+        context.restore_entry(MemoryEntry(key="old", ttl_seconds=1,
+                                          created_at=datetime.utcnow() - timedelta(seconds=5)))
+        context.add_entry("a", 1)
+        context.add_entry("b", 2)
+
+        assert set(context.entries) == {"a", "b"}
+        assert context.expirations == 1
+        assert context.evictions == 0
+
+    def test_unknown_policy_raises(self):
+        """알 수 없는 정책 이름은 ValueError를 발생시켜야 함."""
+        with pytest.raises(ValueError):
+            get_eviction_policy("random")
+
+
+class TestHubEviction:
+    """MemoryHub Eviction 통합 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_hub_sheds_and_persists_evictions(self, tmp_path):
+        """허브는 쓰기를 실패시키지 않고 제거 내역을 저장해야 함."""
+        hub = MemoryHub(
+            storage=JSONMemoryStorage(str(tmp_path)),
+            auto_cleanup_interval=0,
+            eviction_policy="lru",
+            context_limits={ContextType.A_CTX: {"max_entries": 5}},
+        )
+        await hub.initialize()
+
+        for i in range(20):
+            assert await hub.put(ContextType.A_CTX, f"exec_{i}", {"i": i}) is True
+
+        stats = await hub.get_context_stats(ContextType.A_CTX)
+        assert stats["total_entries"] == 5
+        assert stats["evictions"] == 15
+        assert stats["eviction_policy"] == "lru"
+        assert stats["total_size_bytes"] > 0
+
+        reloaded = await JSONMemoryStorage(str(tmp_path)).load_context(ContextType.A_CTX)
+        assert set(reloaded.entries) == {f"exec_{i}" for i in range(15, 20)}
+        await hub.shutdown()
@@ -0,0 +1,131 @@
+"""지연 로딩 테스트.
+
+MemoryHub의 컨텍스트 단위 지연 로드와 WAL 저장소의 큰 값 지연 디코딩을 검증합니다.
+"""
+
+import asyncio
+
+import pytest
+
+from backend.packages.memory.contexts import ContextType
+from backend.packages.memory.hub import MemoryHub
+from backend.packages.memory.storage import WALMemoryStorage
+
+
+class LoadCountingStorage(WALMemoryStorage):
+    """load_context 호출을 기록하는 WAL 저장소."""
+
+    def __init__(self, base_path: str, **kwargs) -> None:
+        super().__init__(base_path, **kwargs)
+        self.loaded = []
+
+    async def load_context(self, context_type):
+        self.loaded.append(context_type)
+        return await super().load_context(context_type)
+
+
+class SlowLoadStorage(LoadCountingStorage):
+    """로드가 느려 동시 접근이 겹치는 WAL 저장소."""
+
+    async def load_context(self, context_type):
+        await asyncio.sleep(0.05)
+        return await super().load_context(context_type)
+
+
+BIG_VALUE = {"report": ["line " * 20 for _ in range(100)], "score": 0.9}
+
+
+class TestLazyLoading:
+    """지연 로딩 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_contexts_load_on_first_access(self, tmp_path):
+        """lazy_load 모드에서는 접근한 컨텍스트만 한 번 로드되어야 함."""
+        storage = LoadCountingStorage(str(tmp_path))
+        hub = MemoryHub(storage=storage, auto_cleanup_interval=0, lazy_load=True)
+        await hub.initialize()
+        assert storage.loaded == []
+
+        await asyncio.gather(*[hub.get(ContextType.O_CTX, "missing") for _ in range(5)])
+        await hub.put(ContextType.O_CTX, "k", 1)
+        assert storage.loaded == [ContextType.O_CTX]
+        assert set(hub.contexts) == {ContextType.O_CTX}
+        await hub.shutdown()
+
+        reopened = MemoryHub(storage=LoadCountingStorage(str(tmp_path)),
+                             auto_cleanup_interval=0, lazy_load=True)
+        await reopened.initialize()
+        assert await reopened.get(ContextType.O_CTX, "k") == 1
+        await reopened.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_first_access_from_another_event_loop(self, tmp_path):
+        """다른 스레드의 이벤트 루프와 동시에 접근해도 한 번만 로드되어야 함."""
+        seed = MemoryHub(storage=WALMemoryStorage(str(tmp_path)), auto_cleanup_interval=0)
+        await seed.initialize()
+        await seed.put(ContextType.S_CTX, "k", "v")
+        await seed.shutdown()
+
+        storage = SlowLoadStorage(str(tmp_path))
+        hub = MemoryHub(storage=storage, auto_cleanup_interval=0, lazy_load=True)
+        await hub.initialize()
+
+        async def worker_reads():
+            return await asyncio.gather(*[hub.get(ContextType.S_CTX, "k") for _ in range(3)])
+
+        loop = asyncio.get_running_loop()
+        workers = [loop.run_in_executor(None, lambda: asyncio.run(worker_reads()))
+                   for _ in range(2)]
+        await asyncio.sleep(0.01)
+        values = await asyncio.wait_for(
+            asyncio.gather(*[hub.get(ContextType.S_CTX, "k") for _ in range(3)], *workers),
+            timeout=5
+        )
+        assert values == ["v"] * 3 + [["v"] * 3] * 2
+        assert storage.loaded == [ContextType.S_CTX]
+        await hub.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_large_values_are_decoded_on_read(self, tmp_path):
+        """큰 값은 로드 시 디코딩되지 않고 처음 읽을 때 디코딩되어야 함."""
+        storage = WALMemoryStorage(str(tmp_path), lazy_value_bytes=1024)
+        hub = MemoryHub(storage=storage, auto_cleanup_interval=0)
+        await hub.initialize()
+        await hub.put(ContextType.O_CTX, "big", BIG_VALUE, tags=["report"])
+        await hub.put(ContextType.O_CTX, "small", {"ok": True})
+
+        context = await WALMemoryStorage(str(tmp_path)).load_context(ContextType.O_CTX)
+        big, small = context.entries["big"], context.entries["small"]
+        assert not big.is_loaded()
+        assert small.is_loaded()
+        assert context.total_size_bytes > 0
+
+        assert big.value == BIG_VALUE
+        assert big.is_loaded()
+        await hub.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_lazy_values_survive_compaction(self, tmp_path):
+        """컴팩션 후에도 로드되지 않은 값은 새 스냅샷을 가리켜야 함."""
+        hub = MemoryHub(storage=WALMemoryStorage(str(tmp_path), lazy_value_bytes=1024),
+                        auto_cleanup_interval=0)
+        await hub.initialize()
+        await hub.put(ContextType.A_CTX, "big", BIG_VALUE)
+        await hub.shutdown()
+
+        storage = WALMemoryStorage(str(tmp_path), lazy_value_bytes=1024)
+        hub = MemoryHub(storage=storage, auto_cleanup_interval=0, lazy_load=True)
+        await hub.initialize()
+        await hub.put(ContextType.A_CTX, "other", 1)
+        context = hub.contexts[ContextType.A_CTX]
+        assert not context.entries["big"].is_loaded()
+
+        assert await storage.save_context(context) is True
+        assert storage._list_segments(ContextType.A_CTX) == []
+        assert not context.entries["big"].is_loaded()
+        assert await hub.get(ContextType.A_CTX, "big") == BIG_VALUE
+        await hub.shutdown()
+
+        reloaded = await WALMemoryStorage(str(tmp_path)).load_context(ContextType.A_CTX)
+        assert reloaded.entries["big"].value == BIG_VALUE
+        assert reloaded.entries["other"].value == 1
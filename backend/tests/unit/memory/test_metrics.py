@@ -0,0 +1,95 @@
+"""메모리 메트릭 테스트.
+
+히스토그램 분위수, 허브/저장소 계측, Prometheus 텍스트 출력을 검증합니다.
+"""
+
+import pytest
+
+from backend.packages.memory.contexts import ContextType
+from backend.packages.memory.hub import MemoryHub
+from backend.packages.memory.metrics import Histogram, MemoryMetrics
+from backend.packages.memory.storage import JSONMemoryStorage, WALMemoryStorage
+
+
+class TestHistogram:
+    """히스토그램 테스트."""
+
+    def test_quantiles_interpolate_within_buckets(self):
+        """분위수는 해당 버킷 범위 안에서 추정되어야 함."""
+        histogram = Histogram(buckets=(1, 2, 4, 8))
+        for value in [0.5] * 50 + [3] * 45 + [7] * 5:
+            histogram.observe(value)
+
+        summary = histogram.summary()
+        assert summary["count"] == 100
+        assert 0 < summary["p50"] <= 1
+        assert 2 < summary["p95"] <= 4
+        assert 4 < summary["p99"] <= 8
+
+    def test_prometheus_rendering(self):
+        """히스토그램과 게이지를 Prometheus 텍스트 형식으로 출력해야 함."""
+        metrics = MemoryMetrics()
+        metrics.observe("memory_operation_seconds", 0.002, operation="get", context="a_ctx")
+        metrics.set_gauge("memory_context_entries", 3, context="a_ctx")
+
+        text = metrics.render_prometheus()
+        assert "# TYPE memory_operation_seconds histogram" in text
+        assert 'memory_operation_seconds_bucket{context="a_ctx",operation="get",le="0.0025"} 1' in text
+        assert 'memory_operation_seconds_bucket{context="a_ctx",operation="get",le="+Inf"} 1' in text
+        assert 'memory_operation_seconds_count{context="a_ctx",operation="get"} 1' in text
+        assert 'memory_context_entries{context="a_ctx"} 3' in text
+
+
+class TestHubInstrumentation:
+    """허브/저장소 계측 테스트."""
+
+    @pytest.mark.parametrize("storage_class", [JSONMemoryStorage, WALMemoryStorage])
+    @pytest.mark.asyncio
+    async def test_operations_and_writes_are_recorded(self, tmp_path, storage_class):
+        """허브 작업 지연 시간과 저장 바이트 수가 기록되어야 함."""
+        metrics = MemoryMetrics()
+        hub = MemoryHub(storage=storage_class(str(tmp_path)), auto_cleanup_interval=0,
+                        metrics=metrics)
+        await hub.initialize()
+
+        await hub.put(ContextType.A_CTX, "k", {"data": "x" * 100})
+        await hub.get(ContextType.A_CTX, "k")
+        await hub.search(ContextType.A_CTX)
+
+        for operation in ("put", "get", "search"):
+            histogram = metrics.histogram(
+                "memory_operation_seconds", operation=operation, context=ContextType.A_CTX.value
+            )
+            assert histogram is not None and histogram.count == 1
+
+        written = metrics.histogram(
+            "memory_storage_write_bytes", context=ContextType.A_CTX.value,
+            backend=storage_class.__name__
+        )
+        assert written.count >= 1 and written.total > 100
+
+        stats = await hub.get_context_stats(ContextType.A_CTX)
+        assert stats["metrics"]["memory_operation_seconds"]["get"]["count"] == 1
+        await hub.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_render_includes_context_gauges(self, tmp_path):
+        """렌더링 시 엔트리 수와 축출 횟수가 갱신되어야 함."""
+        metrics = MemoryMetrics()
+        hub = MemoryHub(
+            storage=JSONMemoryStorage(str(tmp_path)),
+            auto_cleanup_interval=0,
+            eviction_policy="lru",
+            context_limits={ContextType.S_CTX: {"max_entries": 2}},
+            metrics=metrics,
+        )
+        await hub.initialize()
+        for i in range(4):
+            await hub.put(ContextType.S_CTX, f"k{i}", i)
+
+        text = hub.render_metrics()
+        label = ContextType.S_CTX.value
+        assert f'memory_context_entries{{context="{label}"}} 2' in text
+        assert f'memory_evictions_total{{context="{label}"}} 2' in text
+        assert "# TYPE memory_evictions_total counter" in text
+        await hub.shutdown()
@@ -0,0 +1,136 @@
+"""MemoryHub 쿼리 API 테스트.
+
+태그 AND/OR/NOT, 메타데이터/시간 조건, 필드 프로젝션, 커서 페이지 조회를
+메모리 백엔드와 SQLite 백엔드에서 검증합니다.
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from backend.packages.memory.contexts import ContextType, LazyValue
+from backend.packages.memory.hub import MemoryHub
+from backend.packages.memory.query import MemoryQuery, decode_cursor
+from backend.packages.memory.storage import JSONMemoryStorage, SQLiteMemoryStorage
+
+
+ITEMS = [
+    {"key": "r1", "value": {"status": "ok"}, "tags": ["report", "static"], "metadata": {"agent_id": "a"}},
+    {"key": "r2", "value": {"status": "bad"}, "tags": ["report", "impact"], "metadata": {"agent_id": "b"}},
+    {"key": "r3", "value": {"status": "ok"}, "tags": ["report", "static", "draft"], "metadata": {"agent_id": "a"}},
+    {"key": "n1", "value": 1, "tags": ["note"], "metadata": {"agent_id": "a"}},
+]
+
+
+@pytest.fixture(params=["json", "sqlite"])
+async def hub(request, tmp_path):
+    """샘플 엔트리가 들어 있는 메모리 허브 (백엔드별)."""
+    if request.param == "json":
+        storage = JSONMemoryStorage(str(tmp_path))
+    else:
+        storage = SQLiteMemoryStorage(str(tmp_path / "memory.db"))
+    hub = MemoryHub(storage=storage, auto_cleanup_interval=0)
+    await hub.initialize()
+    await hub.put_many(ContextType.A_CTX, ITEMS)
+    yield hub
+    await hub.shutdown()
+
+
+def keys(page):
+    """페이지 결과의 키 목록."""
+    return [item["key"] for item in page["items"]]
+
+
+class TestMemoryQuery:
+    """쿼리 조건 테스트."""
+
+    @pytest.mark.asyncio
+    async def test_tag_logic(self, hub):
+        """AND/OR/NOT 태그 조건을 조합할 수 있어야 함."""
+        assert keys(await hub.query(ContextType.A_CTX, all_tags=["report", "static"])) == ["r1", "r3"]
+        assert keys(await hub.query(ContextType.A_CTX, any_tags=["impact", "note"])) == ["r2", "n1"]
+        assert keys(await hub.query(
+            ContextType.A_CTX, all_tags=["report"], none_tags=["draft"]
+        )) == ["r1", "r2"]
+
+    @pytest.mark.asyncio
+    async def test_metadata_key_and_time_predicates(self, hub):
+        """메타데이터, 키 접두사, updated_at 범위 조건이 적용되어야 함."""
+        assert keys(await hub.query(
+            ContextType.A_CTX, metadata={"agent_id": "a"}, key_prefix="r"
+        )) == ["r1", "r3"]
+
+        future = datetime.utcnow() + timedelta(hours=1)
+        assert keys(await hub.query(ContextType.A_CTX, updated_after=future)) == []
+        assert len((await hub.query(ContextType.A_CTX, updated_before=future))["items"]) == 4
+
+    @pytest.mark.asyncio
+    async def test_projection(self, hub):
+        """선택한 필드만 반환하고 값 내부 경로도 선택할 수 있어야 함."""
+        page = await hub.query(ContextType.A_CTX, all_tags=["report"], fields=["key", "value.status"])
+        assert page["items"] == [
+            {"key": "r1", "value.status": "ok"},
+            {"key": "r2", "value.status": "bad"},
+            {"key": "r3", "value.status": "ok"},
+        ]
+
+    @pytest.mark.asyncio
+    async def test_cursor_pagination(self, hub):
+        """커서로 모든 결과를 중복 없이 순서대로 가져와야 함."""
+        first = await hub.query(ContextType.A_CTX, limit=3)
+        assert keys(first) == ["r1", "r2", "r3"]
+        assert first["next_cursor"]
+
+        second = await hub.query(ContextType.A_CTX, limit=3, cursor=first["next_cursor"])
+        assert keys(second) == ["n1"]
+        assert second["next_cursor"] is None
+
+        scanned = [item["key"] async for item in hub.scan(ContextType.A_CTX, limit=1)]
+        assert scanned == ["r1", "r2", "r3", "n1"]
+
+    @pytest.mark.asyncio
+    async def test_updates_while_paging_do_not_duplicate(self, hub):
+        """페이지 조회 중 이미 반환된 엔트리를 갱신해도 다시 나오지 않아야 함."""
+        first = await hub.query(ContextType.A_CTX, limit=2)
+        assert keys(first) == ["r1", "r2"]
+
+        await hub.put(ContextType.A_CTX, "r1", {"status": "updated"})
+        second = await hub.query(ContextType.A_CTX, limit=10, cursor=first["next_cursor"])
+        assert keys(second) == ["r3", "n1"]
+
+    @pytest.mark.asyncio
+    async def test_invalid_query(self, hub):
+        """잘못된 커서와 필드는 ValueError."""
+        with pytest.raises(ValueError):
+            await hub.query(ContextType.A_CTX, cursor="not-a-cursor")
+        with pytest.raises(ValueError):
+            await hub.query(ContextType.A_CTX, fields=["secret"])
+
+
+class TestQueryLaziness:
+    """지연 평가 테스트."""
+
+    def test_query_roundtrips_through_dict(self):
+        """to_dict/coerce로 쿼리를 그대로 전달할 수 있어야 함."""
+        query = MemoryQuery(all_tags=["a"], updated_after=datetime(2025, 1, 1), limit=5)
+        assert MemoryQuery.coerce(query.to_dict()) == query
+        assert MemoryQuery.coerce(query, limit=7).limit == 7
+        assert decode_cursor(None) == -1
+
+    @pytest.mark.asyncio
+    async def test_unprojected_lazy_values_stay_on_disk(self, tmp_path):
+        """값을 선택하지 않으면 지연 로딩된 값을 디코딩하지 않아야 함."""
+        hub = MemoryHub(storage=JSONMemoryStorage(str(tmp_path)), auto_cleanup_interval=0)
+        await hub.initialize()
+        await hub.put(ContextType.A_CTX, "big", {"x": 1}, tags=["t"], metadata={"agent_id": "a"})
+        context = await hub._get_context(ContextType.A_CTX)
+
+        payload = b'{"x": 1}'
+        path = tmp_path / "lazy.bin"
+        path.write_bytes(payload)
+        context.entries["big"].__dict__["_value"] = LazyValue(str(path), 0, len(payload))
+
+        page = await hub.query(ContextType.A_CTX, metadata={"agent_id": "a"}, fields=["key", "tags"])
+        assert page["items"] == [{"key": "big", "tags": ["t"]}]
+        assert context.entries["big"].is_loaded() is False
+        await hub.shutdown()
@@ -0,0 +1,128 @@
+"""MemoryHub 서버/클라이언트 테스트.
+
+Unix 소켓을 통한 허브 공유, 파이프라이닝, 에러 전달, 다른 이벤트 루프(스레드)에서의 접근을 검증합니다.
+"""
+
+import asyncio
+import threading
+from datetime import datetime
+
+import pytest
+
+from backend.packages.memory.client import MemoryHubClient
+from backend.packages.memory.contexts import ContextType
+from backend.packages.memory.hub import MemoryHub
+from backend.packages.memory.server import MemoryHubServer
+from backend.packages.memory.storage import JSONMemoryStorage
+
+
+class TestMemoryHubServer:
+    """MemoryHub 서버 테스트."""
+
+    @pytest.fixture
+    async def server(self, tmp_path):
+        """임시 디렉터리의 허브를 제공하는 서버."""
+        hub = MemoryHub(storage=JSONMemoryStorage(str(tmp_path / "memory")),
+                        auto_cleanup_interval=0, write_behind=True)
+        await hub.initialize()
+        server = MemoryHubServer(hub, str(tmp_path / "memory.sock"))
+        await server.start()
+        yield server
+        await server.stop()
+        await hub.shutdown()
+
+    @pytest.fixture
+    async def client(self, server):
+        """서버에 연결된 클라이언트."""
+        client = MemoryHubClient(server.socket_path)
+        await client.initialize()
+        yield client
+        await client.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_client_implements_hub_api(self, server, client):
+        """클라이언트의 put/get/search/delete가 서버의 허브에 반영되어야 함."""
+        assert await client.ping() is True
+        started = datetime(2025, 1, 1, 12, 0)
+        assert await client.put(ContextType.O_CTX, "task_1_status",
+                                {"progress": 0.5, "started_at": started}, tags=["task"])
+
+        assert await server.hub.get(ContextType.O_CTX, "task_1_status") == {
+            "progress": 0.5, "started_at": started
+        }
+        assert (await client.read(ContextType.O_CTX, "task_1_status"))["started_at"] == started
+        results = await client.search(ContextType.O_CTX, tags=["task"])
+        assert [r["key"] for r in results] == ["task_1_status"]
+
+        assert await client.delete(ContextType.O_CTX, "task_1_status") is True
+        assert await client.get(ContextType.O_CTX, "task_1_status") is None
+        assert (await client.get_context_stats(ContextType.O_CTX))["total_entries"] == 0
+        assert await client.flush() is True
+
+    @pytest.mark.asyncio
+    async def test_query_over_socket(self, client):
+        """쿼리(시간 조건 포함)와 커서 스캔이 소켓을 통해 동작해야 함."""
+        for i in range(3):
+            await client.put(ContextType.O_CTX, f"task_{i}_status", {"n": i},
+                             tags=["task_status"], metadata={"task_id": str(i)})
+
+        page = await client.query(ContextType.O_CTX, all_tags=["task_status"],
+                                  updated_after=datetime(2020, 1, 1),
+                                  fields=["metadata.task_id"], limit=2)
+        assert page["items"] == [{"metadata.task_id": "0"}, {"metadata.task_id": "1"}]
+        scanned = [item["key"] async for item in client.scan(ContextType.O_CTX, limit=1)]
+        assert scanned == ["task_0_status", "task_1_status", "task_2_status"]
+
+    @pytest.mark.asyncio
+    async def test_pipelined_requests_keep_order(self, client):
+        """한 연결에서 동시에 보낸 요청은 보낸 순서대로 실행되어야 함."""
+        await asyncio.gather(*[
+            client.put(ContextType.S_CTX, "counter", i) for i in range(200)
+        ])
+        assert await client.get(ContextType.S_CTX, "counter") == 199
+
+        stats = await client.get_write_behind_stats()
+        assert stats["writes"] == 200
+
+    @pytest.mark.asyncio
+    async def test_errors_are_raised_on_client(self, client):
+        """서버에서 발생한 에러는 클라이언트에서 같은 타입으로 발생해야 함."""
+        with pytest.raises(ValueError):
+            await client._call("get", context_type="unknown", key="k")
+        with pytest.raises(ValueError):
+            await client._call("storage")
+
+        # 에러 후에도 연결은 계속 사용 가능해야 함
+        assert await client.ping() is True
+
+    @pytest.mark.asyncio
+    async def test_clients_in_other_threads_share_the_hub(self, server):
+        """각자 이벤트 루프를 가진 스레드들이 하나의 허브를 공유해야 함."""
+
+        async def worker(index):
+            client = MemoryHubClient(server.socket_path)
+            await client.initialize()
+            for i in range(20):
+                await client.put(ContextType.O_CTX, f"task_{index}_{i}", i)
+            await client.shutdown()
+
+        threads = [
+            threading.Thread(target=asyncio.run, args=(worker(index),))
+            for index in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        while any(thread.is_alive() for thread in threads):
+            await asyncio.sleep(0.01)
+
+        assert len(await server.hub.search(ContextType.O_CTX, limit=1000)) == 80
+        assert server.get_stats()["connections"] == 4
+
+    @pytest.mark.asyncio
+    async def test_client_requires_server(self, tmp_path):
+        """서버가 없으면 연결 에러, 초기화 전 호출은 RuntimeError."""
+        client = MemoryHubClient(str(tmp_path / "missing.sock"))
+        with pytest.raises(RuntimeError):
+            await client.get(ContextType.O_CTX, "k")
+        with pytest.raises(ConnectionError):
+            await client.initialize()
@@ -0,0 +1,150 @@
+"""SQLiteMemoryStorage 테스트.
+
+엔트리 단위 행 저장, 태그/TTL 인덱스 질의, 다중 인스턴스 공유를 검증합니다.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from backend.packages.memory.contexts import ContextType, MemoryContext
+from backend.packages.memory.hub import MemoryHub
+from backend.packages.memory.storage import SQLiteMemoryStorage, get_memory_storage
+
+
+class TestSQLiteMemoryStorage:
+    """SQLiteMemoryStorage 테스트."""
+
+    @pytest.fixture
+    def db_path(self, tmp_path):
+        """테스트용 DB 경로."""
+        return str(tmp_path / "memory.db")
+
+    @pytest.fixture
+    async def hub(self, db_path):
+        """SQLite 저장소를 사용하는 메모리 허브."""
+        hub = MemoryHub(storage=SQLiteMemoryStorage(db_path), auto_cleanup_interval=0)
+        await hub.initialize()
+        yield hub
+        await hub.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_put_get_update_merges_metadata(self, hub):
+        """기존 엔트리 갱신 시 값은 교체되고 메타데이터는 병합되어야 함."""
+        await hub.put(ContextType.A_CTX, "k", {"v": 1}, tags=["a"], metadata={"x": 1})
+        await hub.put(ContextType.A_CTX, "k", {"v": 2}, tags=["ignored"], metadata={"y": 2})
+
+        assert await hub.get(ContextType.A_CTX, "k") == {"v": 2}
+        results = await hub.search(ContextType.A_CTX, tags=["a"])
+        assert len(results) == 1
+        assert results[0]["tags"] == ["a"]
+        assert results[0]["metadata"] == {"x": 1, "y": 2}
+
+    @pytest.mark.asyncio
+    async def test_search_by_tags_uses_or_and_limit(self, hub):
+        """태그 검색은 OR 조건과 삽입 순서, limit을 지켜야 함."""
+        for i in range(5):
+            await hub.put(ContextType.S_CTX, f"k{i}", i, tags=["even" if i % 2 == 0 else "odd"])
+        await hub.put(ContextType.S_CTX, "other", -1, tags=["other"])
+
+        results = await hub.search(ContextType.S_CTX, tags=["even", "other"])
+        assert [r["key"] for r in results] == ["k0", "k2", "k4", "other"]
+
+        limited = await hub.search(ContextType.S_CTX, tags=["even"], limit=2)
+        assert [r["key"] for r in limited] == ["k0", "k2"]
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_are_hidden_and_cleaned(self, hub, db_path):
+        """만료된 엔트리는 조회되지 않고 cleanup에서 삭제되어야 함."""
+        storage = hub.storage
+        context = MemoryContext(type=ContextType.OBS_CTX)
+        old = context.add_entry("old", 1, ttl_seconds=10, tags=["m"])
+        old.created_at = datetime.utcnow() - timedelta(seconds=60)
+        context.add_entry("fresh", 2, ttl_seconds=3600, tags=["m"])
+        await storage.save_context(context)
+
+        assert await hub.get(ContextType.OBS_CTX, "old") is None
+        assert [r["key"] for r in await hub.search(ContextType.OBS_CTX, tags=["m"])] == ["fresh"]
+        assert await storage.cleanup_expired(ContextType.OBS_CTX) == 1
+
+        stats = await hub.get_context_stats(ContextType.OBS_CTX)
+        assert stats["total_entries"] == 1
+        assert stats["indexed_tags"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stats_count_indexed_tags(self, hub):
+        """통계의 indexed_tags는 저장소의 서로 다른 태그 수여야 함."""
+        await hub.put(ContextType.S_CTX, "a", 1, tags=["x", "y"])
+        await hub.put(ContextType.S_CTX, "b", 2, tags=["y", "z"])
+
+        stats = await hub.get_context_stats(ContextType.S_CTX)
+        assert (stats["total_entries"], stats["indexed_tags"]) == (2, 3)
+
+    def test_eviction_is_rejected(self, db_path):
+        """질의형 저장소에는 적용되지 않는 eviction 설정은 거부되어야 함."""
+        with pytest.raises(ValueError):
+            MemoryHub(storage=SQLiteMemoryStorage(db_path), eviction_policy="lru")
+        with pytest.raises(ValueError):
+            MemoryHub(
+                storage=SQLiteMemoryStorage(db_path),
+                context_limits={ContextType.A_CTX: {"max_entries": 10}},
+            )
+
+    @pytest.mark.asyncio
+    async def test_delete_and_clear(self, hub):
+        """delete와 clear_context가 행과 태그를 제거해야 함."""
+        await hub.put(ContextType.U_CTX, "a", 1, tags=["t"])
+        await hub.put(ContextType.U_CTX, "b", 2, tags=["t"])
+
+        assert await hub.delete(ContextType.U_CTX, "a") is True
+        assert await hub.delete(ContextType.U_CTX, "a") is False
+        assert [r["key"] for r in await hub.search(ContextType.U_CTX, tags=["t"])] == ["b"]
+
+        await hub.clear_context(ContextType.U_CTX)
+        assert await hub.search(ContextType.U_CTX) == []
+
+    @pytest.mark.asyncio
+    async def test_shared_between_hubs_without_lost_writes(self, db_path):
+        """같은 DB를 쓰는 여러 허브의 동시 쓰기가 모두 보존되어야 함."""
+        hubs = [
+            MemoryHub(storage=SQLiteMemoryStorage(db_path), auto_cleanup_interval=0)
+            for _ in range(3)
+        ]
+        for hub in hubs:
+            await hub.initialize()
+
+        await asyncio.gather(*[
+            hub.put(ContextType.O_CTX, f"task_{h}_{i}", i, tags=["task"])
+            for h, hub in enumerate(hubs)
+            for i in range(20)
+        ])
+
+        results = await hubs[0].search(ContextType.O_CTX, tags=["task"], limit=1000)
+        assert len(results) == 60
+        assert await hubs[2].get(ContextType.O_CTX, "task_0_19") == 19
+
+        for hub in hubs:
+            await hub.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_load_context_roundtrip(self, db_path):
+        """save_context/load_context 왕복 시 엔트리가 보존되어야 함."""
+        storage = SQLiteMemoryStorage(db_path)
+        context = MemoryContext(type=ContextType.A_CTX, max_entries=10)
+        context.add_entry("k", {"nested": [1, 2]}, tags=["x", "y"], metadata={"m": True})
+        await storage.save_context(context)
+
+        loaded = await storage.load_context(ContextType.A_CTX)
+        assert loaded.max_entries == 10
+        assert loaded.entries["k"].value == {"nested": [1, 2]}
+        assert sorted(loaded.entries["k"].tags) == ["x", "y"]
+        assert await storage.load_context(ContextType.U_CTX) is None
+
+    def test_get_memory_storage_factory(self, tmp_path):
+        """팩토리가 타입별 저장소를 생성해야 함."""
+        storage = get_memory_storage("sqlite", {"base_path": str(tmp_path)})
+        assert isinstance(storage, SQLiteMemoryStorage)
+
+        with pytest.raises(ValueError):
+            get_memory_storage("redis", {"base_path": str(tmp_path)})
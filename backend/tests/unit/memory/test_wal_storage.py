@@ -0,0 +1,108 @@
+"""WALMemoryStorage 테스트.
+
+Append-only 로그 기반 저장소의 기록, 재생, 컴팩션을 검증합니다.
+"""
+
+import asyncio
+
+import pytest
+
+from backend.packages.memory.contexts import ContextType
+from backend.packages.memory.hub import MemoryHub
+from backend.packages.memory.storage import WALMemoryStorage
+
+
+class TestWALMemoryStorage:
+    """WALMemoryStorage 테스트."""
+
+    @pytest.fixture
+    def storage(self, tmp_path):
+        """테스트용 WAL 저장소."""
+        return WALMemoryStorage(base_path=str(tmp_path), compact_min_records=50)
+
+    @pytest.fixture
+    async def hub(self, storage):
+        """WAL 저장소를 사용하는 메모리 허브."""
+        hub = MemoryHub(storage=storage, auto_cleanup_interval=0)
+        await hub.initialize()
+        yield hub
+        await hub.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_put_appends_single_record(self, hub, storage):
+        """put은 전체 재작성 대신 레코드 한 줄만 추가해야 함."""
+        await hub.put(ContextType.A_CTX, "k1", {"v": 1}, tags=["t"])
+        await hub.put(ContextType.A_CTX, "k2", {"v": 2})
+
+        segment = storage._get_segment_path(ContextType.A_CTX, 0)
+        lines = segment.read_text().strip().splitlines()
+        assert len(lines) == 2
+        assert not storage._get_snapshot_path(ContextType.A_CTX).exists()
+
+    @pytest.mark.asyncio
+    async def test_replay_restores_puts_and_deletes(self, hub, storage, tmp_path):
+        """재시작 시 로그를 재생하여 동일한 상태를 복원해야 함."""
+        await hub.put(ContextType.S_CTX, "a", 1, tags=["x"])
+        await hub.put(ContextType.S_CTX, "b", 2)
+        await hub.put(ContextType.S_CTX, "a", 3)
+        await hub.delete(ContextType.S_CTX, "b")
+
+        reloaded = WALMemoryStorage(base_path=str(tmp_path))
+        context = await reloaded.load_context(ContextType.S_CTX)
+
+        assert context is not None
+        assert set(context.entries) == {"a"}
+        assert context.entries["a"].value == 3
+        assert context.entries["a"].tags == ["x"]
+
+    @pytest.mark.asyncio
+    async def test_background_compaction(self, hub, storage, tmp_path):
+        """세그먼트가 커지면 스냅샷을 만들고 이전 세그먼트를 제거해야 함."""
+        for i in range(60):
+            await hub.put(ContextType.A_CTX, f"key_{i % 10}", i)
+        await storage._wait_for_compaction(ContextType.A_CTX)
+
+        assert storage._get_snapshot_path(ContextType.A_CTX).exists()
+        assert 0 not in storage._list_segments(ContextType.A_CTX)
+
+        reloaded = WALMemoryStorage(base_path=str(tmp_path))
+        context = await reloaded.load_context(ContextType.A_CTX)
+        assert len(context.entries) == 10
+        assert context.entries["key_9"].value == 59
+
+    @pytest.mark.asyncio
+    async def test_writes_during_compaction_survive(self, hub, storage, tmp_path):
+        """컴팩션 중에 들어온 쓰기도 재생 후 유지되어야 함."""
+        for i in range(50):
+            await hub.put(ContextType.A_CTX, f"key_{i}", i)
+        await asyncio.gather(*[
+            hub.put(ContextType.A_CTX, f"late_{i}", i) for i in range(20)
+        ])
+        await storage._wait_for_compaction(ContextType.A_CTX)
+
+        reloaded = WALMemoryStorage(base_path=str(tmp_path))
+        context = await reloaded.load_context(ContextType.A_CTX)
+        assert len(context.entries) == 70
+
+    @pytest.mark.asyncio
+    async def test_truncated_record_is_ignored(self, storage, tmp_path):
+        """비정상 종료로 잘린 마지막 레코드는 무시되어야 함."""
+        hub = MemoryHub(storage=storage, auto_cleanup_interval=0)
+        await hub.initialize()
+        await hub.put(ContextType.U_CTX, "ok", "value")
+
+        segment = storage._get_segment_path(ContextType.U_CTX, 0)
+        with open(segment, "a") as f:
+            f.write('{"op": "put", "entry": {"id"')
+
+        context = await WALMemoryStorage(base_path=str(tmp_path)).load_context(ContextType.U_CTX)
+        assert context.entries["ok"].value == "value"
+
+    @pytest.mark.asyncio
+    async def test_clear_context_removes_files(self, hub, storage):
+        """clear_context는 스냅샷과 세그먼트를 모두 삭제해야 함."""
+        await hub.put(ContextType.O_CTX, "k", "v")
+        assert await storage.exists(ContextType.O_CTX)
+
+        await hub.clear_context(ContextType.O_CTX)
+        assert not await storage.exists(ContextType.O_CTX)
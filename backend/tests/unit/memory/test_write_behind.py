@@ -0,0 +1,176 @@
+"""MemoryHub write-behind 모드 테스트.
+
+지연 저장, 동일 키 병합, 배치 플러시, 종료 시 동기 플러시를 검증합니다.
+"""
+
+import asyncio
+
+import pytest
+
+from backend.packages.memory.contexts import ContextType
+from backend.packages.memory.hub import MemoryHub
+from backend.packages.memory.storage import JSONMemoryStorage, WALMemoryStorage
+
+
+class CountingStorage(JSONMemoryStorage):
+    """저장 호출 횟수를 세는 JSON 저장소."""
+
+    def __init__(self, base_path: str) -> None:
+        super().__init__(base_path)
+        self.save_calls = 0
+        self.batches = []
+
+    async def save_context(self, context):
+        self.save_calls += 1
+        return await super().save_context(context)
+
+    async def apply_mutations(self, context, changed, deleted):
+        self.batches.append(([e.key for e in changed], list(deleted)))
+        return await super().apply_mutations(context, changed, deleted)
+
+
+class TestWriteBehind:
+    """Write-behind 테스트."""
+
+    @pytest.fixture
+    def storage(self, tmp_path):
+        """호출 횟수를 세는 저장소."""
+        return CountingStorage(str(tmp_path))
+
+    @pytest.mark.asyncio
+    async def test_writes_are_coalesced_into_one_flush(self, storage):
+        """같은 키의 반복 쓰기는 한 번의 저장으로 병합되어야 함."""
+        hub = MemoryHub(storage=storage, auto_cleanup_interval=0, write_behind=True,
+                        flush_interval_ms=10_000)
+        await hub.initialize()
+
+        for progress in range(10):
+            await hub.put(ContextType.O_CTX, "task_1_status", {"progress": progress / 10})
+        await hub.put(ContextType.O_CTX, "task_1_result", {"ok": True})
+
+        assert storage.save_calls == 0
+        assert await hub.get(ContextType.O_CTX, "task_1_status") == {"progress": 0.9}
+
+        assert await hub.flush() is True
+        assert storage.batches == [(["task_1_status", "task_1_result"], [])]
+
+        stats = hub.get_write_behind_stats()
+        assert stats["writes"] == 11
+        assert stats["coalesced_writes"] == 9
+        assert stats["flushes"] == 1
+        assert stats["flushed_entries"] == 2
+        assert stats["pending_keys"] == 0
+        await hub.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_background_flush_after_max_mutations(self, storage):
+        """대기 중인 쓰기가 임계값을 넘으면 백그라운드에서 플러시되어야 함."""
+        hub = MemoryHub(storage=storage, auto_cleanup_interval=0, write_behind=True,
+                        flush_interval_ms=10_000, flush_max_mutations=5)
+        await hub.initialize()
+
+        for i in range(5):
+            await hub.put(ContextType.A_CTX, f"k{i}", i)
+        await asyncio.sleep(0.05)
+
+        assert len(storage.batches) == 1
+        assert hub.get_write_behind_stats()["pending_keys"] == 0
+        await hub.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_shutdown_flushes_pending_writes(self, tmp_path):
+        """shutdown은 대기 중인 쓰기를 동기적으로 저장해야 함."""
+        hub = MemoryHub(storage=WALMemoryStorage(str(tmp_path)), auto_cleanup_interval=0,
+                        write_behind=True, flush_interval_ms=10_000)
+        await hub.initialize()
+        await hub.put(ContextType.S_CTX, "a", 1)
+        await hub.put(ContextType.S_CTX, "b", 2)
+        await hub.delete(ContextType.S_CTX, "a")
+        await hub.shutdown()
+
+        context = await WALMemoryStorage(str(tmp_path)).load_context(ContextType.S_CTX)
+        assert set(context.entries) == {"b"}
+
+    @pytest.mark.asyncio
+    async def test_flush_from_another_event_loop(self, storage):
+        """다른 스레드의 이벤트 루프에서 호출한 flush도 허브의 루프에서 실행되어야 함."""
+        hub = MemoryHub(storage=storage, auto_cleanup_interval=0, write_behind=True,
+                        flush_interval_ms=10_000)
+        await hub.initialize()
+        apply_mutations = storage.apply_mutations
+
+        async def slow_apply(context, changed, deleted):
+            await asyncio.sleep(0.05)
+            return await apply_mutations(context, changed, deleted)
+
+        storage.apply_mutations = slow_apply
+
+        async def write_and_flush(key):
+            await hub.put(ContextType.A_CTX, key, 1)
+            return await asyncio.gather(hub.flush(), hub.flush())
+
+        loop = asyncio.get_running_loop()
+        await hub.put(ContextType.A_CTX, "main", 1)
+        main_flush = asyncio.ensure_future(hub.flush())
+        await asyncio.sleep(0.01)
+        workers = [loop.run_in_executor(None, lambda key=key: asyncio.run(write_and_flush(key)))
+                   for key in ("w1", "w2")]
+        results = await asyncio.wait_for(
+            asyncio.gather(main_flush, hub.flush(), *workers), timeout=5
+        )
+        assert results[:2] == [True, True]
+        assert results[2:] == [[True, True]] * 2
+        assert hub.get_write_behind_stats()["pending_keys"] == 0
+        assert sorted(key for keys, _ in storage.batches for key in keys) == ["main", "w1", "w2"]
+        await hub.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_writes_from_other_threads_are_never_lost(self, storage):
+        """다른 스레드의 쓰기가 플러시와 겹쳐도 모든 키가 저장되어야 함."""
+        hub = MemoryHub(storage=storage, auto_cleanup_interval=0, write_behind=True,
+                        flush_interval_ms=1, flush_max_mutations=5)
+        await hub.initialize()
+        flushed = set()
+
+        async def record(context, changed, deleted):
+            for entry in changed:
+                flushed.add(entry.key)
+                await asyncio.sleep(0)
+            return True
+
+        storage.apply_mutations = record
+
+        async def write(worker):
+            for i in range(300):
+                await hub.put(ContextType.S_CTX, f"{worker}-{i}", i)
+
+        loop = asyncio.get_running_loop()
+        workers = [loop.run_in_executor(None, lambda worker=worker: asyncio.run(write(worker)))
+                   for worker in range(4)]
+        await asyncio.wait_for(asyncio.gather(*workers), timeout=30)
+        assert await hub.flush() is True
+
+        assert flushed == {f"{worker}-{i}" for worker in range(4) for i in range(300)}
+        await hub.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_is_retried(self, storage):
+        """저장 실패 시 변경 사항은 다음 플러시를 위해 유지되어야 함."""
+        hub = MemoryHub(storage=storage, auto_cleanup_interval=0, write_behind=True,
+                        flush_interval_ms=10_000)
+        await hub.initialize()
+        await hub.put(ContextType.U_CTX, "k", "v")
+
+        original = storage.apply_mutations
+
+        async def failing(context, changed, deleted):
+            return False
+
+        storage.apply_mutations = failing
+        assert await hub.flush() is False
+        assert hub.get_write_behind_stats()["pending_keys"] == 1
+
+        storage.apply_mutations = original
+        assert await hub.flush() is True
+        assert hub.get_write_behind_stats()["failed_flushes"] == 1
+        await hub.shutdown()
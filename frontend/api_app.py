@@ -117,6 +117,28 @@ def get_task_status(task_id):
     except:
         return None
 
+# AI 출력 스트리밍 (SSE)
+def stream_task_output(task_id):
+    """작업의 AI 출력 이벤트를 도착하는 대로 반환"""
+    try:
+        with requests.get(
+            f"{API_URL}/api/upgrade/stream/{task_id}",
+            stream=True,
+            timeout=(5, 60)
+        ) as response:
+            if response.status_code != 200:
+                return
+            event_type = None
+            for line in response.iter_lines(decode_unicode=True):
+                if line.startswith("event:"):
+                    event_type = line[6:].strip()
+                elif line.startswith("data:") and event_type:
+                    yield json.loads(line[5:])
+                    if event_type == "end":
+                        return
+    except requests.exceptions.RequestException:
+        return
+
 # 결과 다운로드
 def download_result(task_id):
     """작업 결과 다운로드"""
@@ -240,6 +262,19 @@ with col2:
                     task_id = result.get("task_id")
                     st.success(f"✅ 작업 시작됨 - Task ID: {task_id}")
                     
+                    # 에이전트 AI 출력 실시간 표시 (작업 종료 시 스트림도 종료)
+                    agent_text = st.empty()
+                    output_box = st.empty()
+                    current_agent, output = None, ""
+                    for event in stream_task_output(task_id):
+                        if event.get("event") != "token":
+                            continue
+                        if event.get("agent") != current_agent:
+                            current_agent, output = event.get("agent"), ""
+                            agent_text.caption(f"🤖 {current_agent} 응답 생성 중...")
+                        output += event.get("text", "")
+                        output_box.markdown(output[-4000:])
+                    
                     # 진행 상황 모니터링
                     progress_bar = st.progress(0)
                     status_text = st.empty()
@@ -330,6 +330,25 @@ with log_container:
     else:
         st.info("실행 버튼을 눌러 시작하세요")
 
+# 에이전트 AI 출력 실시간 표시 영역
+st.markdown("## 🤖 AI 출력")
+stream_agent = st.empty()
+stream_box = st.empty()
+
+
+def attach_stream_display(orchestrator):
+    """런타임의 스트리밍 AI 출력을 화면에 표시."""
+    state = {"agent": None, "text": ""}
+    
+    def on_chunk(agent_name, chunk):
+        if agent_name != state["agent"]:
+            state["agent"], state["text"] = agent_name, ""
+            stream_agent.caption(f"🤖 {agent_name} 응답 생성 중...")
+        state["text"] += chunk
+        stream_box.markdown(state["text"][-4000:])
+    
+    orchestrator.runtime.add_stream_callback(on_chunk)
+
 # 실행 함수
 async def run_orchestrator():
     """오케스트레이터 실행."""
@@ -354,6 +373,7 @@ async def run_orchestrator():
             # 오케스트레이터 생성
             orchestrator = AWSUpgradeOrchestrator(config)
             st.session_state.orchestrator = orchestrator
+            attach_stream_display(orchestrator)
             
             # Evolution Loop 실행
             if enable_evolution:
@@ -386,6 +406,7 @@ async def run_orchestrator():
             # 오케스트레이터 생성
             orchestrator = AWSNewBuilderOrchestrator(config)
             st.session_state.orchestrator = orchestrator
+            attach_stream_display(orchestrator)
             
             # SeedProduct 생성
             result = await orchestrator.create_seed_product(requirements)
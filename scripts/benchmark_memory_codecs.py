@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+"""메모리 codec 마이크로 벤치마크 스크립트
+
+실제 O_CTX(오케스트레이터 컨텍스트)와 비슷한 리포트 데이터를 만들어
+json / orjson / msgpack codec의 인코딩/디코딩 시간과 저장 크기를 비교합니다.
+설치되지 않은 codec은 건너뜁니다.
+
+사용법:
+    python scripts/benchmark_memory_codecs.py [--entries 200] [--rounds 20]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from backend.packages.memory.codecs import CODECS, available_codecs, get_codec
+from backend.packages.memory.contexts import ContextType, MemoryContext
+from backend.packages.memory.storage import JSONMemoryStorage
+
+
+def build_o_ctx_blob(entries: int) -> dict:
+    """O_CTX 리포트와 비슷한 저장 데이터 생성
+
+    Args:
+        entries: 생성할 엔트리 수
+
+    Returns:
+        JSONMemoryStorage가 디스크에 쓰는 것과 같은 형태의 데이터
+    """
+    context = MemoryContext(type=ContextType.O_CTX, max_entries=entries * 2)
+    started = datetime.utcnow() - timedelta(hours=1)
+
+    for i in range(entries):
+        report = {
+            "agent": ["RequirementAnalyzer", "StaticAnalyzer", "GapAnalyzer", "PlannerAgent"][i % 4],
+            "status": "completed",
+            "started_at": (started + timedelta(seconds=i)).isoformat(),
+            "summary": "분석 결과 요약: 모듈 간 결합도가 높고 테스트 커버리지가 낮습니다. " * 3,
+            "metrics": {
+                "files_analyzed": 120 + i,
+                "complexity": {"avg": 7.3, "max": 41, "p95": 18.5},
+                "coverage": 0.42 + (i % 10) / 100,
+            },
+            "findings": [
+                {
+                    "file": f"backend/packages/agents/module_{j}.py",
+                    "line": 10 * j + i,
+                    "severity": ["low", "medium", "high"][j % 3],
+                    "message": f"Function too complex (cyclomatic complexity {12 + j})",
+                }
+                for j in range(8)
+            ],
+            "recommendations": [f"Refactor module_{j} into smaller units" for j in range(4)],
+        }
+        context.add_entry(
+            f"task_{i}_report",
+            report,
+            tags=["report", report["agent"].lower()],
+            metadata={"loop": i // 50, "tokens": 1500 + i},
+            ttl_seconds=3600 if i % 5 == 0 else None,
+        )
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        storage = JSONMemoryStorage(tmp_dir)
+        return {
+            "type": context.type.value,
+            "max_entries": context.max_entries,
+            "max_size_bytes": context.max_size_bytes,
+            "entries": {
+                key: storage._serialize_entry(entry)
+                for key, entry in context.entries.items()
+            },
+        }
+
+
+def bench(codec_name: str, blob: dict, rounds: int) -> dict:
+    """Codec 하나의 인코딩/디코딩 시간 측정
+
+    Args:
+        codec_name: Codec 이름
+        blob: 인코딩할 데이터
+        rounds: 반복 횟수
+
+    Returns:
+        측정 결과 (ms 단위 평균 시간, 바이트 크기)
+    """
+    codec = get_codec(codec_name)
+    payload = codec.encode(blob)
+    assert codec.decode(payload) == blob, f"{codec_name} round-trip mismatch"
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        codec.encode(blob)
+    encode_ms = (time.perf_counter() - start) * 1000 / rounds
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        codec.decode(payload)
+    decode_ms = (time.perf_counter() - start) * 1000 / rounds
+
+    return {"encode_ms": encode_ms, "decode_ms": decode_ms, "bytes": len(payload)}
+
+
+def main() -> None:
+    """벤치마크 실행 및 결과 출력"""
+    parser = argparse.ArgumentParser(description="Benchmark memory codecs")
+    parser.add_argument("--entries", type=int, default=200, help="O_CTX 엔트리 수")
+    parser.add_argument("--rounds", type=int, default=20, help="반복 횟수")
+    args = parser.parse_args()
+
+    blob = build_o_ctx_blob(args.entries)
+    availability = available_codecs()
+
+    print(f"O_CTX blob: {args.entries} entries, {args.rounds} rounds")
+    print(f"{'codec':<10}{'encode ms':>12}{'decode ms':>12}{'bytes':>12}{'vs json':>10}")
+    print("-" * 56)
+
+    baseline = None
+    for name in CODECS:
+        if not availability[name]:
+            print(f"{name:<10}{'(not installed, skipped)':>46}")
+            continue
+        result = bench(name, blob, args.rounds)
+        baseline = baseline or result["bytes"]
+        ratio = result["bytes"] / baseline
+        print(
+            f"{name:<10}{result['encode_ms']:>12.2f}{result['decode_ms']:>12.2f}"
+            f"{result['bytes']:>12,}{ratio:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
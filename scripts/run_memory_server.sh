@@ -0,0 +1,17 @@
+#!/bin/bash
+# Script to run a standalone T-Developer Memory Hub server
+
+echo "========================================"
+echo "Starting T-Developer Memory Hub Server"
+echo "========================================"
+
+# Clients (API, orchestrators, scripts) connect through MEMORY_SOCKET
+export MEMORY_SOCKET=${MEMORY_SOCKET:-/tmp/t-developer/memory.sock}
+
+echo "Serving memory on unix://$MEMORY_SOCKET"
+echo "Storage: ${MEMORY_STORAGE:-json} at ${MEMORY_PATH:-/tmp/t-developer/memory}"
+echo ""
+echo "Press Ctrl+C to stop the server"
+echo "----------------------------------------"
+
+python -c "from backend.packages.memory.server import main; main()"